@@ -0,0 +1,75 @@
+# benchmarks/_harness.py
+"""
+最小基准框架：不依赖 pytest-benchmark / asv，只用 time.perf_counter_ns。
+
+每个 benchmark 是一个 `setup(scale) -> (run_fn, n_ops)` 工厂：
+- setup 里构造数据/组件（不计时）
+- run_fn() 执行一次被测逻辑（计时），n_ops 为这一次执行包含的操作数
+同一个 setup 结果只跑一次 run_fn（很多被测对象是一次性消费的，如 reader/engine），
+因此每个 repeat 都会重新 setup。
+"""
+from __future__ import annotations
+
+import gc
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+SetupFn = Callable[[float], Tuple[Callable[[], object], int]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: SetupFn
+    group: str = ""
+    params: Dict[str, object] = field(default_factory=dict)
+
+
+_REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, group: str = "", **params):
+    """装饰器：注册一个 setup 工厂。"""
+    def deco(fn: SetupFn) -> SetupFn:
+        _REGISTRY.append(Benchmark(name=name, setup=fn, group=group, params=dict(params)))
+        return fn
+    return deco
+
+
+def registry() -> List[Benchmark]:
+    return list(_REGISTRY)
+
+
+def measure(bench: Benchmark, scale: float = 1.0, repeat: int = 5) -> dict:
+    """运行一个 benchmark，返回可 JSON 序列化的结果。"""
+    times_ns: List[int] = []
+    n_ops = 0
+    for _ in range(max(1, repeat)):
+        run, n_ops = bench.setup(scale)
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            t0 = time.perf_counter_ns()
+            run()
+            t1 = time.perf_counter_ns()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        times_ns.append(t1 - t0)
+
+    best = min(times_ns)
+    median = statistics.median(times_ns)
+    return {
+        "name": bench.name,
+        "group": bench.group,
+        "params": bench.params,
+        "n_ops": n_ops,
+        "repeat": len(times_ns),
+        "best_ns": best,
+        "median_ns": int(median),
+        "ns_per_op": best / n_ops if n_ops else None,
+        "ops_per_sec": n_ops * 1e9 / best if best else None,
+    }
@@ -0,0 +1,51 @@
+# benchmarks/_synthetic.py
+"""本地生成的合成数据（固定随机种子，保证跨 commit 可比）。"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+SYMBOL = "BTC-USDT-SWAP"
+MID = 50000.0
+TICK = 0.1
+
+
+def _mid_path(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    steps = rng.integers(-2, 3, size=n) * TICK
+    return MID + np.cumsum(steps)
+
+
+def bookticker_frames(n: int, batch_size: int = 10_000, depth: int = 25, seed: int = 7, t0: int = 1_000_000):
+    """OKXBooktickerArrayReader 期望的 DataFrame 批次列表。"""
+    mids = _mid_path(n, seed)
+    ts = t0 + np.arange(n, dtype=np.int64) * 100
+    cols = {
+        "timestamp": ts,
+        "symbol": np.full(n, SYMBOL, dtype=object),
+        "local_timestamp": ts + 5,
+    }
+    for i in range(1, depth + 1):
+        spread = (i - 0.5) * TICK
+        cols[f"ask_price_{i}"] = mids + spread
+        cols[f"ask_amount_{i}"] = np.full(n, 10.0)
+        cols[f"bid_price_{i}"] = mids - spread
+        cols[f"bid_amount_{i}"] = np.full(n, 10.0)
+    df = pd.DataFrame(cols)
+    return [df.iloc[i:i + batch_size].reset_index(drop=True) for i in range(0, n, batch_size)]
+
+
+def trades_frames(n: int, batch_size: int = 10_000, seed: int = 11, t0: int = 1_000_050):
+    """OKXTradesArrayReader 期望的 DataFrame 批次列表。"""
+    rng = np.random.default_rng(seed)
+    mids = _mid_path(n, seed)
+    sides = np.where(rng.random(n) < 0.5, "buy", "sell").astype(object)
+    df = pd.DataFrame({
+        "created_time": t0 + np.arange(n, dtype=np.int64) * 100,
+        "instrument_name": np.full(n, SYMBOL, dtype=object),
+        "trade_id": np.arange(n, dtype=np.int64),
+        "price": np.round(mids, 1),
+        "size": rng.random(n) + 0.01,
+        "side": sides,
+    })
+    return [df.iloc[i:i + batch_size].reset_index(drop=True) for i in range(0, n, batch_size)]
@@ -0,0 +1,110 @@
+# benchmarks/bench_core.py
+"""Core 热路径：EventEngine 派发、DelayBus 堆、MergedDataset 归并、Order.derive。"""
+from __future__ import annotations
+
+from hft_backtest import DelayBus, Event, EventEngine, FixedDelayModel, MergedDataset, Order
+
+from ._harness import benchmark
+
+
+def _n(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+class _Tick(Event):
+    pass
+
+
+def _engine_put(n_listeners: int):
+    def setup(scale):
+        n = _n(200_000, scale)
+        engine = EventEngine()
+        for _ in range(n_listeners):
+            # 每次都是新的函数对象，不会触发重复注册检查
+            engine.register(_Tick, lambda e: None)
+        events = [_Tick(i + 1) for i in range(n)]
+        put = engine.put
+
+        def run():
+            for e in events:
+                put(e)
+        return run, n
+    return setup
+
+
+benchmark("event_engine.put_drain.listeners=1", group="event_engine", listeners=1)(_engine_put(1))
+benchmark("event_engine.put_drain.listeners=4", group="event_engine", listeners=4)(_engine_put(4))
+
+
+@benchmark("event_engine.cascade", group="event_engine")
+def _engine_cascade(scale):
+    """listener 内部再 put：测 _drain 队列路径（而不是 put 直接触发的 drain）。"""
+    n = _n(100_000, scale)
+    engine = EventEngine()
+
+    class _Echo(Event):
+        pass
+
+    def on_tick(e):
+        engine.put(_Echo(e.timestamp))
+
+    engine.register(_Tick, on_tick)
+    engine.register(_Echo, lambda e: None)
+    events = [_Tick(i + 1) for i in range(n)]
+
+    def run():
+        for e in events:
+            engine.put(e)
+    return run, 2 * n
+
+
+@benchmark("delaybus.push_pop", group="delaybus")
+def _delaybus(scale):
+    n = _n(200_000, scale)
+    src = EventEngine()
+    dst = EventEngine()
+    bus = DelayBus(FixedDelayModel(1_000))
+    bus.set_target_engine(dst)
+    bus.start(src)
+    events = []
+    for i in range(n):
+        e = Event(i + 1)
+        e.source = src._id
+        events.append(e)
+
+    def run():
+        on_event = bus.on_event
+        for e in events:
+            on_event(e)
+        bus.process_until(n + 1_000)
+    return run, n
+
+
+def _merged(k: int):
+    def setup(scale):
+        n = _n(200_000, scale)
+        per = n // k
+        # 每路时间戳交错，保证归并堆每一步都要比较
+        sources = [[Event(j * k + s + 1) for j in range(per)] for s in range(k)]
+
+        def run():
+            for _ in MergedDataset(sources):
+                pass
+        return run, per * k
+    return setup
+
+
+for _k in (2, 8, 32):
+    benchmark(f"merged_dataset.fan_in={_k}", group="merged_dataset", fan_in=_k)(_merged(_k))
+
+
+@benchmark("order.derive", group="order")
+def _order_derive(scale):
+    n = _n(500_000, scale)
+    order = Order.create_limit("BTC-USDT-SWAP", 1.0, 50000.0)
+
+    def run():
+        derive = order.derive
+        for _ in range(n):
+            derive()
+    return run, n
@@ -0,0 +1,189 @@
+# benchmarks/bench_okx.py
+"""OKX：两个 ArrayReader、OKXMatcher（N 个挂单）以及端到端合成回测。"""
+from __future__ import annotations
+
+from hft_backtest import BacktestEngine, DelayBus, EventEngine, FixedDelayModel, MergedDataset, Order, Strategy, Timer
+from hft_backtest.okx.account import OKXAccount
+from hft_backtest.core.factor import FactorSignal
+from hft_backtest.okx.event import OKXBookticker, OKXTrades
+from hft_backtest.okx.factor_evaluator import FactorEvaluator
+from hft_backtest.okx.factor_market_sampler import FactorMarketSampler
+from hft_backtest.okx.label_sampler import OKXLabelSampler
+from hft_backtest.okx.matcher import OKXMatcher
+from hft_backtest.okx.reader import OKXBooktickerArrayReader, OKXTradesArrayReader
+
+from ._harness import benchmark
+from ._synthetic import MID, SYMBOL, TICK, bookticker_frames, trades_frames
+
+
+def _n(base: int, scale: float) -> int:
+    return max(1, int(base * scale))
+
+
+@benchmark("okx.bookticker_reader", group="okx_reader")
+def _bookticker_reader(scale):
+    n = _n(200_000, scale)
+    frames = bookticker_frames(n)
+
+    def run():
+        for _ in OKXBooktickerArrayReader(frames):
+            pass
+    return run, n
+
+
+@benchmark("okx.trades_reader", group="okx_reader")
+def _trades_reader(scale):
+    n = _n(200_000, scale)
+    frames = trades_frames(n)
+
+    def run():
+        for _ in OKXTradesArrayReader(frames):
+            pass
+    return run, n
+
+
+def _ticker(ts: int, mid: float) -> OKXBookticker:
+    t = OKXBookticker(timestamp=ts, symbol=SYMBOL)
+    for i in range(1, 26):
+        spread = (i - 0.5) * TICK
+        setattr(t, f"ask_price_{i}", mid + spread)
+        setattr(t, f"ask_amount_{i}", 10.0)
+        setattr(t, f"bid_price_{i}", mid - spread)
+        setattr(t, f"bid_amount_{i}", 10.0)
+    return t
+
+
+def _matcher_resting(n_orders: int):
+    def setup(scale):
+        n = _n(20_000, scale)
+        engine = EventEngine()
+        matcher = OKXMatcher(SYMBOL)
+        matcher.start(engine)
+        engine.put(_ticker(1, MID))
+        # 挂在盘口之外、永远不会成交的单：每个行情事件都要扫描它们
+        for i in range(n_orders):
+            depth = (i // 2 + 5) * TICK
+            if i % 2 == 0:
+                o = Order.create_limit(SYMBOL, 1.0, MID - depth)
+            else:
+                o = Order.create_limit(SYMBOL, -1.0, MID + depth)
+            o.state = Order.ORDER_STATE_SUBMITTED
+            engine.put(o)
+        events = []
+        for j in range(n):
+            ts = 10 + j
+            if j % 2 == 0:
+                events.append(_ticker(ts, MID))
+            else:
+                events.append(OKXTrades(timestamp=ts, symbol=SYMBOL, trade_id=j, price=MID, size=0.5, side="buy"))
+
+        def run():
+            for e in events:
+                engine.put(e)
+        return run, n
+    return setup
+
+
+for _k in (10, 100, 1000):
+    benchmark(f"okx.matcher.resting={_k}", group="okx_matcher", resting=_k)(_matcher_resting(_k))
+
+
+def _sampler_events(n: int, n_symbols: int = 50):
+    # 多品种盘口，每 4 笔盘口带一个因子，每 10ms 一个 Timer
+    events = []
+    for j in range(n):
+        ts = 1_000 + j
+        sym = f"S{j % n_symbols}"
+        mid = MID + (j % 7) * TICK
+        events.append(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=mid - TICK, ask_price_1=mid + TICK))
+        if j % 4 == 0:
+            f = FactorSignal(sym, float(j % 13), name=f"f{j % 3}")
+            f.timestamp = ts
+            events.append(f)
+        if j % 10 == 0:
+            events.append(Timer(ts))
+    return events
+
+
+@benchmark("okx.factor_market_sampler", group="okx_sampler")
+def _factor_market_sampler(scale):
+    n = _n(200_000, scale)
+    events = _sampler_events(n)
+    engine = EventEngine()
+    FactorMarketSampler(interval_ms=100, max_samples_per_series=1000).start(engine)
+
+    def run():
+        for e in events:
+            engine.put(e)
+    return run, n
+
+
+@benchmark("okx.label_sampler", group="okx_sampler")
+def _label_sampler(scale):
+    n = _n(200_000, scale)
+    events = _sampler_events(n)
+    engine = EventEngine()
+    OKXLabelSampler(max_records=1000).start(engine)
+
+    def run():
+        for e in events:
+            engine.put(e)
+    return run, n
+
+
+@benchmark("okx.factor_evaluator", group="okx_sampler")
+def _factor_evaluator(scale):
+    n = _n(200_000, scale)
+    events = _sampler_events(n)
+    engine = EventEngine()
+    FactorEvaluator(horizons=[0, 50, 500]).start(engine)
+
+    def run():
+        for e in events:
+            engine.put(e)
+    return run, n
+
+
+class _PingPongStrategy(Strategy):
+    """每个 Timer 挂一张贴近盘口的限价单，并撤掉上一张。"""
+
+    def __init__(self, account):
+        super().__init__(account)
+        self.last = None
+        self.mid = MID
+
+    def start(self, engine):
+        super().start(engine)
+        engine.register(Timer, self.on_timer)
+        engine.register(OKXBookticker, self.on_bookticker)
+
+    def on_bookticker(self, event):
+        self.mid = (event.ask_price_1 + event.bid_price_1) * 0.5
+
+    def on_timer(self, timer):
+        if self.last is not None and self.last.order_id in self.account.get_orders():
+            self.send_order(Order.create_cancel(self.last))
+        qty = 1.0 if (timer.timestamp // 10_000) % 2 == 0 else -1.0
+        self.last = Order.create_limit(SYMBOL, qty, round(self.mid - qty * TICK, 1))
+        self.send_order(self.last)
+
+
+@benchmark("backtest.end_to_end", group="backtest")
+def _end_to_end(scale):
+    n = _n(100_000, scale)
+    books = bookticker_frames(n)
+    trades = trades_frames(n)
+
+    def run():
+        dataset = MergedDataset([OKXBooktickerArrayReader(books), OKXTradesArrayReader(trades)])
+        engine = BacktestEngine(
+            dataset, DelayBus(FixedDelayModel(500)), DelayBus(FixedDelayModel(500)), timer_interval=10_000,
+        )
+        server_account = OKXAccount(initial_balance=1_000_000)
+        client_account = OKXAccount(initial_balance=1_000_000)
+        engine.add_component(OKXMatcher(SYMBOL), is_server=True)
+        engine.add_component(server_account, is_server=True)
+        engine.add_component(client_account, is_server=False)
+        engine.add_component(_PingPongStrategy(client_account), is_server=False)
+        engine.run()
+    return run, 2 * n
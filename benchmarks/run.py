@@ -0,0 +1,110 @@
+# benchmarks/run.py
+"""
+基准入口：
+
+    python -m benchmarks.run                         # 全量，结果打印到终端
+    python -m benchmarks.run --quick                 # scale=0.1，冒烟用
+    python -m benchmarks.run -k matcher --out cur.json
+    python -m benchmarks.run --out cur.json --compare base.json --threshold 0.15
+
+`--compare` 按 name 对齐两份 JSON，ns_per_op 变慢超过 threshold 时退出码为 1，
+可直接挂在 CI 上抓 Cython 内核的性能回退。
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import json
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+from . import bench_core, bench_okx  # noqa: F401  (导入即注册)
+from ._harness import measure, registry
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _compare(current: list[dict], baseline_path: Path, threshold: float) -> int:
+    baseline = {r["name"]: r for r in json.loads(baseline_path.read_text())["results"]}
+    regressions = 0
+    print(f"\n{'benchmark':<40} {'base ns/op':>12} {'cur ns/op':>12} {'ratio':>8}")
+    for r in current:
+        b = baseline.get(r["name"])
+        if b is None or not b.get("ns_per_op") or not r.get("ns_per_op"):
+            continue
+        ratio = r["ns_per_op"] / b["ns_per_op"]
+        flag = ""
+        if ratio > 1.0 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1.0 - threshold:
+            flag = "  faster"
+        print(f"{r['name']:<40} {b['ns_per_op']:>12.1f} {r['ns_per_op']:>12.1f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="hft_backtest core benchmarks")
+    parser.add_argument("-k", dest="keyword", default=None, help="只运行 name 包含该子串的 benchmark")
+    parser.add_argument("--scale", type=float, default=1.0, help="数据规模倍数")
+    parser.add_argument("--quick", action="store_true", help="等价于 --scale 0.1 --repeat 2")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", type=Path, default=None, help="结果 JSON 输出路径")
+    parser.add_argument("--compare", type=Path, default=None, help="与之对比的基线 JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="判定回退的相对阈值")
+    parser.add_argument("--list", action="store_true", help="只列出 benchmark 名称")
+    args = parser.parse_args(argv)
+
+    scale, repeat = args.scale, args.repeat
+    if args.quick:
+        scale, repeat = 0.1, 2
+
+    benches = [b for b in registry() if args.keyword is None or args.keyword in b.name]
+    if args.list:
+        for b in benches:
+            print(b.name)
+        return 0
+
+    results = []
+    print(f"{'benchmark':<40} {'n_ops':>9} {'ns/op':>10} {'ops/s':>14}")
+    for b in benches:
+        r = measure(b, scale=scale, repeat=repeat)
+        results.append(r)
+        print(f"{r['name']:<40} {r['n_ops']:>9} {r['ns_per_op']:>10.1f} {r['ops_per_sec']:>14,.0f}")
+
+    report = {
+        "meta": {
+            "git_rev": _git_rev(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created_at": _dt.datetime.now().isoformat(timespec="seconds"),
+            "scale": scale,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    if args.out is not None:
+        args.out.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"\nwritten: {args.out}")
+
+    if args.compare is not None:
+        if _compare(results, args.compare, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
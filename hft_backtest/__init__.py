@@ -1,6 +1,7 @@
 # 先导入基础数据结构
 from .core.event import Event
 from .core.order import Order
+from .core.order_batch import OrderBatch
 from .core.timer import Timer
 
 # 再按照依赖顺序导入组件
@@ -14,9 +15,11 @@ from .core.account import Account
 from .core.recorder import Recorder, TradeRecorder, AccountRecorder, OrderRecorder
 from .core.strategy import Strategy
 from .core.helper import EventPrinter
+from .core.monitor import MemoryMonitor
 from .core.factor import FactorSignal
 from .core.alpha import AlphaSignal
 from .core.factor_sampler import FactorSampler
+from .core.sink import RecordSink
 from .ashare import (
 	AshareAccount,
 	AshareBalanceSheetEvent,
@@ -9,6 +9,8 @@ from .event import (
     AshareStkLimitEvent,
 )
 from .matcher import AshareDailyMatcher
+from .state import AshareSymbolTable
+from .vector import VectorBarBacktest
 
 __all__ = [
     "AshareAccount",
@@ -20,4 +22,6 @@ __all__ = [
     "AshareIncomeEvent",
     "AshareNameChangeEvent",
     "AshareStkLimitEvent",
+    "AshareSymbolTable",
+    "VectorBarBacktest",
 ]
\ No newline at end of file
@@ -5,8 +5,10 @@ from typing import Dict
 from hft_backtest.core.account import Account
 from hft_backtest.core.event_engine import EventEngine
 from hft_backtest.core.order import Order
+from hft_backtest.core.order_batch import OrderBatch
 
 from .event import AshareDailyEvent
+from .state import AshareSymbolTable
 
 
 class AshareAccount(Account):
@@ -17,12 +19,8 @@ class AshareAccount(Account):
         self.allow_short = allow_short
 
         self.order_dict: Dict[int, Order] = {}
-        self.position_qty: Dict[str, float] = {}
-        self.sellable_qty: Dict[str, float] = {}
-        self.market_values: Dict[str, float] = {}
-        self.last_close: Dict[str, float] = {}
-        self.last_pct_chg: Dict[str, float] = {}
-        self.last_trade_date: Dict[str, str] = {}
+        # 持仓 / T+1 可卖 / 市值 / 最新收盘价 / 交易日：按 symbol id 的 C 数组，原地更新
+        self.state = AshareSymbolTable()
 
         self.total_turnover = 0.0
         self.total_commission = 0.0
@@ -30,33 +28,15 @@ class AshareAccount(Account):
 
     def start(self, engine: EventEngine):
         engine.register(Order, self.on_order)
+        engine.register(OrderBatch, self.on_order_batch)
         engine.register(AshareDailyEvent, self.on_daily)
 
     def stop(self):
         pass
 
     def on_daily(self, event: AshareDailyEvent):
-        symbol = event.ts_code
-        close_price = getattr(event, "close", None)
-        pct_chg = getattr(event, "pct_chg", None)
-        trade_date = str(getattr(event, "trade_date", ""))
-
-        # T+1 规则：进入新交易日后，上一日持仓转为可卖仓位。
-        if trade_date and self.last_trade_date.get(symbol) != trade_date:
-            position = self.position_qty.get(symbol, 0.0)
-            if position > 1e-12:
-                self.sellable_qty[symbol] = position
-            else:
-                self.sellable_qty.pop(symbol, None)
-            self.last_trade_date[symbol] = trade_date
-
-        if close_price is not None:
-            self.last_close[symbol] = float(close_price)
-        pct_chg_value = 0.0 if pct_chg is None else float(pct_chg)
-        self.last_pct_chg[symbol] = pct_chg_value
-
-        if symbol in self.market_values:
-            self.market_values[symbol] *= 1.0 + pct_chg_value / 100.0
+        state = self.state
+        state.on_daily(state.intern(event.ts_code), event.trade_date, event.close, event.pct_chg)
 
     def on_order(self, order: Order):
         if order.is_cancel_order:
@@ -74,67 +54,76 @@ class AshareAccount(Account):
             return
 
         self.order_dict.pop(order.order_id, None)
-        symbol = order.symbol
-        qty = float(order.quantity)
-        prev_qty = self.position_qty.get(symbol, 0.0)
-        prev_value = self.market_values.get(symbol, 0.0)
-        new_qty = prev_qty + qty
-
-        # 防御性校验：正常路径由 matcher 预先阻断，这里只兜底异常状态。
-        if not self.allow_short and new_qty < -1e-12:
-            raise RuntimeError(f"Unexpected negative position in ledger: {symbol}")
-
-        trade_notional = qty * float(order.filled_price)
+        self._apply_fill(order.symbol, float(order.quantity), float(order.filled_price), float(order.commission_fee))
+
+    def on_order_batch(self, batch: OrderBatch):
+        # 按行顺序应用，与逐笔 on_order 结果一致；成交行直接读列，不构造 Order
+        states = batch.states.tolist()
+        types = batch.order_types.tolist()
+        order_ids = batch.order_ids.tolist()
+        quantities = batch.quantities.tolist()
+        filled_prices = batch.filled_prices.tolist()
+        fees = batch.commission_fees.tolist()
+        symbols = batch.symbols
+        for i, state in enumerate(states):
+            if types[i] == Order.ORDER_TYPE_CANCEL:
+                continue
+            if state == Order.ORDER_STATE_FILLED:
+                self.order_dict.pop(order_ids[i], None)
+                self._apply_fill(symbols[i], quantities[i], filled_prices[i], fees[i])
+            elif state == Order.ORDER_STATE_SUBMITTED or state == Order.ORDER_STATE_RECEIVED:
+                self.order_dict[order_ids[i]] = batch.order_at(i)
+            elif state == Order.ORDER_STATE_CANCELED or state == Order.ORDER_STATE_REJECTED:
+                self.order_dict.pop(order_ids[i], None)
+
+    def _apply_fill(self, symbol: str, qty: float, filled_price: float, commission_fee: float):
+        state = self.state
+        state.apply_fill(state.intern(symbol), qty, filled_price, self.allow_short)
+
+        trade_notional = qty * filled_price
         self.cash_balance -= trade_notional
-        self.cash_balance -= float(order.commission_fee)
+        self.cash_balance -= commission_fee
         self.total_turnover += abs(trade_notional)
-        self.total_commission += float(order.commission_fee)
+        self.total_commission += commission_fee
         self.total_trade_count += 1
 
-        if qty > 0:
-            valuation_price = self.last_close.get(symbol, float(order.filled_price))
-            new_value = prev_value + qty * valuation_price
-        elif qty < 0 and prev_qty > 0:
-            sell_qty = min(-qty, prev_qty)
-            reduction_ratio = sell_qty / prev_qty
-            new_value = prev_value * (1.0 - reduction_ratio)
-            if symbol in self.sellable_qty:
-                left = self.sellable_qty[symbol] - sell_qty
-                if left <= 1e-12:
-                    self.sellable_qty.pop(symbol, None)
-                else:
-                    self.sellable_qty[symbol] = left
-        else:
-            new_value = prev_value
-
-        if abs(new_qty) < 1e-12:
-            self.position_qty.pop(symbol, None)
-            self.sellable_qty.pop(symbol, None)
-            self.market_values.pop(symbol, None)
-        else:
-            self.position_qty[symbol] = new_qty
-            self.market_values[symbol] = new_value
+    # 按品种明细的只读快照（热路径不要用）
+    @property
+    def position_qty(self) -> Dict[str, float]:
+        return self.state.positions()
+
+    @property
+    def sellable_qty(self) -> Dict[str, float]:
+        return self.state.sellables()
+
+    @property
+    def market_values(self) -> Dict[str, float]:
+        return self.state.market_values()
+
+    @property
+    def last_close(self) -> Dict[str, float]:
+        return self.state.last_closes()
 
     def get_position_qty(self, symbol: str) -> float:
-        return float(self.position_qty.get(symbol, 0.0))
+        return self.state.get_position(symbol)
 
     def get_sellable_qty(self, symbol: str) -> float:
-        return float(self.sellable_qty.get(symbol, 0.0))
+        return self.state.get_sellable(symbol)
 
     def get_positions(self):
-        return self.position_qty.copy()
+        return self.state.positions()
 
     def get_orders(self):
         return self.order_dict.copy()
 
     def get_prices(self):
-        return self.last_close.copy()
+        return self.state.last_closes()
 
     def get_balance(self):
         return self.cash_balance
 
     def get_equity(self):
-        return self.cash_balance + sum(self.market_values.values())
+        return self.cash_balance + self.state.get_market_value()
 
     def get_total_turnover(self):
         return self.total_turnover
@@ -152,4 +141,4 @@ class AshareAccount(Account):
         return self.total_trade_count
 
     def get_market_value(self):
-        return sum(self.market_values.values())
\ No newline at end of file
+        return self.state.get_market_value()
\ No newline at end of file
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, Iterable, List
 
+import numpy as np
 from hft_backtest.core.event_engine import EventEngine
 from hft_backtest.core.matcher import MatchEngine
 from hft_backtest.core.order import Order
+from hft_backtest.core.order_batch import OrderBatch
 
 from .account import AshareAccount
 from .event import AshareDailyEvent, AshareStkLimitEvent
+from .state import AshareSymbolTable
 
 
 class AshareDailyMatcher(MatchEngine):
@@ -31,15 +34,21 @@ class AshareDailyMatcher(MatchEngine):
         self.enforce_integer_lot = enforce_integer_lot
         self.event_engine = None
         self.active_orders: Dict[str, Dict[int, Order]] = defaultdict(dict)
+        # order_id -> symbol，撤单时直接定位，不再遍历全部品种
+        self.order_symbol: Dict[int, str] = {}
         self.order_meta: Dict[int, dict] = {}
         self.order_reserved_sell: Dict[int, float] = {}
         self.symbol_reserved_sell: Dict[str, float] = defaultdict(float)
         self.latest_daily: Dict[str, AshareDailyEvent] = {}
-        self.latest_limits: Dict[str, dict] = {}
+        # 最新涨跌停按 symbol id 存在 C 数组里（NaN 表示该侧未知）
+        self.limits = AshareSymbolTable()
+        # 处理 OrderBatch 期间回报先收集在这里，结束后合并成一个 OrderBatch 发出
+        self._batch_reports: List[Order] | None = None
 
     def start(self, engine: EventEngine):
         self.event_engine = engine
         engine.register(Order, self.on_order)
+        engine.register(OrderBatch, self.on_order_batch)
         engine.register(AshareStkLimitEvent, self.on_stk_limit)
         engine.register(AshareDailyEvent, self.on_daily)
 
@@ -47,11 +56,8 @@ class AshareDailyMatcher(MatchEngine):
         pass
 
     def on_stk_limit(self, event: AshareStkLimitEvent):
-        self.latest_limits[event.ts_code] = {
-            "timestamp": event.timestamp,
-            "up_limit": getattr(event, "up_limit", None),
-            "down_limit": getattr(event, "down_limit", None),
-        }
+        limits = self.limits
+        limits.set_limits(limits.intern(event.ts_code), event.up_limit, event.down_limit)
 
     def on_order(self, order: Order):
         if order.is_cancel_order:
@@ -66,40 +72,139 @@ class AshareDailyMatcher(MatchEngine):
             return
 
         if order.quantity < 0 and not self.account.allow_short:
-            if not self._reserve_sell_capacity(order):
+            if not self._reserve_sell_capacity(order.order_id, order.symbol, -float(order.quantity)):
                 self._cancel_submitted_order(order)
                 return
 
         received = order.derive()
         received.state = Order.ORDER_STATE_RECEIVED
+        latest_daily = self._accept(received)
+        self._emit(received)
+
+        if self.fill_mode == "close":
+            self._try_fill_symbol(received.symbol, latest_daily)
+
+    def on_order_batch(self, batch: OrderBatch):
+        """
+        一次处理整批：整手 / 可卖检查直接读列数组，只为回报行构造 Order。
+        close 模式下同一品种的撮合在整批入簿后只做一次；遇到撤单行时先把之前的撮合做完，
+        保证撤单看到的挂单状态与逐笔下单一致。回报合并成一个 OrderBatch 发出。
+        """
+        n = len(batch)
+        if n == 0:
+            return
+        types = batch.order_types.tolist()
+        states = batch.states.tolist()
+        order_ids = batch.order_ids.tolist()
+        quantities = batch.quantities.tolist()
+        symbols = batch.symbols
+        bad_lot = None
+        if self.enforce_integer_lot:
+            q = batch.quantities
+            bad_lot = (np.abs(q - np.round(q)) >= 1e-12).tolist()
+        check_sell = not self.account.allow_short
+        close_mode = self.fill_mode == "close"
+        # 待撮合的品种 -> 最新日线（保持插入顺序）
+        to_fill: Dict[str, AshareDailyEvent | None] = {}
+
+        reports = self._batch_reports = []
+        try:
+            for i in range(n):
+                if types[i] == Order.ORDER_TYPE_CANCEL:
+                    self._fill_symbols(to_fill)
+                    self._cancel_order(order_ids[i])
+                    continue
+                if states[i] != Order.ORDER_STATE_SUBMITTED:
+                    continue
+                symbol = symbols[i]
+                qty = quantities[i]
+                if (bad_lot is not None and bad_lot[i]) or (
+                    check_sell and qty < 0 and not self._reserve_sell_capacity(order_ids[i], symbol, -qty)
+                ):
+                    report = batch.order_at(i)
+                    report.state = Order.ORDER_STATE_CANCELED
+                    self._emit(report)
+                    continue
+
+                received = batch.order_at(i)
+                received.state = Order.ORDER_STATE_RECEIVED
+                latest_daily = self._accept(received)
+                self._emit(received)
+                if close_mode:
+                    to_fill[symbol] = latest_daily
+            self._fill_symbols(to_fill)
+        finally:
+            self._batch_reports = None
+        if reports:
+            self.event_engine.put(OrderBatch.from_orders(reports))
+
+    def _accept(self, received: Order) -> AshareDailyEvent | None:
+        """RECEIVED 订单入簿，返回该品种的最新日线"""
         self.active_orders[received.symbol][received.order_id] = received
+        self.order_symbol[received.order_id] = received.symbol
         latest_daily = self.latest_daily.get(received.symbol)
         self.order_meta[received.order_id] = {
             "eligible_after": latest_daily.timestamp if latest_daily is not None else -1,
         }
-        self.event_engine.put(received)
+        return latest_daily
 
-        if self.fill_mode == "close":
-            self._try_fill_symbol(received.symbol, latest_daily)
+    def _fill_symbols(self, to_fill: Dict[str, AshareDailyEvent | None]):
+        for symbol, latest_daily in to_fill.items():
+            self._try_fill_symbol(symbol, latest_daily)
+        to_fill.clear()
+
+    def _emit(self, report: Order):
+        if self._batch_reports is not None:
+            self._batch_reports.append(report)
+        else:
+            self.event_engine.put(report)
 
     def on_daily(self, event: AshareDailyEvent):
         self.latest_daily[event.ts_code] = event
         self._try_fill_symbol(event.ts_code, event)
 
     def _cancel_order(self, order_id: int):
-        for symbol, orders in list(self.active_orders.items()):
-            existing = orders.pop(order_id, None)
-            if existing is None:
-                continue
-            report = existing.derive()
-            report.order_type = Order.ORDER_TYPE_LIMIT
-            report.state = Order.ORDER_STATE_CANCELED
-            self._release_sell_reservation(order_id, symbol)
-            self.order_meta.pop(order_id, None)
-            self.event_engine.put(report)
-            if not orders:
-                self.active_orders.pop(symbol, None)
-            return
+        report = self._pop_cancel_report(order_id)
+        if report is not None:
+            self._emit(report)
+
+    def cancel_orders(self, order_ids: Iterable[int]) -> int:
+        """
+        批量撤单：先把所有命中的挂单摘掉，再统一发出撤单回报。
+        不存在（已成交/已撤）的 id 直接忽略，返回实际撤掉的数量。
+        """
+        reports: List[Order] = []
+        for order_id in order_ids:
+            report = self._pop_cancel_report(order_id)
+            if report is not None:
+                reports.append(report)
+        for report in reports:
+            self._emit(report)
+        return len(reports)
+
+    def _pop_cancel_report(self, order_id: int) -> Order | None:
+        symbol = self.order_symbol.get(order_id)
+        if symbol is None:
+            return None
+        existing = self._remove_active(symbol, order_id)
+        if existing is None:
+            return None
+        report = existing.derive()
+        report.order_type = Order.ORDER_TYPE_LIMIT
+        report.state = Order.ORDER_STATE_CANCELED
+        self._release_sell_reservation(order_id, symbol)
+        return report
+
+    def _remove_active(self, symbol: str, order_id: int) -> Order | None:
+        self.order_symbol.pop(order_id, None)
+        self.order_meta.pop(order_id, None)
+        orders = self.active_orders.get(symbol)
+        if orders is None:
+            return None
+        existing = orders.pop(order_id, None)
+        if not orders:
+            self.active_orders.pop(symbol, None)
+        return existing
 
     def _try_fill_symbol(self, symbol: str, market_event: AshareDailyEvent | None):
         if market_event is None:
@@ -159,28 +264,17 @@ class AshareDailyMatcher(MatchEngine):
         return fill_price >= order.price
 
     def _is_tradeable_price(self, symbol: str, fill_price: float) -> bool:
-        limits = self.latest_limits.get(symbol)
-        if limits is None:
-            return fill_price > 0
-        up_limit = limits.get("up_limit")
-        down_limit = limits.get("down_limit")
-        if up_limit is not None and fill_price > float(up_limit):
-            return False
-        if down_limit is not None and fill_price < float(down_limit):
-            return False
-        return fill_price > 0
+        limits = self.limits
+        return limits.tradeable_price(limits.index_of(symbol), fill_price)
 
     def _is_price_limit_invalid(self, order: Order) -> str | None:
         if order.is_market_order:
             return None
-        limits = self.latest_limits.get(order.symbol)
-        if limits is None:
-            return None
-        up_limit = limits.get("up_limit")
-        down_limit = limits.get("down_limit")
-        if up_limit is not None and order.price > float(up_limit):
-            return "order price is above up_limit"
-        if down_limit is not None and order.price < float(down_limit):
+        limits = self.limits
+        if limits.limit_price_invalid(limits.index_of(order.symbol), order.price):
+            up_limit, _ = limits.get_limits(order.symbol)
+            if up_limit is not None and order.price > up_limit:
+                return "order price is above up_limit"
             return "order price is below down_limit"
         return None
 
@@ -194,37 +288,29 @@ class AshareDailyMatcher(MatchEngine):
             commission += notional * self.stamp_tax_rate
         report.commission_fee = commission
         self._release_sell_reservation(order.order_id, order.symbol)
-        self.active_orders[order.symbol].pop(order.order_id, None)
-        if not self.active_orders[order.symbol]:
-            self.active_orders.pop(order.symbol, None)
-        self.order_meta.pop(order.order_id, None)
-        self.event_engine.put(report)
+        self._remove_active(order.symbol, order.order_id)
+        self._emit(report)
 
     def _cancel_invalid_order(self, order: Order):
         report = order.derive()
         report.state = Order.ORDER_STATE_CANCELED
         self._release_sell_reservation(order.order_id, order.symbol)
-        self.active_orders[order.symbol].pop(order.order_id, None)
-        if not self.active_orders[order.symbol]:
-            self.active_orders.pop(order.symbol, None)
-        self.order_meta.pop(order.order_id, None)
-        self.event_engine.put(report)
+        self._remove_active(order.symbol, order.order_id)
+        self._emit(report)
 
     def _cancel_submitted_order(self, order: Order):
         report = order.derive()
         report.state = Order.ORDER_STATE_CANCELED
-        self.event_engine.put(report)
+        self._emit(report)
 
-    def _reserve_sell_capacity(self, order: Order) -> bool:
+    def _reserve_sell_capacity(self, order_id: int, symbol: str, need: float) -> bool:
         # 规则解释：卖单在提交阶段先占用可卖仓位，防止同一时刻多单超卖。
-        need = -float(order.quantity)
-        symbol = order.symbol
         sellable = self.account.get_sellable_qty(symbol)
         reserved = self.symbol_reserved_sell.get(symbol, 0.0)
         available = sellable - reserved
         if need > available + 1e-12:
             return False
-        self.order_reserved_sell[order.order_id] = need
+        self.order_reserved_sell[order_id] = need
         self.symbol_reserved_sell[symbol] = reserved + need
         return True
 
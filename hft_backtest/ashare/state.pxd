@@ -0,0 +1,36 @@
+# cython: language_level=3
+
+# 单个 A 股品种的日线状态，按 symbol id 存在连续数组里
+cdef struct AshareSymbolState:
+    double up_limit        # NaN 表示未知
+    double down_limit
+    double last_close      # NaN 表示还没有收盘价
+    double pct_chg
+    double position
+    double sellable        # T+1 可卖仓位
+    double market_value
+    long long trade_date   # 交易日键，NO_TRADE_DATE 表示还没见过
+
+cdef class AshareSymbolTable:
+    cdef dict _sym_index           # {symbol: symbol_id}
+    cdef list _symbols             # [symbol]，下标即 symbol_id
+    cdef AshareSymbolState* _states
+    cdef Py_ssize_t _n_sym
+    cdef Py_ssize_t _cap_sym
+    cdef double _market_value      # Σ market_value，增量维护
+    cdef Py_ssize_t _n_open        # 非零持仓的品种数
+
+    cpdef Py_ssize_t intern(self, str symbol) except -1
+    cpdef Py_ssize_t index_of(self, str symbol)
+
+    cpdef void set_limits(self, Py_ssize_t sid, object up_limit, object down_limit)
+    cpdef bint limit_price_invalid(self, Py_ssize_t sid, double price)
+    cpdef bint tradeable_price(self, Py_ssize_t sid, double price)
+
+    cpdef void on_daily(self, Py_ssize_t sid, object trade_date, object close, object pct_chg)
+    cpdef void apply_fill(self, Py_ssize_t sid, double qty, double fill_price, bint allow_short) except *
+
+    cpdef double get_position(self, str symbol)
+    cpdef double get_sellable(self, str symbol)
+    cpdef double get_market_value(self)
+    cdef void _set_market_value(self, AshareSymbolState* st, double value)
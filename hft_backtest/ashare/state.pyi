@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+class AshareSymbolTable:
+    """
+    A 股日线的按品种状态表（涨跌停、最新收盘价、持仓、T+1 可卖、持仓市值、交易日），
+    按 symbol id 存在连续的 C 结构体数组里，原地更新。
+    """
+
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def symbols(self) -> List[str]: ...
+
+    def intern(self, symbol: str) -> int:
+        """symbol -> 下标，首次出现时分配"""
+        ...
+    def index_of(self, symbol: str) -> int:
+        """没见过的品种返回 -1"""
+        ...
+
+    def set_limits(self, sid: int, up_limit: Optional[float], down_limit: Optional[float]) -> None: ...
+    def limit_price_invalid(self, sid: int, price: float) -> bool: ...
+    def tradeable_price(self, sid: int, price: float) -> bool: ...
+
+    def on_daily(self, sid: int, trade_date: Any, close: Optional[float], pct_chg: Optional[float]) -> None:
+        """T+1 滚动、最新收盘价、按 pct_chg 更新持仓市值"""
+        ...
+    def apply_fill(self, sid: int, qty: float, fill_price: float, allow_short: bool) -> None: ...
+
+    def get_position(self, symbol: str) -> float: ...
+    def get_sellable(self, symbol: str) -> float: ...
+    def get_market_value(self) -> float: ...
+    def get_limits(self, symbol: str) -> Tuple[Optional[float], Optional[float]]: ...
+
+    def positions(self) -> Dict[str, float]: ...
+    def sellables(self) -> Dict[str, float]: ...
+    def market_values(self) -> Dict[str, float]: ...
+    def last_closes(self) -> Dict[str, float]: ...
+    def memory_footprint(self) -> Dict[str, int]: ...
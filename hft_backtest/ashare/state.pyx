@@ -0,0 +1,237 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from libc.stdlib cimport realloc, free
+from libc.math cimport NAN, isnan, fabs
+from libc.limits cimport LLONG_MIN
+
+cdef double _EPS = 1e-12
+
+cdef enum:
+    # trade_date 的两个特殊键
+    NO_TRADE_DATE = -1          # 还没见过交易日（构造时的初始值）
+    SKIP_TRADE_DATE = -2        # 事件没有交易日（空串），不做 T+1 滚动
+
+
+cdef inline long long _trade_date_key(object value) except? LLONG_MIN:
+    """
+    交易日 -> 整数键，与原来 str(trade_date) 的比较语义一致：
+    "20240101" / 20240101 得到同一个键，空串不滚动，其他值按字符串哈希。
+    """
+    cdef long long key
+    cdef str text
+    if type(value) is int:
+        key = value
+    else:
+        text = value if type(value) is str else str(value)
+        if not text:
+            return SKIP_TRADE_DATE
+        if len(text) <= 18 and text.isdigit():
+            key = int(text)
+        else:
+            key = hash(text)
+    # 避开两个特殊键
+    if key == NO_TRADE_DATE or key == SKIP_TRADE_DATE:
+        key -= 2
+    return key
+
+
+cdef inline double _as_double(object value):
+    """None -> NaN，其余按 float 转换（日线字段可能是 float / numpy 标量 / None）"""
+    if value is None:
+        return NAN
+    return <double>value
+
+
+cdef class AshareSymbolTable:
+    """
+    A 股日线的按品种状态表：涨跌停、最新收盘价、持仓、T+1 可卖、持仓市值和交易日，
+    按 symbol id 存在连续的 C 结构体数组里，原地更新；全账户持仓市值增量维护。
+    AshareDailyMatcher（涨跌停）和 AshareAccount（其余字段）各持有一份。
+    """
+
+    def __cinit__(self):
+        self._states = NULL
+        self._n_sym = 0
+        self._cap_sym = 0
+
+    def __dealloc__(self):
+        if self._states != NULL:
+            free(self._states)
+
+    def __init__(self):
+        self._sym_index = {}
+        self._symbols = []
+        self._market_value = 0.0
+        self._n_open = 0
+
+    def __len__(self):
+        return self._n_sym
+
+    @property
+    def symbols(self):
+        return list(self._symbols)
+
+    cpdef Py_ssize_t intern(self, str symbol) except -1:
+        """symbol -> 下标，首次出现时分配一格。注意：扩容后之前取到的指针失效"""
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t new_cap
+        cdef AshareSymbolState* buf
+        cdef AshareSymbolState* st
+        if self._n_sym == self._cap_sym:
+            new_cap = 8 if self._cap_sym == 0 else self._cap_sym * 2
+            buf = <AshareSymbolState*>realloc(self._states, new_cap * sizeof(AshareSymbolState))
+            if buf == NULL:
+                raise MemoryError()
+            self._states = buf
+            self._cap_sym = new_cap
+        st = &self._states[self._n_sym]
+        st.up_limit = NAN
+        st.down_limit = NAN
+        st.last_close = NAN
+        st.pct_chg = 0.0
+        st.position = 0.0
+        st.sellable = 0.0
+        st.market_value = 0.0
+        st.trade_date = NO_TRADE_DATE
+        self._sym_index[symbol] = self._n_sym
+        self._symbols.append(symbol)
+        self._n_sym += 1
+        return self._n_sym - 1
+
+    cpdef Py_ssize_t index_of(self, str symbol):
+        """没见过的品种返回 -1，不分配"""
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is None:
+            return -1
+        return <Py_ssize_t>idx
+
+    # ==========================
+    # 涨跌停
+    # ==========================
+
+    cpdef void set_limits(self, Py_ssize_t sid, object up_limit, object down_limit):
+        cdef AshareSymbolState* st = &self._states[sid]
+        st.up_limit = _as_double(up_limit)
+        st.down_limit = _as_double(down_limit)
+
+    cpdef bint limit_price_invalid(self, Py_ssize_t sid, double price):
+        """限价超出最新涨跌停（未知的一侧不限制）"""
+        if sid < 0:
+            return False
+        cdef AshareSymbolState* st = &self._states[sid]
+        return price > st.up_limit or price < st.down_limit
+
+    cpdef bint tradeable_price(self, Py_ssize_t sid, double price):
+        if sid >= 0:
+            if price > self._states[sid].up_limit or price < self._states[sid].down_limit:
+                return False
+        return price > 0
+
+    # ==========================
+    # 行情 / 成交
+    # ==========================
+
+    cpdef void on_daily(self, Py_ssize_t sid, object trade_date, object close, object pct_chg):
+        cdef AshareSymbolState* st = &self._states[sid]
+        cdef long long key = _trade_date_key(trade_date)
+        # T+1 规则：进入新交易日后，上一日持仓转为可卖仓位。
+        if key != SKIP_TRADE_DATE and key != st.trade_date:
+            st.sellable = st.position if st.position > _EPS else 0.0
+            st.trade_date = key
+
+        if close is not None:
+            st.last_close = <double>close
+        st.pct_chg = 0.0 if pct_chg is None else <double>pct_chg
+
+        if st.position != 0.0:
+            self._set_market_value(st, st.market_value * (1.0 + st.pct_chg / 100.0))
+
+    cpdef void apply_fill(self, Py_ssize_t sid, double qty, double fill_price, bint allow_short) except *:
+        cdef AshareSymbolState* st = &self._states[sid]
+        cdef double prev_qty = st.position
+        cdef double new_qty = prev_qty + qty
+        cdef double new_value = st.market_value
+        cdef double sell_qty
+
+        # 防御性校验：正常路径由 matcher 预先阻断，这里只兜底异常状态。
+        if not allow_short and new_qty < -_EPS:
+            raise RuntimeError(f"Unexpected negative position in ledger: {self._symbols[sid]}")
+
+        if qty > 0:
+            new_value += qty * (fill_price if isnan(st.last_close) else st.last_close)
+        elif qty < 0 and prev_qty > 0:
+            sell_qty = -qty if -qty < prev_qty else prev_qty
+            new_value *= 1.0 - sell_qty / prev_qty
+            st.sellable -= sell_qty
+            if st.sellable <= _EPS:
+                st.sellable = 0.0
+
+        if fabs(new_qty) < _EPS:
+            if prev_qty != 0.0:
+                self._n_open -= 1
+            st.position = 0.0
+            st.sellable = 0.0
+            self._set_market_value(st, 0.0)
+            if self._n_open == 0:
+                # 清仓时消掉浮点累积误差
+                self._market_value = 0.0
+        else:
+            if prev_qty == 0.0:
+                self._n_open += 1
+            st.position = new_qty
+            self._set_market_value(st, new_value)
+
+    cdef void _set_market_value(self, AshareSymbolState* st, double value):
+        self._market_value += value - st.market_value
+        st.market_value = value
+
+    # ==========================
+    # 查询
+    # ==========================
+
+    cpdef double get_position(self, str symbol):
+        cdef Py_ssize_t sid = self.index_of(symbol)
+        return 0.0 if sid < 0 else self._states[sid].position
+
+    cpdef double get_sellable(self, str symbol):
+        cdef Py_ssize_t sid = self.index_of(symbol)
+        return 0.0 if sid < 0 else self._states[sid].sellable
+
+    cpdef double get_market_value(self):
+        return self._market_value
+
+    def get_limits(self, str symbol):
+        """(up_limit, down_limit)，未知为 None"""
+        cdef Py_ssize_t sid = self.index_of(symbol)
+        if sid < 0:
+            return None, None
+        cdef AshareSymbolState* st = &self._states[sid]
+        return (
+            None if isnan(st.up_limit) else st.up_limit,
+            None if isnan(st.down_limit) else st.down_limit,
+        )
+
+    def positions(self):
+        cdef Py_ssize_t i
+        return {self._symbols[i]: self._states[i].position for i in range(self._n_sym) if self._states[i].position != 0.0}
+
+    def sellables(self):
+        cdef Py_ssize_t i
+        return {self._symbols[i]: self._states[i].sellable for i in range(self._n_sym) if self._states[i].sellable != 0.0}
+
+    def market_values(self):
+        cdef Py_ssize_t i
+        return {self._symbols[i]: self._states[i].market_value for i in range(self._n_sym) if self._states[i].position != 0.0}
+
+    def last_closes(self):
+        cdef Py_ssize_t i
+        return {self._symbols[i]: self._states[i].last_close for i in range(self._n_sym) if not isnan(self._states[i].last_close)}
+
+    def memory_footprint(self):
+        """MemoryMonitor 协议"""
+        return {"symbols": self._n_sym, "state_bytes": self._cap_sym * sizeof(AshareSymbolState)}
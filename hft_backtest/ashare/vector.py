@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+_EPS = 1e-12
+
+# strategy(step, backtest) -> (quantity[N], price[N]) 或 None；price 为 NaN 表示市价单
+VectorStrategy = Callable[[int, "VectorBarBacktest"], Optional[Tuple[np.ndarray, np.ndarray]]]
+
+
+class VectorBarBacktest:
+    """
+    截面向量化 K 线回测：按时间步推进，每一步对 (symbols,) 向量一次性完成
+    T+1 可卖更新、涨跌停检查、撮合和手续费计算，不经过 EventEngine 逐事件分发。
+
+    规则与 AshareDailyMatcher + AshareAccount 保持一致，便于做等价性对照：
+    - fill_mode="close"：本步提交的订单及挂单按本步收盘价撮合；
+      fill_mode="next_open"：订单从下一步起按开盘价撮合；
+    - 限价单价格超出最新涨跌停 -> 撤单；成交价超出涨跌停 -> 继续挂着；
+    - 不允许做空时，卖单数量超过可卖仓位 -> 撤单；T+1：进入新交易日时昨日持仓转为可卖；
+    - 手续费 = max(成交额 * commission_rate, min_commission)，卖出另加印花税；
+    - 持仓市值按 pct_chg 复利更新（与 AshareAccount 一致，拆分送转日不失真）。
+
+    与事件驱动版本的差异：每个品种同一时刻最多一张工作订单，新订单会替换该品种的旧挂单。
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        close: np.ndarray,
+        open: Optional[np.ndarray] = None,
+        pct_chg: Optional[np.ndarray] = None,
+        up_limit: Optional[np.ndarray] = None,
+        down_limit: Optional[np.ndarray] = None,
+        timestamps: Optional[Sequence[int]] = None,
+        initial_balance: float = 0.0,
+        fill_mode: str = "close",
+        commission_rate: float = 0.0003,
+        stamp_tax_rate: float = 0.001,
+        min_commission: float = 5.0,
+        allow_short: bool = False,
+        t_plus_one: bool = True,
+        enforce_integer_lot: bool = False,
+    ):
+        if fill_mode not in {"close", "next_open"}:
+            raise ValueError("fill_mode must be either 'close' or 'next_open'")
+        self.symbols = list(symbols)
+        self.close = np.asarray(close, dtype=np.float64)
+        n_steps, n_symbols = self.close.shape
+        if n_symbols != len(self.symbols):
+            raise ValueError(f"close has {n_symbols} columns but {len(self.symbols)} symbols were given")
+        if fill_mode == "next_open" and open is None:
+            raise ValueError("fill_mode='next_open' requires the open matrix")
+
+        nan = np.full((n_steps, n_symbols), np.nan)
+        self.open = nan if open is None else np.asarray(open, dtype=np.float64)
+        self.pct_chg = self._default_pct_chg() if pct_chg is None else np.asarray(pct_chg, dtype=np.float64)
+        self.up_limit = nan if up_limit is None else np.asarray(up_limit, dtype=np.float64)
+        self.down_limit = nan if down_limit is None else np.asarray(down_limit, dtype=np.float64)
+        for name in ("open", "pct_chg", "up_limit", "down_limit"):
+            if getattr(self, name).shape != self.close.shape:
+                raise ValueError(f"{name} must have shape {self.close.shape}")
+        self.timestamps = np.arange(n_steps) if timestamps is None else np.asarray(timestamps)
+
+        self.initial_balance = float(initial_balance)
+        self.fill_mode = fill_mode
+        self.commission_rate = commission_rate
+        self.stamp_tax_rate = stamp_tax_rate
+        self.min_commission = min_commission
+        self.allow_short = allow_short
+        self.t_plus_one = t_plus_one
+        self.enforce_integer_lot = enforce_integer_lot
+        self.symbol_index: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        self.reset()
+
+    @classmethod
+    def from_frame(cls, df, symbol_col: str = "ts_code", time_col: str = "trade_date", **kwargs) -> "VectorBarBacktest":
+        """
+        从长表（每行一个 symbol-时间）构造。
+        识别的列：close（必需）、open、pct_chg、up_limit、down_limit；缺失的品种-时间为 NaN。
+        """
+        wide = {}
+        for name in ("close", "open", "pct_chg", "up_limit", "down_limit"):
+            if name in df.columns:
+                wide[name] = df.pivot_table(index=time_col, columns=symbol_col, values=name, aggfunc="last")
+        close = wide["close"].sort_index()
+        index, columns = close.index, close.columns
+        matrices = {name: frame.reindex(index=index, columns=columns).to_numpy(dtype=np.float64) for name, frame in wide.items()}
+        return cls([str(c) for c in columns], timestamps=index.to_numpy(), **matrices, **kwargs)
+
+    def _default_pct_chg(self) -> np.ndarray:
+        # 没有 pct_chg 时按相邻收盘价推算（首个有效值为 0）
+        prev = np.full_like(self.close, np.nan)
+        last = np.full(self.close.shape[1], np.nan)
+        for t in range(self.close.shape[0]):
+            prev[t] = last
+            row = self.close[t]
+            last = np.where(np.isnan(row), last, row)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = (self.close / prev - 1.0) * 100.0
+        return np.where(np.isnan(pct), 0.0, pct)
+
+    # ==========================
+    # 状态
+    # ==========================
+
+    def reset(self):
+        n = len(self.symbols)
+        self.step = -1
+        self.cash_balance = self.initial_balance
+        self.position = np.zeros(n)
+        self.sellable = np.zeros(n)
+        self.market_value = np.zeros(n)
+        self.last_close = np.full(n, np.nan)
+        self.cur_up = np.full(n, np.nan)
+        self.cur_down = np.full(n, np.nan)
+
+        # 每个品种一张工作订单：数量为 0 表示没有
+        self.order_qty = np.zeros(n)
+        self.order_price = np.full(n, np.nan)
+        self.order_step = np.full(n, -1, dtype=np.int64)
+
+        self.total_turnover = 0.0
+        self.total_commission = 0.0
+        self.total_trade_count = 0
+        self.total_cancel_count = 0
+        self.equity_curve = np.full(len(self.timestamps), np.nan)
+        self._trades = []
+
+    def run(self, strategy: VectorStrategy) -> "VectorBarBacktest":
+        self.reset()
+        next_open = self.fill_mode == "next_open"
+        for t in range(self.close.shape[0]):
+            self.step = t
+            self._roll(t)
+            if next_open:
+                self._match(t, self.open[t], self.order_step < t)
+            orders = strategy(t, self)
+            if orders is not None:
+                self.submit(*orders)
+            if not next_open:
+                self._match(t, self.close[t], self.order_qty != 0)
+            self.equity_curve[t] = self.get_equity()
+        return self
+
+    def _roll(self, t: int):
+        """行情到达：T+1 可卖、最新收盘价、涨跌停、持仓市值"""
+        close = self.close[t]
+        valid = ~np.isnan(close)
+        held = valid & (np.abs(self.position) > _EPS)
+        if self.t_plus_one:
+            self.sellable = np.where(valid, np.where(self.position > _EPS, self.position, 0.0), self.sellable)
+        self.last_close = np.where(valid, close, self.last_close)
+        up, down = self.up_limit[t], self.down_limit[t]
+        self.cur_up = np.where(np.isnan(up), self.cur_up, up)
+        self.cur_down = np.where(np.isnan(down), self.cur_down, down)
+        pct = np.nan_to_num(self.pct_chg[t])
+        self.market_value = np.where(held, self.market_value * (1.0 + pct / 100.0), self.market_value)
+
+    # ==========================
+    # 下单与撮合
+    # ==========================
+
+    def submit(self, quantity: np.ndarray, price: Optional[np.ndarray] = None):
+        """
+        提交本步订单：quantity 为 0 的品种不变，非 0 的品种替换原有挂单。
+        price 为 NaN（或不传）表示市价单。
+        """
+        qty = np.asarray(quantity, dtype=np.float64)
+        px = np.full_like(qty, np.nan) if price is None else np.asarray(price, dtype=np.float64)
+        new = qty != 0
+        if not new.any():
+            return
+        replaced = new & (self.order_qty != 0)
+        self.total_cancel_count += int(replaced.sum())
+
+        reject = np.zeros_like(new)
+        if self.enforce_integer_lot:
+            reject |= new & (np.abs(qty - np.round(qty)) >= _EPS)
+        if not self.allow_short:
+            # 提交阶段占用可卖仓位
+            reject |= new & (qty < 0) & (-qty > self._available_to_sell() + _EPS)
+        self.total_cancel_count += int(reject.sum())
+
+        accept = new & ~reject
+        self.order_qty = np.where(new, np.where(accept, qty, 0.0), self.order_qty)
+        self.order_price = np.where(accept, px, np.where(new, np.nan, self.order_price))
+        self.order_step = np.where(accept, self.step, self.order_step)
+
+    def cancel(self, mask: np.ndarray):
+        mask = np.asarray(mask, dtype=bool) & (self.order_qty != 0)
+        self.total_cancel_count += int(mask.sum())
+        self._clear_orders(mask)
+
+    def _available_to_sell(self) -> np.ndarray:
+        return self.sellable if self.t_plus_one else np.maximum(self.position, 0.0)
+
+    def _clear_orders(self, mask: np.ndarray):
+        self.order_qty[mask] = 0.0
+        self.order_price[mask] = np.nan
+        self.order_step[mask] = -1
+
+    def _match(self, t: int, fill_px: np.ndarray, eligible: np.ndarray):
+        qty = self.order_qty
+        cand = (qty != 0) & eligible & ~np.isnan(fill_px)
+        if not cand.any():
+            return
+        limit = self.order_price
+        market = np.isnan(limit)
+        buy = qty > 0
+
+        cancel = np.zeros_like(cand)
+        if not self.allow_short:
+            cancel |= cand & ~buy & (-qty > self._available_to_sell() + _EPS)
+        # 限价超出涨跌停：撤单（NaN 比较为 False，未知涨跌停不限制）
+        cancel |= cand & ~market & ((limit > self.cur_up) | (limit < self.cur_down))
+        if cancel.any():
+            self.total_cancel_count += int(cancel.sum())
+            self._clear_orders(cancel)
+            cand &= ~cancel
+
+        price_ok = market | np.where(buy, fill_px <= limit, fill_px >= limit)
+        tradeable = (fill_px > 0) & ~(fill_px > self.cur_up) & ~(fill_px < self.cur_down)
+        fill = cand & price_ok & tradeable
+        if fill.any():
+            self._apply_fills(t, np.flatnonzero(fill), fill_px)
+
+    def _apply_fills(self, t: int, idx: np.ndarray, fill_px: np.ndarray):
+        q = self.order_qty[idx].copy()
+        p = fill_px[idx]
+        trade_notional = q * p
+        notional = np.abs(trade_notional)
+        commission = np.maximum(notional * self.commission_rate, self.min_commission)
+        commission += np.where(q < 0, notional * self.stamp_tax_rate, 0.0)
+
+        prev_qty = self.position[idx]
+        prev_value = self.market_value[idx]
+        new_qty = prev_qty + q
+        if not self.allow_short and (new_qty < -_EPS).any():
+            bad = self.symbols[idx[np.argmax(new_qty < -_EPS)]]
+            raise RuntimeError(f"Unexpected negative position in ledger: {bad}")
+
+        self.cash_balance -= trade_notional.sum() + commission.sum()
+        self.total_turnover += notional.sum()
+        self.total_commission += commission.sum()
+        self.total_trade_count += len(idx)
+
+        # 持仓市值：买入按最新收盘价估值，卖出按卖出比例缩减
+        valuation = np.where(np.isnan(self.last_close[idx]), p, self.last_close[idx])
+        new_value = np.where(q > 0, prev_value + q * valuation, prev_value)
+        sell_long = (q < 0) & (prev_qty > 0)
+        safe_prev = np.where(sell_long, prev_qty, 1.0)
+        sell_qty = np.where(sell_long, np.minimum(-q, prev_qty), 0.0)
+        new_value = np.where(sell_long, prev_value * (1.0 - sell_qty / safe_prev), new_value)
+        sellable = np.maximum(self.sellable[idx] - sell_qty, 0.0)
+        sellable[sellable <= _EPS] = 0.0
+
+        flat = np.abs(new_qty) < _EPS
+        self.position[idx] = np.where(flat, 0.0, new_qty)
+        self.market_value[idx] = np.where(flat, 0.0, new_value)
+        self.sellable[idx] = np.where(flat, 0.0, sellable)
+
+        self._trades.append((np.full(len(idx), t), idx, q, p, commission))
+        self._clear_orders(idx)
+
+    # ==========================
+    # 查询（与 AshareAccount 同名）
+    # ==========================
+
+    @property
+    def trades(self) -> Dict[str, np.ndarray]:
+        """成交流水：step / symbol 下标 / quantity / price / commission"""
+        if not self._trades:
+            empty = np.zeros(0)
+            return {"step": empty.astype(np.int64), "symbol": empty.astype(np.int64),
+                    "quantity": empty, "price": empty, "commission": empty}
+        cols = [np.concatenate(parts) for parts in zip(*self._trades)]
+        return dict(zip(("step", "symbol", "quantity", "price", "commission"), cols))
+
+    def get_positions(self) -> Dict[str, float]:
+        return {self.symbols[i]: float(self.position[i]) for i in np.flatnonzero(self.position)}
+
+    def get_sellable_qty(self, symbol: str) -> float:
+        return float(self.sellable[self.symbol_index[symbol]])
+
+    def get_balance(self) -> float:
+        return self.cash_balance
+
+    def get_market_value(self) -> float:
+        return float(self.market_value.sum())
+
+    def get_equity(self) -> float:
+        return self.cash_balance + float(self.market_value.sum())
+
+    def get_total_turnover(self) -> float:
+        return self.total_turnover
+
+    def get_total_commission(self) -> float:
+        return self.total_commission
+
+    def get_total_trade_count(self) -> int:
+        return self.total_trade_count
+
+    def get_total_trade_pnl(self) -> float:
+        return self.get_equity() - self.initial_balance
@@ -1,6 +1,7 @@
 """
-这个模块包含了针对binance交易所的具体组件实现
+这个模块针对binance交易所实现了高频交易回测功能。
 """
-from .account import BinanceAccount
-from .matcher import BinanceMatcher
-from .recorder import BinanceRecorder
\ No newline at end of file
+from hft_backtest.binance.event import BinanceBookTicker, BinanceTrade
+from hft_backtest.binance.reader import BinanceBookTickerArrayReader, BinanceTradeArrayReader
+from hft_backtest.binance.account import BinanceAccount
+from hft_backtest.binance.matcher import BinanceMatcher
@@ -0,0 +1,7 @@
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.okx.account cimport OKXAccount
+from hft_backtest.binance.event cimport BinanceTrade
+
+cdef class BinanceAccount(OKXAccount):
+    cpdef start(self, EventEngine engine)
+    cpdef void on_trade(self, BinanceTrade event)
@@ -0,0 +1,10 @@
+from hft_backtest.core.event_engine import EventEngine
+from hft_backtest.okx.account import OKXAccount
+from hft_backtest.binance.event import BinanceTrade
+
+class BinanceAccount(OKXAccount):
+    """
+    与 OKXAccount 共用订单状态机和按品种的增量统计，盯市价格来自 BinanceTrade。
+    """
+    def start(self, engine: EventEngine) -> None: ...
+    def on_trade(self, event: BinanceTrade) -> None: ...
@@ -0,0 +1,24 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.core.order cimport Order
+from hft_backtest.core.account cimport Account
+from hft_backtest.okx.account cimport OKXAccount
+from hft_backtest.binance.event cimport BinanceTrade
+
+cdef class BinanceAccount(OKXAccount):
+    """
+    Binance U 本位合约账户。
+    订单状态机、按品种的持仓/统计数组和增量汇总与 OKXAccount 完全一致，
+    这里只把盯市价格来源换成 BinanceTrade。
+    """
+
+    cpdef start(self, EventEngine engine):
+        engine.register(Order, self.on_order)
+        engine.register(BinanceTrade, self.on_trade)
+
+    cpdef void on_trade(self, BinanceTrade event):
+        self.set_price(event.symbol, event.price)
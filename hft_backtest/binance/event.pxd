@@ -0,0 +1,20 @@
+# cython: language_level=3
+
+from hft_backtest.core.event cimport Event
+
+cdef class BinanceBookTicker(Event):
+    cdef public str symbol
+    cdef public long long update_id
+    cdef public long long local_timestamp
+    cdef public double best_bid_price
+    cdef public double best_bid_qty
+    cdef public double best_ask_price
+    cdef public double best_ask_qty
+
+cdef class BinanceTrade(Event):
+    cdef public str symbol
+    cdef public long long trade_id
+    cdef public double price
+    cdef public double qty
+    # True: 买方是 maker，即卖方主动成交（砸 bid）
+    cdef public bint is_buyer_maker
@@ -0,0 +1,40 @@
+from hft_backtest.core.event import Event
+
+class BinanceBookTicker(Event):
+    symbol: str
+    update_id: int
+    local_timestamp: int
+    best_bid_price: float
+    best_bid_qty: float
+    best_ask_price: float
+    best_ask_qty: float
+
+    def __init__(
+        self,
+        timestamp: int = 0,
+        symbol: str = "",
+        update_id: int = 0,
+        local_timestamp: int = 0,
+        best_bid_price: float = 0.0,
+        best_bid_qty: float = 0.0,
+        best_ask_price: float = 0.0,
+        best_ask_qty: float = 0.0,
+    ) -> None: ...
+
+class BinanceTrade(Event):
+    symbol: str
+    trade_id: int
+    price: float
+    qty: float
+    # True: 卖方主动成交（砸 bid）；False: 买方主动成交（吃 ask）
+    is_buyer_maker: bool
+
+    def __init__(
+        self,
+        timestamp: int = 0,
+        symbol: str = "",
+        trade_id: int = 0,
+        price: float = 0.0,
+        qty: float = 0.0,
+        is_buyer_maker: bool = False,
+    ) -> None: ...
@@ -0,0 +1,88 @@
+# hft_backtest/binance/event.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from hft_backtest.core.event cimport Event
+
+# =============================================================================
+# BinanceBookTicker: 一档盘口 (bookTicker 推送)
+# =============================================================================
+cdef class BinanceBookTicker(Event):
+    def __init__(
+        self,
+        long long timestamp = 0,
+        str symbol = "",
+        long long update_id = 0,
+        long long local_timestamp = 0,
+        double best_bid_price = 0.0,
+        double best_bid_qty = 0.0,
+        double best_ask_price = 0.0,
+        double best_ask_qty = 0.0,
+    ):
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.update_id = update_id
+        self.local_timestamp = local_timestamp
+        self.best_bid_price = best_bid_price
+        self.best_bid_qty = best_bid_qty
+        self.best_ask_price = best_ask_price
+        self.best_ask_qty = best_ask_qty
+
+    cpdef Event derive(self):
+        cdef BinanceBookTicker evt = BinanceBookTicker.__new__(BinanceBookTicker)
+        evt.timestamp = 0
+        evt.source = 0
+        evt.producer = 0
+
+        evt.symbol = self.symbol
+        evt.update_id = self.update_id
+        evt.local_timestamp = self.local_timestamp
+        evt.best_bid_price = self.best_bid_price
+        evt.best_bid_qty = self.best_bid_qty
+        evt.best_ask_price = self.best_ask_price
+        evt.best_ask_qty = self.best_ask_qty
+        return evt
+
+    def __repr__(self):
+        return (f"BinanceBookTicker(timestamp={self.timestamp}, symbol='{self.symbol}', "
+                f"bid=({self.best_bid_price}, {self.best_bid_qty}), "
+                f"ask=({self.best_ask_price}, {self.best_ask_qty}))")
+
+# =============================================================================
+# BinanceTrade: 逐笔成交 (trades / aggTrades 推送)
+# =============================================================================
+cdef class BinanceTrade(Event):
+    def __init__(
+        self,
+        long long timestamp = 0,
+        str symbol = "",
+        long long trade_id = 0,
+        double price = 0.0,
+        double qty = 0.0,
+        bint is_buyer_maker = False,
+    ):
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.trade_id = trade_id
+        self.price = price
+        self.qty = qty
+        self.is_buyer_maker = is_buyer_maker
+
+    cpdef Event derive(self):
+        cdef BinanceTrade evt = BinanceTrade.__new__(BinanceTrade)
+        evt.timestamp = 0
+        evt.source = 0
+        evt.producer = 0
+
+        evt.symbol = self.symbol
+        evt.trade_id = self.trade_id
+        evt.price = self.price
+        evt.qty = self.qty
+        evt.is_buyer_maker = self.is_buyer_maker
+        return evt
+
+    def __repr__(self):
+        return (f"BinanceTrade(timestamp={self.timestamp}, symbol={self.symbol}, trade_id={self.trade_id}, "
+                f"price={self.price}, qty={self.qty}, is_buyer_maker={bool(self.is_buyer_maker)})")
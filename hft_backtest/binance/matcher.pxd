@@ -0,0 +1,64 @@
+# cython: language_level=3
+
+from hft_backtest.core.matcher cimport MatchEngine
+from hft_backtest.core.order cimport Order
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.binance.event cimport BinanceBookTicker, BinanceTrade
+
+# 单边价位索引：按 key 升序的 C 数组，key 最大者即最优价（买: key=price，卖: key=-price）
+cdef class PriceLevelIndex:
+    cdef long* _keys
+    cdef Py_ssize_t _n
+    cdef Py_ssize_t _cap
+    cdef long _sign
+    cdef long _empty
+
+    cdef Py_ssize_t _bisect(self, long key)
+    cdef int insert(self, long price) except -1
+    cdef void remove(self, long price)
+    cdef bint empty(self)
+    cdef long best(self)
+    cdef long at(self, Py_ssize_t i)
+
+cdef class BinanceMatcher(MatchEngine):
+    cdef public str symbol
+    cdef public double taker_fee
+    cdef public double maker_fee
+
+    cdef public long PRICE_SCALAR
+    cdef public double INIT_RANK
+
+    # 最近一次行情推断出的 BBO
+    cdef public long best_bid_price_int
+    cdef public long best_ask_price_int
+
+    # price_int -> {order_id: Order}，dict 保持插入顺序即价格内的时间优先
+    cdef public dict buy_levels
+    cdef public dict sell_levels
+    # order_id -> Order (在簿订单)
+    cdef public dict order_index
+    # 有序价位索引，维护在簿订单的极值价格（空时为 EMPTY_BID / MAX_ASK）
+    cdef public PriceLevelIndex buy_index
+    cdef public PriceLevelIndex sell_index
+    cdef public long max_buy_int
+    cdef public long min_sell_int
+
+    # 已确认、等待下一条行情入场的订单/撤单
+    cdef public object pending
+
+    cdef EventEngine event_engine
+
+    cdef inline long _to_int(self, double price)
+    cpdef long to_int_price(self, double price)
+
+    cdef void _add_order(self, Order order)
+    cdef bint _remove_order(self, Order order)
+    cdef void fill_order(self, Order order, double filled_price, bint is_taker)
+    cdef void cancel_order(self, long order_id)
+    cdef void _fill_level(self, dict bucket)
+    cdef void _flush_pending(self, double bid_qty, double ask_qty)
+
+    cpdef start(self, EventEngine engine)
+    cpdef on_order(self, Order order)
+    cpdef on_bookticker(self, BinanceBookTicker event)
+    cpdef on_trade(self, BinanceTrade event)
@@ -0,0 +1,42 @@
+from typing import Deque, Dict, Iterator
+from hft_backtest.core.matcher import MatchEngine
+from hft_backtest.core.event_engine import EventEngine
+from hft_backtest.core.order import Order
+from hft_backtest.binance.event import BinanceBookTicker, BinanceTrade
+
+class PriceLevelIndex:
+    """单边有序价位集合（C 数组 + 二分），最优价 O(1)，增删 O(log n) 查找"""
+    def __init__(self, is_buy: bool) -> None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[int]:
+        """从最优价开始迭代 price_int"""
+        ...
+    def __contains__(self, price_int: int) -> bool: ...
+
+class BinanceMatcher(MatchEngine):
+    symbol: str
+    taker_fee: float
+    maker_fee: float
+    PRICE_SCALAR: int
+    INIT_RANK: float
+
+    best_bid_price_int: int
+    best_ask_price_int: int
+    # price_int -> {order_id: Order}
+    buy_levels: Dict[int, Dict[int, Order]]
+    sell_levels: Dict[int, Dict[int, Order]]
+    order_index: Dict[int, Order]
+    # 有序价位索引，与 buy_levels / sell_levels 的 key 一一对应
+    buy_index: PriceLevelIndex
+    sell_index: PriceLevelIndex
+    max_buy_int: int
+    min_sell_int: int
+    # 已确认、等待下一条行情入场的订单/撤单
+    pending: Deque[Order]
+
+    def __init__(self, symbol: str, taker_fee: float = ..., maker_fee: float = ...) -> None: ...
+    def start(self, engine: EventEngine) -> None: ...
+    def to_int_price(self, price: float) -> int: ...
+    def on_order(self, order: Order) -> None: ...
+    def on_bookticker(self, event: BinanceBookTicker) -> None: ...
+    def on_trade(self, event: BinanceTrade) -> None: ...
@@ -0,0 +1,452 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+from collections import deque
+from hft_backtest.core.matcher cimport MatchEngine
+from hft_backtest.core.order cimport (
+    Order,
+    ORDER_STATE_FILLED,
+    ORDER_STATE_CANCELED,
+    ORDER_STATE_RECEIVED,
+    ORDER_TYPE_LIMIT,
+    ORDER_TYPE_MARKET,
+    ORDER_TYPE_TRACKING,
+    ORDER_TYPE_CANCEL,
+)
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.binance.event cimport BinanceBookTicker, BinanceTrade
+from libc.math cimport fabs, fmax
+from libc.limits cimport LONG_MAX
+from libc.stdlib cimport realloc, free
+from libc.string cimport memmove
+
+# 空簿哨兵：价格是 Order.SCALER 定点整数，卖方哨兵必须比任何真实价格都大
+cdef long EMPTY_BID = -1
+cdef long MAX_ASK = LONG_MAX
+
+
+cdef class PriceLevelIndex:
+    """
+    单边有序价位集合。
+    key 升序存在连续 C 数组里，最优价在数组末尾：买单 key = price，卖单 key = -price。
+    查找 O(log n)；最优价的读取和删除 O(1)（扫簿总是从末尾弹出）；
+    插入/删除中间价位是一次 memmove，价位数通常只有几十到几百，比树结构更快。
+    """
+    def __cinit__(self, bint is_buy):
+        self._keys = NULL
+        self._n = 0
+        self._cap = 0
+        self._sign = 1 if is_buy else -1
+        self._empty = EMPTY_BID if is_buy else MAX_ASK
+
+    def __dealloc__(self):
+        if self._keys != NULL:
+            free(self._keys)
+
+    cdef inline Py_ssize_t _bisect(self, long key):
+        """第一个 >= key 的下标"""
+        cdef Py_ssize_t lo = 0
+        cdef Py_ssize_t hi = self._n
+        cdef Py_ssize_t mid
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self._keys[mid] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    cdef int insert(self, long price) except -1:
+        cdef long key = price * self._sign
+        cdef Py_ssize_t i
+        cdef Py_ssize_t new_cap
+        cdef long* buf
+        # 新价位通常在最优价附近，先看末尾
+        if self._n > 0 and self._keys[self._n - 1] < key:
+            i = self._n
+        else:
+            i = self._bisect(key)
+            if i < self._n and self._keys[i] == key:
+                return 0
+        if self._n == self._cap:
+            new_cap = self._cap * 2 if self._cap > 0 else 16
+            buf = <long*>realloc(self._keys, new_cap * sizeof(long))
+            if buf == NULL:
+                raise MemoryError()
+            self._keys = buf
+            self._cap = new_cap
+        if i < self._n:
+            memmove(&self._keys[i + 1], &self._keys[i], (self._n - i) * sizeof(long))
+        self._keys[i] = key
+        self._n += 1
+        return 0
+
+    cdef void remove(self, long price):
+        cdef long key = price * self._sign
+        cdef Py_ssize_t i
+        if self._n > 0 and self._keys[self._n - 1] == key:
+            self._n -= 1
+            return
+        i = self._bisect(key)
+        if i < self._n and self._keys[i] == key:
+            memmove(&self._keys[i], &self._keys[i + 1], (self._n - i - 1) * sizeof(long))
+            self._n -= 1
+
+    cdef inline bint empty(self):
+        return self._n == 0
+
+    cdef inline long best(self):
+        """最优价；空边返回哨兵（EMPTY_BID / MAX_ASK），调用方应先用 empty() 判断"""
+        if self._n == 0:
+            return self._empty
+        return self._keys[self._n - 1] * self._sign
+
+    cdef inline long at(self, Py_ssize_t i):
+        """第 i 优的价位（0 为最优）"""
+        return self._keys[self._n - 1 - i] * self._sign
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        """从最优价开始迭代"""
+        cdef Py_ssize_t i
+        return iter([self.at(i) for i in range(self._n)])
+
+    def __contains__(self, long price):
+        cdef long key = price * self._sign
+        cdef Py_ssize_t i = self._bisect(key)
+        return i < self._n and self._keys[i] == key
+
+
+cdef class BinanceMatcher(MatchEngine):
+    """
+    Binance 一档行情撮合（单品种）。
+
+    - 订单到达时先回 RECEIVED，进入 pending 队列，在下一条 bookTicker/trade 到达时按当时的 BBO 入场；
+    - 在簿订单按价格分桶，同价按时间优先；每边另有有序价位索引（PriceLevelIndex），最优价 O(1)、增删 O(log n)；rank 为队列中排在前面的数量，
+      未知（挂在 BBO 之外）时为 INIT_RANK，价格回到 BBO 时用盘口数量初始化；
+    - bookTicker 更新排位/处理穿价，trade 按成交价扫簿并累计同价成交量。
+    """
+
+    def __init__(self, str symbol, double taker_fee = 2e-4, double maker_fee = 1.1e-4):
+        self.symbol = symbol
+        self.taker_fee = taker_fee
+        self.maker_fee = maker_fee
+
+        from hft_backtest.core.order import Order as PyOrder
+        self.PRICE_SCALAR = PyOrder.SCALER
+
+        self.INIT_RANK = 10.0**9
+
+        self.best_bid_price_int = 0
+        self.best_ask_price_int = MAX_ASK
+
+        self.buy_levels = {}
+        self.sell_levels = {}
+        self.order_index = {}
+        self.buy_index = PriceLevelIndex(True)
+        self.sell_index = PriceLevelIndex(False)
+        self.max_buy_int = EMPTY_BID
+        self.min_sell_int = MAX_ASK
+
+        self.pending = deque()
+
+    cpdef start(self, EventEngine engine):
+        self.event_engine = engine
+        engine.register(Order, self.on_order)
+        engine.register(BinanceBookTicker, self.on_bookticker)
+        engine.register(BinanceTrade, self.on_trade)
+
+    # --- Price Conversion ---
+    cdef inline long _to_int(self, double price):
+        return <long>(price * self.PRICE_SCALAR + 0.5)
+
+    cpdef long to_int_price(self, double price):
+        return self._to_int(price)
+
+    # --- Order Book Ops ---
+    cdef void _add_order(self, Order order):
+        cdef long p = order.price_int
+        cdef dict bucket
+        if order.quantity > 0:
+            bucket = self.buy_levels.get(p)
+            if bucket is None:
+                bucket = self.buy_levels[p] = {}
+                self.buy_index.insert(p)
+                self.max_buy_int = self.buy_index.best()
+        else:
+            bucket = self.sell_levels.get(p)
+            if bucket is None:
+                bucket = self.sell_levels[p] = {}
+                self.sell_index.insert(p)
+                self.min_sell_int = self.sell_index.best()
+        bucket[order.order_id] = order
+        self.order_index[order.order_id] = order
+
+    cdef bint _remove_order(self, Order order):
+        cdef long oid = order.order_id
+        if oid not in self.order_index:
+            return False
+        cdef Order resting = self.order_index.pop(oid)
+        cdef long p = resting.price_int
+        cdef bint is_buy = resting.quantity > 0
+        cdef dict levels = self.buy_levels if is_buy else self.sell_levels
+        cdef dict bucket = levels[p]
+        del bucket[oid]
+        if not bucket:
+            del levels[p]
+            if is_buy:
+                self.buy_index.remove(p)
+                self.max_buy_int = self.buy_index.best()
+            else:
+                self.sell_index.remove(p)
+                self.min_sell_int = self.sell_index.best()
+        return True
+
+    cdef void fill_order(self, Order order, double filled_price, bint is_taker):
+        cdef Order new_order = order.derive()
+        new_order.state = ORDER_STATE_FILLED
+        new_order.filled_price = filled_price
+        cdef double amount = fabs(filled_price * new_order.quantity)
+        new_order.commission_fee = amount * self.taker_fee if is_taker else amount * self.maker_fee
+
+        self._remove_order(order)
+        self.event_engine.put(new_order)
+
+    cdef void cancel_order(self, long order_id):
+        cdef Order order = self.order_index.get(order_id)
+        cdef Order new_order
+        if order is None:
+            return
+        new_order = order.derive()
+        new_order.order_type = ORDER_TYPE_LIMIT
+        new_order.state = ORDER_STATE_CANCELED
+        self._remove_order(order)
+        self.event_engine.put(new_order)
+
+    cdef void _fill_level(self, dict bucket):
+        """整桶按挂单价成交（maker）"""
+        cdef Order order
+        for order in list(bucket.values()):
+            self.fill_order(order, order.price, False)
+
+    # --- Order Entry ---
+    cpdef on_order(self, Order order):
+        if order.symbol != self.symbol: return
+
+        # 撤单指令直接排队，按到达顺序在下一条行情时处理
+        if order.is_cancel_order:
+            self.pending.append(order)
+            return
+        if not order.is_submitted:
+            return
+
+        cdef Order new_order = order.derive()
+        new_order.state = ORDER_STATE_RECEIVED
+        self.pending.append(new_order)
+        self.event_engine.put(new_order)
+
+    cdef void _flush_pending(self, double bid_qty, double ask_qty):
+        """
+        用当前 BBO 让 pending 队列入场。
+        bid_qty/ask_qty 为 BBO 数量，trade 推断的 BBO 没有数量，传 INIT_RANK（排位未知）。
+        """
+        cdef Order order
+        cdef Order report
+        cdef long bid = self.best_bid_price_int
+        cdef long ask = self.best_ask_price_int
+        cdef double scalar = <double>self.PRICE_SCALAR
+        cdef long p
+        cdef bint is_buy
+
+        while self.pending:
+            order = self.pending.popleft()
+            is_buy = order.quantity > 0
+
+            # 1. 撤单
+            if order.order_type == ORDER_TYPE_CANCEL:
+                self.cancel_order(order.order_id)
+                continue
+
+            # 2. 市价单（假设流动性无限）
+            if order.order_type == ORDER_TYPE_MARKET:
+                self.fill_order(order, (ask if is_buy else bid) / scalar, True)
+                continue
+
+            # 3. 跟踪单 -> 最优价限价单
+            if order.order_type == ORDER_TYPE_TRACKING:
+                order = order.derive()
+                order.order_type = ORDER_TYPE_LIMIT
+                order.price = (bid if is_buy else ask) / scalar
+
+            # 4. 限价单：能立即成交则吃单，post_only 则拒绝
+            p = order.price_int
+            if (is_buy and p >= ask) or (not is_buy and p <= bid):
+                if order.post_only:
+                    report = order.derive()
+                    report.state = ORDER_STATE_CANCELED
+                    self.event_engine.put(report)
+                else:
+                    self.fill_order(order, (ask if is_buy else bid) / scalar, True)
+                continue
+
+            # 5. 挂单入簿，初始化排位
+            order.traded = 0.0
+            if bid < p < ask:
+                order.rank = 0.0
+            elif is_buy and p == bid:
+                order.rank = bid_qty
+            elif not is_buy and p == ask:
+                order.rank = ask_qty
+            else:
+                order.rank = self.INIT_RANK
+            self._add_order(order)
+
+            # 推送入场事件（跟踪单此时才确定价格）
+            self.event_engine.put(order.derive())
+
+    # --- Market Data ---
+    cpdef on_bookticker(self, BinanceBookTicker event):
+        if event.symbol != self.symbol: return
+
+        cdef long bid = self._to_int(event.best_bid_price)
+        cdef long ask = self._to_int(event.best_ask_price)
+        self.best_bid_price_int = bid
+        self.best_ask_price_int = ask
+
+        cdef long p
+        cdef dict bucket
+        cdef Order order
+        cdef double front_cancel
+        cdef list prices
+        cdef Py_ssize_t i
+
+        # --- Buy Orders: 只有 >= bid 的价位需要处理，从最优价往下取，处理中会删价位所以先取快照 ---
+        prices = []
+        for i in range(self.buy_index._n):
+            p = self.buy_index.at(i)
+            if p < bid:
+                break
+            prices.append(p)
+        for p in prices:
+            bucket = self.buy_levels.get(p)
+            if bucket is None:
+                continue
+            if p >= ask:
+                # ask 打穿买单
+                self._fill_level(bucket)
+            elif p > bid:
+                # 价格在 bid ask 之间，排第一
+                for order in bucket.values():
+                    order.rank = 0.0
+                    order.traded = 0.0
+            else:
+                for order in list(bucket.values()):
+                    if order.rank >= self.INIT_RANK:
+                        # 刚回到 best bid，用盘口数量初始化排位
+                        order.rank = event.best_bid_qty
+                        order.traded = 0.0
+                        continue
+                    front_cancel = fmax(0.0, order.rank - order.traded - event.best_bid_qty)
+                    order.rank = order.rank - order.traded - front_cancel
+                    order.traded = 0.0
+                    if order.rank < 0:
+                        self.fill_order(order, order.price, False)
+
+        # --- Sell Orders: 只有 <= ask 的价位需要处理 ---
+        prices = []
+        for i in range(self.sell_index._n):
+            p = self.sell_index.at(i)
+            if p > ask:
+                break
+            prices.append(p)
+        for p in prices:
+            bucket = self.sell_levels.get(p)
+            if bucket is None:
+                continue
+            if p <= bid:
+                self._fill_level(bucket)
+            elif p < ask:
+                for order in bucket.values():
+                    order.rank = 0.0
+                    order.traded = 0.0
+            else:
+                for order in list(bucket.values()):
+                    if order.rank >= self.INIT_RANK:
+                        order.rank = event.best_ask_qty
+                        order.traded = 0.0
+                        continue
+                    front_cancel = fmax(0.0, order.rank - order.traded - event.best_ask_qty)
+                    order.rank = order.rank - order.traded - front_cancel
+                    order.traded = 0.0
+                    if order.rank < 0:
+                        self.fill_order(order, order.price, False)
+
+        # --- 入场阶段：直接用最新盘口 ---
+        self._flush_pending(event.best_bid_qty, event.best_ask_qty)
+
+    cpdef on_trade(self, BinanceTrade event):
+        """
+        1. 用成交价推断 BBO
+        2. 用成交价扫簿（先处理在簿订单，避免 pending 被重复撮合）
+        3. 用推断的 BBO 让 pending 入场
+        """
+        if event.symbol != self.symbol: return
+
+        cdef long price_int = self._to_int(event.price)
+        cdef dict bucket
+        cdef Order order
+
+        # === Step 1: 推断 BBO ===
+        if event.is_buyer_maker:
+            # 卖方主动（砸 bid）
+            self.best_bid_price_int = price_int
+            if self.best_ask_price_int < price_int:
+                self.best_ask_price_int = price_int
+        else:
+            # 买方主动（吃 ask）
+            self.best_ask_price_int = price_int
+            if self.best_bid_price_int > price_int:
+                self.best_bid_price_int = price_int
+
+        # === Step 2: 扫簿 ===
+        # 买价高于成交价的买单全部成交
+        # 空边直接跳过，不和哨兵比较价格
+        while not self.buy_index.empty() and self.max_buy_int > price_int:
+            self._fill_level(self.buy_levels[self.max_buy_int])
+
+        if not self.buy_index.empty() and self.max_buy_int == price_int:
+            bucket = self.buy_levels[price_int]
+            if not event.is_buyer_maker:
+                # 买方吃 ask：此刻成交价就是 ask，同价买单全部成交
+                self._fill_level(bucket)
+            else:
+                # 卖方砸 bid：同价买单累计成交量
+                for order in list(bucket.values()):
+                    if order.rank >= self.INIT_RANK:
+                        continue
+                    order.traded += event.qty
+                    if order.traded > order.rank:
+                        self.fill_order(order, order.price, False)
+
+        # 卖价低于成交价的卖单全部成交
+        while not self.sell_index.empty() and self.min_sell_int < price_int:
+            self._fill_level(self.sell_levels[self.min_sell_int])
+
+        if not self.sell_index.empty() and self.min_sell_int == price_int:
+            bucket = self.sell_levels[price_int]
+            if event.is_buyer_maker:
+                self._fill_level(bucket)
+            else:
+                for order in list(bucket.values()):
+                    if order.rank >= self.INIT_RANK:
+                        continue
+                    order.traded += event.qty
+                    if order.traded > order.rank:
+                        self.fill_order(order, order.price, False)
+
+        # === Step 3: pending 入场（成交推断的 BBO 没有数量信息） ===
+        self._flush_pending(self.INIT_RANK, self.INIT_RANK)
@@ -0,0 +1,42 @@
+# hft_backtest/binance/reader.pxd
+# cython: language_level=3
+
+from hft_backtest.core.reader cimport DataReader
+
+# BinanceBookTicker 专用 Batch 读取器
+cdef class BinanceBookTickerArrayReader(DataReader):
+    cdef object batch_iterator
+    cdef object current_df # 保持引用，防止 MemoryView 失效
+    cdef str default_symbol # 数据里没有 symbol 列时使用（Binance 官方归档按品种分文件）
+
+    cdef long[:] timestamps
+    cdef long[:] local_timestamps
+    cdef long[:] update_ids
+    cdef object[:] symbols
+    cdef double[:] bid_prices
+    cdef double[:] bid_qtys
+    cdef double[:] ask_prices
+    cdef double[:] ask_qtys
+
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t length
+
+    cdef void load_next_batch(self)
+
+# BinanceTrade 专用 Batch 读取器
+cdef class BinanceTradeArrayReader(DataReader):
+    cdef object batch_iterator
+    cdef object current_df
+    cdef str default_symbol
+
+    cdef long[:] timestamps
+    cdef long[:] trade_ids
+    cdef object[:] symbols
+    cdef double[:] prices
+    cdef double[:] qtys
+    cdef unsigned char[:] buyer_makers
+
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t length
+
+    cdef void load_next_batch(self)
@@ -0,0 +1,162 @@
+# hft_backtest/binance/reader.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+import numpy as np
+cimport numpy as np
+from hft_backtest.core.event cimport Event
+from hft_backtest.core.reader cimport DataReader
+from hft_backtest.binance.event cimport BinanceBookTicker, BinanceTrade
+
+# 初始化 Numpy C-API
+np.import_array()
+
+
+cdef inline object _pick(object df, tuple names):
+    """按顺序取第一个存在的列名；Binance 官方归档与 websocket 落盘的列名不完全一致"""
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    raise KeyError(f"none of columns {names} found")
+
+
+cdef inline object _symbol_column(object df, str default_symbol):
+    """symbol 列 -> 可写的 object ndarray；没有该列时用 default_symbol 填充"""
+    if 'symbol' not in df.columns:
+        return np.full(len(df), default_symbol, dtype=object)
+    arr = df['symbol'].to_numpy(dtype=object)
+    if not arr.flags.writeable:
+        arr = arr.copy()
+    return arr
+
+
+cdef inline object _bool_column(object series):
+    """is_buyer_maker 可能是 bool，也可能是 'true'/'True' 字符串"""
+    if series.dtype.kind in 'biuf':
+        return series.to_numpy(dtype=np.uint8)
+    return series.astype(str).str.lower().eq('true').to_numpy(dtype=np.uint8)
+
+
+cdef class BinanceBookTickerArrayReader(DataReader):
+    def __init__(self, dataset, str symbol = ""):
+        """
+        :param dataset: 任何迭代返回 DataFrame 的对象 (如 ParquetDataset(mode='batch'))
+        :param symbol: 数据不含 symbol 列时使用的品种名
+        """
+        self.batch_iterator = iter(dataset)
+        self.default_symbol = symbol
+        self.length = 0
+        self.idx = 0
+        self.current_df = None
+        self.load_next_batch()
+
+    cdef void load_next_batch(self):
+        try:
+            df = next(self.batch_iterator)
+
+            ts = _pick(df, ('timestamp', 'transaction_time', 'event_time')).values.astype(np.int64)
+            self.timestamps = ts
+            if 'local_timestamp' in df.columns:
+                self.local_timestamps = df['local_timestamp'].values.astype(np.int64)
+            else:
+                self.local_timestamps = np.zeros(len(df), dtype=np.int64)
+            if 'update_id' in df.columns:
+                self.update_ids = df['update_id'].values.astype(np.int64)
+            else:
+                self.update_ids = np.zeros(len(df), dtype=np.int64)
+            self.symbols = _symbol_column(df, self.default_symbol)
+            self.bid_prices = df['best_bid_price'].values.astype(np.float64)
+            self.bid_qtys = df['best_bid_qty'].values.astype(np.float64)
+            self.ask_prices = df['best_ask_price'].values.astype(np.float64)
+            self.ask_qtys = df['best_ask_qty'].values.astype(np.float64)
+
+            self.current_df = df # 重要：保活
+            self.length = len(df)
+            self.idx = 0
+
+        except StopIteration:
+            self.length = 0
+            self.current_df = None
+
+    cdef Event fetch_next(self):
+        cdef BinanceBookTicker evt
+        cdef Py_ssize_t i
+
+        if self.idx >= self.length:
+            self.load_next_batch()
+
+        if self.length == 0:
+            return None
+
+        evt = BinanceBookTicker.__new__(BinanceBookTicker)
+        i = self.idx
+
+        evt.timestamp = self.timestamps[i]
+        evt.local_timestamp = self.local_timestamps[i]
+        evt.update_id = self.update_ids[i]
+        evt.symbol = self.symbols[i]
+        evt.best_bid_price = self.bid_prices[i]
+        evt.best_bid_qty = self.bid_qtys[i]
+        evt.best_ask_price = self.ask_prices[i]
+        evt.best_ask_qty = self.ask_qtys[i]
+
+        self.idx += 1
+        return evt
+
+
+cdef class BinanceTradeArrayReader(DataReader):
+    def __init__(self, dataset, str symbol = ""):
+        """
+        :param dataset: 任何迭代返回 DataFrame 的对象 (如 ParquetDataset(mode='batch'))
+        :param symbol: 数据不含 symbol 列时使用的品种名
+        """
+        self.batch_iterator = iter(dataset)
+        self.default_symbol = symbol
+        self.length = 0
+        self.idx = 0
+        self.current_df = None
+        self.load_next_batch()
+
+    cdef void load_next_batch(self):
+        try:
+            df = next(self.batch_iterator)
+
+            self.timestamps = _pick(df, ('timestamp', 'time', 'transact_time')).values.astype(np.int64)
+            self.trade_ids = _pick(df, ('trade_id', 'id', 'agg_trade_id')).values.astype(np.int64)
+            self.symbols = _symbol_column(df, self.default_symbol)
+            self.prices = df['price'].values.astype(np.float64)
+            self.qtys = _pick(df, ('qty', 'quantity')).values.astype(np.float64)
+            self.buyer_makers = _bool_column(df['is_buyer_maker'])
+
+            self.current_df = df # 重要：保活
+            self.length = len(df)
+            self.idx = 0
+
+        except StopIteration:
+            self.length = 0
+            self.current_df = None
+
+    cdef Event fetch_next(self):
+        cdef BinanceTrade evt
+        cdef Py_ssize_t i
+
+        if self.idx >= self.length:
+            self.load_next_batch()
+
+        if self.length == 0:
+            return None
+
+        evt = BinanceTrade.__new__(BinanceTrade)
+        i = self.idx
+
+        evt.timestamp = self.timestamps[i]
+        evt.trade_id = self.trade_ids[i]
+        evt.symbol = self.symbols[i]
+        evt.price = self.prices[i]
+        evt.qty = self.qtys[i]
+        evt.is_buyer_maker = self.buyer_makers[i]
+
+        self.idx += 1
+        return evt
@@ -1,10 +1,42 @@
 # hft_backtest/core/backtest.pxd
 # cython: language_level=3
 
+from libcpp.vector cimport vector
 from hft_backtest.core.event_engine cimport EventEngine, Component
 from hft_backtest.core.delaybus cimport DelayBus
 from hft_backtest.core.reader cimport DataReader
 
+cdef enum TimerMode:
+    TIMER_DENSE = 0
+    TIMER_ON_ACTIVITY = 1
+    TIMER_CATCH_UP = 2
+
+# 一个 timer 的调度状态（默认 timer + 命名 timer 共用）
+cdef struct TimerSlot:
+    long long next_time
+    long long interval
+    long long skipped      # catch_up 模式下累积的空 tick 数
+    long long last_seq     # 上次触发时的数据序号（惰性模式判断是否有新数据）
+    long long seq          # 添加顺序，同一时刻按它决定先后
+    int timer_id
+    bint is_server
+
+# run() 的运行统计：各来源事件数、各阶段耗时（单调时钟 ns）、DelayBus 峰值深度
+cdef class RunStats:
+    cdef readonly long long n_data
+    cdef readonly long long n_timer
+    cdef readonly long long n_s2c
+    cdef readonly long long n_c2s
+    cdef readonly long long fetch_ns       # dataset.fetch_next
+    cdef readonly long long bus_ns         # DelayBus.process_until（含目标引擎内的派发）
+    cdef readonly long long dispatch_ns    # 数据与 Timer 在引擎内的派发
+    cdef readonly long long wall_ns
+    cdef readonly long long peak_s2c_depth
+    cdef readonly long long peak_c2s_depth
+    cdef readonly long long sim_time       # 已推进到的回测时间
+    cdef readonly bint finished
+    cdef long long _t_start
+
 cdef class BacktestEngine:
     # 引擎
     cdef public EventEngine server_engine
@@ -20,15 +52,45 @@ cdef class BacktestEngine:
     # Timer 相关
     cdef bint _use_timer
     cdef long _timer_interval_v
+    cdef public str timer_mode
+    cdef int _timer_mode_v
+    # timer 小顶堆 (next_time, seq)
+    cdef vector[TimerSlot] _timers
+    cdef dict _timer_names         # {name: timer_id}，防止重复添加
+    cdef long long _timer_seq
+    # 已派发的数据条数（惰性 timer 模式判断“上个 tick 之后是否有数据”）
+    cdef long long _data_seq
+    cdef bint _started
     
     # Bus (强类型定义，以便直接访问内部队列)
     cdef public DelayBus server2client_bus
     cdef public DelayBus client2server_bus
 
+    # 运行模式：'dual' / 'single'
+    cdef public str mode
+    cdef bint _single
+    # 两侧组件产生事件的 source 标记（dual 模式下即两个引擎的 _id）
+    cdef public unsigned long server_source_id
+    cdef public unsigned long client_source_id
+
+    # 最近一次 run() 的统计
+    cdef readonly RunStats stats
+    cdef long long _s2c_base
+    cdef long long _c2s_base
+
     # 【新增】起止时间控制
     cdef public long long start_time
     cdef public long long end_time
     
     # 方法
     cpdef add_component(self, Component component, bint is_server)
-    cpdef run(self)
\ No newline at end of file
+    cpdef RunStats run(self, object progress=*, double progress_interval=*)
+    cdef void _run_single(self, object progress, long long interval_ns) except *
+    cdef void _sync_stats(self, long long now)
+    cdef void _report(self, object progress, long long now) except *
+    cpdef int add_timer(self, str name, long long interval, bint is_server=*) except -1
+    cdef void _push_timer_slot(self, int timer_id, long long interval, bint is_server)
+    cdef void _init_timers(self, long long t0)
+    cdef long long _peek_timer(self)
+    cdef void _fire_timer(self, long long t_data) except *
+    cdef void _timer_sift_down(self, size_t idx)
\ No newline at end of file
@@ -1,9 +1,33 @@
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from .dataset import Dataset
 from .reader import DataReader
 from .delaybus import DelayBus
 from .event_engine import EventEngine, Component
 
+class RunStats:
+    """
+    run() 的运行统计（只读）。阶段耗时为单调时钟纳秒：
+    fetch_ns = 读数据，bus_ns = DelayBus 投递（含目标引擎内派发），dispatch_ns = 数据/Timer 派发。
+    """
+    n_data: int
+    n_timer: int
+    n_s2c: int
+    n_c2s: int
+    fetch_ns: int
+    bus_ns: int
+    dispatch_ns: int
+    wall_ns: int
+    peak_s2c_depth: int
+    peak_c2s_depth: int
+    sim_time: int
+    finished: bool
+
+    @property
+    def n_events(self) -> int: ...
+    @property
+    def events_per_sec(self) -> float: ...
+    def as_dict(self) -> Dict[str, Any]: ...
+
 class BacktestEngine:
     """
     全 Cython 版回测引擎
@@ -17,17 +41,60 @@ class BacktestEngine:
     
     dataset: DataReader
     
-    server2client_bus: DelayBus
-    client2server_bus: DelayBus
+    # mode='single' 时为 None
+    server2client_bus: Optional[DelayBus]
+    client2server_bus: Optional[DelayBus]
+
+    mode: str
+    timer_mode: str
+    server_source_id: int
+    client_source_id: int
+
+    start_time: int
+    end_time: int
+    # 最近一次 run() 的统计（run 之前为 None）
+    stats: Optional[RunStats]
 
     def __init__(
         self, 
         dataset: Union[Dataset, DataReader], 
-        server2client_delaybus: DelayBus, 
-        client2server_delaybus: DelayBus, 
-        timer_interval: Optional[int] = ...
-    ) -> None: ...
+        server2client_delaybus: Optional[DelayBus] = None, 
+        client2server_delaybus: Optional[DelayBus] = None, 
+        timer_interval: Optional[int] = ...,
+        start_time: int = ...,
+        end_time: int = ...,
+        mode: str = "dual",
+        timer_mode: str = "dense",
+        server_timer_interval: Optional[int] = None,
+    ) -> None:
+        """
+        mode='dual'   两个 EventEngine + 两条 DelayBus（必须传入两条总线）。
+        mode='single' 单引擎零延迟模式：server/client 组件共用一个 EventEngine，
+                      不使用 DelayBus（两条总线必须为 None），client_engine is server_engine。
+        timer_mode='dense'       每个 interval 一个 Timer；
+                   'on_activity' 只在上个 tick 后有数据到达时才发 Timer；
+                   'catch_up'    空档合并成一个 Timer，Timer.skipped 为合并掉的 tick 数。
+        server_timer_interval  server 侧默认 Timer 间隔（None = 不调度）。开启后 client Timer
+                               不再经 C2S 总线搬到 server，两侧节拍独立。
+        """
+        ...
 
     def add_component(self, component: Component, is_server: bool) -> None: ...
+
+    def add_timer(self, name: str, interval: int, is_server: bool = False) -> int:
+        """
+        添加命名 timer（run() 之前调用），返回 timer_id。is_server=True 时注入 server 引擎。
+        组件用 engine.register_timer(name, callback) 订阅；它不会派发给 register(Timer, ...) 的监听器。
+        """
+        ...
     
-    def run(self) -> None: ...
\ No newline at end of file
+    def run(
+        self,
+        progress: Optional[Callable[[RunStats], None]] = None,
+        progress_interval: float = 1.0,
+    ) -> RunStats:
+        """
+        运行回测并返回 RunStats。progress 不为 None 时，每隔 progress_interval 秒（墙钟）
+        以当前统计调用一次，结束时再以 stats.finished=True 调用一次。
+        """
+        ...
\ No newline at end of file
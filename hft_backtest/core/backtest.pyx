@@ -14,8 +14,53 @@ from hft_backtest.core.reader cimport DataReader, PyDatasetWrapper
 # 引入 Bus 和它的结构体 BusItem
 from hft_backtest.core.delaybus cimport DelayBus, BusItem 
 
-# 引入 Python 层的 Timer 类
-from hft_backtest.core.timer import Timer
+from hft_backtest.core.timer cimport Timer, timer_id_of
+from hft_backtest.core.clock cimport monotonic_ns
+
+
+cdef class RunStats:
+    """
+    BacktestEngine.run() 的运行统计（由 run() 创建并在 C 层累加，Python 侧只读）。
+    阶段耗时用单调时钟纳秒：fetch = 读数据，bus = DelayBus 投递（含目标引擎里的派发），
+    dispatch = 数据与 Timer 在引擎内的派发。三者之和约等于主循环耗时，
+    可以用来判断是 I/O（fetch）还是策略/撮合（dispatch / bus）在拖慢回测。
+    """
+    @property
+    def n_events(self):
+        return self.n_data + self.n_timer + self.n_s2c + self.n_c2s
+
+    @property
+    def events_per_sec(self):
+        if self.wall_ns <= 0:
+            return 0.0
+        return self.n_events * 1e9 / self.wall_ns
+
+    def as_dict(self):
+        return {
+            "n_data": self.n_data,
+            "n_timer": self.n_timer,
+            "n_s2c": self.n_s2c,
+            "n_c2s": self.n_c2s,
+            "n_events": self.n_events,
+            "fetch_ns": self.fetch_ns,
+            "bus_ns": self.bus_ns,
+            "dispatch_ns": self.dispatch_ns,
+            "wall_ns": self.wall_ns,
+            "events_per_sec": self.events_per_sec,
+            "peak_s2c_depth": self.peak_s2c_depth,
+            "peak_c2s_depth": self.peak_c2s_depth,
+            "sim_time": self.sim_time,
+            "finished": self.finished,
+        }
+
+    def __repr__(self):
+        return (
+            f"RunStats(events={self.n_events} [data={self.n_data}, timer={self.n_timer}, "
+            f"s2c={self.n_s2c}, c2s={self.n_c2s}], wall={self.wall_ns / 1e9:.3f}s, "
+            f"events/s={self.events_per_sec:,.0f}, fetch={self.fetch_ns / 1e9:.3f}s, "
+            f"bus={self.bus_ns / 1e9:.3f}s, dispatch={self.dispatch_ns / 1e9:.3f}s, "
+            f"peak_depth=(s2c={self.peak_s2c_depth}, c2s={self.peak_c2s_depth}))"
+        )
 
 cdef class BacktestEngine:
     """
@@ -24,18 +69,58 @@ cdef class BacktestEngine:
     1. 时间单调性检查 (防止时间倒流)
     2. 自动熔断机制 (End Time Check)
     3. 类型安全检查
+
+    mode:
+        'dual'   (默认) 两个 EventEngine + 两条 DelayBus，完整模拟网络延迟。
+        'single' 零延迟快速模式：server/client 组件挂在同一个 EventEngine 上，
+                 没有 DelayBus，也没有 derive 快照。事件的 source 仍按组件所在侧
+                 标记（server_source_id / client_source_id），producer/ignore_self 语义不变。
+
+    timer_mode:
+        'dense'       (默认) 每个 timer_interval 都注入一个 Timer，包括没有数据的空档。
+        'on_activity' 只有上一个 tick 之后有数据到达，才注入 Timer；空 tick 直接跳过。
+        'catch_up'    空档内的连续空 tick 合并成一个 Timer（放在数据恢复前的最后一个网格点），
+                      Timer.skipped 记录被合并掉的 tick 数。
+        两种惰性模式下空档是 O(1) 跳过的，不会逐个生成 Timer。
+
+    server_timer_interval:
+        server 侧默认 Timer 的间隔（None = 不调度）。开启后 server 组件（撮合过期单、批量结算等）
+        有自己的节拍，client 的 Timer 不再经 C2S 总线搬运到 server，两侧节拍互相独立。
     """
     def __init__(
         self, 
         dataset, 
-        DelayBus server2client_delaybus, 
-        DelayBus client2server_delaybus, 
+        DelayBus server2client_delaybus=None, 
+        DelayBus client2server_delaybus=None, 
         timer_interval=1000,
         long long start_time=0,
-        long long end_time=LLONG_MAX
+        long long end_time=LLONG_MAX,
+        str mode='dual',
+        str timer_mode='dense',
+        server_timer_interval=None
     ):
+        if mode == 'dual':
+            self._single = False
+            if server2client_delaybus is None or client2server_delaybus is None:
+                raise ValueError("mode='dual' requires both server2client and client2server DelayBus")
+        elif mode == 'single':
+            self._single = True
+            if server2client_delaybus is not None or client2server_delaybus is not None:
+                raise ValueError("mode='single' does not use DelayBus, pass None for both buses")
+        else:
+            raise ValueError(f"Unknown mode: {mode!r}, expected 'dual' or 'single'")
+        self.mode = mode
+
         self.server_engine = EventEngine()
-        self.client_engine = EventEngine()
+        if self._single:
+            # 同一个引擎对象：server 侧沿用引擎自身 id，client 侧用本对象 id 区分
+            self.client_engine = self.server_engine
+            self.server_source_id = <unsigned long>self.server_engine._id
+            self.client_source_id = <unsigned long>id(self)
+        else:
+            self.client_engine = EventEngine()
+            self.server_source_id = <unsigned long>self.server_engine._id
+            self.client_source_id = <unsigned long>self.client_engine._id
         self.server_components = []
         self.client_components = []
         
@@ -53,14 +138,39 @@ cdef class BacktestEngine:
             self._use_timer = False
             self._timer_interval_v = 0
         else:
+            if timer_interval <= 0:
+                raise ValueError(f"timer_interval must be positive or None, got {timer_interval}")
             self._use_timer = True
             self._timer_interval_v = timer_interval
 
+        if timer_mode == 'dense':
+            self._timer_mode_v = TIMER_DENSE
+        elif timer_mode == 'on_activity':
+            self._timer_mode_v = TIMER_ON_ACTIVITY
+        elif timer_mode == 'catch_up':
+            self._timer_mode_v = TIMER_CATCH_UP
+        else:
+            raise ValueError(f"Unknown timer_mode: {timer_mode!r}, expected 'dense', 'on_activity' or 'catch_up'")
+        self.timer_mode = timer_mode
+        self._timer_names = {}
+        self._timer_seq = 0
+        self._data_seq = 0
+        self._started = False
+        # 默认 timer 都是 id 0；同一时刻 server 侧先于 client 侧
+        if server_timer_interval is not None:
+            if server_timer_interval <= 0:
+                raise ValueError(f"server_timer_interval must be positive or None, got {server_timer_interval}")
+            self._push_timer_slot(0, server_timer_interval, True)
+        if self._use_timer:
+            self._push_timer_slot(0, self._timer_interval_v, False)
+
         # 3. 记录起止时间
         self.start_time = start_time
         self.end_time = end_time
             
         # 4. 自动接线
+        if self._single:
+            return
         self.server2client_bus.set_target_engine(self.client_engine)
         self.client2server_bus.set_target_engine(self.server_engine)
         
@@ -72,10 +182,63 @@ cdef class BacktestEngine:
             self.server_components.append(component)
         else:
             self.client_components.append(component)
+
+    cpdef int add_timer(self, str name, long long interval, bint is_server=False) except -1:
+        """
+        添加一个命名 timer，返回它的 timer_id。
+        命名 timer 和默认 timer 一样对齐到第一条数据（或 start_time），遵循同一个 timer_mode，
+        但只派发给 engine.register_timer(name, ...) 的订阅者。必须在 run() 之前调用。
+        """
+        if self._started:
+            raise RuntimeError("add_timer() must be called before run()")
+        if interval <= 0:
+            raise ValueError(f"timer interval must be positive, got {interval}")
+        if name in self._timer_names:
+            raise ValueError(f"Timer {name!r} already added")
+        cdef int tid = timer_id_of(name)
+        self._timer_names[name] = tid
+        self._push_timer_slot(tid, interval, is_server)
+        return tid
             
-    cpdef run(self):
+    cpdef RunStats run(self, object progress=None, double progress_interval=1.0):
+        """
+        运行回测，返回 RunStats。
+        progress: 可选回调 progress(stats)，运行期间每隔 progress_interval 秒（墙钟）调用一次，
+                  结束时再以 stats.finished=True 调用一次。
+        """
+        self._started = True
+        cdef RunStats stats = RunStats.__new__(RunStats)
+        self.stats = stats
+        cdef long long interval_ns = <long long>(progress_interval * 1e9)
+        if progress is not None and interval_ns <= 0:
+            raise ValueError(f"progress_interval must be positive, got {progress_interval}")
+
+        # 按侧别调度 timer：server 侧有自己的默认 timer 时，不再接收 client 的默认节拍
+        cdef bint server_has_timer = False
+        cdef size_t i
+        for i in range(self._timers.size()):
+            if self._timers[i].is_server and self._timers[i].timer_id == 0:
+                server_has_timer = True
+                break
+
+        if self._single:
+            self.server_engine.scope_timers = server_has_timer
+            self._run_single(progress, interval_ns)
+            return stats
+
+        self.client2server_bus.forward_timers = not server_has_timer
+        # server 侧默认 Timer 是交易所本地节拍，永远不发给 client
+        self.server2client_bus.forward_timers = False
+
+        # 统计基线：总线可能被复用，只统计本次 run 的增量
+        self._s2c_base = self.server2client_bus.delivered
+        self._c2s_base = self.client2server_bus.delivered
+        self.server2client_bus.peak_depth = self.server2client_bus.depth()
+        self.client2server_bus.peak_depth = self.client2server_bus.depth()
+
         # 1. 启动组件
         cdef Component c
+        stats._t_start = monotonic_ns()
         for c_obj in self.server_components:
             c = <Component>c_obj
             c.start(self.server_engine)
@@ -94,25 +257,35 @@ cdef class BacktestEngine:
         cdef long long last_engine_time = self.start_time 
         
         cdef Event current_data = None
+
+        # 阶段计时：每个分支结束时读一次时钟，差值记到该分支所属阶段
+        cdef long long t_prev, t_now
+        cdef long long next_report = LLONG_MAX
         
         try:
+            t_prev = monotonic_ns()
             # 预读第一条数据
             current_data = self.dataset.fetch_next()
             
             # [逻辑]：快进到 start_time
             while current_data is not None and current_data.timestamp < self.start_time:
                 current_data = self.dataset.fetch_next()
+            t_now = monotonic_ns()
+            stats.fetch_ns += t_now - t_prev
+            t_prev = t_now
+            if progress is not None:
+                next_report = t_prev + interval_ns
             
             # Timer 初始化 (对齐到当前数据时间，或者 start_time)
-            if self._use_timer:
-                if current_data is not None:
-                    next_timer = current_data.timestamp
-                else:
-                    next_timer = self.start_time
+            if current_data is not None:
+                self._init_timers(current_data.timestamp)
+            else:
+                self._init_timers(self.start_time)
                 
             # --- 主循环 (纯 C 速度) ---
             while current_data is not None:
                 t_data = current_data.timestamp
+                next_timer = self._peek_timer()
                 
                 # 获取 DelayBus 触发时间
                 t_s2c = self.server2client_bus.peek_trigger_time()
@@ -140,27 +313,37 @@ cdef class BacktestEngine:
                 # --- [防傻设计 2]：熔断检查 (End Time) ---
                 if min_t > self.end_time:
                     break
+                stats.sim_time = min_t
         
                 # 优先级处理与事件分发
                 if t_s2c <= min_t:
                     self.server2client_bus.process_until(t_s2c)
-                    continue
-                
-                if t_c2s <= min_t:
+                    t_now = monotonic_ns()
+                    stats.bus_ns += t_now - t_prev
+                elif t_c2s <= min_t:
                     self.client2server_bus.process_until(t_c2s)
-                    continue
-                    
-                if next_timer <= min_t:
-                    self.client_engine.put(Timer(next_timer))
-                    if self._use_timer:
-                        next_timer += self._timer_interval_v
-                    else:
-                        next_timer = LLONG_MAX
-                    continue
-                    
-                if t_data == min_t:
+                    t_now = monotonic_ns()
+                    stats.bus_ns += t_now - t_prev
+                elif next_timer <= min_t:
+                    self._fire_timer(t_data)
+                    t_now = monotonic_ns()
+                    stats.dispatch_ns += t_now - t_prev
+                else:
+                    # t_data == min_t
                     self.server_engine.put(current_data)
+                    self._data_seq += 1
+                    stats.n_data += 1
+                    t_now = monotonic_ns()
+                    stats.dispatch_ns += t_now - t_prev
+                    t_prev = t_now
                     current_data = self.dataset.fetch_next()
+                    t_now = monotonic_ns()
+                    stats.fetch_ns += t_now - t_prev
+                t_prev = t_now
+
+                if t_now >= next_report:
+                    self._report(progress, t_now)
+                    next_report = t_now + interval_ns
             
             # --- 收尾逻辑 (处理剩余的在途延迟消息) ---
             while True:
@@ -187,14 +370,247 @@ cdef class BacktestEngine:
                 # --- [防傻设计 2 复用]：收尾阶段熔断 ---
                 if min_t > self.end_time:
                     break
+                stats.sim_time = min_t
                     
                 if t_s2c <= t_c2s:
                      self.server2client_bus.process_until(t_s2c)
                 else:
                      self.client2server_bus.process_until(t_c2s)
+                t_now = monotonic_ns()
+                stats.bus_ns += t_now - t_prev
+                t_prev = t_now
+
+                if t_now >= next_report:
+                    self._report(progress, t_now)
+                    next_report = t_now + interval_ns
                       
         finally:
             # 停止组件
             for c_obj in chain(self.server_components, self.client_components):
                 c = <Component>c_obj
-                c.stop()
\ No newline at end of file
+                c.stop()
+
+        stats.finished = True
+        if progress is not None:
+            self._report(progress, monotonic_ns())
+        else:
+            self._sync_stats(monotonic_ns())
+        return stats
+
+    cdef void _run_single(self, object progress, long long interval_ns) except *:
+        """
+        单引擎主循环：只有数据与 Timer 两路时间源。
+        server 组件先于 client 组件启动，因此同一事件总是先经过撮合/服务端账户，再到策略侧。
+        """
+        cdef EventEngine engine = self.server_engine
+        cdef Component c
+        cdef RunStats stats = self.stats
+
+        # 1. 启动组件（按侧别打 source 标记）
+        stats._t_start = monotonic_ns()
+        engine.register_source = self.server_source_id
+        for c_obj in self.server_components:
+            c = <Component>c_obj
+            c.start(engine)
+        engine.register_source = self.client_source_id
+        for c_obj in self.client_components:
+            c = <Component>c_obj
+            c.start(engine)
+        engine.register_source = 0
+
+        cdef long long t_data = LLONG_MAX
+        cdef long long next_timer = LLONG_MAX
+        cdef long long min_t = 0
+        cdef long long last_engine_time = self.start_time
+        cdef Event current_data = None
+        cdef long long t_prev, t_now
+        cdef long long next_report = LLONG_MAX
+
+        try:
+            t_prev = monotonic_ns()
+            current_data = self.dataset.fetch_next()
+            while current_data is not None and current_data.timestamp < self.start_time:
+                current_data = self.dataset.fetch_next()
+            t_now = monotonic_ns()
+            stats.fetch_ns += t_now - t_prev
+            t_prev = t_now
+            if progress is not None:
+                next_report = t_prev + interval_ns
+
+            if current_data is not None:
+                self._init_timers(current_data.timestamp)
+            else:
+                self._init_timers(self.start_time)
+
+            while current_data is not None:
+                t_data = current_data.timestamp
+                next_timer = self._peek_timer()
+                min_t = t_data
+                if next_timer < min_t: min_t = next_timer
+
+                if min_t < last_engine_time:
+                    raise RuntimeError(
+                        f"FATAL: Time travel detected! Engine time regression.\n"
+                        f"Current Engine Time: {last_engine_time}\n"
+                        f"Next Event Time:   {min_t}\n"
+                        f"Diff:              {min_t - last_engine_time}\n"
+                        f"Debug Sources:     Data={t_data}, Timer={next_timer}"
+                    )
+                last_engine_time = min_t
+
+                if min_t > self.end_time:
+                    break
+                stats.sim_time = min_t
+
+                # Timer 优先于同一时刻的数据（与双引擎模式一致）
+                if next_timer <= min_t:
+                    self._fire_timer(t_data)
+                    t_now = monotonic_ns()
+                    stats.dispatch_ns += t_now - t_prev
+                else:
+                    engine.put(current_data)
+                    self._data_seq += 1
+                    stats.n_data += 1
+                    t_now = monotonic_ns()
+                    stats.dispatch_ns += t_now - t_prev
+                    t_prev = t_now
+                    current_data = self.dataset.fetch_next()
+                    t_now = monotonic_ns()
+                    stats.fetch_ns += t_now - t_prev
+                t_prev = t_now
+
+                if t_now >= next_report:
+                    self._report(progress, t_now)
+                    next_report = t_now + interval_ns
+
+        finally:
+            for c_obj in chain(self.server_components, self.client_components):
+                c = <Component>c_obj
+                c.stop()
+
+        stats.finished = True
+        if progress is not None:
+            self._report(progress, monotonic_ns())
+        else:
+            self._sync_stats(monotonic_ns())
+
+    cdef void _sync_stats(self, long long now):
+        """把 DelayBus 上的计数同步进 stats（只在汇报/结束时调用，不在热路径上）"""
+        cdef RunStats stats = self.stats
+        stats.wall_ns = now - stats._t_start
+        if self._single:
+            return
+        stats.n_s2c = self.server2client_bus.delivered - self._s2c_base
+        stats.n_c2s = self.client2server_bus.delivered - self._c2s_base
+        stats.peak_s2c_depth = self.server2client_bus.peak_depth
+        stats.peak_c2s_depth = self.client2server_bus.peak_depth
+
+    cdef void _report(self, object progress, long long now) except *:
+        self._sync_stats(now)
+        progress(self.stats)
+
+    # ----------------------------------------------------
+    #  Timer 调度：按 (next_time, seq) 排序的小顶堆（C++ vector）
+    # ----------------------------------------------------
+
+    cdef void _push_timer_slot(self, int timer_id, long long interval, bint is_server):
+        cdef TimerSlot slot
+        slot.next_time = LLONG_MAX
+        slot.interval = interval
+        slot.skipped = 0
+        slot.last_seq = 0
+        slot.seq = self._timer_seq
+        slot.timer_id = timer_id
+        slot.is_server = is_server
+        self._timer_seq += 1
+        self._timers.push_back(slot)
+
+    cdef void _init_timers(self, long long t0):
+        # 所有 timer 对齐到同一起点；按 seq 顺序排列的等值数组本身就是合法的堆
+        cdef size_t i
+        for i in range(self._timers.size()):
+            self._timers[i].next_time = t0
+            self._timers[i].last_seq = self._data_seq
+
+    cdef inline long long _peek_timer(self):
+        if self._timers.empty():
+            return LLONG_MAX
+        return self._timers[0].next_time
+
+    cdef void _fire_timer(self, long long t_data) except *:
+        """
+        处理堆顶到期的 timer 网格点，并把它的下一个网格点放回堆里。
+        t_data 是下一条待处理数据的时间（调用时一定 >= 堆顶时间）。
+        """
+        cdef TimerSlot* slot = &self._timers[0]
+        cdef long long iv = slot.interval
+        cdef long long ts = slot.next_time
+        cdef long long n
+        cdef Timer timer
+        cdef EventEngine engine
+
+        if self._timer_mode_v != TIMER_DENSE and slot.last_seq == self._data_seq:
+            # 上一个 tick 之后没有数据到达
+            if self._timer_mode_v == TIMER_ON_ACTIVITY:
+                # 空 tick 丢弃：直接跳到数据到达之后的第一个网格点
+                # （同一时刻 Timer 先于数据，所以必须严格大于 t_data）
+                n = (t_data - ts) // iv + 1
+                slot.next_time = ts + n * iv
+                self._timer_sift_down(0)
+                return
+            # catch_up：跳到 t_data 之前（含）的最后一个网格点，在那里补发一个合并 Timer
+            n = (t_data - ts) // iv
+            if n > 0:
+                slot.skipped += n
+                slot.next_time = ts + n * iv
+                self._timer_sift_down(0)
+                return
+
+        timer = Timer.__new__(Timer)
+        timer.timestamp = ts
+        timer.producer = 0
+        timer.skipped = slot.skipped
+        timer.timer_id = slot.timer_id
+        if slot.is_server:
+            engine = self.server_engine
+            timer.source = self.server_source_id if self._single else 0
+        else:
+            engine = self.client_engine
+            timer.source = self.client_source_id if self._single else 0
+
+        # 先更新堆再派发：回调里看到的是一致的调度状态
+        slot.skipped = 0
+        slot.last_seq = self._data_seq
+        slot.next_time = ts + iv
+        self._timer_sift_down(0)
+
+        self.stats.n_timer += 1
+        engine.put(timer)
+
+    cdef void _timer_sift_down(self, size_t idx):
+        cdef size_t left, right, smallest
+        cdef size_t size = self._timers.size()
+        cdef TimerSlot temp
+
+        while True:
+            left = (idx << 1) + 1
+            right = left + 1
+            smallest = idx
+
+            if left < size and _slot_less(self._timers[left], self._timers[smallest]):
+                smallest = left
+            if right < size and _slot_less(self._timers[right], self._timers[smallest]):
+                smallest = right
+
+            if smallest == idx:
+                break
+            temp = self._timers[idx]
+            self._timers[idx] = self._timers[smallest]
+            self._timers[smallest] = temp
+            idx = smallest
+
+
+cdef inline bint _slot_less(TimerSlot& a, TimerSlot& b):
+    if a.next_time != b.next_time:
+        return a.next_time < b.next_time
+    return a.seq < b.seq
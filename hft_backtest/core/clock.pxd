@@ -0,0 +1,27 @@
+# hft_backtest/core/clock.pxd
+# cython: language_level=3
+#
+# 单调时钟（纳秒），供 profiling / telemetry 使用。只有 pxd，cimport 即内联进调用方模块。
+# Linux/MacOS 走 clock_gettime(CLOCK_MONOTONIC)，Windows 走 QueryPerformanceCounter。
+
+cdef extern from *:
+    """
+    #ifdef _WIN32
+    #include <windows.h>
+    static long long hft_monotonic_ns(void) {
+        static LARGE_INTEGER freq = {0};
+        LARGE_INTEGER c;
+        if (freq.QuadPart == 0) QueryPerformanceFrequency(&freq);
+        QueryPerformanceCounter(&c);
+        return (long long)((double)c.QuadPart * (1e9 / (double)freq.QuadPart));
+    }
+    #else
+    #include <time.h>
+    static long long hft_monotonic_ns(void) {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return (long long)ts.tv_sec * 1000000000LL + (long long)ts.tv_nsec;
+    }
+    #endif
+    """
+    long long monotonic_ns "hft_monotonic_ns" () nogil
@@ -1373,6 +1373,7 @@ static const char* const __pyx_f[] = {
   "cpython/type.pxd",
   "hft_backtest/core/event.pxd",
   "hft_backtest/core/event_engine.pxd",
+  "hft_backtest/core/timer.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* Atomics.proto (used by UnpackUnboundCMethod) */
@@ -1552,27 +1553,42 @@ static const char* const __pyx_f[] = {
 struct __pyx_obj_12hft_backtest_4core_5event_Event;
 struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine;
 struct __pyx_obj_12hft_backtest_4core_12event_engine_Component;
+struct __pyx_obj_12hft_backtest_4core_5timer_Timer;
 struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel;
 struct __pyx_obj_12hft_backtest_4core_8delaybus_FixedDelayModel;
 struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus;
 struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register;
+struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register_timer;
 struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_global_register;
+struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_enable_profile;
 
-/* "hft_backtest/core/event_engine.pxd":15
- *     cdef unsigned long _current_listener_id
+/* "hft_backtest/core/event_engine.pxd":23
+ *     cdef dict _listener_names       # {listener_id: "Class.method"}
  * 
  *     cpdef register(self, object event_type, object listener, bint ignore_self=*)             # <<<<<<<<<<<<<<
+ *     cpdef register_timer(self, str name, object listener, bint ignore_self=*)
  *     cpdef global_register(self, object listener, bint ignore_self=*, bint is_senior=*)
- *     cpdef put(self, Event event)
 */
 struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register {
   int __pyx_n;
   int ignore_self;
 };
 
-/* "hft_backtest/core/event_engine.pxd":16
+/* "hft_backtest/core/event_engine.pxd":24
  * 
  *     cpdef register(self, object event_type, object listener, bint ignore_self=*)
+ *     cpdef register_timer(self, str name, object listener, bint ignore_self=*)             # <<<<<<<<<<<<<<
+ *     cpdef global_register(self, object listener, bint ignore_self=*, bint is_senior=*)
+ *     cpdef put(self, Event event)
+*/
+struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register_timer {
+  int __pyx_n;
+  int ignore_self;
+};
+
+/* "hft_backtest/core/event_engine.pxd":25
+ *     cpdef register(self, object event_type, object listener, bint ignore_self=*)
+ *     cpdef register_timer(self, str name, object listener, bint ignore_self=*)
  *     cpdef global_register(self, object listener, bint ignore_self=*, bint is_senior=*)             # <<<<<<<<<<<<<<
  *     cpdef put(self, Event event)
  *     cdef void _drain(self)
@@ -1582,6 +1598,18 @@ struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_global_r
   int ignore_self;
   int is_senior;
 };
+
+/* "hft_backtest/core/event_engine.pxd":32
+ *     cdef void _record_call(self, object event_type, unsigned long lid, long long elapsed)
+ *     cdef void _record_put(self, Event event)
+ *     cpdef enable_profile(self, bint enabled=*)             # <<<<<<<<<<<<<<
+ *     cpdef reset_profile(self)
+ *     cpdef dict get_profile(self)
+*/
+struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_enable_profile {
+  int __pyx_n;
+  int enabled;
+};
 struct __pyx_t_12hft_backtest_4core_8delaybus_BusItem;
 
 /* "hft_backtest/core/delaybus.pxd":9
@@ -1627,14 +1655,22 @@ struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine {
   PyObject *senior_global_listeners;
   PyObject *junior_global_listeners;
   PyObject *listener_dict;
+  PyObject *timer_listener_dict;
   PyObject *_queue;
   int _dispatching;
   unsigned long _current_listener_id;
+  unsigned long register_source;
+  unsigned long _current_source_id;
+  int scope_timers;
+  int _profiling;
+  PyObject *_prof_listener;
+  PyObject *_prof_put;
+  PyObject *_listener_names;
 };
 
 
-/* "hft_backtest/core/event_engine.pxd":21
- *     cdef void _call_listener(self, object listener, bint ignore_self, Event event)
+/* "hft_backtest/core/event_engine.pxd":36
+ *     cpdef dict get_profile(self)
  * 
  * cdef class Component:             # <<<<<<<<<<<<<<
  *     cpdef start(self, EventEngine engine)
@@ -1646,6 +1682,20 @@ struct __pyx_obj_12hft_backtest_4core_12event_engine_Component {
 };
 
 
+/* "hft_backtest/core/timer.pxd":9
+ * cpdef object timer_name_of(int timer_id)
+ * 
+ * cdef class Timer(Event):             # <<<<<<<<<<<<<<
+ *     #  tick catch_up
+ *     cdef public long long skipped
+*/
+struct __pyx_obj_12hft_backtest_4core_5timer_Timer {
+  struct __pyx_obj_12hft_backtest_4core_5event_Event __pyx_base;
+  PY_LONG_LONG skipped;
+  int timer_id;
+};
+
+
 /* "hft_backtest/core/delaybus.pxd":13
  *     PyObject* event
  * 
@@ -1684,6 +1734,9 @@ struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus {
   struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *target_engine;
   struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *model;
   unsigned long _source_id;
+  int forward_timers;
+  PY_LONG_LONG delivered;
+  PY_LONG_LONG peak_depth;
   std::vector<struct __pyx_t_12hft_backtest_4core_8delaybus_BusItem>  _queue;
 };
 
@@ -1713,16 +1766,23 @@ static struct __pyx_vtabstruct_12hft_backtest_4core_5event_Event *__pyx_vtabptr_
 
 struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine {
   PyObject *(*__pyx_register)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register *__pyx_optional_args);
+  PyObject *(*register_timer)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_register_timer *__pyx_optional_args);
   PyObject *(*global_register)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_global_register *__pyx_optional_args);
   PyObject *(*put)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, struct __pyx_obj_12hft_backtest_4core_5event_Event *, int __pyx_skip_dispatch);
   void (*_drain)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *);
-  void (*_call_listener)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, int, struct __pyx_obj_12hft_backtest_4core_5event_Event *);
+  void (*_call_listener)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, int, unsigned long, struct __pyx_obj_12hft_backtest_4core_5event_Event *);
+  unsigned long (*_effective_register_source)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *);
+  void (*_record_call)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, PyObject *, unsigned long, PY_LONG_LONG);
+  void (*_record_put)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, struct __pyx_obj_12hft_backtest_4core_5event_Event *);
+  PyObject *(*enable_profile)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, int __pyx_skip_dispatch, struct __pyx_opt_args_12hft_backtest_4core_12event_engine_11EventEngine_enable_profile *__pyx_optional_args);
+  PyObject *(*reset_profile)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, int __pyx_skip_dispatch);
+  PyObject *(*get_profile)(struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine *__pyx_vtabptr_12hft_backtest_4core_12event_engine_EventEngine;
 
 
-/* "hft_backtest/core/event_engine.pxd":21
- *     cdef void _call_listener(self, object listener, bint ignore_self, Event event)
+/* "hft_backtest/core/event_engine.pxd":36
+ *     cpdef dict get_profile(self)
  * 
  * cdef class Component:             # <<<<<<<<<<<<<<
  *     cpdef start(self, EventEngine engine)
@@ -1736,7 +1796,21 @@ struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_Component {
 static struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_Component *__pyx_vtabptr_12hft_backtest_4core_12event_engine_Component;
 
 
-/* "hft_backtest/core/delaybus.pyx":20
+/* "hft_backtest/core/timer.pxd":9
+ * cpdef object timer_name_of(int timer_id)
+ * 
+ * cdef class Timer(Event):             # <<<<<<<<<<<<<<
+ *     #  tick catch_up
+ *     cdef public long long skipped
+*/
+
+struct __pyx_vtabstruct_12hft_backtest_4core_5timer_Timer {
+  struct __pyx_vtabstruct_12hft_backtest_4core_5event_Event __pyx_base;
+};
+static struct __pyx_vtabstruct_12hft_backtest_4core_5timer_Timer *__pyx_vtabptr_12hft_backtest_4core_5timer_Timer;
+
+
+/* "hft_backtest/core/delaybus.pyx":21
  * # ==========================================
  * 
  * cdef class LatencyModel:             # <<<<<<<<<<<<<<
@@ -1750,7 +1824,7 @@ struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_LatencyModel {
 static struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_LatencyModel *__pyx_vtabptr_12hft_backtest_4core_8delaybus_LatencyModel;
 
 
-/* "hft_backtest/core/delaybus.pyx":25
+/* "hft_backtest/core/delaybus.pyx":26
  *         return 0
  * 
  * cdef class FixedDelayModel(LatencyModel):             # <<<<<<<<<<<<<<
@@ -1764,7 +1838,7 @@ struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_FixedDelayModel {
 static struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_FixedDelayModel *__pyx_vtabptr_12hft_backtest_4core_8delaybus_FixedDelayModel;
 
 
-/* "hft_backtest/core/delaybus.pyx":37
+/* "hft_backtest/core/delaybus.pyx":38
  * # ==========================================
  * 
  * cdef class DelayBus(Component):             # <<<<<<<<<<<<<<
@@ -1780,6 +1854,7 @@ struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus {
   void (*_sift_down)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, size_t);
   int (*is_empty)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *);
   long (*peek_trigger_time)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *);
+  size_t (*depth)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *);
   PyObject *(*on_event)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, struct __pyx_obj_12hft_backtest_4core_5event_Event *, int __pyx_skip_dispatch);
   PyObject *(*process_until)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, long, int __pyx_skip_dispatch);
   PyObject *(*set_target_engine)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, int __pyx_skip_dispatch);
@@ -2701,6 +2776,9 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value);
+
 /* PyObjectCall2Args.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
@@ -2825,6 +2903,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
 static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, long __pyx_v_timestamp, int __pyx_skip_dispatch); /* proto*/
 static int __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_is_empty(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto*/
 static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto*/
+static size_t __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_depth(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto*/
 static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, long __pyx_v_trigger_time, struct __pyx_obj_12hft_backtest_4core_5event_Event *__pyx_v_event); /* proto*/
 static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto*/
 static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, size_t __pyx_v_idx); /* proto*/
@@ -2852,6 +2931,8 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 
 /* Module declarations from "libc.limits" */
 
+/* Module declarations from "hft_backtest.core.timer" */
+
 /* Module declarations from "hft_backtest.core.delaybus" */
 static PyObject *__pyx_f_12hft_backtest_4core_8delaybus___pyx_unpickle_LatencyModel__set_state(struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *, PyObject *); /*proto*/
 static PyObject *__pyx_f_12hft_backtest_4core_8delaybus___pyx_unpickle_FixedDelayModel__set_state(struct __pyx_obj_12hft_backtest_4core_8delaybus_FixedDelayModel *, PyObject *); /*proto*/
@@ -2880,12 +2961,17 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_4start(struct
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_6stop(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_8on_event(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, struct __pyx_obj_12hft_backtest_4core_5event_Event *__pyx_v_event); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10process_until(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, long __pyx_v_timestamp); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timestamp___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_13target_engine___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
 static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_13target_engine_2__set__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_13target_engine_4__del__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
+static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_2__set__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_9delivered___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus___pyx_unpickle_LatencyModel(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_2__pyx_unpickle_FixedDelayModel(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_12hft_backtest_4core_8delaybus_LatencyModel(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -2915,6 +3001,7 @@ typedef struct {
   PyTypeObject *__pyx_ptype_12hft_backtest_4core_5event_Event;
   PyTypeObject *__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine;
   PyTypeObject *__pyx_ptype_12hft_backtest_4core_12event_engine_Component;
+  PyTypeObject *__pyx_ptype_12hft_backtest_4core_5timer_Timer;
   PyObject *__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel;
   PyObject *__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel;
   PyObject *__pyx_type_12hft_backtest_4core_8delaybus_DelayBus;
@@ -2924,8 +3011,8 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
-  PyObject *__pyx_codeobj_tab[15];
-  PyObject *__pyx_string_tab[89];
+  PyObject *__pyx_codeobj_tab[16];
+  PyObject *__pyx_string_tab[93];
   PyObject *__pyx_number_tab[2];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -2980,82 +3067,86 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_DelayBus __pyx_string_tab[10]
 #define __pyx_n_u_DelayBus___reduce_cython __pyx_string_tab[11]
 #define __pyx_n_u_DelayBus___setstate_cython __pyx_string_tab[12]
-#define __pyx_n_u_DelayBus_on_event __pyx_string_tab[13]
-#define __pyx_n_u_DelayBus_process_until __pyx_string_tab[14]
-#define __pyx_n_u_DelayBus_set_target_engine __pyx_string_tab[15]
-#define __pyx_n_u_DelayBus_start __pyx_string_tab[16]
-#define __pyx_n_u_DelayBus_stop __pyx_string_tab[17]
-#define __pyx_n_u_FixedDelayModel __pyx_string_tab[18]
-#define __pyx_n_u_FixedDelayModel___reduce_cython __pyx_string_tab[19]
-#define __pyx_n_u_FixedDelayModel___setstate_cytho __pyx_string_tab[20]
-#define __pyx_n_u_FixedDelayModel_get_delay __pyx_string_tab[21]
-#define __pyx_n_u_LatencyModel __pyx_string_tab[22]
-#define __pyx_n_u_LatencyModel___reduce_cython __pyx_string_tab[23]
-#define __pyx_n_u_LatencyModel___setstate_cython __pyx_string_tab[24]
-#define __pyx_n_u_LatencyModel_get_delay __pyx_string_tab[25]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[26]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[27]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[28]
-#define __pyx_n_u_delay __pyx_string_tab[29]
-#define __pyx_n_u_delay_model __pyx_string_tab[30]
-#define __pyx_n_u_dict __pyx_string_tab[31]
-#define __pyx_n_u_dict_2 __pyx_string_tab[32]
-#define __pyx_n_u_engine __pyx_string_tab[33]
-#define __pyx_n_u_event __pyx_string_tab[34]
-#define __pyx_n_u_func __pyx_string_tab[35]
-#define __pyx_n_u_get_delay __pyx_string_tab[36]
-#define __pyx_n_u_getstate __pyx_string_tab[37]
-#define __pyx_n_u_hft_backtest_core_delaybus __pyx_string_tab[38]
-#define __pyx_n_u_inf __pyx_string_tab[39]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[40]
-#define __pyx_n_u_items __pyx_string_tab[41]
-#define __pyx_n_u_main __pyx_string_tab[42]
-#define __pyx_n_u_math __pyx_string_tab[43]
-#define __pyx_n_u_module __pyx_string_tab[44]
-#define __pyx_n_u_name __pyx_string_tab[45]
-#define __pyx_n_u_new __pyx_string_tab[46]
-#define __pyx_n_u_on_event __pyx_string_tab[47]
-#define __pyx_n_u_pop __pyx_string_tab[48]
-#define __pyx_n_u_process_until __pyx_string_tab[49]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[50]
-#define __pyx_n_u_pyx_result __pyx_string_tab[51]
-#define __pyx_n_u_pyx_state __pyx_string_tab[52]
-#define __pyx_n_u_pyx_type __pyx_string_tab[53]
-#define __pyx_n_u_pyx_unpickle_FixedDelayModel __pyx_string_tab[54]
-#define __pyx_n_u_pyx_unpickle_LatencyModel __pyx_string_tab[55]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[56]
-#define __pyx_n_u_qualname __pyx_string_tab[57]
-#define __pyx_n_u_reduce __pyx_string_tab[58]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[59]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[60]
-#define __pyx_n_u_self __pyx_string_tab[61]
-#define __pyx_n_u_set_name __pyx_string_tab[62]
-#define __pyx_n_u_set_target_engine __pyx_string_tab[63]
-#define __pyx_n_u_setdefault __pyx_string_tab[64]
-#define __pyx_n_u_setstate __pyx_string_tab[65]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[66]
-#define __pyx_n_u_start __pyx_string_tab[67]
-#define __pyx_n_u_state __pyx_string_tab[68]
-#define __pyx_n_u_stop __pyx_string_tab[69]
-#define __pyx_n_u_test __pyx_string_tab[70]
-#define __pyx_n_u_timestamp __pyx_string_tab[71]
-#define __pyx_n_u_update __pyx_string_tab[72]
-#define __pyx_n_u_use_setstate __pyx_string_tab[73]
-#define __pyx_n_u_values __pyx_string_tab[74]
-#define __pyx_kp_b_iso88591_6 __pyx_string_tab[75]
-#define __pyx_kp_b_iso88591_A __pyx_string_tab[76]
-#define __pyx_kp_b_iso88591_A_5_4q_e7_U_q_E_fJaq_k_1_F __pyx_string_tab[77]
-#define __pyx_kp_b_iso88591_A_G1F_a_vWE_Q_q_q_q_T_G1_T_A __pyx_string_tab[78]
-#define __pyx_kp_b_iso88591_A_N_at_K1 __pyx_string_tab[79]
-#define __pyx_kp_b_iso88591_A_Q __pyx_string_tab[80]
-#define __pyx_kp_b_iso88591_A_d_gV1_4wfA_t_1 __pyx_string_tab[81]
-#define __pyx_kp_b_iso88591_A_q __pyx_string_tab[82]
-#define __pyx_kp_b_iso88591_A_t1 __pyx_string_tab[83]
-#define __pyx_kp_b_iso88591_Q __pyx_string_tab[84]
-#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[85]
-#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_q_0_AWKwa_0_A __pyx_string_tab[86]
-#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[87]
-#define __pyx_kp_b_iso88591_q_0_kQR_xq_7_a_nA_1 __pyx_string_tab[88]
+#define __pyx_n_u_DelayBus_memory_footprint __pyx_string_tab[13]
+#define __pyx_n_u_DelayBus_on_event __pyx_string_tab[14]
+#define __pyx_n_u_DelayBus_process_until __pyx_string_tab[15]
+#define __pyx_n_u_DelayBus_set_target_engine __pyx_string_tab[16]
+#define __pyx_n_u_DelayBus_start __pyx_string_tab[17]
+#define __pyx_n_u_DelayBus_stop __pyx_string_tab[18]
+#define __pyx_n_u_FixedDelayModel __pyx_string_tab[19]
+#define __pyx_n_u_FixedDelayModel___reduce_cython __pyx_string_tab[20]
+#define __pyx_n_u_FixedDelayModel___setstate_cytho __pyx_string_tab[21]
+#define __pyx_n_u_FixedDelayModel_get_delay __pyx_string_tab[22]
+#define __pyx_n_u_LatencyModel __pyx_string_tab[23]
+#define __pyx_n_u_LatencyModel___reduce_cython __pyx_string_tab[24]
+#define __pyx_n_u_LatencyModel___setstate_cython __pyx_string_tab[25]
+#define __pyx_n_u_LatencyModel_get_delay __pyx_string_tab[26]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[27]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[28]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[29]
+#define __pyx_n_u_delay __pyx_string_tab[30]
+#define __pyx_n_u_delay_model __pyx_string_tab[31]
+#define __pyx_n_u_dict __pyx_string_tab[32]
+#define __pyx_n_u_dict_2 __pyx_string_tab[33]
+#define __pyx_n_u_engine __pyx_string_tab[34]
+#define __pyx_n_u_event __pyx_string_tab[35]
+#define __pyx_n_u_func __pyx_string_tab[36]
+#define __pyx_n_u_get_delay __pyx_string_tab[37]
+#define __pyx_n_u_getstate __pyx_string_tab[38]
+#define __pyx_n_u_hft_backtest_core_delaybus __pyx_string_tab[39]
+#define __pyx_n_u_inf __pyx_string_tab[40]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[41]
+#define __pyx_n_u_items __pyx_string_tab[42]
+#define __pyx_n_u_main __pyx_string_tab[43]
+#define __pyx_n_u_math __pyx_string_tab[44]
+#define __pyx_n_u_memory_footprint __pyx_string_tab[45]
+#define __pyx_n_u_module __pyx_string_tab[46]
+#define __pyx_n_u_name __pyx_string_tab[47]
+#define __pyx_n_u_new __pyx_string_tab[48]
+#define __pyx_n_u_on_event __pyx_string_tab[49]
+#define __pyx_n_u_pop __pyx_string_tab[50]
+#define __pyx_n_u_process_until __pyx_string_tab[51]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[52]
+#define __pyx_n_u_pyx_result __pyx_string_tab[53]
+#define __pyx_n_u_pyx_state __pyx_string_tab[54]
+#define __pyx_n_u_pyx_type __pyx_string_tab[55]
+#define __pyx_n_u_pyx_unpickle_FixedDelayModel __pyx_string_tab[56]
+#define __pyx_n_u_pyx_unpickle_LatencyModel __pyx_string_tab[57]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[58]
+#define __pyx_n_u_qualname __pyx_string_tab[59]
+#define __pyx_n_u_queue __pyx_string_tab[60]
+#define __pyx_n_u_reduce __pyx_string_tab[61]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[62]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[63]
+#define __pyx_n_u_self __pyx_string_tab[64]
+#define __pyx_n_u_set_name __pyx_string_tab[65]
+#define __pyx_n_u_set_target_engine __pyx_string_tab[66]
+#define __pyx_n_u_setdefault __pyx_string_tab[67]
+#define __pyx_n_u_setstate __pyx_string_tab[68]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[69]
+#define __pyx_n_u_start __pyx_string_tab[70]
+#define __pyx_n_u_state __pyx_string_tab[71]
+#define __pyx_n_u_stop __pyx_string_tab[72]
+#define __pyx_n_u_test __pyx_string_tab[73]
+#define __pyx_n_u_timestamp __pyx_string_tab[74]
+#define __pyx_n_u_update __pyx_string_tab[75]
+#define __pyx_n_u_use_setstate __pyx_string_tab[76]
+#define __pyx_n_u_values __pyx_string_tab[77]
+#define __pyx_kp_b_iso88591_6 __pyx_string_tab[78]
+#define __pyx_kp_b_iso88591_A __pyx_string_tab[79]
+#define __pyx_kp_b_iso88591_A_5_4q_4q_s_gV_S_T_Q_e7_U_q_E_fJ __pyx_string_tab[80]
+#define __pyx_kp_b_iso88591_A_G1F_a_vWE_Q_q_q_q_T_G1_T_A __pyx_string_tab[81]
+#define __pyx_kp_b_iso88591_A_N_at_K1 __pyx_string_tab[82]
+#define __pyx_kp_b_iso88591_A_Q __pyx_string_tab[83]
+#define __pyx_kp_b_iso88591_A_WE __pyx_string_tab[84]
+#define __pyx_kp_b_iso88591_A_d_gV1_4wfA_t_1 __pyx_string_tab[85]
+#define __pyx_kp_b_iso88591_A_q __pyx_string_tab[86]
+#define __pyx_kp_b_iso88591_A_t1 __pyx_string_tab[87]
+#define __pyx_kp_b_iso88591_Q __pyx_string_tab[88]
+#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[89]
+#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_q_0_AWKwa_0_A __pyx_string_tab[90]
+#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[91]
+#define __pyx_kp_b_iso88591_q_0_kQR_xq_7_a_nA_1 __pyx_string_tab[92]
 #define __pyx_int_115436977 __pyx_number_tab[0]
 #define __pyx_int_238750788 __pyx_number_tab[1]
 /* #### Code section: module_state_clear ### */
@@ -3076,14 +3167,15 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_5event_Event);
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine);
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_12event_engine_Component);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_5timer_Timer);
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel);
   Py_CLEAR(clear_module_state->__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel);
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel);
   Py_CLEAR(clear_module_state->__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel);
   Py_CLEAR(clear_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus);
   Py_CLEAR(clear_module_state->__pyx_type_12hft_backtest_4core_8delaybus_DelayBus);
-  for (int i=0; i<15; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<89; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<16; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<93; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
@@ -3111,14 +3203,15 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_5event_Event);
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine);
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_12event_engine_Component);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_5timer_Timer);
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel);
   Py_VISIT(traverse_module_state->__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel);
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel);
   Py_VISIT(traverse_module_state->__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel);
   Py_VISIT(traverse_module_state->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus);
   Py_VISIT(traverse_module_state->__pyx_type_12hft_backtest_4core_8delaybus_DelayBus);
-  for (int i=0; i<15; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<89; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<16; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<93; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
@@ -3133,7 +3226,7 @@ return 0;
 #endif
 /* #### Code section: module_code ### */
 
-/* "hft_backtest/core/delaybus.pyx":22
+/* "hft_backtest/core/delaybus.pyx":23
  * cdef class LatencyModel:
  *     """"""
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
@@ -3177,7 +3270,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(CYTH
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_get_delay); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 22, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_get_delay); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_12LatencyModel_1get_delay)) {
         __pyx_t_3 = NULL;
@@ -3200,10 +3293,10 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(CYTH
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_t_6 = __Pyx_PyLong_As_long(__pyx_t_2); if (unlikely((__pyx_t_6 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 22, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyLong_As_long(__pyx_t_2); if (unlikely((__pyx_t_6 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 23, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_6;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3222,7 +3315,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(CYTH
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":23
+  /* "hft_backtest/core/delaybus.pyx":24
  *     """"""
  *     cpdef long get_delay(self, Event event):
  *         return 0             # <<<<<<<<<<<<<<
@@ -3232,7 +3325,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(CYTH
   __pyx_r = 0;
   goto __pyx_L0;
 
-  /* "hft_backtest/core/delaybus.pyx":22
+  /* "hft_backtest/core/delaybus.pyx":23
  * cdef class LatencyModel:
  *     """"""
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
@@ -3293,32 +3386,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_event,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 22, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 23, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 22, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 23, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_delay", 0) < (0)) __PYX_ERR(0, 22, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_delay", 0) < (0)) __PYX_ERR(0, 23, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, i); __PYX_ERR(0, 22, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, i); __PYX_ERR(0, 23, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 22, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 23, __pyx_L3_error)
     }
     __pyx_v_event = ((struct __pyx_obj_12hft_backtest_4core_5event_Event *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 22, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 23, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3329,7 +3422,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 23, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(((struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *)__pyx_v_self), __pyx_v_event);
 
   /* function exit code */
@@ -3359,8 +3452,8 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_12LatencyModel_get_dela
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_delay", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(__pyx_v_self, __pyx_v_event, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 22, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay(__pyx_v_self, __pyx_v_event, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -3782,7 +3875,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_12LatencyModel_4__setst
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":27
+/* "hft_backtest/core/delaybus.pyx":28
  * cdef class FixedDelayModel(LatencyModel):
  *     """"""
  *     def __init__(self, long delay):             # <<<<<<<<<<<<<<
@@ -3812,32 +3905,32 @@ static int __pyx_pw_12hft_backtest_4core_8delaybus_15FixedDelayModel_1__init__(P
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_delay,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 27, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 28, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 28, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 27, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 28, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 27, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 28, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 27, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 28, __pyx_L3_error)
     }
-    __pyx_v_delay = __Pyx_PyLong_As_long(values[0]); if (unlikely((__pyx_v_delay == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 27, __pyx_L3_error)
+    __pyx_v_delay = __Pyx_PyLong_As_long(values[0]); if (unlikely((__pyx_v_delay == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 27, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 28, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3861,7 +3954,7 @@ static int __pyx_pw_12hft_backtest_4core_8delaybus_15FixedDelayModel_1__init__(P
 static int __pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel___init__(struct __pyx_obj_12hft_backtest_4core_8delaybus_FixedDelayModel *__pyx_v_self, long __pyx_v_delay) {
   int __pyx_r;
 
-  /* "hft_backtest/core/delaybus.pyx":28
+  /* "hft_backtest/core/delaybus.pyx":29
  *     """"""
  *     def __init__(self, long delay):
  *         self.delay = delay             # <<<<<<<<<<<<<<
@@ -3870,7 +3963,7 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel___init__(st
 */
   __pyx_v_self->delay = __pyx_v_delay;
 
-  /* "hft_backtest/core/delaybus.pyx":27
+  /* "hft_backtest/core/delaybus.pyx":28
  * cdef class FixedDelayModel(LatencyModel):
  *     """"""
  *     def __init__(self, long delay):             # <<<<<<<<<<<<<<
@@ -3883,7 +3976,7 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel___init__(st
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":30
+/* "hft_backtest/core/delaybus.pyx":31
  *         self.delay = delay
  * 
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
@@ -3927,7 +4020,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(s
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_get_delay); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_get_delay); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 31, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_15FixedDelayModel_3get_delay)) {
         __pyx_t_3 = NULL;
@@ -3950,10 +4043,10 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(s
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
-        __pyx_t_6 = __Pyx_PyLong_As_long(__pyx_t_2); if (unlikely((__pyx_t_6 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyLong_As_long(__pyx_t_2); if (unlikely((__pyx_t_6 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_6;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -3972,7 +4065,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(s
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":31
+  /* "hft_backtest/core/delaybus.pyx":32
  * 
  *     cpdef long get_delay(self, Event event):
  *         return self.delay             # <<<<<<<<<<<<<<
@@ -3982,7 +4075,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(s
   __pyx_r = __pyx_v_self->delay;
   goto __pyx_L0;
 
-  /* "hft_backtest/core/delaybus.pyx":30
+  /* "hft_backtest/core/delaybus.pyx":31
  *         self.delay = delay
  * 
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
@@ -4043,32 +4136,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_event,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 30, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 31, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 30, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 31, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_delay", 0) < (0)) __PYX_ERR(0, 30, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_delay", 0) < (0)) __PYX_ERR(0, 31, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, i); __PYX_ERR(0, 30, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, i); __PYX_ERR(0, 31, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 30, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 31, __pyx_L3_error)
     }
     __pyx_v_event = ((struct __pyx_obj_12hft_backtest_4core_5event_Event *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 30, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_delay", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 31, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4079,7 +4172,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 31, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel_2get_delay(((struct __pyx_obj_12hft_backtest_4core_8delaybus_FixedDelayModel *)__pyx_v_self), __pyx_v_event);
 
   /* function exit code */
@@ -4109,8 +4202,8 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel_2get_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_delay", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(__pyx_v_self, __pyx_v_event, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L1_error)
-  __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay(__pyx_v_self, __pyx_v_event, 1); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_long(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
@@ -4539,7 +4632,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_15FixedDelayModel_6__se
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":38
+/* "hft_backtest/core/delaybus.pyx":39
  * 
  * cdef class DelayBus(Component):
  *     def __init__(             # <<<<<<<<<<<<<<
@@ -4569,32 +4662,32 @@ static int __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_1__init__(PyObject
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_delay_model,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 38, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 39, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 38, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 39, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 38, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 39, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 38, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 39, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 38, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 39, __pyx_L3_error)
     }
     __pyx_v_delay_model = ((struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 38, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 39, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4605,7 +4698,7 @@ static int __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_1__init__(PyObject
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delay_model), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, 1, "delay_model", 0))) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_delay_model), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, 1, "delay_model", 0))) __PYX_ERR(0, 41, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus___init__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v_delay_model);
 
   /* function exit code */
@@ -4630,7 +4723,7 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus___init__(struct __p
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "hft_backtest/core/delaybus.pyx":42
+  /* "hft_backtest/core/delaybus.pyx":43
  *         LatencyModel delay_model,
  *     ):
  *         self.model = delay_model             # <<<<<<<<<<<<<<
@@ -4643,21 +4736,21 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus___init__(struct __p
   __Pyx_DECREF((PyObject *)__pyx_v_self->model);
   __pyx_v_self->model = __pyx_v_delay_model;
 
-  /* "hft_backtest/core/delaybus.pyx":43
+  /* "hft_backtest/core/delaybus.pyx":44
  *     ):
  *         self.model = delay_model
  *         self._source_id = 0             # <<<<<<<<<<<<<<
  *         self.target_engine = None
- * 
+ *         #  Timer timer
 */
   __pyx_v_self->_source_id = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":44
+  /* "hft_backtest/core/delaybus.pyx":45
  *         self.model = delay_model
  *         self._source_id = 0
  *         self.target_engine = None             # <<<<<<<<<<<<<<
- * 
- *     cpdef set_target_engine(self, EventEngine engine):
+ *         #  Timer timer
+ *         self.forward_timers = True
 */
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
@@ -4665,7 +4758,34 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus___init__(struct __p
   __Pyx_DECREF((PyObject *)__pyx_v_self->target_engine);
   __pyx_v_self->target_engine = ((struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *)Py_None);
 
-  /* "hft_backtest/core/delaybus.pyx":38
+  /* "hft_backtest/core/delaybus.pyx":47
+ *         self.target_engine = None
+ *         #  Timer timer
+ *         self.forward_timers = True             # <<<<<<<<<<<<<<
+ *         self.delivered = 0
+ *         self.peak_depth = 0
+*/
+  __pyx_v_self->forward_timers = 1;
+
+  /* "hft_backtest/core/delaybus.pyx":48
+ *         #  Timer timer
+ *         self.forward_timers = True
+ *         self.delivered = 0             # <<<<<<<<<<<<<<
+ *         self.peak_depth = 0
+ * 
+*/
+  __pyx_v_self->delivered = 0;
+
+  /* "hft_backtest/core/delaybus.pyx":49
+ *         self.forward_timers = True
+ *         self.delivered = 0
+ *         self.peak_depth = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef set_target_engine(self, EventEngine engine):
+*/
+  __pyx_v_self->peak_depth = 0;
+
+  /* "hft_backtest/core/delaybus.pyx":39
  * 
  * cdef class DelayBus(Component):
  *     def __init__(             # <<<<<<<<<<<<<<
@@ -4679,8 +4799,8 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus___init__(struct __p
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":46
- *         self.target_engine = None
+/* "hft_backtest/core/delaybus.pyx":51
+ *         self.peak_depth = 0
  * 
  *     cpdef set_target_engine(self, EventEngine engine):             # <<<<<<<<<<<<<<
  *         """
@@ -4722,7 +4842,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_eng
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_set_target_engine); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_set_target_engine); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_3set_target_engine)) {
         __Pyx_XDECREF(__pyx_r);
@@ -4746,7 +4866,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_eng
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
         __pyx_r = __pyx_t_2;
@@ -4767,7 +4887,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_eng
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":50
+  /* "hft_backtest/core/delaybus.pyx":55
  * 
  *         """
  *         self.target_engine = engine             # <<<<<<<<<<<<<<
@@ -4780,8 +4900,8 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_eng
   __Pyx_DECREF((PyObject *)__pyx_v_self->target_engine);
   __pyx_v_self->target_engine = __pyx_v_engine;
 
-  /* "hft_backtest/core/delaybus.pyx":46
- *         self.target_engine = None
+  /* "hft_backtest/core/delaybus.pyx":51
+ *         self.peak_depth = 0
  * 
  *     cpdef set_target_engine(self, EventEngine engine):             # <<<<<<<<<<<<<<
  *         """
@@ -4844,32 +4964,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_engine,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 46, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 51, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 46, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 51, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_target_engine", 0) < (0)) __PYX_ERR(0, 46, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_target_engine", 0) < (0)) __PYX_ERR(0, 51, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_target_engine", 1, 1, 1, i); __PYX_ERR(0, 46, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_target_engine", 1, 1, 1, i); __PYX_ERR(0, 51, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 46, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 51, __pyx_L3_error)
     }
     __pyx_v_engine = ((struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_target_engine", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 46, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_target_engine", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 51, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4880,7 +5000,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_engine), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine, 1, "engine", 0))) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_engine), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine, 1, "engine", 0))) __PYX_ERR(0, 51, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_2set_target_engine(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v_engine);
 
   /* function exit code */
@@ -4909,7 +5029,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_2set_target_e
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_target_engine", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_engine(__pyx_v_self, __pyx_v_engine, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_engine(__pyx_v_self, __pyx_v_engine, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 51, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4926,7 +5046,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_2set_target_e
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":52
+/* "hft_backtest/core/delaybus.pyx":57
  *         self.target_engine = engine
  * 
  *     cpdef start(self, EventEngine engine):             # <<<<<<<<<<<<<<
@@ -4971,7 +5091,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(struct _
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_start); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_start); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_5start)) {
         __Pyx_XDECREF(__pyx_r);
@@ -4995,7 +5115,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(struct _
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 52, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
         __pyx_r = __pyx_t_2;
@@ -5016,7 +5136,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(struct _
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":58
+  /* "hft_backtest/core/delaybus.pyx":63
  *         2.
  *         """
  *         self._source_id = engine._id             # <<<<<<<<<<<<<<
@@ -5026,24 +5146,24 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(struct _
   __pyx_t_6 = __pyx_v_engine->_id;
   __pyx_v_self->_source_id = __pyx_t_6;
 
-  /* "hft_backtest/core/delaybus.pyx":62
+  /* "hft_backtest/core/delaybus.pyx":67
  *         #  Global Listener on_event
  *         # is_senior=False (Junior)
  *         engine.global_register(self.on_event, ignore_self=False, is_senior=False)             # <<<<<<<<<<<<<<
  * 
  *     cpdef stop(self):
 */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_on_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_on_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_7.__pyx_n = 2;
   __pyx_t_7.ignore_self = 0;
   __pyx_t_7.is_senior = 0;
-  __pyx_t_2 = ((struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine *)__pyx_v_engine->__pyx_vtab)->global_register(__pyx_v_engine, __pyx_t_1, 0, &__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_t_2 = ((struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine *)__pyx_v_engine->__pyx_vtab)->global_register(__pyx_v_engine, __pyx_t_1, 0, &__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":52
+  /* "hft_backtest/core/delaybus.pyx":57
  *         self.target_engine = engine
  * 
  *     cpdef start(self, EventEngine engine):             # <<<<<<<<<<<<<<
@@ -5107,32 +5227,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_engine,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 52, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 57, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 52, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "start", 0) < (0)) __PYX_ERR(0, 52, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "start", 0) < (0)) __PYX_ERR(0, 57, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("start", 1, 1, 1, i); __PYX_ERR(0, 52, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("start", 1, 1, 1, i); __PYX_ERR(0, 57, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 52, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
     }
     __pyx_v_engine = ((struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("start", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 52, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("start", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 57, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5143,7 +5263,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_engine), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine, 1, "engine", 0))) __PYX_ERR(0, 52, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_engine), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine, 1, "engine", 0))) __PYX_ERR(0, 57, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_4start(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v_engine);
 
   /* function exit code */
@@ -5172,7 +5292,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_4start(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("start", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(__pyx_v_self, __pyx_v_engine, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_start(__pyx_v_self, __pyx_v_engine, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5189,7 +5309,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_4start(struct
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":64
+/* "hft_backtest/core/delaybus.pyx":69
  *         engine.global_register(self.on_event, ignore_self=False, is_senior=False)
  * 
  *     cpdef stop(self):             # <<<<<<<<<<<<<<
@@ -5232,7 +5352,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(CYTHON_UN
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_stop); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_stop); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_7stop)) {
         __Pyx_XDECREF(__pyx_r);
@@ -5256,7 +5376,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(CYTHON_UN
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 64, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 69, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
         __pyx_r = __pyx_t_2;
@@ -5277,7 +5397,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(CYTHON_UN
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":65
+  /* "hft_backtest/core/delaybus.pyx":70
  * 
  *     cpdef stop(self):
  *         pass             # <<<<<<<<<<<<<<
@@ -5301,7 +5421,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(CYTHON_UN
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":64
+/* "hft_backtest/core/delaybus.pyx":69
  *         engine.global_register(self.on_event, ignore_self=False, is_senior=False)
  * 
  *     cpdef stop(self):             # <<<<<<<<<<<<<<
@@ -5361,7 +5481,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_6stop(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_stop(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5378,7 +5498,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_6stop(struct
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":67
+/* "hft_backtest/core/delaybus.pyx":72
  *         pass
  * 
  *     cpdef on_event(self, Event event):             # <<<<<<<<<<<<<<
@@ -5405,9 +5525,10 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
   PyObject *__pyx_t_4 = NULL;
   size_t __pyx_t_5;
   int __pyx_t_6;
-  PY_LONG_LONG __pyx_t_7;
-  unsigned long __pyx_t_8;
-  long __pyx_t_9;
+  int __pyx_t_7;
+  PY_LONG_LONG __pyx_t_8;
+  unsigned long __pyx_t_9;
+  long __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -5428,7 +5549,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_on_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_on_event); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_9on_event)) {
         __Pyx_XDECREF(__pyx_r);
@@ -5452,7 +5573,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
           __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
         __pyx_r = __pyx_t_2;
@@ -5473,89 +5594,133 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":72
+  /* "hft_backtest/core/delaybus.pyx":77
  *         """
  *         # 1.  Source Engine
  *         if event.source != self._source_id:             # <<<<<<<<<<<<<<
  *             return
- * 
+ *         #  timer  add_timer  timer  forward_timers
 */
   __pyx_t_6 = (__pyx_v_event->source != __pyx_v_self->_source_id);
   if (__pyx_t_6) {
 
-    /* "hft_backtest/core/delaybus.pyx":73
+    /* "hft_backtest/core/delaybus.pyx":78
  *         # 1.  Source Engine
  *         if event.source != self._source_id:
  *             return             # <<<<<<<<<<<<<<
- * 
- *         #  derive ( copy.copy)
+ *         #  timer  add_timer  timer  forward_timers
+ *         if type(event) is Timer and ((<Timer>event).timer_id != 0 or not self.forward_timers):
 */
     __Pyx_XDECREF(__pyx_r);
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "hft_backtest/core/delaybus.pyx":72
+    /* "hft_backtest/core/delaybus.pyx":77
  *         """
  *         # 1.  Source Engine
  *         if event.source != self._source_id:             # <<<<<<<<<<<<<<
  *             return
+ *         #  timer  add_timer  timer  forward_timers
+*/
+  }
+
+  /* "hft_backtest/core/delaybus.pyx":80
+ *             return
+ *         #  timer  add_timer  timer  forward_timers
+ *         if type(event) is Timer and ((<Timer>event).timer_id != 0 or not self.forward_timers):             # <<<<<<<<<<<<<<
+ *             return
  * 
 */
+  __pyx_t_7 = (((PyObject *)Py_TYPE(((PyObject *)__pyx_v_event))) == ((PyObject *)__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5timer_Timer));
+  if (__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_7 = (((struct __pyx_obj_12hft_backtest_4core_5timer_Timer *)__pyx_v_event)->timer_id != 0);
+  if (!__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L5_bool_binop_done;
   }
+  __pyx_t_7 = (!__pyx_v_self->forward_timers);
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_6) {
 
-  /* "hft_backtest/core/delaybus.pyx":77
+    /* "hft_backtest/core/delaybus.pyx":81
+ *         #  timer  add_timer  timer  forward_timers
+ *         if type(event) is Timer and ((<Timer>event).timer_id != 0 or not self.forward_timers):
+ *             return             # <<<<<<<<<<<<<<
+ * 
+ *         #  derive ( copy.copy)
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "hft_backtest/core/delaybus.pyx":80
+ *             return
+ *         #  timer  add_timer  timer  forward_timers
+ *         if type(event) is Timer and ((<Timer>event).timer_id != 0 or not self.forward_timers):             # <<<<<<<<<<<<<<
+ *             return
+ * 
+*/
+  }
+
+  /* "hft_backtest/core/delaybus.pyx":85
  *         #  derive ( copy.copy)
  *         #
  *         cdef Event snapshot = event.derive()             # <<<<<<<<<<<<<<
  * 
  *         #  ( derive )
 */
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_12hft_backtest_4core_5event_Event *)__pyx_v_event->__pyx_vtab)->derive(__pyx_v_event, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_12hft_backtest_4core_5event_Event *)__pyx_v_event->__pyx_vtab)->derive(__pyx_v_event, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_snapshot = ((struct __pyx_obj_12hft_backtest_4core_5event_Event *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":80
+  /* "hft_backtest/core/delaybus.pyx":88
  * 
  *         #  ( derive )
  *         snapshot.timestamp = event.timestamp             # <<<<<<<<<<<<<<
  *         snapshot.source = event.source
  *         snapshot.producer = event.producer
 */
-  __pyx_t_7 = __pyx_v_event->timestamp;
-  __pyx_v_snapshot->timestamp = __pyx_t_7;
+  __pyx_t_8 = __pyx_v_event->timestamp;
+  __pyx_v_snapshot->timestamp = __pyx_t_8;
 
-  /* "hft_backtest/core/delaybus.pyx":81
+  /* "hft_backtest/core/delaybus.pyx":89
  *         #  ( derive )
  *         snapshot.timestamp = event.timestamp
  *         snapshot.source = event.source             # <<<<<<<<<<<<<<
  *         snapshot.producer = event.producer
  * 
 */
-  __pyx_t_8 = __pyx_v_event->source;
-  __pyx_v_snapshot->source = __pyx_t_8;
+  __pyx_t_9 = __pyx_v_event->source;
+  __pyx_v_snapshot->source = __pyx_t_9;
 
-  /* "hft_backtest/core/delaybus.pyx":82
+  /* "hft_backtest/core/delaybus.pyx":90
  *         snapshot.timestamp = event.timestamp
  *         snapshot.source = event.source
  *         snapshot.producer = event.producer             # <<<<<<<<<<<<<<
  * 
  *         # 2.  ()
 */
-  __pyx_t_8 = __pyx_v_event->producer;
-  __pyx_v_snapshot->producer = __pyx_t_8;
+  __pyx_t_9 = __pyx_v_event->producer;
+  __pyx_v_snapshot->producer = __pyx_t_9;
 
-  /* "hft_backtest/core/delaybus.pyx":85
+  /* "hft_backtest/core/delaybus.pyx":93
  * 
  *         # 2.  ()
  *         cdef long delay = self.model.get_delay(event)             # <<<<<<<<<<<<<<
  *         cdef long trigger_time = event.timestamp + delay
  * 
 */
-  __pyx_t_9 = ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_LatencyModel *)__pyx_v_self->model->__pyx_vtab)->get_delay(__pyx_v_self->model, __pyx_v_event, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L1_error)
-  __pyx_v_delay = __pyx_t_9;
+  __pyx_t_10 = ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_LatencyModel *)__pyx_v_self->model->__pyx_vtab)->get_delay(__pyx_v_self->model, __pyx_v_event, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_v_delay = __pyx_t_10;
 
-  /* "hft_backtest/core/delaybus.pyx":86
+  /* "hft_backtest/core/delaybus.pyx":94
  *         # 2.  ()
  *         cdef long delay = self.model.get_delay(event)
  *         cdef long trigger_time = event.timestamp + delay             # <<<<<<<<<<<<<<
@@ -5564,16 +5729,16 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(struc
 */
   __pyx_v_trigger_time = (__pyx_v_event->timestamp + __pyx_v_delay);
 
-  /* "hft_backtest/core/delaybus.pyx":89
+  /* "hft_backtest/core/delaybus.pyx":97
  * 
  *         # 3.  ( push  snapshot)
  *         self._push(trigger_time, snapshot)             # <<<<<<<<<<<<<<
  * 
  *     cpdef process_until(self, long timestamp):
 */
-  ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_push(__pyx_v_self, __pyx_v_trigger_time, __pyx_v_snapshot); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 89, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_push(__pyx_v_self, __pyx_v_trigger_time, __pyx_v_snapshot); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 97, __pyx_L1_error)
 
-  /* "hft_backtest/core/delaybus.pyx":67
+  /* "hft_backtest/core/delaybus.pyx":72
  *         pass
  * 
  *     cpdef on_event(self, Event event):             # <<<<<<<<<<<<<<
@@ -5638,32 +5803,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_event,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 67, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 72, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 67, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 72, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "on_event", 0) < (0)) __PYX_ERR(0, 67, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "on_event", 0) < (0)) __PYX_ERR(0, 72, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("on_event", 1, 1, 1, i); __PYX_ERR(0, 67, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("on_event", 1, 1, 1, i); __PYX_ERR(0, 72, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 67, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 72, __pyx_L3_error)
     }
     __pyx_v_event = ((struct __pyx_obj_12hft_backtest_4core_5event_Event *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("on_event", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 67, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("on_event", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 72, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5674,7 +5839,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_event), __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_5event_Event, 1, "event", 0))) __PYX_ERR(0, 72, __pyx_L1_error)
   __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_8on_event(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v_event);
 
   /* function exit code */
@@ -5703,7 +5868,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_8on_event(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_event", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(__pyx_v_self, __pyx_v_event, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event(__pyx_v_self, __pyx_v_event, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5720,7 +5885,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_8on_event(str
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":91
+/* "hft_backtest/core/delaybus.pyx":99
  *         self._push(trigger_time, snapshot)
  * 
  *     cpdef process_until(self, long timestamp):             # <<<<<<<<<<<<<<
@@ -5766,14 +5931,14 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_process_until); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_process_until); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_11process_until)) {
         __Pyx_XDECREF(__pyx_r);
         __pyx_t_3 = NULL;
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; 
-        __pyx_t_5 = __Pyx_PyLong_From_long(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 91, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyLong_From_long(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __pyx_t_6 = 1;
         #if CYTHON_UNPACK_METHODS
@@ -5793,7 +5958,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
           __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
           __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
         }
         __pyx_r = __pyx_t_2;
@@ -5814,7 +5979,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
     #endif
   }
 
-  /* "hft_backtest/core/delaybus.pyx":97
+  /* "hft_backtest/core/delaybus.pyx":105
  *         cdef BusItem item
  * 
  *         while not self._queue.empty():             # <<<<<<<<<<<<<<
@@ -5825,7 +5990,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
     __pyx_t_7 = (!__pyx_v_self->_queue.empty());
     if (!__pyx_t_7) break;
 
-    /* "hft_backtest/core/delaybus.pyx":98
+    /* "hft_backtest/core/delaybus.pyx":106
  * 
  *         while not self._queue.empty():
  *             item = self._queue.front()             # <<<<<<<<<<<<<<
@@ -5834,7 +5999,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
 */
     __pyx_v_item = __pyx_v_self->_queue.front();
 
-    /* "hft_backtest/core/delaybus.pyx":100
+    /* "hft_backtest/core/delaybus.pyx":108
  *             item = self._queue.front()
  * 
  *             if item.trigger_time > timestamp:             # <<<<<<<<<<<<<<
@@ -5844,7 +6009,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
     __pyx_t_7 = (__pyx_v_item.trigger_time > __pyx_v_timestamp);
     if (__pyx_t_7) {
 
-      /* "hft_backtest/core/delaybus.pyx":101
+      /* "hft_backtest/core/delaybus.pyx":109
  * 
  *             if item.trigger_time > timestamp:
  *                 break             # <<<<<<<<<<<<<<
@@ -5853,7 +6018,7 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
 */
       goto __pyx_L4_break;
 
-      /* "hft_backtest/core/delaybus.pyx":100
+      /* "hft_backtest/core/delaybus.pyx":108
  *             item = self._queue.front()
  * 
  *             if item.trigger_time > timestamp:             # <<<<<<<<<<<<<<
@@ -5862,18 +6027,18 @@ static PyObject *__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(
 */
     }
 
-    /* "hft_backtest/core/delaybus.pyx":103
+    /* "hft_backtest/core/delaybus.pyx":111
  *                 break
  * 
  *             self._pop_and_process()             # <<<<<<<<<<<<<<
  * 
- *     @property
+ *     def memory_footprint(self):
 */
-    ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_pop_and_process(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 103, __pyx_L1_error)
+    ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_pop_and_process(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
   }
   __pyx_L4_break:;
 
-  /* "hft_backtest/core/delaybus.pyx":91
+  /* "hft_backtest/core/delaybus.pyx":99
  *         self._push(trigger_time, snapshot)
  * 
  *     cpdef process_until(self, long timestamp):             # <<<<<<<<<<<<<<
@@ -5938,32 +6103,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_timestamp,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 91, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 99, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 99, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "process_until", 0) < (0)) __PYX_ERR(0, 91, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "process_until", 0) < (0)) __PYX_ERR(0, 99, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("process_until", 1, 1, 1, i); __PYX_ERR(0, 91, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("process_until", 1, 1, 1, i); __PYX_ERR(0, 99, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 91, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 99, __pyx_L3_error)
     }
-    __pyx_v_timestamp = __Pyx_PyLong_As_long(values[0]); if (unlikely((__pyx_v_timestamp == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
+    __pyx_v_timestamp = __Pyx_PyLong_As_long(values[0]); if (unlikely((__pyx_v_timestamp == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("process_until", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 91, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("process_until", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 99, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5993,7 +6158,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10process_unt
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("process_until", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(__pyx_v_self, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until(__pyx_v_self, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6010,9 +6175,108 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10process_unt
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":105
+/* "hft_backtest/core/delaybus.pyx":113
  *             self._pop_and_process()
  * 
+ *     def memory_footprint(self):             # <<<<<<<<<<<<<<
+ *         """MemoryMonitor """
+ *         return {"queue": self._queue.size()}
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint, "DelayBus.memory_footprint(self)\n\nMemoryMonitor \345\215\217\350\256\256\357\274\232\345\234\250\351\200\224\344\272\213\344\273\266\346\225\260");
+static PyMethodDef __pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint = {"memory_footprint", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint};
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("memory_footprint (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("memory_footprint", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("memory_footprint", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("memory_footprint", 0);
+
+  /* "hft_backtest/core/delaybus.pyx":115
+ *     def memory_footprint(self):
+ *         """MemoryMonitor """
+ *         return {"queue": self._queue.size()}             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyLong_FromSize_t(__pyx_v_self->_queue.size()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_queue, __pyx_t_2) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "hft_backtest/core/delaybus.pyx":113
+ *             self._pop_and_process()
+ * 
+ *     def memory_footprint(self):             # <<<<<<<<<<<<<<
+ *         """MemoryMonitor """
+ *         return {"queue": self._queue.size()}
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("hft_backtest.core.delaybus.DelayBus.memory_footprint", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hft_backtest/core/delaybus.pyx":117
+ *         return {"queue": self._queue.size()}
+ * 
  *     @property             # <<<<<<<<<<<<<<
  *     def next_timestamp(self):
  *         """"""
@@ -6044,7 +6308,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "hft_backtest/core/delaybus.pyx":108
+  /* "hft_backtest/core/delaybus.pyx":120
  *     def next_timestamp(self):
  *         """"""
  *         if self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6054,7 +6318,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
   __pyx_t_1 = __pyx_v_self->_queue.empty();
   if (__pyx_t_1) {
 
-    /* "hft_backtest/core/delaybus.pyx":109
+    /* "hft_backtest/core/delaybus.pyx":121
  *         """"""
  *         if self._queue.empty():
  *             return float('inf')             # <<<<<<<<<<<<<<
@@ -6062,14 +6326,14 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
  * 
 */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyUnicode_AsDouble(__pyx_mstate_global->__pyx_n_u_inf); if (unlikely(__PYX_CHECK_FLOAT_EXCEPTION(__pyx_t_2, ((double)((double)-1))) && PyErr_Occurred())) __PYX_ERR(0, 109, __pyx_L1_error)
-    __pyx_t_3 = PyFloat_FromDouble(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyUnicode_AsDouble(__pyx_mstate_global->__pyx_n_u_inf); if (unlikely(__PYX_CHECK_FLOAT_EXCEPTION(__pyx_t_2, ((double)((double)-1))) && PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L1_error)
+    __pyx_t_3 = PyFloat_FromDouble(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "hft_backtest/core/delaybus.pyx":108
+    /* "hft_backtest/core/delaybus.pyx":120
  *     def next_timestamp(self):
  *         """"""
  *         if self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6078,7 +6342,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
 */
   }
 
-  /* "hft_backtest/core/delaybus.pyx":110
+  /* "hft_backtest/core/delaybus.pyx":122
  *         if self._queue.empty():
  *             return float('inf')
  *         return self._queue.front().trigger_time             # <<<<<<<<<<<<<<
@@ -6086,14 +6350,14 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
  *     # ====================================================
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_PyLong_From_long(__pyx_v_self->_queue.front().trigger_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyLong_From_long(__pyx_v_self->_queue.front().trigger_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "hft_backtest/core/delaybus.pyx":105
- *             self._pop_and_process()
+  /* "hft_backtest/core/delaybus.pyx":117
+ *         return {"queue": self._queue.size()}
  * 
  *     @property             # <<<<<<<<<<<<<<
  *     def next_timestamp(self):
@@ -6111,7 +6375,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":117
+/* "hft_backtest/core/delaybus.pyx":129
  *     # ====================================================
  * 
  *     cdef bint is_empty(self):             # <<<<<<<<<<<<<<
@@ -6122,7 +6386,7 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14next_timest
 static int __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_is_empty(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
   int __pyx_r;
 
-  /* "hft_backtest/core/delaybus.pyx":119
+  /* "hft_backtest/core/delaybus.pyx":131
  *     cdef bint is_empty(self):
  *         """C """
  *         return self._queue.empty()             # <<<<<<<<<<<<<<
@@ -6132,7 +6396,7 @@ static int __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_is_empty(struct __py
   __pyx_r = __pyx_v_self->_queue.empty();
   goto __pyx_L0;
 
-  /* "hft_backtest/core/delaybus.pyx":117
+  /* "hft_backtest/core/delaybus.pyx":129
  *     # ====================================================
  * 
  *     cdef bint is_empty(self):             # <<<<<<<<<<<<<<
@@ -6145,7 +6409,7 @@ static int __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_is_empty(struct __py
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":121
+/* "hft_backtest/core/delaybus.pyx":133
  *         return self._queue.empty()
  * 
  *     cdef long peek_trigger_time(self):             # <<<<<<<<<<<<<<
@@ -6157,7 +6421,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
   long __pyx_r;
   int __pyx_t_1;
 
-  /* "hft_backtest/core/delaybus.pyx":126
+  /* "hft_backtest/core/delaybus.pyx":138
  *          LLONG_MAX
  *         """
  *         if self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6167,7 +6431,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
   __pyx_t_1 = __pyx_v_self->_queue.empty();
   if (__pyx_t_1) {
 
-    /* "hft_backtest/core/delaybus.pyx":127
+    /* "hft_backtest/core/delaybus.pyx":139
  *         """
  *         if self._queue.empty():
  *             return LLONG_MAX             # <<<<<<<<<<<<<<
@@ -6177,7 +6441,7 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
     __pyx_r = LLONG_MAX;
     goto __pyx_L0;
 
-    /* "hft_backtest/core/delaybus.pyx":126
+    /* "hft_backtest/core/delaybus.pyx":138
  *          LLONG_MAX
  *         """
  *         if self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6186,17 +6450,17 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
 */
   }
 
-  /* "hft_backtest/core/delaybus.pyx":128
+  /* "hft_backtest/core/delaybus.pyx":140
  *         if self._queue.empty():
  *             return LLONG_MAX
  *         return self._queue.front().trigger_time             # <<<<<<<<<<<<<<
  * 
- *     # ----------------------------------------------------
+ *     cdef size_t depth(self):
 */
   __pyx_r = __pyx_v_self->_queue.front().trigger_time;
   goto __pyx_L0;
 
-  /* "hft_backtest/core/delaybus.pyx":121
+  /* "hft_backtest/core/delaybus.pyx":133
  *         return self._queue.empty()
  * 
  *     cdef long peek_trigger_time(self):             # <<<<<<<<<<<<<<
@@ -6209,7 +6473,41 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
   return __pyx_r;
 }
 
-/* "hft_backtest/core/delaybus.pyx":134
+/* "hft_backtest/core/delaybus.pyx":142
+ *         return self._queue.front().trigger_time
+ * 
+ *     cdef size_t depth(self):             # <<<<<<<<<<<<<<
+ *         return self._queue.size()
+ * 
+*/
+
+static size_t __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_depth(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+  size_t __pyx_r;
+
+  /* "hft_backtest/core/delaybus.pyx":143
+ * 
+ *     cdef size_t depth(self):
+ *         return self._queue.size()             # <<<<<<<<<<<<<<
+ * 
+ *     # ----------------------------------------------------
+*/
+  __pyx_r = __pyx_v_self->_queue.size();
+  goto __pyx_L0;
+
+  /* "hft_backtest/core/delaybus.pyx":142
+ *         return self._queue.front().trigger_time
+ * 
+ *     cdef size_t depth(self):             # <<<<<<<<<<<<<<
+ *         return self._queue.size()
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "hft_backtest/core/delaybus.pyx":149
  *     # ----------------------------------------------------
  * 
  *     cdef void _push(self, long trigger_time, Event event):             # <<<<<<<<<<<<<<
@@ -6219,11 +6517,12 @@ static long __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time(s
 
 static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, long __pyx_v_trigger_time, struct __pyx_obj_12hft_backtest_4core_5event_Event *__pyx_v_event) {
   struct __pyx_t_12hft_backtest_4core_8delaybus_BusItem __pyx_v_item;
+  int __pyx_t_1;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":136
+  /* "hft_backtest/core/delaybus.pyx":151
  *     cdef void _push(self, long trigger_time, Event event):
  *         cdef BusItem item
  *         item.trigger_time = trigger_time             # <<<<<<<<<<<<<<
@@ -6232,7 +6531,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_
 */
   __pyx_v_item.trigger_time = __pyx_v_trigger_time;
 
-  /* "hft_backtest/core/delaybus.pyx":137
+  /* "hft_backtest/core/delaybus.pyx":152
  *         cdef BusItem item
  *         item.trigger_time = trigger_time
  *         item.event = <PyObject*>event             # <<<<<<<<<<<<<<
@@ -6241,7 +6540,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_
 */
   __pyx_v_item.event = ((PyObject *)__pyx_v_event);
 
-  /* "hft_backtest/core/delaybus.pyx":142
+  /* "hft_backtest/core/delaybus.pyx":157
  *         #  derive  copy.copy INCREF
  *         #  std::vector  Python
  *         Py_INCREF(event)             # <<<<<<<<<<<<<<
@@ -6250,30 +6549,58 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_
 */
   Py_INCREF(((PyObject *)__pyx_v_event));
 
-  /* "hft_backtest/core/delaybus.pyx":144
+  /* "hft_backtest/core/delaybus.pyx":159
  *         Py_INCREF(event)
  * 
  *         self._queue.push_back(item)             # <<<<<<<<<<<<<<
  *         self._sift_up(self._queue.size() - 1)
- * 
+ *         if <long long>self._queue.size() > self.peak_depth:
 */
   try {
     __pyx_v_self->_queue.push_back(__pyx_v_item);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 144, __pyx_L1_error)
+    __PYX_ERR(0, 159, __pyx_L1_error)
   }
 
-  /* "hft_backtest/core/delaybus.pyx":145
+  /* "hft_backtest/core/delaybus.pyx":160
  * 
  *         self._queue.push_back(item)
  *         self._sift_up(self._queue.size() - 1)             # <<<<<<<<<<<<<<
+ *         if <long long>self._queue.size() > self.peak_depth:
+ *             self.peak_depth = self._queue.size()
+*/
+  ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_sift_up(__pyx_v_self, (__pyx_v_self->_queue.size() - 1)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 160, __pyx_L1_error)
+
+  /* "hft_backtest/core/delaybus.pyx":161
+ *         self._queue.push_back(item)
+ *         self._sift_up(self._queue.size() - 1)
+ *         if <long long>self._queue.size() > self.peak_depth:             # <<<<<<<<<<<<<<
+ *             self.peak_depth = self._queue.size()
+ * 
+*/
+  __pyx_t_1 = (((PY_LONG_LONG)__pyx_v_self->_queue.size()) > __pyx_v_self->peak_depth);
+  if (__pyx_t_1) {
+
+    /* "hft_backtest/core/delaybus.pyx":162
+ *         self._sift_up(self._queue.size() - 1)
+ *         if <long long>self._queue.size() > self.peak_depth:
+ *             self.peak_depth = self._queue.size()             # <<<<<<<<<<<<<<
  * 
  *     cdef void _pop_and_process(self):
 */
-  ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_sift_up(__pyx_v_self, (__pyx_v_self->_queue.size() - 1)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L1_error)
+    __pyx_v_self->peak_depth = __pyx_v_self->_queue.size();
+
+    /* "hft_backtest/core/delaybus.pyx":161
+ *         self._queue.push_back(item)
+ *         self._sift_up(self._queue.size() - 1)
+ *         if <long long>self._queue.size() > self.peak_depth:             # <<<<<<<<<<<<<<
+ *             self.peak_depth = self._queue.size()
+ * 
+*/
+  }
 
-  /* "hft_backtest/core/delaybus.pyx":134
+  /* "hft_backtest/core/delaybus.pyx":149
  *     # ----------------------------------------------------
  * 
  *     cdef void _push(self, long trigger_time, Event event):             # <<<<<<<<<<<<<<
@@ -6288,8 +6615,8 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__push(struct __pyx_
   __pyx_L0:;
 }
 
-/* "hft_backtest/core/delaybus.pyx":147
- *         self._sift_up(self._queue.size() - 1)
+/* "hft_backtest/core/delaybus.pyx":164
+ *             self.peak_depth = self._queue.size()
  * 
  *     cdef void _pop_and_process(self):             # <<<<<<<<<<<<<<
  *         # 1.
@@ -6309,7 +6636,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_pop_and_process", 0);
 
-  /* "hft_backtest/core/delaybus.pyx":149
+  /* "hft_backtest/core/delaybus.pyx":166
  *     cdef void _pop_and_process(self):
  *         # 1.
  *         cdef BusItem top = self._queue.front()             # <<<<<<<<<<<<<<
@@ -6318,7 +6645,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   __pyx_v_top = __pyx_v_self->_queue.front();
 
-  /* "hft_backtest/core/delaybus.pyx":150
+  /* "hft_backtest/core/delaybus.pyx":167
  *         # 1.
  *         cdef BusItem top = self._queue.front()
  *         cdef Event event = <Event>top.event             # <<<<<<<<<<<<<<
@@ -6330,7 +6657,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
   __pyx_v_event = ((struct __pyx_obj_12hft_backtest_4core_5event_Event *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":153
+  /* "hft_backtest/core/delaybus.pyx":170
  * 
  *         # 2.
  *         cdef BusItem last = self._queue.back()             # <<<<<<<<<<<<<<
@@ -6339,7 +6666,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   __pyx_v_last = __pyx_v_self->_queue.back();
 
-  /* "hft_backtest/core/delaybus.pyx":154
+  /* "hft_backtest/core/delaybus.pyx":171
  *         # 2.
  *         cdef BusItem last = self._queue.back()
  *         self._queue.pop_back()             # <<<<<<<<<<<<<<
@@ -6348,7 +6675,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   __pyx_v_self->_queue.pop_back();
 
-  /* "hft_backtest/core/delaybus.pyx":156
+  /* "hft_backtest/core/delaybus.pyx":173
  *         self._queue.pop_back()
  * 
  *         if not self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6358,7 +6685,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
   __pyx_t_2 = (!__pyx_v_self->_queue.empty());
   if (__pyx_t_2) {
 
-    /* "hft_backtest/core/delaybus.pyx":157
+    /* "hft_backtest/core/delaybus.pyx":174
  * 
  *         if not self._queue.empty():
  *             self._queue[0] = last             # <<<<<<<<<<<<<<
@@ -6367,16 +6694,16 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
     (__pyx_v_self->_queue[0]) = __pyx_v_last;
 
-    /* "hft_backtest/core/delaybus.pyx":158
+    /* "hft_backtest/core/delaybus.pyx":175
  *         if not self._queue.empty():
  *             self._queue[0] = last
  *             self._sift_down(0)             # <<<<<<<<<<<<<<
  * 
  *         # 3.  Target Engine
 */
-    ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_sift_down(__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L1_error)
+    ((struct __pyx_vtabstruct_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self->__pyx_base.__pyx_vtab)->_sift_down(__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 175, __pyx_L1_error)
 
-    /* "hft_backtest/core/delaybus.pyx":156
+    /* "hft_backtest/core/delaybus.pyx":173
  *         self._queue.pop_back()
  * 
  *         if not self._queue.empty():             # <<<<<<<<<<<<<<
@@ -6385,7 +6712,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   }
 
-  /* "hft_backtest/core/delaybus.pyx":162
+  /* "hft_backtest/core/delaybus.pyx":179
  *         # 3.  Target Engine
  *         #
  *         if self.target_engine.timestamp < top.trigger_time:             # <<<<<<<<<<<<<<
@@ -6395,7 +6722,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
   __pyx_t_2 = (__pyx_v_self->target_engine->timestamp < __pyx_v_top.trigger_time);
   if (__pyx_t_2) {
 
-    /* "hft_backtest/core/delaybus.pyx":163
+    /* "hft_backtest/core/delaybus.pyx":180
  *         #
  *         if self.target_engine.timestamp < top.trigger_time:
  *             self.target_engine.timestamp = top.trigger_time             # <<<<<<<<<<<<<<
@@ -6405,7 +6732,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
     __pyx_t_3 = __pyx_v_top.trigger_time;
     __pyx_v_self->target_engine->timestamp = __pyx_t_3;
 
-    /* "hft_backtest/core/delaybus.pyx":162
+    /* "hft_backtest/core/delaybus.pyx":179
  *         # 3.  Target Engine
  *         #
  *         if self.target_engine.timestamp < top.trigger_time:             # <<<<<<<<<<<<<<
@@ -6414,18 +6741,27 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   }
 
-  /* "hft_backtest/core/delaybus.pyx":166
+  /* "hft_backtest/core/delaybus.pyx":183
  * 
  *         #
+ *         self.delivered += 1             # <<<<<<<<<<<<<<
+ *         self.target_engine.put(event)
+ * 
+*/
+  __pyx_v_self->delivered = (__pyx_v_self->delivered + 1);
+
+  /* "hft_backtest/core/delaybus.pyx":184
+ *         #
+ *         self.delivered += 1
  *         self.target_engine.put(event)             # <<<<<<<<<<<<<<
  * 
  *         # []
 */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine *)__pyx_v_self->target_engine->__pyx_vtab)->put(__pyx_v_self->target_engine, __pyx_v_event, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine *)__pyx_v_self->target_engine->__pyx_vtab)->put(__pyx_v_self->target_engine, __pyx_v_event, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":171
+  /* "hft_backtest/core/delaybus.pyx":189
  *         #  target_engine
  *         #  DelayBus
  *         Py_DECREF(event)             # <<<<<<<<<<<<<<
@@ -6434,8 +6770,8 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
 */
   Py_DECREF(((PyObject *)__pyx_v_event));
 
-  /* "hft_backtest/core/delaybus.pyx":147
- *         self._sift_up(self._queue.size() - 1)
+  /* "hft_backtest/core/delaybus.pyx":164
+ *             self.peak_depth = self._queue.size()
  * 
  *     cdef void _pop_and_process(self):             # <<<<<<<<<<<<<<
  *         # 1.
@@ -6452,7 +6788,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__pop_and_process(st
   __Pyx_RefNannyFinishContext();
 }
 
-/* "hft_backtest/core/delaybus.pyx":173
+/* "hft_backtest/core/delaybus.pyx":191
  *         Py_DECREF(event)
  * 
  *     cdef void _sift_up(self, size_t idx):             # <<<<<<<<<<<<<<
@@ -6465,7 +6801,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
   struct __pyx_t_12hft_backtest_4core_8delaybus_BusItem __pyx_v_temp;
   int __pyx_t_1;
 
-  /* "hft_backtest/core/delaybus.pyx":176
+  /* "hft_backtest/core/delaybus.pyx":194
  *         cdef size_t parent
  *         cdef BusItem temp
  *         while idx > 0:             # <<<<<<<<<<<<<<
@@ -6476,7 +6812,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
     __pyx_t_1 = (__pyx_v_idx > 0);
     if (!__pyx_t_1) break;
 
-    /* "hft_backtest/core/delaybus.pyx":177
+    /* "hft_backtest/core/delaybus.pyx":195
  *         cdef BusItem temp
  *         while idx > 0:
  *             parent = (idx - 1) >> 1             # <<<<<<<<<<<<<<
@@ -6485,7 +6821,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
 */
     __pyx_v_parent = ((__pyx_v_idx - 1) >> 1);
 
-    /* "hft_backtest/core/delaybus.pyx":178
+    /* "hft_backtest/core/delaybus.pyx":196
  *         while idx > 0:
  *             parent = (idx - 1) >> 1
  *             if self._queue[idx].trigger_time < self._queue[parent].trigger_time:             # <<<<<<<<<<<<<<
@@ -6495,7 +6831,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
     __pyx_t_1 = ((__pyx_v_self->_queue[__pyx_v_idx]).trigger_time < (__pyx_v_self->_queue[__pyx_v_parent]).trigger_time);
     if (__pyx_t_1) {
 
-      /* "hft_backtest/core/delaybus.pyx":179
+      /* "hft_backtest/core/delaybus.pyx":197
  *             parent = (idx - 1) >> 1
  *             if self._queue[idx].trigger_time < self._queue[parent].trigger_time:
  *                 temp = self._queue[idx]             # <<<<<<<<<<<<<<
@@ -6504,7 +6840,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
 */
       __pyx_v_temp = (__pyx_v_self->_queue[__pyx_v_idx]);
 
-      /* "hft_backtest/core/delaybus.pyx":180
+      /* "hft_backtest/core/delaybus.pyx":198
  *             if self._queue[idx].trigger_time < self._queue[parent].trigger_time:
  *                 temp = self._queue[idx]
  *                 self._queue[idx] = self._queue[parent]             # <<<<<<<<<<<<<<
@@ -6513,7 +6849,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
 */
       (__pyx_v_self->_queue[__pyx_v_idx]) = (__pyx_v_self->_queue[__pyx_v_parent]);
 
-      /* "hft_backtest/core/delaybus.pyx":181
+      /* "hft_backtest/core/delaybus.pyx":199
  *                 temp = self._queue[idx]
  *                 self._queue[idx] = self._queue[parent]
  *                 self._queue[parent] = temp             # <<<<<<<<<<<<<<
@@ -6522,7 +6858,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
 */
       (__pyx_v_self->_queue[__pyx_v_parent]) = __pyx_v_temp;
 
-      /* "hft_backtest/core/delaybus.pyx":182
+      /* "hft_backtest/core/delaybus.pyx":200
  *                 self._queue[idx] = self._queue[parent]
  *                 self._queue[parent] = temp
  *                 idx = parent             # <<<<<<<<<<<<<<
@@ -6531,7 +6867,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
 */
       __pyx_v_idx = __pyx_v_parent;
 
-      /* "hft_backtest/core/delaybus.pyx":178
+      /* "hft_backtest/core/delaybus.pyx":196
  *         while idx > 0:
  *             parent = (idx - 1) >> 1
  *             if self._queue[idx].trigger_time < self._queue[parent].trigger_time:             # <<<<<<<<<<<<<<
@@ -6541,7 +6877,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
       goto __pyx_L5;
     }
 
-    /* "hft_backtest/core/delaybus.pyx":184
+    /* "hft_backtest/core/delaybus.pyx":202
  *                 idx = parent
  *             else:
  *                 break             # <<<<<<<<<<<<<<
@@ -6555,7 +6891,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
   }
   __pyx_L4_break:;
 
-  /* "hft_backtest/core/delaybus.pyx":173
+  /* "hft_backtest/core/delaybus.pyx":191
  *         Py_DECREF(event)
  * 
  *     cdef void _sift_up(self, size_t idx):             # <<<<<<<<<<<<<<
@@ -6566,7 +6902,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_up(struct __p
   /* function exit code */
 }
 
-/* "hft_backtest/core/delaybus.pyx":186
+/* "hft_backtest/core/delaybus.pyx":204
  *                 break
  * 
  *     cdef void _sift_down(self, size_t idx):             # <<<<<<<<<<<<<<
@@ -6583,7 +6919,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
   int __pyx_t_1;
   int __pyx_t_2;
 
-  /* "hft_backtest/core/delaybus.pyx":188
+  /* "hft_backtest/core/delaybus.pyx":206
  *     cdef void _sift_down(self, size_t idx):
  *         cdef size_t left, right, smallest
  *         cdef size_t size = self._queue.size()             # <<<<<<<<<<<<<<
@@ -6592,7 +6928,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
   __pyx_v_size = __pyx_v_self->_queue.size();
 
-  /* "hft_backtest/core/delaybus.pyx":191
+  /* "hft_backtest/core/delaybus.pyx":209
  *         cdef BusItem temp
  * 
  *         while True:             # <<<<<<<<<<<<<<
@@ -6601,7 +6937,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
   while (1) {
 
-    /* "hft_backtest/core/delaybus.pyx":192
+    /* "hft_backtest/core/delaybus.pyx":210
  * 
  *         while True:
  *             left = (idx << 1) + 1             # <<<<<<<<<<<<<<
@@ -6610,7 +6946,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
     __pyx_v_left = ((__pyx_v_idx << 1) + 1);
 
-    /* "hft_backtest/core/delaybus.pyx":193
+    /* "hft_backtest/core/delaybus.pyx":211
  *         while True:
  *             left = (idx << 1) + 1
  *             right = left + 1             # <<<<<<<<<<<<<<
@@ -6619,7 +6955,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
     __pyx_v_right = (__pyx_v_left + 1);
 
-    /* "hft_backtest/core/delaybus.pyx":194
+    /* "hft_backtest/core/delaybus.pyx":212
  *             left = (idx << 1) + 1
  *             right = left + 1
  *             smallest = idx             # <<<<<<<<<<<<<<
@@ -6628,7 +6964,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
     __pyx_v_smallest = __pyx_v_idx;
 
-    /* "hft_backtest/core/delaybus.pyx":196
+    /* "hft_backtest/core/delaybus.pyx":214
  *             smallest = idx
  * 
  *             if left < size and self._queue[left].trigger_time < self._queue[smallest].trigger_time:             # <<<<<<<<<<<<<<
@@ -6646,7 +6982,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "hft_backtest/core/delaybus.pyx":197
+      /* "hft_backtest/core/delaybus.pyx":215
  * 
  *             if left < size and self._queue[left].trigger_time < self._queue[smallest].trigger_time:
  *                 smallest = left             # <<<<<<<<<<<<<<
@@ -6655,7 +6991,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       __pyx_v_smallest = __pyx_v_left;
 
-      /* "hft_backtest/core/delaybus.pyx":196
+      /* "hft_backtest/core/delaybus.pyx":214
  *             smallest = idx
  * 
  *             if left < size and self._queue[left].trigger_time < self._queue[smallest].trigger_time:             # <<<<<<<<<<<<<<
@@ -6664,7 +7000,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
     }
 
-    /* "hft_backtest/core/delaybus.pyx":198
+    /* "hft_backtest/core/delaybus.pyx":216
  *             if left < size and self._queue[left].trigger_time < self._queue[smallest].trigger_time:
  *                 smallest = left
  *             if right < size and self._queue[right].trigger_time < self._queue[smallest].trigger_time:             # <<<<<<<<<<<<<<
@@ -6682,7 +7018,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
     __pyx_L9_bool_binop_done:;
     if (__pyx_t_1) {
 
-      /* "hft_backtest/core/delaybus.pyx":199
+      /* "hft_backtest/core/delaybus.pyx":217
  *                 smallest = left
  *             if right < size and self._queue[right].trigger_time < self._queue[smallest].trigger_time:
  *                 smallest = right             # <<<<<<<<<<<<<<
@@ -6691,7 +7027,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       __pyx_v_smallest = __pyx_v_right;
 
-      /* "hft_backtest/core/delaybus.pyx":198
+      /* "hft_backtest/core/delaybus.pyx":216
  *             if left < size and self._queue[left].trigger_time < self._queue[smallest].trigger_time:
  *                 smallest = left
  *             if right < size and self._queue[right].trigger_time < self._queue[smallest].trigger_time:             # <<<<<<<<<<<<<<
@@ -6700,7 +7036,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
     }
 
-    /* "hft_backtest/core/delaybus.pyx":201
+    /* "hft_backtest/core/delaybus.pyx":219
  *                 smallest = right
  * 
  *             if smallest != idx:             # <<<<<<<<<<<<<<
@@ -6710,7 +7046,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
     __pyx_t_1 = (__pyx_v_smallest != __pyx_v_idx);
     if (__pyx_t_1) {
 
-      /* "hft_backtest/core/delaybus.pyx":202
+      /* "hft_backtest/core/delaybus.pyx":220
  * 
  *             if smallest != idx:
  *                 temp = self._queue[idx]             # <<<<<<<<<<<<<<
@@ -6719,7 +7055,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       __pyx_v_temp = (__pyx_v_self->_queue[__pyx_v_idx]);
 
-      /* "hft_backtest/core/delaybus.pyx":203
+      /* "hft_backtest/core/delaybus.pyx":221
  *             if smallest != idx:
  *                 temp = self._queue[idx]
  *                 self._queue[idx] = self._queue[smallest]             # <<<<<<<<<<<<<<
@@ -6728,7 +7064,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       (__pyx_v_self->_queue[__pyx_v_idx]) = (__pyx_v_self->_queue[__pyx_v_smallest]);
 
-      /* "hft_backtest/core/delaybus.pyx":204
+      /* "hft_backtest/core/delaybus.pyx":222
  *                 temp = self._queue[idx]
  *                 self._queue[idx] = self._queue[smallest]
  *                 self._queue[smallest] = temp             # <<<<<<<<<<<<<<
@@ -6737,7 +7073,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       (__pyx_v_self->_queue[__pyx_v_smallest]) = __pyx_v_temp;
 
-      /* "hft_backtest/core/delaybus.pyx":205
+      /* "hft_backtest/core/delaybus.pyx":223
  *                 self._queue[idx] = self._queue[smallest]
  *                 self._queue[smallest] = temp
  *                 idx = smallest             # <<<<<<<<<<<<<<
@@ -6746,7 +7082,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
 */
       __pyx_v_idx = __pyx_v_smallest;
 
-      /* "hft_backtest/core/delaybus.pyx":201
+      /* "hft_backtest/core/delaybus.pyx":219
  *                 smallest = right
  * 
  *             if smallest != idx:             # <<<<<<<<<<<<<<
@@ -6756,7 +7092,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
       goto __pyx_L11;
     }
 
-    /* "hft_backtest/core/delaybus.pyx":207
+    /* "hft_backtest/core/delaybus.pyx":225
  *                 idx = smallest
  *             else:
  *                 break             # <<<<<<<<<<<<<<
@@ -6768,7 +7104,7 @@ static void __pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down(struct _
   }
   __pyx_L4_break:;
 
-  /* "hft_backtest/core/delaybus.pyx":186
+  /* "hft_backtest/core/delaybus.pyx":204
  *                 break
  * 
  *     cdef void _sift_down(self, size_t idx):             # <<<<<<<<<<<<<<
@@ -6893,6 +7229,187 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_13target_engine_4__
   return __pyx_r;
 }
 
+/* "hft_backtest/core/delaybus.pxd":24
+ * 
+ *     cdef unsigned long _source_id
+ *     cdef public bint forward_timers             # <<<<<<<<<<<<<<
+ * 
+ *     # BacktestEngine  RunStats
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers___get__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->forward_timers); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("hft_backtest.core.delaybus.DelayBus.forward_timers.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_2__set__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_2__set__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(2, 24, __pyx_L1_error)
+  __pyx_v_self->forward_timers = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("hft_backtest.core.delaybus.DelayBus.forward_timers.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "hft_backtest/core/delaybus.pxd":27
+ * 
+ *     # BacktestEngine  RunStats
+ *     cdef readonly long long delivered             # <<<<<<<<<<<<<<
+ *     cdef readonly long long peak_depth
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_9delivered_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_9delivered_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_9delivered___get__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_9delivered___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_PY_LONG_LONG(__pyx_v_self->delivered); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("hft_backtest.core.delaybus.DelayBus.delivered.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "hft_backtest/core/delaybus.pxd":28
+ *     # BacktestEngine  RunStats
+ *     cdef readonly long long delivered
+ *     cdef readonly long long peak_depth             # <<<<<<<<<<<<<<
+ * 
+ *     #
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth___get__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth___get__(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_PY_LONG_LONG(__pyx_v_self->peak_depth); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("hft_backtest.core.delaybus.DelayBus.peak_depth.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
 /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError, "self._queue cannot be converted to a Python object for pickling"
@@ -6900,16 +7417,16 @@ static int __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_13target_engine_4__
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__, "DelayBus.__reduce_cython__(self)");
-static PyMethodDef __pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__};
-static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__, "DelayBus.__reduce_cython__(self)");
+static PyMethodDef __pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__};
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6935,14 +7452,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
   if (unlikely(__pyx_kwds_len < 0)) return NULL;
   if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
-  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -6982,16 +7499,16 @@ static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cy
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__, "DelayBus.__setstate_cython__(self, __pyx_state)");
-static PyMethodDef __pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__};
-static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__, "DelayBus.__setstate_cython__(self, __pyx_state)");
+static PyMethodDef __pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__};
+static PyObject *__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7057,7 +7574,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__(((struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7067,7 +7584,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -7984,15 +8501,41 @@ static int __pyx_setprop_12hft_backtest_4core_8delaybus_8DelayBus_target_engine(
   }
 }
 
+static PyObject *__pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_forward_timers(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_1__get__(o);
+}
+
+static int __pyx_setprop_12hft_backtest_4core_8delaybus_8DelayBus_forward_timers(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_14forward_timers_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_delivered(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_9delivered_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_peak_depth(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_10peak_depth_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_12hft_backtest_4core_8delaybus_DelayBus[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__setstate_cython__},
+  {"memory_footprint", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_12memory_footprint},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_14__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_12hft_backtest_4core_8delaybus_8DelayBus_16__setstate_cython__},
   {0, 0, 0, 0}
 };
 
 static struct PyGetSetDef __pyx_getsets_12hft_backtest_4core_8delaybus_DelayBus[] = {
   {"next_timestamp", __pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_next_timestamp, 0, PyDoc_STR("\350\216\267\345\217\226\344\270\213\344\270\200\344\270\252\346\234\200\346\227\251\350\247\246\345\217\221\347\232\204\346\227\266\351\227\264"), 0},
   {"target_engine", __pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_target_engine, __pyx_setprop_12hft_backtest_4core_8delaybus_8DelayBus_target_engine, PyDoc_STR("target_engine: hft_backtest.core.event_engine.EventEngine"), 0},
+  {"forward_timers", __pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_forward_timers, __pyx_setprop_12hft_backtest_4core_8delaybus_8DelayBus_forward_timers, PyDoc_STR("forward_timers: 'bool'"), 0},
+  {"delivered", __pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_delivered, 0, 0, 0},
+  {"peak_depth", __pyx_getprop_12hft_backtest_4core_8delaybus_8DelayBus_peak_depth, 0, 0, 0},
   {0, 0, 0, 0, 0}
 };
 #if CYTHON_USE_TYPE_SPECS
@@ -8147,15 +8690,15 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_vtabptr_12hft_backtest_4core_8delaybus_LatencyModel = &__pyx_vtable_12hft_backtest_4core_8delaybus_LatencyModel;
   __pyx_vtable_12hft_backtest_4core_8delaybus_LatencyModel.get_delay = (long (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *, struct __pyx_obj_12hft_backtest_4core_5event_Event *, int __pyx_skip_dispatch))__pyx_f_12hft_backtest_4core_8delaybus_12LatencyModel_get_delay;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel)) __PYX_ERR(0, 20, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel)) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel = &__pyx_type_12hft_backtest_4core_8delaybus_LatencyModel;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel);
@@ -8165,20 +8708,20 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, __pyx_vtabptr_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_LatencyModel, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 20, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, __pyx_vtabptr_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_LatencyModel, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel) < (0)) __PYX_ERR(0, 21, __pyx_L1_error)
   __pyx_vtabptr_12hft_backtest_4core_8delaybus_FixedDelayModel = &__pyx_vtable_12hft_backtest_4core_8delaybus_FixedDelayModel;
   __pyx_vtable_12hft_backtest_4core_8delaybus_FixedDelayModel.__pyx_base = *__pyx_vtabptr_12hft_backtest_4core_8delaybus_LatencyModel;
   __pyx_vtable_12hft_backtest_4core_8delaybus_FixedDelayModel.__pyx_base.get_delay = (long (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_LatencyModel *, struct __pyx_obj_12hft_backtest_4core_5event_Event *, int __pyx_skip_dispatch))__pyx_f_12hft_backtest_4core_8delaybus_15FixedDelayModel_get_delay;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_Pack(1, (PyObject *)__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel_spec, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel)) __PYX_ERR(0, 25, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel = &__pyx_type_12hft_backtest_4core_8delaybus_FixedDelayModel;
   #endif
@@ -8186,7 +8729,7 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel->tp_base = __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel);
@@ -8196,10 +8739,10 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel, __pyx_vtabptr_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_FixedDelayModel, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel, __pyx_vtabptr_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_FixedDelayModel, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel) < (0)) __PYX_ERR(0, 26, __pyx_L1_error)
   __pyx_t_1 = PyImport_ImportModule("hft_backtest.core.event_engine"); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_12event_engine_Component = __Pyx_ImportType_3_2_4(__pyx_t_1, "hft_backtest.core.event_engine", "Component",
@@ -8222,16 +8765,17 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus._sift_down = (void (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, size_t))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus__sift_down;
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.is_empty = (int (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_is_empty;
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.peek_trigger_time = (long (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_peek_trigger_time;
+  __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.depth = (size_t (*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_depth;
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.on_event = (PyObject *(*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, struct __pyx_obj_12hft_backtest_4core_5event_Event *, int __pyx_skip_dispatch))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_on_event;
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.process_until = (PyObject *(*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, long, int __pyx_skip_dispatch))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_process_until;
   __pyx_vtable_12hft_backtest_4core_8delaybus_DelayBus.set_target_engine = (PyObject *(*)(struct __pyx_obj_12hft_backtest_4core_8delaybus_DelayBus *, struct __pyx_obj_12hft_backtest_4core_12event_engine_EventEngine *, int __pyx_skip_dispatch))__pyx_f_12hft_backtest_4core_8delaybus_8DelayBus_set_target_engine;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_t_2 = PyTuple_Pack(1, (PyObject *)__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_Component); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_Pack(1, (PyObject *)__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_Component); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_12hft_backtest_4core_8delaybus_DelayBus_spec, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus)) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_DelayBus_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (unlikely(!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus)) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_12hft_backtest_4core_8delaybus_DelayBus_spec, __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus = &__pyx_type_12hft_backtest_4core_8delaybus_DelayBus;
   #endif
@@ -8239,7 +8783,7 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus->tp_base = __pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_12event_engine_Component;
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus);
@@ -8249,10 +8793,10 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_vtabptr_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_DelayBus, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 37, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_vtabptr_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_DelayBus, (PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus) < (0)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -8310,6 +8854,19 @@ static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine) __PYX_ERR(5, 4, __pyx_L1_error)
   __pyx_vtabptr_12hft_backtest_4core_12event_engine_EventEngine = (struct __pyx_vtabstruct_12hft_backtest_4core_12event_engine_EventEngine*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_12event_engine_EventEngine); if (unlikely(!__pyx_vtabptr_12hft_backtest_4core_12event_engine_EventEngine)) __PYX_ERR(5, 4, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("hft_backtest.core.timer"); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_12hft_backtest_4core_5timer_Timer = __Pyx_ImportType_3_2_4(__pyx_t_1, "hft_backtest.core.timer", "Timer",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12hft_backtest_4core_5timer_Timer), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12hft_backtest_4core_5timer_Timer),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12hft_backtest_4core_5timer_Timer), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12hft_backtest_4core_5timer_Timer),
+  #else
+  sizeof(struct __pyx_obj_12hft_backtest_4core_5timer_Timer), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12hft_backtest_4core_5timer_Timer),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12hft_backtest_4core_5timer_Timer) __PYX_ERR(6, 9, __pyx_L1_error)
+  __pyx_vtabptr_12hft_backtest_4core_5timer_Timer = (struct __pyx_vtabstruct_12hft_backtest_4core_5timer_Timer*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12hft_backtest_4core_5timer_Timer); if (unlikely(!__pyx_vtabptr_12hft_backtest_4core_5timer_Timer)) __PYX_ERR(6, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8615,19 +9172,19 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_math, __pyx_t_2) < (0)) __PYX_ERR(0, 10, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":22
+  /* "hft_backtest/core/delaybus.pyx":23
  * cdef class LatencyModel:
  *     """"""
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
  *         return 0
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_12LatencyModel_1get_delay, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LatencyModel_get_delay, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_12LatencyModel_1get_delay, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_LatencyModel_get_delay, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, __pyx_mstate_global->__pyx_n_u_get_delay, __pyx_t_2) < (0)) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, __pyx_mstate_global->__pyx_n_u_get_delay, __pyx_t_2) < (0)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -8657,19 +9214,19 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
   if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_LatencyModel, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":30
+  /* "hft_backtest/core/delaybus.pyx":31
  *         self.delay = delay
  * 
  *     cpdef long get_delay(self, Event event):             # <<<<<<<<<<<<<<
  *         return self.delay
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_15FixedDelayModel_3get_delay, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_FixedDelayModel_get_delay, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_15FixedDelayModel_3get_delay, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_FixedDelayModel_get_delay, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel, __pyx_mstate_global->__pyx_n_u_get_delay, __pyx_t_2) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel, __pyx_mstate_global->__pyx_n_u_get_delay, __pyx_t_2) < (0)) __PYX_ERR(0, 31, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -8699,79 +9256,94 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
   if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_FixedDelayModel, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":46
- *         self.target_engine = None
+  /* "hft_backtest/core/delaybus.pyx":51
+ *         self.peak_depth = 0
  * 
  *     cpdef set_target_engine(self, EventEngine engine):             # <<<<<<<<<<<<<<
  *         """
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_3set_target_engine, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_set_target_engine, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_3set_target_engine, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_set_target_engine, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_set_target_engine, __pyx_t_2) < (0)) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_set_target_engine, __pyx_t_2) < (0)) __PYX_ERR(0, 51, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":52
+  /* "hft_backtest/core/delaybus.pyx":57
  *         self.target_engine = engine
  * 
  *     cpdef start(self, EventEngine engine):             # <<<<<<<<<<<<<<
  *         """
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_5start, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_start, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 52, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_5start, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_start, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_start, __pyx_t_2) < (0)) __PYX_ERR(0, 52, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_start, __pyx_t_2) < (0)) __PYX_ERR(0, 57, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":64
+  /* "hft_backtest/core/delaybus.pyx":69
  *         engine.global_register(self.on_event, ignore_self=False, is_senior=False)
  * 
  *     cpdef stop(self):             # <<<<<<<<<<<<<<
  *         pass
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_7stop, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_stop, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_7stop, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_stop, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_stop, __pyx_t_2) < (0)) __PYX_ERR(0, 64, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_stop, __pyx_t_2) < (0)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":67
+  /* "hft_backtest/core/delaybus.pyx":72
  *         pass
  * 
  *     cpdef on_event(self, Event event):             # <<<<<<<<<<<<<<
  *         """
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_9on_event, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_on_event, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_9on_event, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_on_event, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_on_event, __pyx_t_2) < (0)) __PYX_ERR(0, 67, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_on_event, __pyx_t_2) < (0)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "hft_backtest/core/delaybus.pyx":91
+  /* "hft_backtest/core/delaybus.pyx":99
  *         self._push(trigger_time, snapshot)
  * 
  *     cpdef process_until(self, long timestamp):             # <<<<<<<<<<<<<<
  *         """
  *          trigger_time <= timestamp
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_11process_until, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_process_until, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_11process_until, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_process_until, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_process_until, __pyx_t_2) < (0)) __PYX_ERR(0, 91, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_process_until, __pyx_t_2) < (0)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "hft_backtest/core/delaybus.pyx":113
+ *             self._pop_and_process()
+ * 
+ *     def memory_footprint(self):             # <<<<<<<<<<<<<<
+ *         """MemoryMonitor """
+ *         return {"queue": self._queue.size()}
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_13memory_footprint, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus_memory_footprint, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_12hft_backtest_4core_8delaybus_DelayBus, __pyx_mstate_global->__pyx_n_u_memory_footprint, __pyx_t_2) < (0)) __PYX_ERR(0, 113, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -8779,7 +9351,7 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
  *     raise TypeError, "self._queue cannot be converted to a Python object for pickling"
  * def __setstate_cython__(self, __pyx_state):
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_13__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_15__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -8793,7 +9365,7 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "self._queue cannot be converted to a Python object for pickling"
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_15__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_8DelayBus_17__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_DelayBus___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -8808,7 +9380,7 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
  *     cdef object __pyx_result
  *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0xe3b0c44, 0xda39a3e, 0xd41d8cd, b'')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_1__pyx_unpickle_LatencyModel, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_LatencyModel, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_1__pyx_unpickle_LatencyModel, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_LatencyModel, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -8821,7 +9393,7 @@ __Pyx_RefNannySetupContext("PyInit_delaybus", 0);
  *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_3__pyx_unpickle_FixedDelayModel, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_FixedDelayModel, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_12hft_backtest_4core_8delaybus_3__pyx_unpickle_FixedDelayModel, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_FixedDelayModel, NULL, __pyx_mstate_global->__pyx_n_u_hft_backtest_core_delaybus, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[15])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -8899,31 +9471,31 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 8; } index[] = {{179},{1},{8},{7},{6},{2},{30},{9},{63},{14},{8},{26},{28},{17},{22},{26},{14},{13},{15},{33},{35},{25},{12},{30},{32},{22},{20},{18},{18},{5},{11},{8},{5},{6},{5},{8},{9},{12},{26},{3},{13},{5},{8},{4},{10},{8},{7},{8},{3},{13},{14},{12},{11},{10},{30},{27},{14},{12},{10},{17},{13},{4},{12},{17},{10},{12},{19},{5},{5},{4},{8},{9},{6},{12},{6},{11},{2},{99},{89},{33},{12},{50},{7},{9},{9},{11},{91},{57},{55}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1080 bytes) */
-const char* const cstring = "BZh91AY&SY\277i\352\326\000\000\270\177\377\357\377\376\213\357\337\367\335\277\277\177\200\277\377\377\344\300@@@@@@@@@@@@\000@\000P\003\275\262\nh\000\302\022\240M\022&j?T\363\3253T\364\200\006M\240M\352\206M=CF\200\365\032l\210\323i\017L\024\366\223S\324~R\tM@!2\236\0214\324\361\006\247\251=M2\0004\r\000\000\000\000\000\03244\323\3248\320\320\006\200\006\200\000\000\003@\000\000\0002\000\000\030\2004\324SS\365OS\324\006\200\323A\220\032\000a1\r\006 \r\0004\r1\006#\324\320\003\215\r\000h\000h\000\000\0004\000\000\000\003 \000\001\210\014\r\261\305\222\240x\021\035\252\210\353\277\210\023\364\021\362,\307\362[\204(\036\006\211(\010Lw\"\301\010\275\022\036FB\350\321\"y\3369a\030 }\344\034\340\234\034C3--R \211\215\022\306\345\031\243\036\010%\033\022\3378\372\004\227\343\277\306\275\267\2770\022F\3101%\220b\345fG\206N\201jh\334\252t\335\327)0\246.\202\326\213\261\324\037\245+KK\252C\nd\0220\317\2460\"61\204\313\214\327\256\207\023\312\362\030e\355\372\224\317]O*\333N\316\363\212X#\231]\337t8\302\350\026\240\345\003>\236\271\305\252\347|\034\314S\332\345\300\325\232\273\017\355_!\031K\016\023\337\252\205\251\014/r\252\276z\342\226\2635\333P\374\377\201\370\331\"C\215eL\307\022\025;\257\003\2526\016f\213\017Q\306\016\376%\035\223\376{\265w*\230\363sf\353B0j\266\275\245d\200{\\\"C\336\n\216-Q\345p\025\246\2513M:#\212=\"\2414\236c\023\247\215\026\272:\326\345}\023\250\345\273a\201E\303\237b\021?\002\00593\322\327\301\007R\241\336\035mZ\215\006?\347\215\330\007\361\232]\224\306\214\212x3\205M[\215\206\3339>\232\335:\002*b\000'3i\351Y\246\346bm\205\226\177\266\304V\001=\3732\3077&Z\016L\372\333jKb]\255k$\222KLS\237m\233\013lT\nq\240\215\250\344>Z\336-\020z\200\tA\r\230S,}ocBW\263\260tL,/$\330+q\236\306\023\t0\350\026fU.\3376\236\326rS5dUCt\211l#x\240\035{\203%\0078c6v\342\342*\211\2229j\341\251@\\5\302\226J\274\252v\274#\316\306\267\321\233\177\200<m\351\222  cq\224\301\355\010dD\223\242\373G\264\034:\013`\3509\231&I\307\253\214\247\324\213\024\241\212\n&\203(\032\212P""\210\205_\211\213R\275\007l\r\310O\345\030\343\315<\252:]W\205\347Mg\333\300`]\224I\017u\221\2735\374\014\317\320\355\\\372\372f\343\260;zy\233]\313\027\234V\332\310\305\333\n\030\223\037R\243\243\302\342\266\014\243\001ClwY\031\031\237\241Q\005\312\235;b!\004\243h\220\316}?T;\232nW\355}\246\275\233\342?\"<\204\300\347}\342f+\202\261\232\307;:b\302\322\217\013\203\220b\342\027g%I\265\244\346\342\026\215j\204\227\031\257\203\273Q\250j]\016\244#r\317`l\257\264\024Ac\236;Blg\312?\223v\227\246i\260\235\2167\201\344\243JI$\222\021\013\272\250\221\255\0014\000\236v\274\223\274J\212\304\211\024\265\214\337\021\275`\370\331\022&\277x\367\206\n\346nO\037\324\320\213\230\342\230O+\0251\234a\275l,p\357\030\313\2257:e\274\373\267\016\266\345\353\374\020\250\301\016\276\357\356\326{\224\251x\246\355\371wLf*\361\363c\354\346\027Q\376\337\331q\220?\276\022\255\230\31240\225\213\205c`\347\327?\022\223#n\315]_J\017G`\255C\013\215\247\212\204\321';\2353\257\014\026L\336\271\207\016B\241\021T\362T\204\235\"\n\3677\376.\344\212p\241!~\323\325\254";
-    PyObject *data = __Pyx_DecompressString(cstring, 1080, 2);
+    const struct { const unsigned int length: 8; } index[] = {{179},{1},{8},{7},{6},{2},{30},{9},{63},{14},{8},{26},{28},{25},{17},{22},{26},{14},{13},{15},{33},{35},{25},{12},{30},{32},{22},{20},{18},{18},{5},{11},{8},{5},{6},{5},{8},{9},{12},{26},{3},{13},{5},{8},{4},{16},{10},{8},{7},{8},{3},{13},{14},{12},{11},{10},{30},{27},{14},{12},{5},{10},{17},{13},{4},{12},{17},{10},{12},{19},{5},{5},{4},{8},{9},{6},{12},{6},{11},{2},{135},{89},{33},{12},{15},{50},{7},{9},{9},{11},{91},{57},{55}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1142 bytes) */
+const char* const cstring = "BZh91AY&SY\314\240`\325\000\000\302\377\377\377\377\376\213\357\337\367\335\277\277\177\200\277\377\377\344\300@@@@@@@@@@@@\000@\000P\003\373\326\343\035\224\264U\267\027\rS&\242z\200\007\251\247\247\25144\320\320\001\240\332F@\321\240h\320\323\324\323@=\0314\207\265M3 \323Ra4\320\251\370\025?MS\305<(\000\001\240\r\000\000\320d\000\000\014\232\r\000\224#BM2\247\251\247\224\036\215CC@\000\0004\000\000\000\003@\007\250z\206\236\246\207\000\000\320\000\320\006\200\000\r\030\200\001\240\000\000\000\001\240\002SPS\322hOCA5?*hm#\324\320\001\243@\000\000\000\000\000\006\200\032P\271K\260Ua{bd\306\211\223\371\372\312\202\177\2054\313\rD\236`\237\330!9\212\252\251\002\023\017\260\300\241\027\"\344\304\013\004\205\257\216D\330\2369_#\004\017\234\2130N,\221\273Z\336\234\022\254\347\230\261\235f\2515\036AV\241<P\241\245i\223\037'\036\222|0\031P:\271\224A\014\242\0325\250\000\327j&X\"\r\341\317\n X\300\3415c\030\300W_$G\177\371\243\331\027\014WY\327\004\212\255\300\305\206\"V\305\270N%\240\347Pu\224\005\323f\227]\357\261O\210?k\033\372\033\201\201\324\221\234\267}\205B\231\326\223\0202\240\026]\277\030\005\363\253\303\231\004}\314\264\213\347\232\022\217\311\241\300\212\332\355\230\360>11!\001\322{\374\3220\234\"Y\361\221\201x>\005\357\215\224,\250h\r\232]\020\330(\2672\301\023t&\261\204p\202\275\370\267\342O\212o\226\232p\221\001L\364\257w\007\212S\024\022W$\004\022\301I\020\272D\032\246 \257\263`.*\025*$\325\234b\220U*\027\013\306+\276\310\236\273\334\037~Y\245_\272\365\274X\206\034F)A\232\217\233\016\304\250V$\303\033\n\314\306\\\231\014%\377\326\246\250?@\306\352d#\032#\3419oI\0241\014p\311\350\221N\214\002\036\201`\002\244K\266\220\272t@\344\246\020\330\231\200\300\000\355\276*\352\227%v\214\226aLf'%\253\220\255d\222Ilj\206\304\205\264ea\326\3425\227,\331\036\370=\230\3710$\302\032\330\245pV\341i\354aJ\363*\2450U(\2445$3T\354H\n\002P(,BR\363\257\232\355[\003\\\034/\254*1\235\241\270\203(\005`pv\333$\260\261JD\023Z\227\336$`\260\214\317\271\345`\335$&kV'\301e\325\337\216f+|""\314\327\267#\306\322L\221\0010\306\211L\201\355\010R9&xXA5\330e\022C\252\347\r\026DUEV:\267\345V\203\241J\027\324&M\006P*&\230\204D\341\323\356\3604g\306}\300\321B}\321\213\326\345N\2319S\236\026K\246UA\203ctyE1,\017u\270\242\213\226\250f~\027\0313\025e4MQ\332I\345\312\263\225\367\231\366\302\341}\325\223\027\302C\354\247\023>8\234N1L`(b}\245o\"\3540-\024-ZmmqE\t=\202\250\215\n}Tl\371\266cj\361G8\250\257J#\314\004vD\200\314\373\302f'\202\264\315i\316\302\230\264g\023=\250\005\331\010ZF\334\003\322ia:\312@{\004\261c5\330\231\264\313Q\204J\026\304\320\213\316l\200\030\344\325A\031\002\n\210*\322\225;(\212\374\367DQ\034\200\252\252\250@9D\\\222I$\214b\nq\3506\264\244\002\302\005\323/\022\317\r\325w\365\220\350B\004;\302Ti%\327\342\010\tB@\351\023\310/\334\240\225\365\225\351\2158\216\212\217\002U1^\013\017\266\331\000\352\261DS@\255\225:< \314f\253\010\363\212\335v1\212\034Wj}\201\355\226\261Kn\243\322&\363\346\221\002\307\357l\234\007Q\235\204\033J-\252Sa\213 \177\312\022X\226!\235o\301\306\032\034\202(q\367\355\312\025]x>\025]\0177\013S\207\325c\251\246t\252\246\263\227\023hk\354\325y\352\317\320\200\362F\232\332\216\034\204\351\207/5\311\310Z\243F\231\025\233'\374]\311\024\341BC2\201\203T";
+    PyObject *data = __Pyx_DecompressString(cstring, 1142, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (953 bytes) */
-const char* const cstring = "x\332\235S\315s\333D\024O\006\003Ij\327q\n\303\241\003]\017\2050@\334\232\t\224)\235v\014I:\320\222\211C?\216;k\351\311^,\257d\355\312\261g\230\301G\035u\324QG\037u\3141\307\034}\364\321\177B\376\004\336J\261q\354r\341\240\335\267\357\363\367\336\357\351\330Q@T\213)\362\313@\265\034A\270$&\330\274\001\036S`\017\210T\0367\024x\332I\220\223\303\223\275\375\037\367\t\023&\361\340O0\224$\322o\0306\223\022$q,\322\360\271\255\270 j\340\202\254\220_-2p|\"\000L\242\034\342\242\337b\200j\201 \022\224\026\310.\023\302QLqGP\014\347\242\271KL\356a\021\336\003\035}\304l\t\225g\3144):\202\311%k\330\000B\237M\243e)\332`F[\201T\017\014\307\203\007\330\010\0334|Yq\007}.3?S\202mUh\327\007\037\210\221V$\r\224\034\321\003Oe(\0319\311\206\3414t\213\304r<\342r\243m#\244'z \242)\035\3373\340\351\201\256\360\263/gw\205R\017L\337\000j\244\031(]\260`\237\022\333{\207\r\037\320\003\241\346\n\327s\014\220\222\372Bq{\256\305\004T1\257\211\027\210&\027\360\257\005\325j\341\345\270G\274\017f\252\371\335\3019,=Wq\256:\254\300]v\3218\322\021\277D/ad\332Ey\265\312\222u\245\304\r\373<?\245'\203>~\007\270\211\364\030\372\352\024,&\007\302\340N\005\211v|\\8\220\006\322\003\224\343\356x\314\000\275\tip\226\241\2433Rj\352\014\331\225M0\035;\245\226/\014J\027\n6g\310\350\342Z\351jP\231\255\025\027\026\345\222\316\021p\005\035Ii\207!\006<U\213\352\262\276\215I(\025\254\223\335pF\351\214o\327qo0M)n*5Z`\264\245\337\311^\036H\337V\231|\rI\213\372\377\312$_\244\273\t\313\374,Y\027G\233\231zJ\377\020\032T\327g\366\014\3405ct\205\273\271\002\372\2329\333J\371\273nle5Qa\"K)\3649\315\364\035\224\247\253\233\252\364\332R\252o<y\007o\326q}\327D\223/a\036\331c\266\017r\270>\311}=*\217~HJ\303\332\260v\265\265\266\231\017\276\0177\242\367\242\375\250;\311\027\2566\3266\357E\020?\032\225\257>X\333,\205\205\350u\\\236ll\207[\321\027\350\201B>:\214K\332x7\272\037Y\361o#6B}9\3768n';IU[\n\301QX\016\237\306\245\341:&|\277\020\324&\271|\360<\254\206G\321\2671\233\344>\034\366\202\267\341a\364QT\237l\354\204X\340\223\260;\325""\207\266a\272\342\270\2707z\225\224\222\335\363\273\027\317/\253\323\233\032\215=\257\353\034G_\306\272\306fq|\373\263\210Ej\374\371\343\361\343\027\227Ut@ma\234\3774\252g\316\305\300\014\357\207\315\350M\\\235\344\357\204\373\341\031\242\257M\363\305@!\324\035\324n\227\246\371\355\361v\031q\327\020B\320\315.\025V\365\334\266\202o\302\272\026\366F\365\221\225\324\262\336n\007\257\302\322\377\350\356a\222Kj\311\333\363\027\027g\227lzS\323\035\256Os\367\242\356\230<Ln\235\377t\321\036\327O'\271;\341\263\370+\344\256\252\223\374\025>\2120o5)\215\277;\2708\036\237\3761\311\335\n\252\377\021\370$\352\307\335\321\372B`\005Y\373\373\\\\\326\322\260\177\000D?\247z";
-    PyObject *data = __Pyx_DecompressString(cstring, 953, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1013 bytes) */
+const char* const cstring = "x\332\235S\277o\333F\024\266[5\221m9\266\234\024\035\2026'$\255\213\264V\242\302m\n7H\240\326v\320\2465,\307\211\307\303\211|\224XSG\212w\224%\240@5r\344\310\221#G\216\0365j\324\250Q\177\202\377\204\276#cU\226\322\245\003\357\036\337\317\357{\357\335\221-\201\310&\223\344\227\236l\332\234\230\202\350`\231up\231\004\253G\204tMM\202\253\23489>8\336\331\375q\2270\256\023\027\376\004M\n\"\274\272f1!@\020\333 u\317\264\244\311\211\3549 \312\344W\203\364l\217p\000\235H\2338\3507\033 \233\300\211\000\251\004\262\3158\267%\223\246\315)\206\233\274\261Mt\323\305\"f\007T\364!\263\004\224_2]\247\350\010\272)X\335\002\340\352lhMC\322:\323\316%\010\371D\263]x\202DX\257\356\211\262\323\353\232\"\363\323\005XF\231\266=\360\200hiERG\311\346\035pe\206\222\221\343\254\031v]Q$\206\355\022\307\324\316-\204\364\\5\2047\204\355\271\032\274\330W\025~\366\304\365]\246\324\005\335\323\200ji\006Jg,\310S \275\017\330Z\320\262\335\0365l[:\230]N\r\350\005\035\230Q8\256\255\201\020\324\343\322\264\246Z\314L%s\033x\001o\230\034\376\265\240Z\316\374\331\316\241\331\005=\325\374ac\203\346~\027\t,:,\360\230wQ8\322\336\377\216^\\\313\264\263\362b\2259\353B\211\033\366i~J\217{]\374\366qE\351\021t\345\t\030L\364\270f\332e\334\000\333\303M\004\241\341\334\200\232\270T.\323@\255H\032\234eh\251\214\224\352*Cve\035L\333N\251\341q\215\322\231\202\215kdtv\337T5(_\357\233\311\rj\n:E`Jh\tJ[\0141\340)\233\363\363\246\n\206gaRJ9ke7\\Pz=\177\307vnL\236R\\i\2525A;\027^+\373sAx\226\314\344\367\020\225\250\036b&y<]b\230\237\327\234u\266\325\231\251#\325\313Q\240\332\036\2632\200\351\003\232\216\221.\014t\252\200\256\032\247e\244C}\317na_Q\241\343\350R\374\323\331\323\017\354A\272\317\251J\3552\245\352\306\323l\341\315Z\216\347\350h\362\004L#;\314\362@\364\227\307\271\307q)\376!)\366\253\375\352\325\352\322J\301\377>\310\207\037\207\273a{\\X\237\344\327\374]\277\035\334\016D\370Ut+j\304\357\222\275\3137\203\217\006\017\007\247\303{\303\032\372\\\345\227V\036\204\020=\213KW\267\226V\212\301z\3706*\215\363\233\301j""\370%fA\241\020\036DEe\274\037>\n\215\350\267\230\305\250/E\237F\347\311VRQ\226u\3770(\005/\242b\177\031\023~\262\356W\307\271\202\377*\250\004\207\341\267\021\033\347n\367;\376Yp\020\336\013k\343\374V\200\005>\013\332\023u(\033\246\333\030m\354\304\247I1\331\276\274?x5\254Lnj\024\277\202\252s\204LT\215\225\215\321\235/B\026\312\321\303\275\321\336\353a\005\035P\273>*|\036\326\372\325\t\342^\301jg\321A\\\314b7|=x\0244\302wQe\\\270\033\354\006\027H\246:)l\370\022\221o\241v\2638)l\2166KH\243\212\210\374vv\311\240\242Z\275\352\177\023\324\224\260\023\327b#\251fT\357\370\247A\361\177\220}\232\344\222jrv\371zp1d\223\233\232v\177y\222{\020\266G\344i\262v\371\323\340|T;\031\347\356\006/\243\257q\334\025\225\344\257\340Y\210y+Iq\364\335\376\340ht\362f\234[\363+\377\021\370<\354F\355xy&\260\214C\374\373\222\017\253i\330?\207)\317j";
+    PyObject *data = __Pyx_DecompressString(cstring, 1013, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (1744 bytes) */
-const char* const bytes = "Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.?add_notedisableenablegchft_backtest/core/delaybus.pyxisenabledself._queue cannot be converted to a Python object for pickling<stringsource>DelayBusDelayBus.__reduce_cython__DelayBus.__setstate_cython__DelayBus.on_eventDelayBus.process_untilDelayBus.set_target_engineDelayBus.startDelayBus.stopFixedDelayModelFixedDelayModel.__reduce_cython__FixedDelayModel.__setstate_cython__FixedDelayModel.get_delayLatencyModelLatencyModel.__reduce_cython__LatencyModel.__setstate_cython__LatencyModel.get_delay__Pyx_PyDict_NextRefasyncio.coroutinescline_in_tracebackdelaydelay_model__dict___dictengineevent__func__get_delay__getstate__hft_backtest.core.delaybusinf_is_coroutineitems__main__math__module____name____new__on_eventpopprocess_until__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_FixedDelayModel__pyx_unpickle_LatencyModel__pyx_vtable____qualname____reduce____reduce_cython____reduce_ex__self__set_name__set_target_enginesetdefault__setstate____setstate_cython__startstatestop__test__timestampupdateuse_setstatevalues\200\001\330\004*\250!\2506\260\021\200A\200A\360\n\000\t\014\2105\220\010\230\003\2304\230q\330\014\r\360\010\000\t\037\230e\2407\250!\360\006\000\t\021\220\r\230U\240!\330\010\020\220\n\230%\230q\330\010\020\220\014\230E\240\021\360\006\000\t\033\230$\230f\240J\250a\250q\330\010!\240\025\240k\260\022\2601\360\006\000\t\r\210F\220!\220>\240\021\200\001\360\010\000\005\r\210A\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\027\220q\330\004\007\200q\330\010\017\320\017-\250T\260\021\260'\270\033\300G\3101\340\010\017\320\017-\250T\260\021\260'\270\033\300A\200A\360\014\000\t\r\210N\230&\240\001\360\010\000\t\017\320\016\036\230a\230t\320#:\320:K\3101\200A\360\010\000\t\r\320\014\035\230Q\200A\360\014\000\t\017""\210d\220$\220g\230V\2401\330\014\023\2204\220w\230f\240A\340\014\017\210t\220>\240\022\2401\330\020\021\340\014\020\320\020!\240\021\200A\330\010\017\210q\200A\330\010\017\210t\2201\200\001\330\004\n\210+\220Q\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\220\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\027\220q\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220<\230x\240q\250\001\330\004\007\200|\2207\230!\330\010.\250a\250\177\270n\310A\330\004\013\2101";
+    #else /* compression: none (1841 bytes) */
+const char* const bytes = "Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.?add_notedisableenablegchft_backtest/core/delaybus.pyxisenabledself._queue cannot be converted to a Python object for pickling<stringsource>DelayBusDelayBus.__reduce_cython__DelayBus.__setstate_cython__DelayBus.memory_footprintDelayBus.on_eventDelayBus.process_untilDelayBus.set_target_engineDelayBus.startDelayBus.stopFixedDelayModelFixedDelayModel.__reduce_cython__FixedDelayModel.__setstate_cython__FixedDelayModel.get_delayLatencyModelLatencyModel.__reduce_cython__LatencyModel.__setstate_cython__LatencyModel.get_delay__Pyx_PyDict_NextRefasyncio.coroutinescline_in_tracebackdelaydelay_model__dict___dictengineevent__func__get_delay__getstate__hft_backtest.core.delaybusinf_is_coroutineitems__main__mathmemory_footprint__module____name____new__on_eventpopprocess_until__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_FixedDelayModel__pyx_unpickle_LatencyModel__pyx_vtable____qualname__queue__reduce____reduce_cython____reduce_ex__self__set_name__set_target_enginesetdefault__setstate____setstate_cython__startstatestop__test__timestampupdateuse_setstatevalues\200\001\330\004*\250!\2506\260\021\200A\200A\360\n\000\t\014\2105\220\010\230\003\2304\230q\330\014\r\340\010\013\2104\210q\220\007\220s\230&\240\006\240g\250V\260:\270S\300\002\300#\300T\310\024\310Q\330\014\r\360\010\000\t\037\230e\2407\250!\360\006\000\t\021\220\r\230U\240!\330\010\020\220\n\230%\230q\330\010\020\220\014\230E\240\021\360\006\000\t\033\230$\230f\240J\250a\250q\330\010!\240\025\240k\260\022\2601\360\006\000\t\r\210F\220!\220>\240\021\200\001\360\010\000\005\r\210A\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\027\220q\330\004\007\200q\330\010\017\320\017-\250T\260\021\260'\270\033\300G\3101\340\010\017\320\017-\250T\260\021\260'\270\033\300A""\200A\360\014\000\t\r\210N\230&\240\001\360\010\000\t\017\320\016\036\230a\230t\320#:\320:K\3101\200A\360\010\000\t\r\320\014\035\230Q\200A\340\010\020\220\t\230\024\230W\240E\250\021\200A\360\014\000\t\017\210d\220$\220g\230V\2401\330\014\023\2204\220w\230f\240A\340\014\017\210t\220>\240\022\2401\330\020\021\340\014\020\320\020!\240\021\200A\330\010\017\210q\200A\330\010\017\210t\2201\200\001\330\004\n\210+\220Q\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\220\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\027\220q\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220<\230x\240q\250\001\330\004\007\200|\2207\230!\330\010.\250a\250\177\270n\310A\330\004\013\2101";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 75; i++) {
+    for (int i = 0; i < 78; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
       if (likely(string) && i >= 10) PyUnicode_InternInPlace(&string);
@@ -8934,7 +9506,7 @@ const char* const bytes = "Note that Cython is deliberately stricter than PEP-48
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 75; i < 89; i++) {
+    for (int i = 78; i < 93; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -8945,15 +9517,15 @@ const char* const bytes = "Note that Cython is deliberately stricter than PEP-48
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 89; i++) {
+    for (Py_ssize_t i = 0; i < 93; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 75;
-      for (Py_ssize_t i=0; i<14; ++i) {
+      PyObject **table = stringtab + 78;
+      for (Py_ssize_t i=0; i<15; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
@@ -9025,7 +9597,7 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 22};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 23};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_event};
     __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_get_delay, __pyx_mstate->__pyx_kp_b_iso88591_A_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
   }
@@ -9040,7 +9612,7 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_6, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 30};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 31};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_event};
     __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_get_delay, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
@@ -9055,49 +9627,54 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_QfA, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 46};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 51};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_engine};
     __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_set_target_engine, __pyx_mstate->__pyx_kp_b_iso88591_A_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 52};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 57};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_engine};
     __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_start, __pyx_mstate->__pyx_kp_b_iso88591_A_N_at_K1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 64};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 69};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
     __pyx_mstate_global->__pyx_codeobj_tab[8] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_stop, __pyx_mstate->__pyx_kp_b_iso88591_A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[8])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 67};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 72};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_event};
-    __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_on_event, __pyx_mstate->__pyx_kp_b_iso88591_A_5_4q_e7_U_q_E_fJaq_k_1_F, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_on_event, __pyx_mstate->__pyx_kp_b_iso88591_A_5_4q_4q_s_gV_S_T_Q_e7_U_q_E_fJ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 91};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 99};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_timestamp};
     __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_process_until, __pyx_mstate->__pyx_kp_b_iso88591_A_d_gV1_4wfA_t_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
   }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 113};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_hft_backtest_core_delaybus_pyx, __pyx_mstate->__pyx_n_u_memory_footprint, __pyx_mstate->__pyx_kp_b_iso88591_A_WE, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
+  }
   {
     const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
-    __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[12] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[12])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
-    __pyx_mstate_global->__pyx_codeobj_tab[12] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[12])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[13] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[13])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[13] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_LatencyModel, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_xq_7_a_nA_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[13])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[14] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_LatencyModel, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_xq_7_a_nA_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[14])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[14] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_FixedDelayModel, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[14])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_FixedDelayModel, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -13848,6 +14425,75 @@ raise_neg_overflow:
     return (long) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(PY_LONG_LONG));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* PyObjectCall2Args */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
     PyObject *args[3] = {NULL, arg1, arg2};
@@ -21,6 +21,11 @@ cdef class DelayBus(Component):
     cdef LatencyModel model
     
     cdef unsigned long _source_id
+    cdef public bint forward_timers
+
+    # 运行统计：累计投递条数、队列峰值深度（BacktestEngine 的 RunStats 读取）
+    cdef readonly long long delivered
+    cdef readonly long long peak_depth
     
     # 核心数据结构：最小堆
     cdef vector[BusItem] _queue
@@ -36,6 +41,8 @@ cdef class DelayBus(Component):
     cdef bint is_empty(self)
     # 返回堆顶触发时间，如果为空则返回 LLONG_MAX
     cdef long peek_trigger_time(self)
+    # 当前在途事件数
+    cdef size_t depth(self)
     
     # --- cpdef 方法 ---
     cpdef on_event(self, Event event)
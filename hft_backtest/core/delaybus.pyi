@@ -22,6 +22,13 @@ class DelayBus(Component):
     高性能延迟总线组件。
     使用最小堆维护事件队列，模拟网络传输延迟。
     """
+    # 是否搬运默认 Timer（默认 True；BacktestEngine 在目标侧有自己的默认 timer 时关闭）。
+    # 命名 timer（timer_id != 0）永远不跨总线。
+    forward_timers: bool
+    # 运行统计（只读）：累计投递到目标引擎的事件数、在途队列的峰值深度
+    delivered: int
+    peak_depth: int
+
     def __init__(
         self,
         delay_model: LatencyModel,
@@ -53,6 +60,10 @@ class DelayBus(Component):
         """
         ...
 
+    def memory_footprint(self) -> dict[str, int]:
+        """MemoryMonitor 协议：在途事件数"""
+        ...
+
     @property
     def next_timestamp(self) -> Union[int, float]:
         """
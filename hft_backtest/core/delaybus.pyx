@@ -12,6 +12,7 @@ import math
 # 导入 Component 供继承
 from hft_backtest.core.event_engine cimport Component, EventEngine
 from hft_backtest.core.event cimport Event
+from hft_backtest.core.timer cimport Timer
 
 # ==========================================
 # Latency Models
@@ -42,6 +43,10 @@ cdef class DelayBus(Component):
         self.model = delay_model
         self._source_id = 0
         self.target_engine = None
+        # 是否搬运默认 Timer。目标侧有自己的默认 timer 时应关闭，避免重复节拍
+        self.forward_timers = True
+        self.delivered = 0
+        self.peak_depth = 0
     
     cpdef set_target_engine(self, EventEngine engine):
         """
@@ -71,6 +76,9 @@ cdef class DelayBus(Component):
         # 1. 来源过滤：只处理 Source Engine 产生的事件
         if event.source != self._source_id:
             return
+        # 命名 timer 在 add_timer 时已指定侧别，永不跨总线；默认 timer 由 forward_timers 控制
+        if type(event) is Timer and ((<Timer>event).timer_id != 0 or not self.forward_timers):
+            return
 
         # 【核心修复】使用 derive (现已基于 copy.copy) 创建副本
         # 这确保了如果发送方后续修改对象，不会影响延迟总线中的副本
@@ -102,6 +110,10 @@ cdef class DelayBus(Component):
             
             self._pop_and_process()
 
+    def memory_footprint(self):
+        """MemoryMonitor 协议：在途事件数"""
+        return {"queue": self._queue.size()}
+
     @property
     def next_timestamp(self):
         """获取下一个最早触发的时间"""
@@ -127,6 +139,9 @@ cdef class DelayBus(Component):
             return LLONG_MAX
         return self._queue.front().trigger_time
 
+    cdef size_t depth(self):
+        return self._queue.size()
+
     # ----------------------------------------------------
     #  Min-Heap Logic (C++ Vector)
     # ----------------------------------------------------
@@ -143,6 +158,8 @@ cdef class DelayBus(Component):
         
         self._queue.push_back(item)
         self._sift_up(self._queue.size() - 1)
+        if <long long>self._queue.size() > self.peak_depth:
+            self.peak_depth = self._queue.size()
 
     cdef void _pop_and_process(self):
         # 1. 取出堆顶
@@ -163,6 +180,7 @@ cdef class DelayBus(Component):
             self.target_engine.timestamp = top.trigger_time
 
         # 【直接推送】
+        self.delivered += 1
         self.target_engine.put(event)
         
         # [关键] 释放堆中持有的引用
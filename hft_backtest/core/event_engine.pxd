@@ -8,15 +8,30 @@ cdef class EventEngine:
     cdef list senior_global_listeners
     cdef list junior_global_listeners
     cdef dict listener_dict
+    cdef dict timer_listener_dict   # {timer_id: [(listener, ignore_self, source_id)]}
     cdef object _queue
     cdef bint _dispatching
     cdef unsigned long _current_listener_id
+    cdef public unsigned long register_source
+    cdef unsigned long _current_source_id
+    cdef public bint scope_timers
+    cdef bint _profiling
+    cdef dict _prof_listener        # {(event_type, listener_id): [calls, total_ns]}
+    cdef dict _prof_put             # {(origin_listener_id, event_type): count}
+    cdef dict _listener_names       # {listener_id: "Class.method"}
 
     cpdef register(self, object event_type, object listener, bint ignore_self=*)
+    cpdef register_timer(self, str name, object listener, bint ignore_self=*)
     cpdef global_register(self, object listener, bint ignore_self=*, bint is_senior=*)
     cpdef put(self, Event event)
     cdef void _drain(self)
-    cdef void _call_listener(self, object listener, bint ignore_self, Event event)
+    cdef void _call_listener(self, object listener, bint ignore_self, unsigned long source_id, Event event)
+    cdef unsigned long _effective_register_source(self)
+    cdef void _record_call(self, object event_type, unsigned long lid, long long elapsed)
+    cdef void _record_put(self, Event event)
+    cpdef enable_profile(self, bint enabled=*)
+    cpdef reset_profile(self)
+    cpdef dict get_profile(self)
 
 cdef class Component:
     cpdef start(self, EventEngine engine)
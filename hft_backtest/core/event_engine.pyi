@@ -21,11 +21,17 @@ class EventEngine:
     # --- 公开属性 (对应 cdef public) ---
     timestamp: int
     _id: int
+    # 之后注册的 listener 所属的侧别 source id（0 = 使用 _id）。
+    # listener 回调内 put 的事件，若 source 为 0 则被标记为该 id。
+    register_source: int
+    # True 时默认 Timer 只派发给注册侧别（source id）与 timer.source 相同的 listener（单引擎模式使用）。
+    # 命名 timer 总是按侧别派发。
+    scope_timers: bool
     
     # --- 内部属性 (对应 cdef 成员，通常 IDE 不需要提示，但为了完整性可以列出) ---
-    # senior_global_listeners: List[tuple[Listener, bool]]
-    # junior_global_listeners: List[tuple[Listener, bool]]
-    # listener_dict: Dict[Type[Event], List[tuple[Listener, bool]]]
+    # senior_global_listeners: List[tuple[Listener, bool, int]]
+    # junior_global_listeners: List[tuple[Listener, bool, int]]
+    # listener_dict: Dict[Type[Event], List[tuple[Listener, bool, int]]]
     # _queue: deque[Event]
     # _dispatching: bool
     # _current_listener_id: int
@@ -48,6 +54,18 @@ class EventEngine:
         """
         ...
 
+    def register_timer(
+        self,
+        name: str,
+        listener: Listener,
+        ignore_self: bool = True,
+    ) -> None:
+        """
+        订阅命名 timer（由 BacktestEngine.add_timer 注入）。
+        命名 timer 只派发给它自己的订阅者，register(Timer, ...) 只会收到默认 timer。
+        """
+        ...
+
     def global_register(
         self,
         listener: Listener,
@@ -74,6 +92,27 @@ class EventEngine:
         """
         ...
 
+    # --- profiling（默认关闭） ---
+
+    def enable_profile(self, enabled: bool = True) -> None:
+        """
+        打开/关闭 profiling：按 (事件类型, listener) 累计调用次数与单调时钟纳秒，
+        并按 put() 来源统计事件数。关闭时不清空已累计的数据。
+        """
+        ...
+
+    def reset_profile(self) -> None:
+        """清空已累计的 profiling 数据"""
+        ...
+
+    def get_profile(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        返回 {"listeners": [...], "puts": [...]}：
+          - listeners: event_type / listener / calls / total_ns / avg_ns，按 total_ns 降序
+          - puts: origin / event_type / count，按 count 降序；origin 为 "<external>" 表示来自 listener 之外
+        """
+        ...
+
     # _drain 和 _call_listener 是 cdef 方法，对 Python 不可见，
     # 因此不需要在 pyi 中暴露，除非你是用 cpdef 定义的。
     # 如果你在测试中需要调用 _drain (虽然它现在是 cdef void)，
@@ -5,7 +5,22 @@
 # cython: initializedcheck=False
 
 from collections import deque
+from operator import itemgetter
 from hft_backtest.core.event cimport Event
+from hft_backtest.core.timer cimport Timer, timer_id_of
+from hft_backtest.core.clock cimport monotonic_ns
+
+
+cdef str _listener_name(object listener):
+    """profiling 报告里用的可读名字：绑定方法为 Class.method，函数为 __qualname__"""
+    cdef object owner = getattr(listener, "__self__", None)
+    cdef object name = getattr(listener, "__name__", None)
+    if owner is not None and name is not None:
+        return f"{type(owner).__name__}.{name}"
+    name = getattr(listener, "__qualname__", name)
+    if name is not None:
+        return name
+    return type(listener).__name__
 
 # --- Component 类 ---
 # 属性和方法已经在 .pxd 中声明，这里只写实现
@@ -31,10 +46,23 @@ cdef class EventEngine:
         self.senior_global_listeners = []
         self.junior_global_listeners = []
         self.listener_dict = {}
+        self.timer_listener_dict = {}
         self._queue = deque()
         self._dispatching = False
         self._current_listener_id = 0
         self._id = id(self)
+        # 注册时打上的“侧别” source id（0 表示用本引擎 _id）。
+        # 单引擎模式下 server/client 组件共用一个引擎，靠它区分事件来自哪一侧。
+        self.register_source = 0
+        self._current_source_id = 0
+        # 单引擎模式下两侧共用一个引擎：打开后默认 Timer 也只派发给与 timer.source 同侧的 listener
+        # （命名 timer 总是按侧别派发）
+        self.scope_timers = False
+        # profiling（默认关闭，关闭时热路径只多一次 bint 判断）
+        self._profiling = False
+        self._prof_listener = {}   # {(event_type, listener_id): [calls, total_ns]}
+        self._prof_put = {}        # {(origin_listener_id, event_type): count}
+        self._listener_names = {}  # {listener_id: name}，注册时记录
 
     cpdef register(self, object event_type, object listener, bint ignore_self=True):
         """
@@ -47,11 +75,32 @@ cdef class EventEngine:
             self.listener_dict[event_type] = []
             
         cdef list lst = self.listener_dict[event_type]
-        for l, _ in lst:
+        for l, _, _ in lst:
             if l == listener:
                 raise ValueError("Listener already registered")
                 
-        lst.append((listener, ignore_self))
+        lst.append((listener, ignore_self, self._effective_register_source()))
+        self._listener_names[id(listener)] = _listener_name(listener)
+
+    cpdef register_timer(self, str name, object listener, bint ignore_self=True):
+        """
+        订阅命名 timer（BacktestEngine.add_timer 添加）。
+        命名 timer 只派发给这里的订阅者，不会派发给 register(Timer, ...) 的监听器。
+        """
+        if self._dispatching:
+            raise RuntimeError("Cannot register listener during dispatching")
+
+        cdef int tid = timer_id_of(name)
+        cdef list lst = self.timer_listener_dict.get(tid)
+        if lst is None:
+            lst = []
+            self.timer_listener_dict[tid] = lst
+        for l, _, _ in lst:
+            if l == listener:
+                raise ValueError("Listener already registered")
+
+        lst.append((listener, ignore_self, self._effective_register_source()))
+        self._listener_names[id(listener)] = _listener_name(listener)
 
     cpdef global_register(self, object listener, bint ignore_self=False, bint is_senior=False):
         if self._dispatching:
@@ -59,17 +108,28 @@ cdef class EventEngine:
             
         cdef list lst = self.senior_global_listeners if is_senior else self.junior_global_listeners
         
-        if listener in lst:
-             raise ValueError("Listener already registered")
+        for l, _, _ in lst:
+            if l == listener:
+                raise ValueError("Listener already registered")
              
-        lst.append((listener, ignore_self))
+        lst.append((listener, ignore_self, self._effective_register_source()))
+        self._listener_names[id(listener)] = _listener_name(listener)
+
+    cdef inline unsigned long _effective_register_source(self):
+        if self.register_source != 0:
+            return self.register_source
+        return <unsigned long>self._id
 
     cpdef put(self, Event event):
         """
         推送事件。
         """
         if event.source == 0:
-            event.source = self._id
+            # 在 listener 内部 put 的事件，归属该 listener 注册时的侧别
+            if self._current_source_id != 0:
+                event.source = self._current_source_id
+            else:
+                event.source = self._id
             
         cdef long ts = event.timestamp
         if ts <= 0:
@@ -81,6 +141,9 @@ cdef class EventEngine:
             event.producer = self._current_listener_id
         else:
             event.producer = 0
+
+        if self._profiling:
+            self._record_put(event)
             
         self._queue.append(event)
         
@@ -95,6 +158,9 @@ cdef class EventEngine:
         
         cdef object queue = self._queue
         cdef dict listener_dict = self.listener_dict
+        cdef dict timer_listener_dict = self.timer_listener_dict
+        cdef object event_type
+        cdef bint scoped
         cdef Event event
         cdef list handlers
         cdef list senior_lst = self.senior_global_listeners
@@ -105,26 +171,43 @@ cdef class EventEngine:
                 event = queue.popleft()
                 
                 # 1. Senior Global
-                for listener, ignore_self in senior_lst:
-                    self._call_listener(listener, ignore_self, event)
+                for listener, ignore_self, source_id in senior_lst:
+                    self._call_listener(listener, ignore_self, source_id, event)
 
                 # 2. Specific Listeners
-                handlers = listener_dict.get(type(event))
-                if handlers is not None:
-                    for listener, ignore_self in handlers:
-                        self._call_listener(listener, ignore_self, event)
+                event_type = type(event)
+                if event_type is Timer:
+                    if (<Timer>event).timer_id != 0:
+                        # 命名 timer 只路由给自己的订阅者，且总是按侧别过滤
+                        handlers = timer_listener_dict.get((<Timer>event).timer_id)
+                        scoped = True
+                    else:
+                        handlers = listener_dict.get(event_type)
+                        scoped = self.scope_timers
+                    if handlers is not None:
+                        for listener, ignore_self, source_id in handlers:
+                            if scoped and source_id != event.source:
+                                continue
+                            self._call_listener(listener, ignore_self, source_id, event)
+                else:
+                    handlers = listener_dict.get(event_type)
+                    if handlers is not None:
+                        for listener, ignore_self, source_id in handlers:
+                            self._call_listener(listener, ignore_self, source_id, event)
 
                 # 3. Junior Global
-                for listener, ignore_self in junior_lst:
-                    self._call_listener(listener, ignore_self, event)
+                for listener, ignore_self, source_id in junior_lst:
+                    self._call_listener(listener, ignore_self, source_id, event)
                     
                 self._current_listener_id = 0
+                self._current_source_id = 0
                 
         finally:
             self._dispatching = False
             self._current_listener_id = 0
+            self._current_source_id = 0
 
-    cdef inline void _call_listener(self, object listener, bint ignore_self, Event event):
+    cdef inline void _call_listener(self, object listener, bint ignore_self, unsigned long source_id, Event event):
         """内联辅助函数"""
         cdef unsigned long lid = id(listener)
         
@@ -132,5 +215,70 @@ cdef class EventEngine:
             return
             
         self._current_listener_id = lid
-        listener(event)
-        self._current_listener_id = 0
\ No newline at end of file
+        self._current_source_id = source_id
+        cdef long long t0
+        if self._profiling:
+            t0 = monotonic_ns()
+            listener(event)
+            self._record_call(type(event), lid, monotonic_ns() - t0)
+        else:
+            listener(event)
+        self._current_listener_id = 0
+        self._current_source_id = 0
+
+    # --- profiling ---
+
+    cdef void _record_call(self, object event_type, unsigned long lid, long long elapsed):
+        cdef object key = (event_type, lid)
+        cdef list stat = self._prof_listener.get(key)
+        if stat is None:
+            self._prof_listener[key] = [1, elapsed]
+        else:
+            stat[0] += 1
+            stat[1] += elapsed
+
+    cdef void _record_put(self, Event event):
+        cdef object key = (event.producer, type(event))
+        self._prof_put[key] = self._prof_put.get(key, 0) + 1
+
+    cpdef enable_profile(self, bint enabled=True):
+        """
+        打开/关闭 profiling。打开后按 (事件类型, listener) 累计调用次数和单调时钟纳秒，
+        并按 put() 的来源 listener 统计事件数。已累计的数据不会被清空（见 reset_profile）。
+        """
+        self._profiling = enabled
+
+    cpdef reset_profile(self):
+        self._prof_listener = {}
+        self._prof_put = {}
+
+    cpdef dict get_profile(self):
+        """
+        返回:
+            {
+              "listeners": [{"event_type", "listener", "calls", "total_ns", "avg_ns"}, ...]  按 total_ns 降序,
+              "puts": [{"origin", "event_type", "count"}, ...]  按 count 降序,
+            }
+        listener 耗时是自身耗时：listener 内部 put 的事件进入队列，由 _drain 之后派发，不计入调用方。
+        origin 为 "<external>" 表示事件来自 listener 之外（数据集、BacktestEngine、DelayBus 等）。
+        """
+        cdef dict names = self._listener_names
+        cdef list listeners = []
+        cdef list puts = []
+        for (event_type, lid), (calls, total_ns) in self._prof_listener.items():
+            listeners.append({
+                "event_type": event_type.__name__,
+                "listener": names.get(lid, f"<listener {lid:#x}>"),
+                "calls": calls,
+                "total_ns": total_ns,
+                "avg_ns": total_ns / calls,
+            })
+        for (origin, event_type), count in self._prof_put.items():
+            puts.append({
+                "origin": "<external>" if origin == 0 else names.get(origin, f"<listener {origin:#x}>"),
+                "event_type": event_type.__name__,
+                "count": count,
+            })
+        listeners.sort(key=itemgetter("total_ns"), reverse=True)
+        puts.sort(key=itemgetter("count"), reverse=True)
+        return {"listeners": listeners, "puts": puts}
\ No newline at end of file
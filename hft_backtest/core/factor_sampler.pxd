@@ -5,20 +5,62 @@ from hft_backtest.core.factor cimport FactorSignal
 from hft_backtest.core.timer cimport Timer
 
 
+cdef class FactorRing:
+    # 列式环形缓冲：timestamp / symbol id / (行 × 因子) 矩阵，缺失为 NaN
+    cdef public object ts_arr         # int64[cap]
+    cdef public object sid_arr        # int32[cap]
+    cdef public object val_arr        # float64[cap, n_cols]
+    cdef long long[::1] _ts
+    cdef int[::1] _sid
+    cdef double[:, ::1] _vals
+    cdef Py_ssize_t _cap
+    cdef Py_ssize_t _max_rows         # 0 表示不限（满了就扩容）
+    cdef Py_ssize_t _head             # 最早一行的物理下标
+    cdef Py_ssize_t _count
+    cdef Py_ssize_t _n_cols
+
+    cdef Py_ssize_t push(self) except -1
+    cdef void _resize(self, Py_ssize_t new_cap, Py_ssize_t new_cols)
+    cdef void ensure_cols(self, Py_ssize_t n_cols)
+    cdef inline Py_ssize_t phys(self, Py_ssize_t i) noexcept
+    cdef Py_ssize_t lower_bound(self, long long ts) noexcept
+    cdef Py_ssize_t upper_bound(self, long long ts) noexcept
+    cpdef void pop_front(self, Py_ssize_t n)
+    cpdef void clear(self)
+    cpdef tuple columns(self, Py_ssize_t start=*, Py_ssize_t stop=*)
+
+
 cdef class FactorSampler(Component):
     cdef public object event_engine
     cdef public int max_records
     cdef public bint enable_store
     cdef public bint emit_empty
+    cdef public str timer_name
+    cdef public object sink           # RecordSink 或 None
+
+    # symbol / factor 名 -> 下标（按首次出现顺序）
+    cdef dict _sym_index
+    cdef list _symbols
+    cdef dict _factor_index
+    cdef list _factor_names
 
-    cdef dict _latest_by_symbol   # {symbol: {factor_name: (factor_ts, value)}}
-    cdef dict _symbols_set        # {symbol: True}
-    cdef dict _factors_set        # {factor_name: True}
+    # 最新因子值：(symbol × factor) 矩阵，_latest_ts 为 LLONG_MIN 表示没有值
+    cdef object _latest_val_arr
+    cdef object _latest_ts_arr
+    cdef double[:, ::1] _latest_val
+    cdef long long[:, ::1] _latest_ts
 
-    cdef object _records          # deque[dict]
-    cdef object _new_records      # deque[dict]
+    cdef FactorRing _records
+    cdef FactorRing _new_records
+    cdef FactorRing _sink_rows        # 攒给 sink 的行，满 chunk_rows 后整块交出
 
-    cdef void _append_record(self, dict rec)
+    cdef Py_ssize_t _symbol_id(self, str symbol)
+    cdef Py_ssize_t _factor_id(self, str name)
+    cdef void _grow_latest(self, Py_ssize_t n_sym, Py_ssize_t n_fac)
+    cdef void _write_row(self, FactorRing ring, long long ts, Py_ssize_t sid)
+    cdef dict _row_dict(self, FactorRing ring, Py_ssize_t i)
+    cdef list _slice_fids(self, object factors)
+    cdef void _flush_sink(self)
 
     cpdef start(self, EventEngine engine)
     cpdef stop(self)
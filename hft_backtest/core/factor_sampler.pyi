@@ -4,8 +4,36 @@ from typing import Any, Iterable
 
 from hft_backtest.core.event_engine import Component, EventEngine
 from hft_backtest.core.factor import FactorSignal
+from hft_backtest.core.sink import RecordSink
 from hft_backtest.core.timer import Timer
 
+import numpy as np
+
+
+class FactorRing:
+    """Columnar ring buffer: timestamp / symbol id / (rows x factors) float64, NaN = missing.
+
+    `max_rows > 0` overwrites the oldest rows once full; `max_rows = 0` grows instead.
+    """
+
+    ts_arr: np.ndarray
+    sid_arr: np.ndarray
+    val_arr: np.ndarray
+
+    def __init__(self, max_rows: int = 0, n_cols: int = 0, init_cap: int = 1024) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def n_cols(self) -> int: ...
+    @property
+    def nbytes(self) -> int: ...
+    def pop_front(self, n: int) -> None: ...
+    def clear(self) -> None: ...
+    def columns(self, start: int = 0, stop: int = -1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Logical rows [start, stop); views when physically contiguous."""
+        ...
+
 
 class FactorSampler(Component):
     """Core factor sampler.
@@ -14,6 +42,10 @@ class FactorSampler(Component):
     - On every `Timer`, emits one row per symbol:
         {"timestamp": timer_ts, "symbol": sym, "factors": {factor_name: value, ...}}
       where factor snapshot uses the latest factor with `factor_ts <= timer_ts`.
+    - Rows are stored in a `FactorRing` (columnar, NaN = missing); `to_dataframe` /
+      `to_arrays` read the columns directly and time-range queries are binary searches.
+    - With `sink=RecordSink(...)`, every emitted row is also spilled to disk in
+      columnar chunks (independent of `max_records`); `stop()` closes the sink.
 
     This produces a factor table that can be merged with a label table on
     (timestamp, symbol) for rankIC/OLS and other downstream analysis.
@@ -23,12 +55,16 @@ class FactorSampler(Component):
     max_records: int
     enable_store: bool
     emit_empty: bool
+    timer_name: str | None
+    sink: RecordSink | None
 
     def __init__(
         self,
         max_records: int = 20000,
         enable_store: bool = True,
         emit_empty: bool = False,
+        timer_name: str | None = None,
+        sink: RecordSink | None = None,
     ) -> None: ...
 
     def start(self, engine: EventEngine) -> None: ...
@@ -63,8 +99,14 @@ class FactorSampler(Component):
         limit: int | None = None,
     ) -> Any: ...
 
+    def to_arrays(self, start_ts: int = 0, end_ts: int = 0) -> dict[str, Any]:
+        """{"timestamp", "symbol_id", "values", "symbols", "factors"}; values columns follow `factors`."""
+        ...
+
     def pop_new_records(self, max_items: int | None = None) -> list[dict[str, Any]]: ...
 
+    def memory_footprint(self) -> dict[str, int]: ...
+
     def get_row(self, ts: int, symbol: str) -> dict[str, Any]:
         """Return the latest row matching (ts, symbol), or {}."""
         ...
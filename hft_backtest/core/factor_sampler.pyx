@@ -6,117 +6,380 @@
 
 from __future__ import annotations
 
-from collections import deque
+import numpy as np
+
+from libc.math cimport NAN, isnan
+from libc.limits cimport LLONG_MIN
 
 from hft_backtest.core.event_engine cimport Component, EventEngine
 from hft_backtest.core.factor cimport FactorSignal
 from hft_backtest.core.timer cimport Timer
 
 
-cdef inline object _nan():
-    return float('nan')
+cdef class FactorRing:
+    """
+    列式环形缓冲：预分配的 timestamp 数组、symbol id 数组和 (行 × 因子) float64 矩阵。
+    - max_rows > 0：写满后覆盖最早的行；max_rows = 0：写满就扩容（不丢历史）。
+    - 因子列可以动态增加，新列对已有行填 NaN。
+    - 行按写入顺序（即 timestamp 非递减）排列，时间范围查询是二分。
+    """
+
+    def __init__(self, Py_ssize_t max_rows=0, Py_ssize_t n_cols=0, Py_ssize_t init_cap=1024):
+        if max_rows < 0:
+            raise ValueError("max_rows must be >= 0")
+        self._max_rows = max_rows
+        cdef Py_ssize_t cap = init_cap if init_cap > 0 else 1
+        if max_rows > 0 and max_rows < cap:
+            cap = max_rows
+        self._cap = 0
+        self._n_cols = 0
+        self._head = 0
+        self._count = 0
+        self._resize(cap, n_cols)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return self._cap
+
+    @property
+    def n_cols(self):
+        return self._n_cols
+
+    @property
+    def nbytes(self):
+        return self.ts_arr.nbytes + self.sid_arr.nbytes + self.val_arr.nbytes
+
+    cdef inline Py_ssize_t phys(self, Py_ssize_t i) noexcept:
+        cdef Py_ssize_t p = self._head + i
+        if p >= self._cap:
+            p -= self._cap
+        return p
+
+    cdef void _resize(self, Py_ssize_t new_cap, Py_ssize_t new_cols):
+        """按逻辑顺序搬到新数组（head 归零），新增的列填 NaN"""
+        ts_arr = np.empty(new_cap, dtype=np.int64)
+        sid_arr = np.empty(new_cap, dtype=np.int32)
+        val_arr = np.full((new_cap, new_cols), np.nan, dtype=np.float64)
+        cdef Py_ssize_t n = self._count
+        cdef Py_ssize_t first
+        if n > 0:
+            first = self._cap - self._head
+            if first >= n:
+                ts_arr[:n] = self.ts_arr[self._head:self._head + n]
+                sid_arr[:n] = self.sid_arr[self._head:self._head + n]
+                val_arr[:n, :self._n_cols] = self.val_arr[self._head:self._head + n]
+            else:
+                ts_arr[:first] = self.ts_arr[self._head:]
+                ts_arr[first:n] = self.ts_arr[:n - first]
+                sid_arr[:first] = self.sid_arr[self._head:]
+                sid_arr[first:n] = self.sid_arr[:n - first]
+                val_arr[:first, :self._n_cols] = self.val_arr[self._head:]
+                val_arr[first:n, :self._n_cols] = self.val_arr[:n - first]
+        self.ts_arr = ts_arr
+        self.sid_arr = sid_arr
+        self.val_arr = val_arr
+        self._ts = ts_arr
+        self._sid = sid_arr
+        self._vals = val_arr
+        self._cap = new_cap
+        self._n_cols = new_cols
+        self._head = 0
+
+    cdef void ensure_cols(self, Py_ssize_t n_cols):
+        if n_cols <= self._n_cols:
+            return
+        cdef Py_ssize_t new_cols = self._n_cols * 2
+        if new_cols < 8:
+            new_cols = 8
+        if new_cols < n_cols:
+            new_cols = n_cols
+        self._resize(self._cap, new_cols)
+
+    cdef Py_ssize_t push(self) except -1:
+        """追加一行，返回它的物理下标（调用方负责写满整行）"""
+        cdef Py_ssize_t new_cap
+        if self._count == self._cap:
+            if self._max_rows > 0 and self._cap >= self._max_rows:
+                # 满了：覆盖最早的一行
+                self._head = self.phys(1)
+                self._count -= 1
+            else:
+                new_cap = self._cap * 2
+                if self._max_rows > 0 and new_cap > self._max_rows:
+                    new_cap = self._max_rows
+                self._resize(new_cap, self._n_cols)
+        cdef Py_ssize_t p = self.phys(self._count)
+        self._count += 1
+        return p
+
+    cdef Py_ssize_t lower_bound(self, long long ts) noexcept:
+        """第一个 timestamp >= ts 的逻辑下标"""
+        cdef Py_ssize_t lo = 0, hi = self._count, mid
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self._ts[self.phys(mid)] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    cdef Py_ssize_t upper_bound(self, long long ts) noexcept:
+        """第一个 timestamp > ts 的逻辑下标"""
+        cdef Py_ssize_t lo = 0, hi = self._count, mid
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self._ts[self.phys(mid)] <= ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    cpdef void pop_front(self, Py_ssize_t n):
+        if n > self._count:
+            n = self._count
+        self._head = self.phys(n) if n < self._count else 0
+        self._count -= n
+
+    cpdef void clear(self):
+        self._head = 0
+        self._count = 0
+
+    cpdef tuple columns(self, Py_ssize_t start=0, Py_ssize_t stop=-1):
+        """
+        逻辑区间 [start, stop) 的 (timestamp, symbol_id, values)。
+        区间在物理上连续时返回视图（零拷贝），跨越环尾时拼接一份。
+        """
+        if stop < 0 or stop > self._count:
+            stop = self._count
+        if start < 0:
+            start = 0
+        if start >= stop:
+            return (
+                np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int32),
+                np.empty((0, self._n_cols), dtype=np.float64),
+            )
+        cdef Py_ssize_t p0 = self.phys(start)
+        cdef Py_ssize_t n = stop - start
+        if p0 + n <= self._cap:
+            return (
+                self.ts_arr[p0:p0 + n],
+                self.sid_arr[p0:p0 + n],
+                self.val_arr[p0:p0 + n],
+            )
+        cdef Py_ssize_t first = self._cap - p0
+        return (
+            np.concatenate((self.ts_arr[p0:], self.ts_arr[:n - first])),
+            np.concatenate((self.sid_arr[p0:], self.sid_arr[:n - first])),
+            np.concatenate((self.val_arr[p0:], self.val_arr[:n - first])),
+        )
 
 
 cdef class FactorSampler(Component):
     """Core factor sampler driven by Timer."""
 
-    def __init__(self, int max_records=20000, bint enable_store=True, bint emit_empty=False):
+    def __init__(self, int max_records=20000, bint enable_store=True, bint emit_empty=False, str timer_name=None, object sink=None):
         if max_records < 0:
             raise ValueError("max_records must be >= 0")
         self.event_engine = None
+        # RecordSink：每一行额外落盘，不受 max_records 淘汰影响；stop() 时关闭
+        self.sink = sink
+        # None: 默认 Timer；否则订阅 BacktestEngine.add_timer 添加的命名 timer
+        self.timer_name = timer_name
         self.max_records = max_records
         self.enable_store = enable_store
         self.emit_empty = emit_empty
-
-        self._latest_by_symbol = {}   # {symbol: {factor_name: (factor_ts, value)}}
-        self._symbols_set = {}        # {symbol: True}
-        self._factors_set = {}        # {factor_name: True}
-
-        self._records = deque()       # deque[dict]
-        self._new_records = deque()   # deque[dict]
+        self.reset()
 
     cpdef start(self, EventEngine engine):
         self.event_engine = engine
         engine.register(FactorSignal, self.on_factor)
-        engine.register(Timer, self.on_timer)
+        if self.timer_name is None:
+            engine.register(Timer, self.on_timer)
+        else:
+            engine.register_timer(self.timer_name, self.on_timer)
 
     cpdef stop(self):
-        pass
+        if self.sink is not None and not self.sink.closed:
+            self._flush_sink()
+            self.sink.close()
 
     cpdef reset(self):
-        self._latest_by_symbol = {}
-        self._symbols_set = {}
-        self._factors_set = {}
-        self._records = deque()
-        self._new_records = deque()
+        self._sym_index = {}
+        self._symbols = []
+        self._factor_index = {}
+        self._factor_names = []
+        self._latest_val_arr = np.empty((0, 0), dtype=np.float64)
+        self._latest_ts_arr = np.empty((0, 0), dtype=np.int64)
+        self._latest_val = self._latest_val_arr
+        self._latest_ts = self._latest_ts_arr
+        self._records = FactorRing(self.max_records)
+        # 待消费的新行不限长度（与 pop_new_records 配合使用）
+        self._new_records = FactorRing(0)
+        self._sink_rows = FactorRing(0)
+
+    # ==========================
+    # 下标分配
+    # ==========================
+
+    cdef void _grow_latest(self, Py_ssize_t n_sym, Py_ssize_t n_fac):
+        cdef Py_ssize_t old_sym = self._latest_val_arr.shape[0]
+        cdef Py_ssize_t old_fac = self._latest_val_arr.shape[1]
+        if n_sym <= old_sym and n_fac <= old_fac:
+            return
+        cdef Py_ssize_t new_sym = old_sym, new_fac = old_fac
+        if n_sym > old_sym:
+            new_sym = max(n_sym, old_sym * 2, 8)
+        if n_fac > old_fac:
+            new_fac = max(n_fac, old_fac * 2, 8)
+        val_arr = np.full((new_sym, new_fac), np.nan, dtype=np.float64)
+        ts_arr = np.full((new_sym, new_fac), LLONG_MIN, dtype=np.int64)
+        val_arr[:old_sym, :old_fac] = self._latest_val_arr
+        ts_arr[:old_sym, :old_fac] = self._latest_ts_arr
+        self._latest_val_arr = val_arr
+        self._latest_ts_arr = ts_arr
+        self._latest_val = val_arr
+        self._latest_ts = ts_arr
+
+    cdef Py_ssize_t _symbol_id(self, str symbol):
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t sid = len(self._symbols)
+        self._sym_index[symbol] = sid
+        self._symbols.append(symbol)
+        self._grow_latest(sid + 1, len(self._factor_names))
+        return sid
+
+    cdef Py_ssize_t _factor_id(self, str name):
+        cdef object idx = self._factor_index.get(name)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t fid = len(self._factor_names)
+        self._factor_index[name] = fid
+        self._factor_names.append(name)
+        self._grow_latest(len(self._symbols), fid + 1)
+        self._records.ensure_cols(fid + 1)
+        self._new_records.ensure_cols(fid + 1)
+        self._sink_rows.ensure_cols(fid + 1)
+        return fid
+
+    # ==========================
+    # 事件
+    # ==========================
 
     cpdef on_factor(self, FactorSignal signal):
-        cdef str sym = signal.symbol
-        cdef str fname = signal.name
-        cdef long long fts = signal.timestamp
-        cdef double x = signal.value
-
-        self._symbols_set[sym] = True
-        self._factors_set[fname] = True
-
-        d = self._latest_by_symbol.get(sym)
-        if d is None:
-            d = {}
-            self._latest_by_symbol[sym] = d
-        d[fname] = (fts, x)
+        cdef Py_ssize_t sid = self._symbol_id(signal.symbol)
+        cdef Py_ssize_t fid = self._factor_id(signal.name)
+        self._latest_ts[sid, fid] = signal.timestamp
+        self._latest_val[sid, fid] = signal.value
 
     cpdef on_timer(self, Timer timer):
         cdef long long ts = timer.timestamp
         if ts <= 0:
             return
+        cdef Py_ssize_t n_sym = len(self._symbols)
+        cdef Py_ssize_t n_fac = len(self._factor_names)
+        cdef Py_ssize_t sid, fid
+        cdef bint has_value
 
         # Emit one row per symbol.
-        for sym in self._symbols_set.keys():
-            d = self._latest_by_symbol.get(sym)
-            if d is None:
-                if self.emit_empty:
-                    self._append_record({"timestamp": ts, "symbol": sym, "factors": {}})
+        for sid in range(n_sym):
+            has_value = False
+            for fid in range(n_fac):
+                # LLONG_MIN 表示该 (symbol, factor) 从未出现过
+                if self._latest_ts[sid, fid] != LLONG_MIN and self._latest_ts[sid, fid] <= ts:
+                    has_value = True
+                    break
+            if not has_value and not self.emit_empty:
                 continue
-
-            factors_out = {}
-            for fname, pair in d.items():
-                # pair: (factor_ts, value)
-                if pair[0] <= ts:
-                    factors_out[fname] = pair[1]
-
-            if (not factors_out) and (not self.emit_empty):
-                continue
-
-            self._append_record({"timestamp": ts, "symbol": sym, "factors": factors_out})
-
-    cdef void _append_record(self, dict rec):
-        self._new_records.append(rec)
-        if not self.enable_store:
+            self._write_row(self._new_records, ts, sid)
+            if self.enable_store:
+                self._write_row(self._records, ts, sid)
+            if self.sink is not None:
+                self._write_row(self._sink_rows, ts, sid)
+
+        if self.sink is not None and self._sink_rows._count >= self.sink.chunk_rows:
+            self._flush_sink()
+
+    cdef void _flush_sink(self):
+        # 交给后台线程的数组必须是拷贝：ring 的内存随后会被复用
+        cdef FactorRing ring = self._sink_rows
+        if ring._count == 0:
             return
-        self._records.append(rec)
-        if self.max_records > 0:
-            while len(self._records) > self.max_records:
-                self._records.popleft()
+        ts, sid, vals = ring.columns()
+        data = {
+            "timestamp": np.array(ts),
+            "symbol": np.asarray(self._symbols, dtype=object)[sid],
+        }
+        for fid, name in enumerate(self._factor_names):
+            data[name] = np.array(vals[:, fid])
+        ring.clear()
+        self.sink.write_columns(data)
+
+    cdef void _write_row(self, FactorRing ring, long long ts, Py_ssize_t sid):
+        # 只用 factor_ts <= ts 的值，其余填 NaN
+        cdef Py_ssize_t p = ring.push()
+        cdef Py_ssize_t n_fac = len(self._factor_names)
+        cdef Py_ssize_t fid
+        ring._ts[p] = ts
+        ring._sid[p] = <int>sid
+        for fid in range(ring._n_cols):
+            if fid < n_fac and self._latest_ts[sid, fid] != LLONG_MIN and self._latest_ts[sid, fid] <= ts:
+                ring._vals[p, fid] = self._latest_val[sid, fid]
+            else:
+                ring._vals[p, fid] = NAN
+
+    # ==========================
+    # 查询
+    # ==========================
 
     cpdef list symbols(self):
-        return sorted(self._symbols_set.keys())
+        return sorted(self._symbols)
 
     cpdef list factors(self):
-        return sorted(self._factors_set.keys())
+        return sorted(self._factor_names)
+
+    cdef dict _row_dict(self, FactorRing ring, Py_ssize_t i):
+        cdef Py_ssize_t p = ring.phys(i)
+        cdef Py_ssize_t fid
+        cdef double v
+        cdef dict factors_out = {}
+        for fid in range(len(self._factor_names)):
+            v = ring._vals[p, fid]
+            if not isnan(v):
+                factors_out[self._factor_names[fid]] = v
+        return {"timestamp": ring._ts[p], "symbol": self._symbols[ring._sid[p]], "factors": factors_out}
+
+    cdef list _slice_fids(self, object factors):
+        """因子名 -> 列下标；没见过的因子为 -1"""
+        factor_list = self.factors() if factors is None else list(factors)
+        return [self._factor_index.get(name, -1) for name in factor_list]
 
     cpdef list get_records(self, str symbol=None, long long start_ts=0, long long end_ts=0, int limit=-1):
+        cdef FactorRing ring = self._records
+        cdef Py_ssize_t i0 = ring.lower_bound(start_ts) if start_ts else 0
+        cdef Py_ssize_t i1 = ring.upper_bound(end_ts) if end_ts else ring._count
+        cdef Py_ssize_t sid = -1
+        cdef Py_ssize_t i
+        if symbol is not None:
+            idx = self._sym_index.get(symbol)
+            if idx is None:
+                return []
+            sid = idx
+        # 从尾部往前取，limit 时可以提前结束
         out = []
-        for rec in self._records:
-            if symbol is not None and rec["symbol"] != symbol:
-                continue
-            rts = rec["timestamp"]
-            if start_ts and rts < start_ts:
-                continue
-            if end_ts and rts > end_ts:
-                continue
-            out.append(rec)
-        if limit is not None and limit >= 0:
-            return out[-limit:]
+        i = i1 - 1
+        while i >= i0:
+            if limit >= 0 and len(out) >= limit:
+                break
+            if sid < 0 or ring._sid[ring.phys(i)] == sid:
+                out.append(self._row_dict(ring, i))
+            i -= 1
+        out.reverse()
         return out
 
     cpdef list get_dense_records(self, object factors=None, bint fill_nan=True, int limit=-1):
@@ -125,60 +388,101 @@ cdef class FactorSampler(Component):
         - `factors=None` uses all seen factors (sorted).
         - `fill_nan=True` fills missing factor values with NaN.
         """
-        if factors is None:
-            factor_list = self.factors()
-        else:
-            factor_list = list(factors)
-
+        factor_list = self.factors() if factors is None else list(factors)
+        cdef list fids = self._slice_fids(factor_list)
+        cdef FactorRing ring = self._records
+        cdef Py_ssize_t start = 0
+        cdef Py_ssize_t i, p, k, fid
+        cdef double v
+        if limit >= 0 and limit < ring._count:
+            start = ring._count - limit
         out = []
-        for rec in self._records:
-            row = {"timestamp": rec["timestamp"], "symbol": rec["symbol"]}
-            fdict = rec["factors"]
-            for fname in factor_list:
-                if fname in fdict:
-                    row[fname] = fdict[fname]
+        for i in range(start, ring._count):
+            p = ring.phys(i)
+            row = {"timestamp": ring._ts[p], "symbol": self._symbols[ring._sid[p]]}
+            for k in range(len(fids)):
+                fid = fids[k]
+                v = ring._vals[p, fid] if fid >= 0 else NAN
+                if not isnan(v):
+                    row[factor_list[k]] = v
                 elif fill_nan:
-                    row[fname] = _nan()
+                    row[factor_list[k]] = NAN
             out.append(row)
-
-        if limit is not None and limit >= 0:
-            return out[-limit:]
         return out
 
     cpdef object to_dataframe(self, object factors=None, bint fill_nan=True, int limit=-1):
-        """Return a pandas.DataFrame with columns: timestamp, symbol, <factors...>."""
+        """Return a pandas.DataFrame with columns: timestamp, symbol, <factors...>.
+
+        Built straight from the ring columns (no per-row dicts); missing values are NaN.
+        """
         import pandas as pd
 
-        records = self.get_dense_records(factors=factors, fill_nan=fill_nan, limit=limit)
-        if not records:
+        factor_list = self.factors() if factors is None else list(factors)
+        cdef list fids = self._slice_fids(factor_list)
+        cdef FactorRing ring = self._records
+        cdef Py_ssize_t start = 0
+        if limit >= 0 and limit < ring._count:
+            start = ring._count - limit
+        ts, sid, vals = ring.columns(start, ring._count)
+        if len(ts) == 0:
             # Keep a stable schema even when empty.
-            if factors is None:
-                factor_list = self.factors()
-            else:
-                factor_list = list(factors)
-            cols = ["timestamp", "symbol"] + factor_list
-            return pd.DataFrame(columns=cols)
-        return pd.DataFrame.from_records(records)
+            return pd.DataFrame(columns=["timestamp", "symbol"] + factor_list)
+        data = {
+            "timestamp": ts,
+            "symbol": np.asarray(self._symbols, dtype=object)[sid],
+        }
+        for name, fid in zip(factor_list, fids):
+            data[name] = vals[:, fid] if fid >= 0 else np.full(len(ts), np.nan)
+        return pd.DataFrame(data)
+
+    def to_arrays(self, long long start_ts=0, long long end_ts=0):
+        """
+        原始列（零拷贝视图，环未回绕时）：
+        {"timestamp", "symbol_id", "values", "symbols", "factors"}；
+        values 的列顺序与 factors（按首次出现顺序）一致，symbol_id 是 symbols 的下标。
+        """
+        cdef FactorRing ring = self._records
+        cdef Py_ssize_t i0 = ring.lower_bound(start_ts) if start_ts else 0
+        cdef Py_ssize_t i1 = ring.upper_bound(end_ts) if end_ts else ring._count
+        ts, sid, vals = ring.columns(i0, i1)
+        return {
+            "timestamp": ts,
+            "symbol_id": sid,
+            "values": vals[:, :len(self._factor_names)],
+            "symbols": list(self._symbols),
+            "factors": list(self._factor_names),
+        }
 
     cpdef list pop_new_records(self, int max_items=-1):
-        cdef int n
-        if max_items is None or max_items < 0:
-            n = len(self._new_records)
-        else:
-            n = max_items if max_items < len(self._new_records) else len(self._new_records)
-        out = []
-        for _ in range(n):
-            out.append(self._new_records.popleft())
+        cdef FactorRing ring = self._new_records
+        cdef Py_ssize_t n = ring._count
+        cdef Py_ssize_t i
+        if max_items >= 0 and max_items < n:
+            n = max_items
+        out = [self._row_dict(ring, i) for i in range(n)]
+        ring.pop_front(n)
         return out
 
+    def memory_footprint(self):
+        """MemoryMonitor 协议"""
+        return {
+            "records": len(self._records),
+            "new_records": len(self._new_records),
+            "symbols": len(self._symbols),
+            "record_bytes": self._records.nbytes + self._new_records.nbytes,
+        }
+
     cpdef dict get_row(self, long long ts, str symbol):
-        # Scan from tail; records are append-only in time order.
-        for rec in reversed(self._records):
-            if rec["symbol"] != symbol:
-                continue
-            rts = rec["timestamp"]
-            if rts == ts:
-                return rec
-            if rts < ts:
-                break
+        idx = self._sym_index.get(symbol)
+        if idx is None:
+            return {}
+        cdef Py_ssize_t sid = idx
+        cdef FactorRing ring = self._records
+        cdef Py_ssize_t i0 = ring.lower_bound(ts)
+        cdef Py_ssize_t i = ring.upper_bound(ts) - 1
+        # 同一 (ts, symbol) 有多行时取最新的一行
+        while i >= i0:
+            if ring._sid[ring.phys(i)] == sid:
+                return self._row_dict(ring, i)
+            i -= 1
         return {}
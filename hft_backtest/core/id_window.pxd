@@ -0,0 +1,16 @@
+# hft_backtest/core/id_window.pxd
+# cython: language_level=3
+
+cdef class OrderIdWindow:
+    # id < _low 的都视为已加入（水位线）
+    cdef long long _low
+    # [_low, _low + _cap) 内的 id 用环形位图记录，bit 下标 = id & _mask
+    cdef unsigned long long* _bits
+    cdef long long _cap
+    cdef long long _mask
+    cdef long long _n_set
+
+    cdef bint contains(self, long long oid)
+    cpdef void add(self, long long oid)
+    cdef void _clear_below(self, long long new_low)
+    cdef void _roll(self)
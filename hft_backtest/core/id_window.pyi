@@ -0,0 +1,15 @@
+class OrderIdWindow:
+    """
+    有界的已终结订单 id 集合：水位线 + 固定大小的环形位图（利用 order_id 单调递增）。
+    id < watermark 一律视为已加入；超出窗口的 add 会强制推进水位线。
+    """
+    def __init__(self, capacity: int = 1 << 20) -> None: ...
+    def add(self, oid: int) -> None: ...
+    def __contains__(self, oid: object) -> bool: ...
+    def __len__(self) -> int:
+        """窗口内显式记录的 id 个数（水位线以下的不计）"""
+        ...
+    @property
+    def watermark(self) -> int: ...
+    @property
+    def capacity(self) -> int: ...
@@ -0,0 +1,137 @@
+# hft_backtest/core/id_window.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from libc.stdlib cimport calloc, free
+
+cdef enum:
+    WORD_BITS = 64
+cdef unsigned long long ALL_ONES = 0xFFFFFFFFFFFFFFFFULL
+
+
+cdef class OrderIdWindow:
+    """
+    有界的“已终结订单 id”集合，利用 order_id 全局单调递增（Order.global_order_id_counter）：
+
+    - 水位线 low：所有 id < low 都视为已加入；
+    - [low, low + capacity) 内的 id 用一块固定大小的环形位图记录；
+    - 每次 add 后，水位线沿着连续已加入的 id 向前滚动，对应的位被清掉复用。
+
+    当一个 id 超出窗口（比 low 大了 capacity 以上）时，水位线被强制推到 id - capacity + 1，
+    中间没见过的 id 从此被当作“已加入”。capacity 应远大于同时在途的订单 id 跨度；
+    被越过的仍在活跃的订单由使用方（如 OKXAccount.order_dict）自行豁免。
+    内存固定为 capacity / 8 字节，contains/add 均摊 O(1)。
+    """
+    def __cinit__(self, long long capacity=1 << 20):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        # 向上取整到 2 的幂（且至少一个 word），方便用掩码取环形下标
+        cdef long long cap = WORD_BITS
+        while cap < capacity:
+            cap <<= 1
+        self._cap = cap
+        self._mask = cap - 1
+        self._low = 0
+        self._n_set = 0
+        self._bits = <unsigned long long*>calloc(cap // WORD_BITS, sizeof(unsigned long long))
+        if self._bits == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        if self._bits != NULL:
+            free(self._bits)
+
+    cdef inline bint contains(self, long long oid):
+        if oid < self._low:
+            return True
+        if oid >= self._low + self._cap:
+            return False
+        cdef long long b = oid & self._mask
+        return (self._bits[b >> 6] >> (b & 63)) & 1
+
+    cpdef void add(self, long long oid):
+        if oid < self._low:
+            return
+        if oid >= self._low + self._cap:
+            self._clear_below(oid - self._cap + 1)
+        cdef long long b = oid & self._mask
+        cdef unsigned long long bit = 1ULL << (b & 63)
+        if self._bits[b >> 6] & bit:
+            return
+        self._bits[b >> 6] |= bit
+        self._n_set += 1
+        if oid == self._low:
+            self._roll()
+
+    cdef void _roll(self):
+        """水位线越过连续的已加入 id，并清掉它们的位"""
+        cdef long long b
+        cdef unsigned long long bit
+        while True:
+            b = self._low & self._mask
+            if (b & 63) == 0 and self._bits[b >> 6] == ALL_ONES:
+                # 整个 word 都已加入：一次跳 64 个
+                self._bits[b >> 6] = 0
+                self._low += WORD_BITS
+                self._n_set -= WORD_BITS
+                continue
+            bit = 1ULL << (b & 63)
+            if not (self._bits[b >> 6] & bit):
+                return
+            self._bits[b >> 6] &= ~bit
+            self._low += 1
+            self._n_set -= 1
+
+    cdef void _clear_below(self, long long new_low):
+        """强制把水位线推到 new_low，窗口中被越过的位清零"""
+        cdef long long b
+        cdef unsigned long long bit
+        if new_low - self._low >= self._cap:
+            for b in range(self._cap // WORD_BITS):
+                self._bits[b] = 0
+            self._n_set = 0
+            self._low = new_low
+        else:
+            while self._low < new_low:
+                b = self._low & self._mask
+                if (b & 63) == 0 and new_low - self._low >= WORD_BITS:
+                    self._n_set -= _popcount(self._bits[b >> 6])
+                    self._bits[b >> 6] = 0
+                    self._low += WORD_BITS
+                    continue
+                bit = 1ULL << (b & 63)
+                if self._bits[b >> 6] & bit:
+                    self._bits[b >> 6] &= ~bit
+                    self._n_set -= 1
+                self._low += 1
+        self._roll()
+
+    # --- Python 接口（与 set 的常用部分兼容） ---
+
+    def __contains__(self, oid):
+        return self.contains(oid)
+
+    def __len__(self):
+        """窗口内显式记录的 id 个数（水位线以下的不计）"""
+        return self._n_set
+
+    @property
+    def watermark(self):
+        return self._low
+
+    @property
+    def capacity(self):
+        return self._cap
+
+    def __repr__(self):
+        return f"OrderIdWindow(watermark={self._low}, pending={self._n_set}, capacity={self._cap})"
+
+
+cdef inline long long _popcount(unsigned long long x):
+    cdef long long n = 0
+    while x:
+        x &= x - 1
+        n += 1
+    return n
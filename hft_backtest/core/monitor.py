@@ -0,0 +1,120 @@
+import gc
+import os
+from collections import Counter
+
+from hft_backtest import Component, EventEngine, Event, Timer
+
+
+def read_rss() -> int:
+    """
+    当前进程常驻内存（字节），取不到时返回 -1。
+    优先 psutil（跨平台，可选依赖），其次 Linux 的 /proc/self/statm。
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return -1
+
+
+def count_live_events() -> Counter:
+    """
+    按类型统计被 Python 容器（list/dict/set/deque/普通对象属性）引用着的 Event。
+    cdef Event 本身不被 GC 追踪，gc.get_objects() 看不到它们，
+    所以从所有被追踪的容器出发扫一层引用，按 id 去重。代价 O(堆大小)，只适合低频采样。
+    只被 C 结构持有的事件（如 DelayBus 的堆）不在其中，由组件的 memory_footprint() 报告。
+    """
+    seen = set()
+    counts = Counter()
+    for container in gc.get_objects():
+        for obj in gc.get_referents(container):
+            if isinstance(obj, Event):
+                oid = id(obj)
+                if oid not in seen:
+                    seen.add(oid)
+                    counts[type(obj).__name__] += 1
+    return counts
+
+
+class MemoryMonitor(Component):
+    """
+    内存采样器：按 Timer 节拍采样，写出长表格式的时间序列 CSV（timestamp,metric,value）：
+    1. rss: 进程常驻内存（字节）
+    2. events.<类型名>: 仍被容器引用的 Event 数量（count_events=True 时）
+    3. <组件名>.<容器名>: 组件 memory_footprint() 报告的容器大小
+
+    memory_footprint 协议：组件实现 memory_footprint() -> dict[str, int]，
+    返回自己持有的、可能无界增长的容器的元素个数。watch() 未实现该协议的组件会抛 TypeError。
+    组件名默认取类名，同类多个实例时可用 watch(component, name) 指定。
+    采样是低频的，每次采样都直接落盘，运行中途就可以用 pandas 读出来看是谁在涨。
+
+    count_events: 默认关闭。count_live_events 每次采样都要遍历 gc.get_objects()，代价 O(堆大小)，
+                  长回测里只在排查 Event 泄漏时临时打开，并配合较大的 interval。
+    timer_name: 订阅 BacktestEngine.add_timer 添加的命名 timer；None 则监听默认 Timer 并按 interval 判断。
+    """
+    def __init__(self, path: str, interval: int, components=None, count_events: bool = False,
+                 timer_name: str = None):
+        self.path = path
+        self.interval = interval
+        self.count_events = count_events
+        self.timer_name = timer_name
+        self.buffer = []
+        self.watched = []
+        self.last_timestamp = -interval
+        # 最近一次采样 {metric: value}，便于运行中直接查看
+        self.last_sample = {}
+        for component in components or ():
+            self.watch(component)
+
+    def watch(self, component, name: str = None):
+        if not hasattr(component, "memory_footprint"):
+            raise TypeError(f"{type(component).__name__} does not implement memory_footprint()")
+        self.watched.append((name or type(component).__name__, component))
+
+    def start(self, engine: EventEngine):
+        if self.timer_name is None:
+            engine.register(Timer, self.on_timer)
+        else:
+            engine.register_timer(self.timer_name, self.on_timer)
+        self.file = open(self.path, "w", encoding="utf-8-sig")
+        self.buffer.append("timestamp,metric,value\n")
+
+    def stop(self):
+        self.flush(flush_to_disk=True)
+        self.file.close()
+
+    def on_timer(self, event: Timer):
+        if event.timestamp - self.last_timestamp < self.interval:
+            return
+        self.last_timestamp = event.timestamp
+        self.record(event.timestamp)
+
+    def sample(self) -> dict:
+        out = {"rss": read_rss()}
+        if self.count_events:
+            for type_name, n in sorted(count_live_events().items()):
+                out[f"events.{type_name}"] = n
+        for name, component in self.watched:
+            for key, n in component.memory_footprint().items():
+                out[f"{name}.{key}"] = n
+        return out
+
+    def record(self, timestamp: int):
+        self.last_sample = self.sample()
+        self.buffer.extend(f"{timestamp},{k},{v}\n" for k, v in self.last_sample.items())
+        self.flush(flush_to_disk=True)
+
+    def flush(self, flush_to_disk: bool = False):
+        if not self.buffer:
+            return
+        if not self.file or self.file.closed:
+            return
+        self.file.writelines(self.buffer)
+        if flush_to_disk:
+            self.file.flush()
+        self.buffer.clear()
@@ -18,6 +18,9 @@ cpdef enum:
     ORDER_STATE_CANCELED = 4    # 已撤销
     ORDER_STATE_REJECTED = 5    # 已拒单
 
+# 批量占用连续订单 ID，返回第一个
+cdef long reserve_order_ids(long n)
+
 cdef class Order(Event):
     # --- 核心字段 (cdef public 让 Python 可读写) ---
     # 使用 C 类型 (long, int, double) 确保 8字节对齐和极致性能
@@ -11,6 +11,14 @@ cdef long _SCALER = 100000000L  # 1亿
 # 全局 ID 计数器 (C 静态变量，极快)
 cdef long global_order_id_counter = 0
 
+
+cdef long reserve_order_ids(long n):
+    """一次性占用 n 个连续订单 ID，返回第一个（OrderBatch 用）"""
+    global global_order_id_counter
+    cdef long first = global_order_id_counter + 1
+    global_order_id_counter += n
+    return first
+
 cdef class Order(Event):
     """
     高性能 Order 对象。
@@ -0,0 +1,17 @@
+# cython: language_level=3
+from hft_backtest.core.event cimport Event
+from hft_backtest.core.order cimport Order
+
+cdef class OrderBatch(Event):
+    # 一批订单按列存放，跨总线时是一个事件
+    cdef public list symbols
+    cdef public object order_ids        # int64
+    cdef public object order_types      # int32，取值同 Order.ORDER_TYPE_*
+    cdef public object states           # int32，取值同 Order.ORDER_STATE_*
+    cdef public object quantities       # float64
+    cdef public object prices           # float64
+    cdef public object filled_prices    # float64
+    cdef public object commission_fees  # float64
+
+    cpdef Order order_at(self, Py_ssize_t i)
+    cpdef list to_orders(self)
@@ -0,0 +1,53 @@
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from hft_backtest.core.event import Event
+from hft_backtest.core.order import Order
+
+class OrderBatch(Event):
+    """
+    篮子订单 / 批量回报：一批订单按列存放，跨总线时是一个事件。
+    每一行的语义与同字段的 Order 一致；回报批次里同一订单可以出现多行（如 RECEIVED 后 FILLED）。
+    """
+
+    symbols: List[str]
+    order_ids: np.ndarray        # int64
+    order_types: np.ndarray      # int32, Order.ORDER_TYPE_*
+    states: np.ndarray           # int32, Order.ORDER_STATE_*
+    quantities: np.ndarray       # float64
+    prices: np.ndarray           # float64
+    filled_prices: np.ndarray    # float64
+    commission_fees: np.ndarray  # float64
+
+    def __init__(
+        self,
+        symbols: List[str],
+        order_ids: Sequence[int],
+        order_types: Sequence[int],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+        states: Optional[Sequence[int]] = None,
+        filled_prices: Optional[Sequence[float]] = None,
+        commission_fees: Optional[Sequence[float]] = None,
+    ) -> None: ...
+
+    @staticmethod
+    def create(
+        symbols: Iterable[str],
+        quantities: Sequence[float],
+        prices: Optional[Sequence[float]] = None,
+    ) -> OrderBatch:
+        """price 为 NaN（或不传）的行是市价单，其余是限价单"""
+        ...
+
+    @staticmethod
+    def create_cancel(order_ids: Sequence[int], symbols: Iterable[str]) -> OrderBatch: ...
+
+    @staticmethod
+    def from_orders(orders: List[Order]) -> OrderBatch: ...
+
+    def __len__(self) -> int: ...
+    def order_at(self, i: int) -> Order: ...
+    def to_orders(self) -> List[Order]: ...
+    def derive(self) -> OrderBatch: ...
@@ -0,0 +1,194 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+import numpy as np
+
+from libc.math cimport isnan
+from hft_backtest.core.event cimport Event
+from hft_backtest.core.order cimport (
+    Order,
+    reserve_order_ids,
+    ORDER_TYPE_LIMIT,
+    ORDER_TYPE_MARKET,
+    ORDER_TYPE_CANCEL,
+    ORDER_STATE_NONE,
+    ORDER_STATE_CREATED,
+)
+
+
+cdef class OrderBatch(Event):
+    """
+    篮子订单 / 批量回报。
+
+    一次调仓的几千笔订单作为一个事件提交：只经过一次 EventEngine.put、一次 DelayBus derive
+    和一次堆操作；支持批量的撮合/账户（如 AshareDailyMatcher / AshareAccount）一次调用处理整批，
+    回报也合并成一个 OrderBatch（按处理顺序逐行记录状态变化，同一订单可以出现多行，
+    例如先 RECEIVED 再 FILLED）。
+
+    每一行的语义与同字段的 Order 一致；不支持批量的组件可以用 to_orders() 拆回单笔订单。
+    """
+
+    def __init__(
+        self,
+        list symbols,
+        object order_ids,
+        object order_types,
+        object quantities,
+        object prices,
+        object states=None,
+        object filled_prices=None,
+        object commission_fees=None,
+    ):
+        super().__init__(0)
+        cdef Py_ssize_t n = len(symbols)
+        self.symbols = symbols
+        self.order_ids = np.ascontiguousarray(order_ids, dtype=np.int64)
+        self.order_types = np.ascontiguousarray(order_types, dtype=np.int32)
+        self.quantities = np.ascontiguousarray(quantities, dtype=np.float64)
+        self.prices = np.ascontiguousarray(prices, dtype=np.float64)
+        self.states = (
+            np.full(n, ORDER_STATE_CREATED, dtype=np.int32) if states is None
+            else np.ascontiguousarray(states, dtype=np.int32)
+        )
+        self.filled_prices = (
+            np.zeros(n, dtype=np.float64) if filled_prices is None
+            else np.ascontiguousarray(filled_prices, dtype=np.float64)
+        )
+        self.commission_fees = (
+            np.zeros(n, dtype=np.float64) if commission_fees is None
+            else np.ascontiguousarray(commission_fees, dtype=np.float64)
+        )
+        for name in ("order_ids", "order_types", "quantities", "prices", "states", "filled_prices", "commission_fees"):
+            if len(getattr(self, name)) != n:
+                raise ValueError(f"OrderBatch column {name} has length {len(getattr(self, name))}, expected {n}")
+
+    # ==========================
+    # 工厂方法
+    # ==========================
+
+    @staticmethod
+    def create(symbols, quantities, prices=None):
+        """
+        创建一批新订单：price 为 NaN（或不传 prices）的行是市价单，其余是限价单。
+        订单 ID 与 Order.create_* 共用同一个计数器。
+        """
+        cdef list syms = list(symbols)
+        cdef Py_ssize_t n = len(syms)
+        cdef double[::1] px
+        cdef int[::1] types
+        cdef Py_ssize_t i
+        price_arr = (
+            np.full(n, np.nan, dtype=np.float64) if prices is None
+            else np.array(prices, dtype=np.float64)
+        )
+        type_arr = np.empty(n, dtype=np.int32)
+        px = price_arr
+        types = type_arr
+        for i in range(n):
+            if isnan(px[i]):
+                types[i] = ORDER_TYPE_MARKET
+                px[i] = -1
+            else:
+                types[i] = ORDER_TYPE_LIMIT
+        cdef long first = reserve_order_ids(n)
+        return OrderBatch(
+            syms,
+            np.arange(first, first + n, dtype=np.int64),
+            type_arr,
+            quantities,
+            price_arr,
+        )
+
+    @staticmethod
+    def create_cancel(order_ids, symbols):
+        """批量撤单指令（语义同 Order.create_cancel）"""
+        cdef list syms = list(symbols)
+        cdef Py_ssize_t n = len(syms)
+        return OrderBatch(
+            syms,
+            order_ids,
+            np.full(n, ORDER_TYPE_CANCEL, dtype=np.int32),
+            np.zeros(n, dtype=np.float64),
+            np.zeros(n, dtype=np.float64),
+            states=np.full(n, ORDER_STATE_NONE, dtype=np.int32),
+        )
+
+    @staticmethod
+    def from_orders(list orders):
+        """把若干 Order（通常是回报）按原顺序合并成一个 OrderBatch"""
+        cdef Py_ssize_t n = len(orders)
+        cdef Py_ssize_t i
+        cdef Order o
+        ids_arr = np.empty(n, dtype=np.int64)
+        types_arr = np.empty(n, dtype=np.int32)
+        states_arr = np.empty(n, dtype=np.int32)
+        qty_arr = np.empty(n, dtype=np.float64)
+        px_arr = np.empty(n, dtype=np.float64)
+        fill_arr = np.empty(n, dtype=np.float64)
+        fee_arr = np.empty(n, dtype=np.float64)
+        cdef long long[::1] ids = ids_arr
+        cdef int[::1] types = types_arr
+        cdef int[::1] states = states_arr
+        cdef double[::1] qty = qty_arr
+        cdef double[::1] px = px_arr
+        cdef double[::1] fill = fill_arr
+        cdef double[::1] fee = fee_arr
+        cdef list syms = [None] * n
+        for i in range(n):
+            o = <Order>orders[i]
+            syms[i] = o.symbol
+            ids[i] = o.order_id
+            types[i] = o.order_type
+            states[i] = o.state
+            qty[i] = o.quantity
+            px[i] = o.price
+            fill[i] = o.filled_price
+            fee[i] = o.commission_fee
+        return OrderBatch(syms, ids_arr, types_arr, qty_arr, px_arr, states_arr, fill_arr, fee_arr)
+
+    # ==========================
+    # 访问
+    # ==========================
+
+    def __len__(self):
+        return len(self.symbols)
+
+    cpdef Order order_at(self, Py_ssize_t i):
+        """第 i 行对应的 Order 对象"""
+        cdef Order o = Order(
+            self.order_ids[i],
+            self.order_types[i],
+            self.symbols[i],
+            self.quantities[i],
+            self.prices[i],
+        )
+        o.state = self.states[i]
+        o.filled_price = self.filled_prices[i]
+        o.commission_fee = self.commission_fees[i]
+        o.timestamp = self.timestamp
+        return o
+
+    cpdef list to_orders(self):
+        cdef Py_ssize_t i
+        return [self.order_at(i) for i in range(len(self.symbols))]
+
+    cpdef Event derive(self):
+        # 列数组整体拷贝：总线另一侧拿到的是独立快照
+        cdef OrderBatch evt = OrderBatch.__new__(OrderBatch)
+        evt.timestamp = 0
+        evt.source = 0
+        evt.producer = 0
+        evt.symbols = list(self.symbols)
+        evt.order_ids = self.order_ids.copy()
+        evt.order_types = self.order_types.copy()
+        evt.states = self.states.copy()
+        evt.quantities = self.quantities.copy()
+        evt.prices = self.prices.copy()
+        evt.filled_prices = self.filled_prices.copy()
+        evt.commission_fees = self.commission_fees.copy()
+        return evt
+
+    def __repr__(self):
+        return f"OrderBatch(n={len(self.symbols)}, timestamp={self.timestamp})"
@@ -65,10 +65,14 @@ class AccountRecorder(Recorder):
     5. flow_pnl: 两次快照间的盈亏, 不含手续费和资金费, 含未实现盈亏
     6. trade_count: 两次快照间的成交次数
     7. trade_amount: 两次快照间的成交金额
+
+    timer_name: 订阅 BacktestEngine.add_timer 添加的命名 timer（间隔设为 interval 即可），
+                不再在每个细粒度默认 Timer 上做间隔判断；None 则监听默认 Timer。
     """
-    def __init__(self, path: str, account: Account, interval: int, buffer_size: int = 1000):
+    def __init__(self, path: str, account: Account, interval: int, buffer_size: int = 1000, timer_name: str = None):
         super().__init__(path, account)
         self.interval = interval
+        self.timer_name = timer_name
         self.current_timestamp = 0
         self.last_timestamp = -interval
         self.buffer = []
@@ -83,7 +87,10 @@ class AccountRecorder(Recorder):
 
     def start(self, engine: EventEngine):
         # 注册账户相关事件监听
-        engine.register(Timer, self.on_timer)
+        if self.timer_name is None:
+            engine.register(Timer, self.on_timer)
+        else:
+            engine.register_timer(self.timer_name, self.on_timer)
         # 打开文件
         self.file = open(self.path, "w", encoding="utf-8-sig")
         # 写入表头
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+import pyarrow as pa
+from pyarrow import ipc
+from pyarrow import parquet as pq
+
+_FORMATS = {"parquet": ".parquet", "ipc": ".arrow"}
+
+
+class RecordSink:
+    """
+    采样器输出的落盘通道：按列攒够 chunk_rows 行后交给后台线程写成一个分片文件。
+
+    - path 是一个目录，分片依次命名为 part-00000.parquet / part-00000.arrow ...；
+      各分片的列可以不同（例如中途出现新因子），读回时按列名对齐，缺失为 null。
+    - 待写分片最多 max_pending_chunks 个，写盘跟不上时 append 会阻塞（内存有上界）。
+    - 后台线程的异常会在下一次 append / flush / close 时抛出。
+    - 用完必须 close()（挂在引擎上的采样器会在 stop() 里关闭）；之后用 RecordSink.read(path) 读回完整数据。
+    """
+
+    def __init__(self, path: str, format: str = "parquet", chunk_rows: int = 65536, max_pending_chunks: int = 8):
+        if format not in _FORMATS:
+            raise ValueError(f"format must be one of {sorted(_FORMATS)}")
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be > 0")
+        self.path = path
+        self.format = format
+        self.chunk_rows = int(chunk_rows)
+        os.makedirs(path, exist_ok=True)
+        if any(name.startswith("part-") for name in os.listdir(path)):
+            raise FileExistsError(f"sink directory already contains parts: {path}")
+
+        self.rows_written = 0
+        self.chunks_written = 0
+        self._rows: Dict[str, List[Any]] = {}
+        self._n_buffered = 0
+        self._n_chunks = 0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[tuple[int, pa.Table]]]" = queue.Queue(maxsize=max_pending_chunks)
+        self._thread = threading.Thread(target=self._run, name=f"RecordSink({path})", daemon=True)
+        self._thread.start()
+
+    # ==========================
+    # 写入
+    # ==========================
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """追加一行（dict）。新出现的列对之前的行补 None"""
+        self._check()
+        rows = self._rows
+        n = self._n_buffered
+        for key, value in record.items():
+            col = rows.get(key)
+            if col is None:
+                col = rows[key] = [None] * n
+            col.append(value)
+        n += 1
+        self._n_buffered = n
+        for col in rows.values():
+            if len(col) < n:
+                col.append(None)
+        if n >= self.chunk_rows:
+            self.flush()
+
+    def write_columns(self, columns: Dict[str, Any]) -> None:
+        """直接提交一块已经是列式的数据（numpy 数组 / list），跳过行缓冲"""
+        self._check()
+        self._submit(pa.table(columns))
+
+    def flush(self) -> None:
+        """把缓冲的行作为一个分片提交"""
+        self._check()
+        if self._n_buffered == 0:
+            return
+        table = pa.table(self._rows)
+        self._rows = {}
+        self._n_buffered = 0
+        self._submit(table)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """MemoryMonitor 协议"""
+        return {"buffered_rows": self._n_buffered, "pending_chunks": self._queue.qsize()}
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"RecordSink writer failed: {self._error!r}") from self._error
+
+    def _check(self) -> None:
+        self._raise_error()
+        if self._closed:
+            raise RuntimeError("RecordSink is closed")
+
+    def _submit(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+        index = self._n_chunks
+        self._n_chunks += 1
+        self._queue.put((index, table))
+
+    def _run(self) -> None:
+        suffix = _FORMATS[self.format]
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+            index, table = item
+            file_path = os.path.join(self.path, f"part-{index:05d}{suffix}")
+            try:
+                if self.format == "parquet":
+                    pq.write_table(table, file_path)
+                else:
+                    with pa.OSFile(file_path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+                self.rows_written += table.num_rows
+                self.chunks_written += 1
+            except BaseException as exc:  # 交给主线程抛出
+                self._error = exc
+
+    # ==========================
+    # 读回
+    # ==========================
+
+    @staticmethod
+    def read_table(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+        parts = sorted(name for name in os.listdir(path) if name.startswith("part-"))
+        tables = []
+        for name in parts:
+            file_path = os.path.join(path, name)
+            if name.endswith(".parquet"):
+                tables.append(pq.read_table(file_path))
+            else:
+                with pa.memory_map(file_path, "r") as source:
+                    tables.append(ipc.open_file(source).read_all())
+        if not tables:
+            return pa.table({} if columns is None else {c: pa.array([], pa.null()) for c in columns})
+        table = pa.concat_tables(tables, promote_options="default")
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        return table
+
+    @staticmethod
+    def read(path: str, columns: Optional[List[str]] = None):
+        """读回全部分片，返回 pandas.DataFrame"""
+        return RecordSink.read_table(path, columns).to_pandas()
@@ -2,6 +2,7 @@
 from abc import ABC
 from hft_backtest.core.event_engine import Component, EventEngine
 from hft_backtest.core.order import Order
+from hft_backtest.core.order_batch import OrderBatch
 from hft_backtest.core.account import Account
 
 class Strategy(Component, ABC):
@@ -32,4 +33,18 @@ class Strategy(Component, ABC):
         
         # 修改状态为 SUBMITTED
         order.state = Order.ORDER_STATE_SUBMITTED
-        self.event_engine.put(order)
\ No newline at end of file
+        self.event_engine.put(order)
+
+    def send_order_batch(self, batch: OrderBatch):
+        """
+        一次发送一篮子订单（一个事件）。
+        需要撮合/账户注册了 OrderBatch（如 AshareDailyMatcher / AshareAccount），回报是一个 OrderBatch。
+        """
+        if self.event_engine is None:
+            raise RuntimeError("Strategy not started: event_engine is None")
+
+        states = batch.states
+        assert ((states == Order.ORDER_STATE_CREATED) | (batch.order_types == Order.ORDER_TYPE_CANCEL)).all(), \
+            "Invalid order state in batch"
+        states[:] = Order.ORDER_STATE_SUBMITTED
+        self.event_engine.put(batch)
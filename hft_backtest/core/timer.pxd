@@ -3,6 +3,14 @@
 
 from hft_backtest.core.event cimport Event
 
+cpdef int timer_id_of(str name) except -1
+cpdef object timer_name_of(int timer_id)
+
 cdef class Timer(Event):
+    # 合并掉的空 tick 个数（catch_up 模式）
+    cdef public long long skipped
+    # 0 = 默认 timer；非 0 = 命名 timer（见 timer_id_of）
+    cdef public int timer_id
+
     # 覆盖基类的 derive 方法
     cpdef Event derive(self)
\ No newline at end of file
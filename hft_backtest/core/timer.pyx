@@ -6,29 +6,72 @@
 
 from hft_backtest.core.event cimport Event
 
+# 命名 timer 的进程级注册表：name -> id。0 保留给 BacktestEngine 的默认 timer。
+# 用进程级 id 而不是每个 BacktestEngine 各自编号，这样组件在 start(engine) 里
+# 只凭名字就能订阅，不需要拿到 BacktestEngine。
+cdef dict _TIMER_IDS = {}
+cdef list _TIMER_NAMES = [None]
+
+
+cpdef int timer_id_of(str name) except -1:
+    """返回命名 timer 的 id（首次出现时分配）。"""
+    if not name:
+        raise ValueError("timer name must be a non-empty string")
+    cdef object tid = _TIMER_IDS.get(name)
+    if tid is None:
+        tid = len(_TIMER_NAMES)
+        _TIMER_IDS[name] = tid
+        _TIMER_NAMES.append(name)
+    return tid
+
+
+cpdef object timer_name_of(int timer_id):
+    """timer_id_of 的反查；默认 timer (0) 或未知 id 返回 None。"""
+    if 0 < timer_id < len(_TIMER_NAMES):
+        return _TIMER_NAMES[timer_id]
+    return None
+
+
 cdef class Timer(Event):
     """
     高性能定时器事件 (Cython 重构版)
+
+    skipped:  本 Timer 之前被合并掉的空 tick 个数（仅 timer_mode='catch_up' 下非 0）。
+    timer_id: 0 为默认 timer（engine.register(Timer, ...) 的订阅者收到）；
+              非 0 为命名 timer，只派发给 engine.register_timer(name, ...) 的订阅者。
     """
-    def __init__(self, long long timestamp = 0):
+    def __init__(self, long long timestamp = 0, long long skipped = 0, int timer_id = 0):
         self.timestamp = timestamp
         self.source = 0
         self.producer = 0
+        self.skipped = skipped
+        self.timer_id = timer_id
+
+    @property
+    def name(self):
+        return timer_name_of(self.timer_id)
 
     # 【核心优化】手动实现 derive，绕过 copy.copy
     cpdef Event derive(self):
         # 1. 极速分配内存 (绕过 __init__)
         cdef Timer evt = Timer.__new__(Timer)
         
-        # 2. 赋值 (Timer 没有额外载荷，只需要重置头部)
+        # 2. 赋值 (重置头部，复制载荷 skipped / timer_id)
         # 注意：DelayBus 稍后会用 event.timestamp 覆盖 evt.timestamp，
         # 所以这里设为 0 或者复制 self.timestamp 都可以。
         # 为了符合 derive "重置路由信息" 的语义，我们设为 0。
         evt.timestamp = 0
         evt.source = 0
         evt.producer = 0
+        evt.skipped = self.skipped
+        evt.timer_id = self.timer_id
         
         return evt
 
     def __repr__(self):
-        return f"<Timer Event | timestamp: {self.timestamp}>"
\ No newline at end of file
+        cdef str extra = ""
+        if self.timer_id:
+            extra += f" | name: {self.name}"
+        if self.skipped:
+            extra += f" | skipped: {self.skipped}"
+        return f"<Timer Event | timestamp: {self.timestamp}{extra}>"
\ No newline at end of file
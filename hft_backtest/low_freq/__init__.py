@@ -1,6 +1,8 @@
 """
 这个模块实现了中低频回测的基础设施。
 """
-from .account import BarAccount
-from .matcher import BarMatcher
-from .recorder import BarRecorder
\ No newline at end of file
+from hft_backtest.low_freq.event import BarEvent, BarFundingRate
+from hft_backtest.low_freq.reader import BarArrayReader
+from hft_backtest.low_freq.account import BarAccount
+from hft_backtest.low_freq.matcher import BarMatcher
+from hft_backtest.low_freq.recorder import BarRecorder
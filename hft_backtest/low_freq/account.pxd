@@ -0,0 +1,14 @@
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.okx.account cimport OKXAccount
+from hft_backtest.low_freq.event cimport BarEvent, BarFundingRate
+
+cdef class BarAccount(OKXAccount):
+    cpdef start(self, EventEngine engine)
+    cpdef void on_bar(self, BarEvent event)
+    cpdef void on_bar_funding(self, BarFundingRate event)
+
+    # --- 单品种 O(1) 查询（Recorder 每根 K 线按品种调用） ---
+    cpdef double get_position(self, str symbol)
+    cpdef double get_price(self, str symbol)
+    cpdef double get_symbol_funding_fee(self, str symbol)
+    cpdef double get_symbol_commission(self, str symbol)
@@ -0,0 +1,24 @@
+from hft_backtest.core.event_engine import EventEngine
+from hft_backtest.okx.account import OKXAccount
+from hft_backtest.low_freq.event import BarEvent, BarFundingRate
+
+class BarAccount(OKXAccount):
+    """
+    与 OKXAccount 共用订单状态机和按品种的增量统计；
+    盯市价格取 BarEvent.close_price，资金费来自 BarFundingRate。
+    """
+    def start(self, engine: EventEngine) -> None: ...
+    def on_bar(self, event: BarEvent) -> None: ...
+    def on_bar_funding(self, event: BarFundingRate) -> None:
+        """funding_fee = 持仓 * 结算价 * 资金费率；结算价 <= 0 时用最新收盘价"""
+        ...
+
+    # --- 单品种 O(1) 查询 ---
+    def get_position(self, symbol: str) -> float: ...
+    def get_price(self, symbol: str) -> float: ...
+    def get_symbol_funding_fee(self, symbol: str) -> float:
+        """该品种累计资金费"""
+        ...
+    def get_symbol_commission(self, symbol: str) -> float:
+        """该品种累计手续费"""
+        ...
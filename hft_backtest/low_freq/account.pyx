@@ -0,0 +1,72 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.core.order cimport Order
+from hft_backtest.core.account cimport Account
+from hft_backtest.okx.account cimport OKXAccount, SymbolState
+from hft_backtest.low_freq.event cimport BarEvent, BarFundingRate
+
+cdef class BarAccount(OKXAccount):
+    """
+    低频/K线账户。
+    订单状态机、按品种的持仓/统计数组和增量汇总复用 OKXAccount，
+    盯市价格取 BarEvent.close_price，资金费来自 BarFundingRate。
+    """
+
+    cpdef start(self, EventEngine engine):
+        engine.register(Order, self.on_order)
+        engine.register(BarEvent, self.on_bar)
+        engine.register(BarFundingRate, self.on_bar_funding)
+
+    cpdef void on_bar(self, BarEvent event):
+        self.set_price(event.symbol, event.close_price)
+
+    cpdef void on_bar_funding(self, BarFundingRate event):
+        """funding_fee = 持仓 * 结算价 * 资金费率；结算价缺省用最新收盘价"""
+        cdef object idx = self._sym_index.get(event.symbol)
+        if idx is None:
+            return
+        cdef SymbolState* st = &self._states[<Py_ssize_t>idx]
+        if st.pos_int == 0:
+            return
+        cdef double price = event.price if event.price > 0 else st.price
+        if price <= 0:
+            return
+
+        cdef double funding_fee = st.pos_int / <double>Order.SCALER * price * event.funding_rate
+        self.cash_balance -= funding_fee
+        st.funding_fee += funding_fee
+        self._funding_fee += funding_fee
+
+    # ==========================
+    # 单品种查询
+    # ==========================
+
+    cpdef double get_position(self, str symbol):
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is None:
+            return 0.0
+        return self._states[<Py_ssize_t>idx].pos_int / <double>Order.SCALER
+
+    cpdef double get_price(self, str symbol):
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is None:
+            return 0.0
+        return self._states[<Py_ssize_t>idx].price
+
+    cpdef double get_symbol_funding_fee(self, str symbol):
+        """该品种累计资金费"""
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is None:
+            return 0.0
+        return self._states[<Py_ssize_t>idx].funding_fee
+
+    cpdef double get_symbol_commission(self, str symbol):
+        """该品种累计手续费"""
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is None:
+            return 0.0
+        return self._states[<Py_ssize_t>idx].commission
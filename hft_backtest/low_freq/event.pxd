@@ -0,0 +1,20 @@
+# cython: language_level=3
+
+from hft_backtest.core.event cimport Event
+
+cdef class BarEvent(Event):
+    # timestamp 为 K 线收盘时间
+    cdef public str symbol
+    cdef public double open_price
+    cdef public double high_price
+    cdef public double low_price
+    cdef public double close_price
+    cdef public double volume
+    # 下一根 K 线开盘价，未知时为 NaN
+    cdef public double next_open_price
+
+cdef class BarFundingRate(Event):
+    cdef public str symbol
+    cdef public double funding_rate
+    # 结算价，<= 0 时账户用最新收盘价
+    cdef public double price
@@ -0,0 +1,38 @@
+from hft_backtest.core.event import Event
+
+class BarEvent(Event):
+    """K 线事件，timestamp 为收盘时间"""
+    symbol: str
+    open_price: float
+    high_price: float
+    low_price: float
+    close_price: float
+    volume: float
+    # 下一根 K 线开盘价，未知时为 NaN
+    next_open_price: float
+
+    def __init__(
+        self,
+        timestamp: int = 0,
+        symbol: str = "",
+        open_price: float = 0.0,
+        high_price: float = 0.0,
+        low_price: float = 0.0,
+        close_price: float = 0.0,
+        volume: float = 0.0,
+        next_open_price: float = ...,
+    ) -> None: ...
+
+class BarFundingRate(Event):
+    symbol: str
+    funding_rate: float
+    # 结算价，<= 0 时账户用最新收盘价
+    price: float
+
+    def __init__(
+        self,
+        timestamp: int = 0,
+        symbol: str = "",
+        funding_rate: float = 0.0,
+        price: float = 0.0,
+    ) -> None: ...
@@ -0,0 +1,86 @@
+# hft_backtest/low_freq/event.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+from hft_backtest.core.event cimport Event
+
+cdef double NAN = float("nan")
+
+# =============================================================================
+# BarEvent: 分钟线/小时线/日线
+# =============================================================================
+cdef class BarEvent(Event):
+    """
+    K 线事件。timestamp 必须用收盘时间，否则与框架“事件发生时刻”的含义不匹配。
+    """
+    def __init__(
+        self,
+        long long timestamp = 0,
+        str symbol = "",
+        double open_price = 0.0,
+        double high_price = 0.0,
+        double low_price = 0.0,
+        double close_price = 0.0,
+        double volume = 0.0,
+        double next_open_price = NAN,
+    ):
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.open_price = open_price
+        self.high_price = high_price
+        self.low_price = low_price
+        self.close_price = close_price
+        self.volume = volume
+        self.next_open_price = next_open_price
+
+    cpdef Event derive(self):
+        cdef BarEvent evt = BarEvent.__new__(BarEvent)
+        evt.timestamp = 0
+        evt.source = 0
+        evt.producer = 0
+
+        evt.symbol = self.symbol
+        evt.open_price = self.open_price
+        evt.high_price = self.high_price
+        evt.low_price = self.low_price
+        evt.close_price = self.close_price
+        evt.volume = self.volume
+        evt.next_open_price = self.next_open_price
+        return evt
+
+    def __repr__(self):
+        return (f"BarEvent(timestamp={self.timestamp}, symbol={self.symbol}, "
+                f"o={self.open_price}, h={self.high_price}, l={self.low_price}, c={self.close_price}, v={self.volume})")
+
+# =============================================================================
+# BarFundingRate: 资金费结算
+# =============================================================================
+cdef class BarFundingRate(Event):
+    def __init__(
+        self,
+        long long timestamp = 0,
+        str symbol = "",
+        double funding_rate = 0.0,
+        double price = 0.0,
+    ):
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.funding_rate = funding_rate
+        self.price = price
+
+    cpdef Event derive(self):
+        cdef BarFundingRate evt = BarFundingRate.__new__(BarFundingRate)
+        evt.timestamp = 0
+        evt.source = 0
+        evt.producer = 0
+
+        evt.symbol = self.symbol
+        evt.funding_rate = self.funding_rate
+        evt.price = self.price
+        return evt
+
+    def __repr__(self):
+        return (f"BarFundingRate(timestamp={self.timestamp}, symbol={self.symbol}, "
+                f"funding_rate={self.funding_rate}, price={self.price})")
@@ -0,0 +1,39 @@
+# cython: language_level=3
+
+from hft_backtest.core.matcher cimport MatchEngine
+from hft_backtest.core.order cimport Order
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.low_freq.event cimport BarEvent
+
+# 单品种挂单：价格/标志位等按列存在 C 数组里，orders 与之按下标对齐
+cdef class SymbolBook:
+    cdef list orders
+    cdef long long* ids
+    cdef double* prices
+    cdef int* flags
+    cdef unsigned char* codes      # on_bar 判定结果的暂存区
+    cdef Py_ssize_t n
+    cdef Py_ssize_t cap
+
+    cdef int append(self, Order order, int flags) except -1
+    cdef Py_ssize_t find(self, long long order_id)
+    cdef void remove_at(self, Py_ssize_t i)
+    cdef Py_ssize_t evaluate(self, double open_px, double high_px, double low_px) noexcept nogil
+
+cdef class BarMatcher(MatchEngine):
+    cdef public double taker_fee
+    cdef public double maker_fee
+
+    cdef dict _books           # symbol -> SymbolBook
+    cdef dict _order_symbol    # order_id -> symbol (撤单索引)
+    cdef dict _last_close      # symbol -> 最新收盘价 (跟踪单定价)
+
+    cdef EventEngine event_engine
+
+    cdef void fill_order(self, Order order, double filled_price, bint is_taker)
+    cdef void cancel_order(self, long order_id)
+    cdef void _report_canceled(self, Order order)
+
+    cpdef start(self, EventEngine engine)
+    cpdef on_order(self, Order order)
+    cpdef on_bar(self, BarEvent event)
@@ -0,0 +1,24 @@
+from typing import Dict, List
+from hft_backtest.core.matcher import MatchEngine
+from hft_backtest.core.event_engine import EventEngine
+from hft_backtest.core.order import Order
+from hft_backtest.low_freq.event import BarEvent
+
+class BarMatcher(MatchEngine):
+    """
+    低频/K线撮合（多品种）：订单在下一根 BarEvent 到达时按 open/high/low 撮合。
+    - 市价单按开盘价成交 (taker)
+    - 限价单触价即成交；开盘已穿价按开盘价成交 (taker，post_only 则撤销)，否则按限价成交 (maker)
+    - 跟踪单按最新收盘价转为限价单
+    """
+    taker_fee: float
+    maker_fee: float
+
+    def __init__(self, taker_fee: float = ..., maker_fee: float = ...) -> None: ...
+    def start(self, engine: EventEngine) -> None: ...
+    def on_order(self, order: Order) -> None: ...
+    def on_bar(self, event: BarEvent) -> None: ...
+    def get_resting_orders(self, symbol: str) -> List[Order]:
+        """该品种当前的挂单（按到达顺序）"""
+        ...
+    def memory_footprint(self) -> Dict[str, int]: ...
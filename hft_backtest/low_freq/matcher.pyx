@@ -0,0 +1,276 @@
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+
+from libc.stdlib cimport realloc, free
+from libc.string cimport memmove
+from libc.math cimport fabs
+from hft_backtest.core.matcher cimport MatchEngine
+from hft_backtest.core.order cimport (
+    Order,
+    ORDER_STATE_FILLED,
+    ORDER_STATE_CANCELED,
+    ORDER_STATE_RECEIVED,
+    ORDER_TYPE_LIMIT,
+    ORDER_TYPE_MARKET,
+    ORDER_TYPE_TRACKING,
+)
+from hft_backtest.core.event_engine cimport EventEngine
+from hft_backtest.low_freq.event cimport BarEvent
+
+# 挂单标志位
+cdef enum:
+    F_BUY = 1
+    F_MARKET = 2
+
+# on_bar 判定结果
+cdef enum:
+    CODE_REST = 0       # 未触价，继续挂着
+    CODE_MAKER = 1      # 按挂单价成交
+    CODE_TAKER = 2      # 开盘即穿价，按开盘价成交
+    CODE_CANCEL = 3     # post_only 限价单开盘即穿价，撤销（回报阶段使用）
+
+
+cdef class SymbolBook:
+    """
+    单品种的活跃订单。
+    价格、方向/类型标志和订单 id 按列存在连续 C 数组里，一根 K 线到达时
+    先在 C 层对全部挂单做一遍 high/low 判定（evaluate，无 GIL），再统一回报和压缩，
+    Python 层的工作只剩下真正成交的那些订单。
+    """
+    def __cinit__(self):
+        self.orders = []
+        self.ids = NULL
+        self.prices = NULL
+        self.flags = NULL
+        self.codes = NULL
+        self.n = 0
+        self.cap = 0
+
+    def __dealloc__(self):
+        free(self.ids)
+        free(self.prices)
+        free(self.flags)
+        free(self.codes)
+
+    def __len__(self):
+        return self.n
+
+    cdef int append(self, Order order, int flags) except -1:
+        cdef Py_ssize_t new_cap
+        cdef void* p
+        if self.n == self.cap:
+            new_cap = self.cap * 2 if self.cap > 0 else 8
+            p = realloc(self.ids, new_cap * sizeof(long long))
+            if p == NULL: raise MemoryError()
+            self.ids = <long long*>p
+            p = realloc(self.prices, new_cap * sizeof(double))
+            if p == NULL: raise MemoryError()
+            self.prices = <double*>p
+            p = realloc(self.flags, new_cap * sizeof(int))
+            if p == NULL: raise MemoryError()
+            self.flags = <int*>p
+            p = realloc(self.codes, new_cap * sizeof(unsigned char))
+            if p == NULL: raise MemoryError()
+            self.codes = <unsigned char*>p
+            self.cap = new_cap
+        self.ids[self.n] = order.order_id
+        self.prices[self.n] = order.price
+        self.flags[self.n] = flags
+        self.orders.append(order)
+        self.n += 1
+        return 0
+
+    cdef Py_ssize_t find(self, long long order_id):
+        cdef Py_ssize_t i
+        for i in range(self.n):
+            if self.ids[i] == order_id:
+                return i
+        return -1
+
+    cdef void remove_at(self, Py_ssize_t i):
+        cdef Py_ssize_t tail = self.n - i - 1
+        if tail > 0:
+            memmove(&self.ids[i], &self.ids[i + 1], tail * sizeof(long long))
+            memmove(&self.prices[i], &self.prices[i + 1], tail * sizeof(double))
+            memmove(&self.flags[i], &self.flags[i + 1], tail * sizeof(int))
+        del self.orders[i]
+        self.n -= 1
+
+    cdef Py_ssize_t evaluate(self, double open_px, double high_px, double low_px) noexcept nogil:
+        """
+        对全部挂单做一遍触价判定，结果写入 codes，返回需要处理（非 CODE_REST）的个数。
+        - 市价单：按开盘价成交 (taker)
+        - 限价买：low <= 限价即成交；开盘已低于限价则按开盘价成交 (taker)，否则按限价 (maker)
+        - 限价卖：high >= 限价即成交；开盘已高于限价则按开盘价成交 (taker)，否则按限价 (maker)
+        """
+        cdef Py_ssize_t i
+        cdef Py_ssize_t n_hit = 0
+        cdef int f
+        cdef double p
+        cdef unsigned char code
+        for i in range(self.n):
+            f = self.flags[i]
+            p = self.prices[i]
+            if f & F_MARKET:
+                code = CODE_TAKER
+            elif f & F_BUY:
+                if low_px <= p:
+                    code = CODE_TAKER if open_px < p else CODE_MAKER
+                else:
+                    code = CODE_REST
+            else:
+                if high_px >= p:
+                    code = CODE_TAKER if open_px > p else CODE_MAKER
+                else:
+                    code = CODE_REST
+            self.codes[i] = code
+            if code != CODE_REST:
+                n_hit += 1
+        return n_hit
+
+
+cdef class BarMatcher(MatchEngine):
+    """
+    低频/K线撮合引擎（多品种）。
+    适用场景：分钟线/小时线/日线回测；订单在下一根 BarEvent 到达时按 open/high/low 撮合。
+    """
+
+    def __init__(self, double taker_fee = 2e-4, double maker_fee = 1.1e-4):
+        self.taker_fee = taker_fee
+        self.maker_fee = maker_fee
+        self._books = {}
+        self._order_symbol = {}
+        self._last_close = {}
+
+    cpdef start(self, EventEngine engine):
+        self.event_engine = engine
+        engine.register(Order, self.on_order)
+        engine.register(BarEvent, self.on_bar)
+
+    # --- 回报 ---
+    cdef void fill_order(self, Order order, double filled_price, bint is_taker):
+        cdef Order new_order = order.derive()
+        new_order.state = ORDER_STATE_FILLED
+        new_order.filled_price = filled_price
+        cdef double amount = fabs(filled_price * new_order.quantity)
+        new_order.commission_fee = amount * self.taker_fee if is_taker else amount * self.maker_fee
+        self._order_symbol.pop(order.order_id, None)
+        self.event_engine.put(new_order)
+
+    cdef void _report_canceled(self, Order order):
+        cdef Order new_order = order.derive()
+        new_order.order_type = ORDER_TYPE_LIMIT
+        new_order.state = ORDER_STATE_CANCELED
+        self._order_symbol.pop(order.order_id, None)
+        self.event_engine.put(new_order)
+
+    cdef void cancel_order(self, long order_id):
+        cdef object symbol = self._order_symbol.get(order_id)
+        if symbol is None:
+            return
+        cdef SymbolBook book = self._books[symbol]
+        cdef Py_ssize_t i = book.find(order_id)
+        if i < 0:
+            return
+        cdef Order order = book.orders[i]
+        book.remove_at(i)
+        self._report_canceled(order)
+
+    # --- 事件 ---
+    cpdef on_order(self, Order order):
+        if order.is_cancel_order:
+            self.cancel_order(order.order_id)
+            return
+        if not order.is_submitted:
+            return
+
+        cdef Order new_order = order.derive()
+        cdef object close_px
+        cdef int flags = F_BUY if new_order.quantity > 0 else 0
+
+        if new_order.order_type == ORDER_TYPE_TRACKING:
+            # 跟踪单 -> 以最新收盘价挂限价单；还没见过该品种行情则无法定价
+            close_px = self._last_close.get(new_order.symbol)
+            if close_px is None:
+                self._report_canceled(new_order)
+                return
+            new_order.order_type = ORDER_TYPE_LIMIT
+            new_order.price = <double>close_px
+        elif new_order.order_type == ORDER_TYPE_MARKET:
+            flags |= F_MARKET
+
+        new_order.state = ORDER_STATE_RECEIVED
+        cdef SymbolBook book = self._books.get(new_order.symbol)
+        if book is None:
+            book = self._books[new_order.symbol] = SymbolBook()
+        book.append(new_order, flags)
+        self._order_symbol[new_order.order_id] = new_order.symbol
+        self.event_engine.put(new_order)
+
+    cpdef on_bar(self, BarEvent event):
+        self._last_close[event.symbol] = event.close_price
+        cdef SymbolBook book = self._books.get(event.symbol)
+        if book is None or book.n == 0:
+            return
+
+        cdef Py_ssize_t n_hit
+        with nogil:
+            n_hit = book.evaluate(event.open_price, event.high_price, event.low_price)
+        if n_hit == 0:
+            return
+
+        # 先原地压缩未成交的订单，簿子恢复一致后再按挂单顺序回报
+        # （回报可能同步触发策略下新单，重新进入 on_order）
+        cdef list orders = book.orders
+        cdef list kept = []
+        cdef list hits = []
+        cdef Py_ssize_t n = book.n
+        cdef Py_ssize_t i
+        cdef Py_ssize_t keep = 0
+        cdef unsigned char code
+        cdef Order order
+        for i in range(n):
+            code = book.codes[i]
+            order = orders[i]
+            if code == CODE_REST:
+                if keep != i:
+                    book.ids[keep] = book.ids[i]
+                    book.prices[keep] = book.prices[i]
+                    book.flags[keep] = book.flags[i]
+                kept.append(order)
+                keep += 1
+            elif code == CODE_MAKER:
+                hits.append((order, CODE_MAKER))
+            elif order.post_only and not (book.flags[i] & F_MARKET):
+                hits.append((order, CODE_CANCEL))
+            else:
+                hits.append((order, CODE_TAKER))
+        book.orders = kept
+        book.n = keep
+
+        for order, code in hits:
+            if code == CODE_MAKER:
+                self.fill_order(order, order.price, False)
+            elif code == CODE_TAKER:
+                self.fill_order(order, event.open_price, True)
+            else:
+                self._report_canceled(order)
+
+    # --- 查询 ---
+    def get_resting_orders(self, str symbol):
+        """该品种当前的挂单（按到达顺序）"""
+        cdef SymbolBook book = self._books.get(symbol)
+        return [] if book is None else list(book.orders)
+
+    def memory_footprint(self):
+        cdef Py_ssize_t cap = 0
+        cdef SymbolBook book
+        for book in self._books.values():
+            cap += book.cap
+        return {
+            "symbols": len(self._books),
+            "orders": len(self._order_symbol),
+            "book_capacity": cap,
+        }
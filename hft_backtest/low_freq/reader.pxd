@@ -0,0 +1,24 @@
+# hft_backtest/low_freq/reader.pxd
+# cython: language_level=3
+
+from hft_backtest.core.reader cimport DataReader
+
+# BarEvent 专用 Batch 读取器
+cdef class BarArrayReader(DataReader):
+    cdef object batch_iterator
+    cdef object current_df # 保持引用，防止 MemoryView 失效
+    cdef str default_symbol
+
+    cdef long[:] timestamps
+    cdef object[:] symbols
+    cdef double[:] opens
+    cdef double[:] highs
+    cdef double[:] lows
+    cdef double[:] closes
+    cdef double[:] volumes
+    cdef double[:] next_opens
+
+    cdef Py_ssize_t idx
+    cdef Py_ssize_t length
+
+    cdef void load_next_batch(self)
@@ -0,0 +1,96 @@
+# hft_backtest/low_freq/reader.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+
+import numpy as np
+cimport numpy as np
+from hft_backtest.core.event cimport Event
+from hft_backtest.core.reader cimport DataReader
+from hft_backtest.low_freq.event cimport BarEvent
+
+# 初始化 Numpy C-API
+np.import_array()
+
+
+cdef inline object _pick(object df, tuple names, object default):
+    """按顺序取第一个存在的列；都不存在时返回 default（None 表示必需列）"""
+    for name in names:
+        if name in df.columns:
+            return df[name].values.astype(np.float64)
+    if default is None:
+        raise KeyError(f"none of columns {names} found")
+    return np.full(len(df), default, dtype=np.float64)
+
+
+cdef class BarArrayReader(DataReader):
+    def __init__(self, dataset, str symbol = ""):
+        """
+        :param dataset: 任何迭代返回 DataFrame 的对象 (如 ParquetDataset(mode='batch'))
+        :param symbol: 数据不含 symbol 列时使用的品种名
+
+        列名：timestamp(或 close_time), symbol, open/high/low/close(或 *_price),
+        volume(或 vol，可选), next_open(或 next_open_price，可选，缺省 NaN)
+        """
+        self.batch_iterator = iter(dataset)
+        self.default_symbol = symbol
+        self.length = 0
+        self.idx = 0
+        self.current_df = None
+        self.load_next_batch()
+
+    cdef void load_next_batch(self):
+        try:
+            df = next(self.batch_iterator)
+
+            if 'timestamp' in df.columns:
+                self.timestamps = df['timestamp'].values.astype(np.int64)
+            else:
+                self.timestamps = df['close_time'].values.astype(np.int64)
+            if 'symbol' in df.columns:
+                arr = df['symbol'].to_numpy(dtype=object)
+                if not arr.flags.writeable:
+                    arr = arr.copy()
+            else:
+                arr = np.full(len(df), self.default_symbol, dtype=object)
+            self.symbols = arr
+            self.opens = _pick(df, ('open', 'open_price'), None)
+            self.highs = _pick(df, ('high', 'high_price'), None)
+            self.lows = _pick(df, ('low', 'low_price'), None)
+            self.closes = _pick(df, ('close', 'close_price'), None)
+            self.volumes = _pick(df, ('volume', 'vol'), 0.0)
+            self.next_opens = _pick(df, ('next_open', 'next_open_price'), np.nan)
+
+            self.current_df = df # 重要：保活
+            self.length = len(df)
+            self.idx = 0
+
+        except StopIteration:
+            self.length = 0
+            self.current_df = None
+
+    cdef Event fetch_next(self):
+        cdef BarEvent evt
+        cdef Py_ssize_t i
+
+        if self.idx >= self.length:
+            self.load_next_batch()
+
+        if self.length == 0:
+            return None
+
+        evt = BarEvent.__new__(BarEvent)
+        i = self.idx
+
+        evt.timestamp = self.timestamps[i]
+        evt.symbol = self.symbols[i]
+        evt.open_price = self.opens[i]
+        evt.high_price = self.highs[i]
+        evt.low_price = self.lows[i]
+        evt.close_price = self.closes[i]
+        evt.volume = self.volumes[i]
+        evt.next_open_price = self.next_opens[i]
+
+        self.idx += 1
+        return evt
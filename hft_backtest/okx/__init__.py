@@ -3,6 +3,7 @@
 """
 from hft_backtest.okx.event import OKXBookticker, OKXTrades, OKXDelivery, OKXFundingRate, OKXPremium
 from hft_backtest.okx.account import OKXAccount
+from hft_backtest.okx.latency import RecordedArrivalLatencyModel
 
 from hft_backtest.okx.factor_evaluator import FactorEvaluator
 from hft_backtest.okx.factor_market_sampler import FactorMarketSampler
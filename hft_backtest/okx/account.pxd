@@ -1,26 +1,52 @@
 from hft_backtest.core.account cimport Account
 from hft_backtest.core.event_engine cimport EventEngine
 from hft_backtest.core.order cimport Order
+from hft_backtest.core.id_window cimport OrderIdWindow
 from hft_backtest.okx.event cimport OKXTrades, OKXFundingRate, OKXDelivery
 
+# 单个品种的账户状态，按 symbol id 存在连续数组里
+cdef struct SymbolState:
+    long long pos_int          # 持仓 (Order.SCALER 定点)
+    double price               # 最新成交价（盯市价）
+    bint has_price
+    double turnover
+    double commission
+    double funding_fee
+    double net_cash_flow
+    long long trade_count
+
 cdef class OKXAccount(Account):
     cdef public double cash_balance
-    cdef public object position_dict
     cdef public object order_dict
-    # 【新增声明】必须在这里声明，否则 .pyx 里无法使用
-    cdef public object finished_order_ids 
-    cdef public object price_dict
-    
-    cdef public object total_turnover
-    cdef public object total_commission
-    cdef public object total_funding_fee
-    cdef public object net_cash_flow
-    cdef public object total_trade_count
+    # 已终结订单 id：水位线 + 环形位图，内存有界
+    cdef public OrderIdWindow finished_order_ids
+
+    # --- 按品种的状态数组 ---
+    cdef dict _sym_index           # {symbol: symbol_id}
+    cdef list _symbols             # [symbol]，下标即 symbol_id
+    cdef SymbolState* _states
+    cdef Py_ssize_t _n_sym
+    cdef Py_ssize_t _cap_sym
+
+    # --- 增量维护的全账户汇总 ---
+    cdef double _turnover
+    cdef double _commission
+    cdef double _funding_fee
+    cdef double _net_cash_flow
+    cdef long long _trade_count
+    cdef double _position_value    # Σ pos * price
+    cdef double _margin            # Σ |pos| * price
+    cdef Py_ssize_t _n_open        # 非零持仓的品种数
+    cdef long long _n_incr         # 上次重算以来的增量更新次数
+
+    cdef void _incr_totals(self, double d_value, double d_margin)
+    cdef void _resync_totals(self)
 
     cpdef start(self, EventEngine engine)
     cpdef stop(self)
     cpdef void on_order(self, Order order)
     cpdef void on_trade_data(self, OKXTrades event)
+    cpdef void set_price(self, str symbol, double price)
     cpdef void on_funding_data(self, OKXFundingRate event)
     cpdef void on_delivery_data(self, OKXDelivery event)
     
@@ -38,4 +64,7 @@ cdef class OKXAccount(Account):
     cpdef double get_total_funding_fee(self)
     cpdef double get_total_trade_pnl(self)
     
-    cdef double _get_position_cashvalue(self)
\ No newline at end of file
+    cdef double _get_position_cashvalue(self)
+    cdef Py_ssize_t _sym_id(self, str symbol) except -1
+    cdef void _set_position(self, SymbolState* st, long long new_pos)
+    cdef dict _per_symbol(self, int field)
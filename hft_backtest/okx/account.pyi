@@ -1,24 +1,40 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, MutableMapping, Optional
 from hft_backtest.core.account import Account
 from hft_backtest.core.event_engine import EventEngine
 from hft_backtest.core.order import Order
+from hft_backtest.core.id_window import OrderIdWindow
 from hft_backtest.okx.event import OKXTrades, OKXFundingRate, OKXDelivery
 
 class OKXAccount(Account):
     # --- 核心状态 (对应 .pxd 中的 cdef public 字段) ---
     cash_balance: float
-    position_dict: Any  # 实际上是 defaultdict(int)
     order_dict: Dict[int, Order]
-    price_dict: Dict[str, float]
+    # 已终结订单 id（水位线 + 位图，内存有界；支持 `in` / add / len）
+    finished_order_ids: OrderIdWindow
 
-    # --- 累计统计 ---
-    total_turnover: Any
-    total_commission: Any
-    total_funding_fee: Any
-    net_cash_flow: Any
-    total_trade_count: Any
+    # --- 按品种明细（内部是按 symbol id 索引的 C 数组，这里返回快照，只含非零项） ---
+    @property
+    def position_dict(self) -> Dict[str, int]:
+        """{symbol: 定点持仓 (Order.SCALER)}"""
+        ...
+    @property
+    def price_dict(self) -> MutableMapping[str, float]:
+        """可写视图：price_dict[symbol] = px 等价于 set_price(symbol, px)"""
+        ...
+    @property
+    def total_turnover(self) -> Dict[str, float]: ...
+    @property
+    def total_commission(self) -> Dict[str, float]: ...
+    @property
+    def total_funding_fee(self) -> Dict[str, float]: ...
+    @property
+    def net_cash_flow(self) -> Dict[str, float]: ...
+    @property
+    def total_trade_count(self) -> Dict[str, int]: ...
 
-    def __init__(self, initial_balance: float = 0.0) -> None: ...
+    def __init__(self, initial_balance: float = 0.0, finished_window: int = 1 << 20) -> None:
+        """finished_window: 已终结订单 id 位图的容量（向上取整到 2 的幂），需远大于同时在途的订单 id 跨度"""
+        ...
     
     def start(self, engine: EventEngine) -> None: ...
     def stop(self) -> None: ...
@@ -26,6 +42,9 @@ class OKXAccount(Account):
     # --- 事件处理 ---
     def on_order(self, order: Order) -> None: ...
     def on_trade_data(self, event: OKXTrades) -> None: ...
+    def set_price(self, symbol: str, price: float) -> None:
+        """更新盯市价格并增量更新持仓市值/保证金"""
+        ...
     def on_funding_data(self, event: OKXFundingRate) -> None: ...
     def on_delivery_data(self, event: OKXDelivery) -> None: ...
 
@@ -39,6 +58,7 @@ class OKXAccount(Account):
     def get_equity(self) -> float: ...
     def get_total_margin(self) -> float: ...
     def get_leverage(self) -> Optional[float]: ...
+    def memory_footprint(self) -> Dict[str, int]: ...
 
     # --- 统计数据 Getter ---
     def get_total_turnover(self) -> float: ...
@@ -3,33 +3,71 @@
 # cython: wraparound=False
 # cython: initializedcheck=False
 
-from collections import defaultdict
+from collections.abc import MutableMapping
+from libc.stdlib cimport realloc, free
+from libc.string cimport memset
 from hft_backtest.core.event_engine cimport EventEngine
 from hft_backtest.core.order cimport Order
+from hft_backtest.core.id_window cimport OrderIdWindow
 from hft_backtest.okx.event cimport OKXTrades, OKXFundingRate, OKXDelivery
 from hft_backtest.core.account cimport Account
 
+# _per_symbol 的字段选择
+cdef enum:
+    F_POSITION = 0
+    F_TURNOVER = 1
+    F_COMMISSION = 2
+    F_FUNDING = 3
+    F_NET_CASH_FLOW = 4
+    F_TRADE_COUNT = 5
+
+# 持仓市值 / 保证金每累计这么多次增量更新就按品种重算一遍，把浮点误差截断
+cdef enum:
+    RESYNC_EVERY = 1 << 16
+
 cdef class OKXAccount(Account):
-    def __init__(self, double initial_balance = 0.0):
+    """
+    OKX 永续账户。
+    按品种的持仓/价格/累计统计存在按 symbol id 索引的 C 结构体数组里，
+    全账户汇总（成交额、手续费、资金费、净现金流、持仓市值、保证金）在成交/行情到达时增量更新，
+    get_equity / get_total_* 都是 O(1)，策略每个 tick 查询也不会随品种数变慢。
+    持仓市值 / 保证金在资金费、交割事件以及每 RESYNC_EVERY 次增量更新后按品种数组重算（O(品种数)），
+    长期持仓时浮点误差不会一直累积。
+    """
+    def __cinit__(self):
+        self._states = NULL
+        self._n_sym = 0
+        self._cap_sym = 0
+
+    def __dealloc__(self):
+        if self._states != NULL:
+            free(self._states)
+
+    def __init__(self, double initial_balance = 0.0, long long finished_window = 1 << 20):
         super().__init__()
         
         # --- 核心状态 ---
         self.cash_balance = initial_balance
-        self.position_dict = defaultdict(int)
         self.order_dict = {}
         
         # 【新增】已终结订单集合 (防止乱序事件导致僵尸单复活)
-        # 存储 order_id
-        self.finished_order_ids = set()
+        # order_id 单调递增，用水位线 + 固定大小位图代替无限增长的 set；
+        # finished_window 需远大于同时在途的订单 id 跨度
+        self.finished_order_ids = OrderIdWindow(finished_window)
 
-        self.price_dict = {}
+        self._sym_index = {}
+        self._symbols = []
 
         # --- 累计统计 ---
-        self.total_turnover = defaultdict(float)
-        self.total_commission = defaultdict(float)
-        self.total_funding_fee = defaultdict(float)
-        self.net_cash_flow = defaultdict(float)
-        self.total_trade_count = defaultdict(int)
+        self._turnover = 0.0
+        self._commission = 0.0
+        self._funding_fee = 0.0
+        self._net_cash_flow = 0.0
+        self._trade_count = 0
+        self._position_value = 0.0
+        self._margin = 0.0
+        self._n_open = 0
+        self._n_incr = 0
 
     cpdef start(self, EventEngine engine):
         engine.register(Order, self.on_order)
@@ -40,81 +78,184 @@ cdef class OKXAccount(Account):
     cpdef stop(self):
         pass
 
+    # ==========================
+    # 品种状态数组
+    # ==========================
+
+    cdef Py_ssize_t _sym_id(self, str symbol) except -1:
+        """symbol -> 下标，首次出现时分配一格。注意：扩容后之前取到的 SymbolState* 失效"""
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t new_cap
+        cdef SymbolState* buf
+        if self._n_sym == self._cap_sym:
+            new_cap = 8 if self._cap_sym == 0 else self._cap_sym * 2
+            buf = <SymbolState*>realloc(self._states, new_cap * sizeof(SymbolState))
+            if buf == NULL:
+                raise MemoryError()
+            self._states = buf
+            self._cap_sym = new_cap
+        memset(&self._states[self._n_sym], 0, sizeof(SymbolState))
+        self._sym_index[symbol] = self._n_sym
+        self._symbols.append(symbol)
+        self._n_sym += 1
+        return self._n_sym - 1
+
+    cdef void _set_position(self, SymbolState* st, long long new_pos):
+        """更新持仓并增量维护持仓市值 / 保证金"""
+        cdef long long old_pos = st.pos_int
+        cdef double scaler = <double>Order.SCALER
+        st.pos_int = new_pos
+        if st.has_price:
+            self._incr_totals((new_pos - old_pos) / scaler * st.price, (abs(new_pos) - abs(old_pos)) / scaler * st.price)
+        if old_pos == 0 and new_pos != 0:
+            self._n_open += 1
+        elif old_pos != 0 and new_pos == 0:
+            self._n_open -= 1
+            if self._n_open == 0:
+                # 全部平仓时清零，避免增量累加的浮点误差一直带下去
+                self._position_value = 0.0
+                self._margin = 0.0
+                self._n_incr = 0
+
+    cdef void _incr_totals(self, double d_value, double d_margin):
+        self._position_value += d_value
+        self._margin += d_margin
+        self._n_incr += 1
+        if self._n_incr >= RESYNC_EVERY:
+            self._resync_totals()
+
+    cdef void _resync_totals(self):
+        """按品种数组重算持仓市值 / 保证金，丢掉增量累加的浮点误差"""
+        cdef double scaler = <double>Order.SCALER
+        cdef double value = 0.0
+        cdef double margin = 0.0
+        cdef Py_ssize_t n_open = 0
+        cdef Py_ssize_t i
+        cdef SymbolState* st
+        for i in range(self._n_sym):
+            st = &self._states[i]
+            if st.pos_int == 0:
+                continue
+            n_open += 1
+            if st.has_price:
+                value += st.pos_int / scaler * st.price
+                margin += abs(st.pos_int) / scaler * st.price
+        self._position_value = value
+        self._margin = margin
+        self._n_open = n_open
+        self._n_incr = 0
+
     # ==========================
     # 核心事件处理
     # ==========================
 
     cpdef void on_order(self, Order order):
         cdef double cash_flow
-        cdef str symbol
+        cdef double notional
+        cdef SymbolState* st
+
+        cdef long oid = order.order_id
+        cdef bint active
 
         # 1. 过滤掉单纯的撤单请求 (Type=CANCEL, State=None/Created)
         # 注意：如果你修改了 Matcher 发送 LIMIT 类型的 CANCELED 回报，这里不会拦截回报
+        # 撤单请求与原单共用 order_id，不能记为终结：同一时刻发出的撤单可能先于原单到达，
+        # 否则原单随后的 RECEIVED / FILLED 都会被当成迟到消息丢掉。水位线只随终结回报前进。
         if order.is_cancel_order:
             return
 
         # 2. 【核心修复】如果订单已知已终结，忽略任何后续消息 (如迟到的 RECEIVED)
-        if order.order_id in self.finished_order_ids:
+        # 仍在活跃列表里的订单不算终结（水位线被强制推过长寿挂单时靠它豁免）
+        active = oid in self.order_dict
+        if not active and self.finished_order_ids.contains(oid):
             return
 
         # 3. 处理终结状态 (FILLED / CANCELED / REJECTED)
         if order.is_filled or order.is_canceled or order.is_rejected:
             # 标记为已终结
-            self.finished_order_ids.add(order.order_id)
+            self.finished_order_ids.add(oid)
             
             # 从活跃列表移除
-            if order.order_id in self.order_dict:
-                del self.order_dict[order.order_id]
+            if active:
+                del self.order_dict[oid]
 
             # 如果是成交，处理资金
             if order.is_filled:
-                symbol = order.symbol
-                self.total_turnover[symbol] += abs(order.quantity * order.filled_price)
-                self.total_commission[symbol] += order.commission_fee
-                self.total_trade_count[symbol] += 1
+                st = &self._states[self._sym_id(order.symbol)]
+                notional = abs(order.quantity * order.filled_price)
+                st.turnover += notional
+                st.commission += order.commission_fee
+                st.trade_count += 1
+                self._turnover += notional
+                self._commission += order.commission_fee
+                self._trade_count += 1
                 
                 cash_flow = -1 * order.quantity * order.filled_price
-                self.net_cash_flow[symbol] += cash_flow
+                st.net_cash_flow += cash_flow
+                self._net_cash_flow += cash_flow
                 self.cash_balance += cash_flow
                 self.cash_balance -= order.commission_fee
 
-                self.position_dict[symbol] += order.quantity_int
-                if self.position_dict[symbol] == 0:
-                    del self.position_dict[symbol]
+                self._set_position(st, st.pos_int + order.quantity_int)
             return
 
         # 4. 处理活跃状态 (SUBMITTED / RECEIVED)
         if order.is_submitted or order.is_received:
             # 只有不在终结集合里才添加 (上面已检查)
-            self.order_dict[order.order_id] = order
+            self.order_dict[oid] = order
             return
 
     cpdef void on_trade_data(self, OKXTrades event):
-        self.price_dict[event.symbol] = event.price
+        self.set_price(event.symbol, event.price)
+
+    cpdef void set_price(self, str symbol, double price):
+        """更新盯市价格（成交数据到达时调用，也可手动设置）"""
+        cdef SymbolState* st = &self._states[self._sym_id(symbol)]
+        cdef double old_price = st.price if st.has_price else 0.0
+        cdef double scaler
+        st.price = price
+        st.has_price = True
+        if st.pos_int != 0:
+            # 盯市：只有持仓品种的价格变动会影响市值
+            scaler = <double>Order.SCALER
+            self._incr_totals(st.pos_int / scaler * (price - old_price), abs(st.pos_int) / scaler * (price - old_price))
 
     cpdef void on_funding_data(self, OKXFundingRate event):
-        cdef long pos_int = self.position_dict.get(event.symbol, 0)
-        if pos_int == 0:
+        # 资金费结算点顺便把汇总重算一遍
+        self._resync_totals()
+        cdef object idx = self._sym_index.get(event.symbol)
+        if idx is None:
+            return
+        cdef SymbolState* st = &self._states[<Py_ssize_t>idx]
+        if st.pos_int == 0:
             return
             
-        cdef double pos_float = pos_int / <double>Order.SCALER
+        cdef double pos_float = st.pos_int / <double>Order.SCALER
         cdef double funding_fee = pos_float * event.price * event.funding_rate
         
         self.cash_balance -= funding_fee
-        self.total_funding_fee[event.symbol] += funding_fee
+        st.funding_fee += funding_fee
+        self._funding_fee += funding_fee
 
     cpdef void on_delivery_data(self, OKXDelivery event):
-        cdef long pos_int = self.position_dict.get(event.symbol, 0)
-        if pos_int == 0:
+        cdef object idx = self._sym_index.get(event.symbol)
+        if idx is None:
+            return
+        cdef SymbolState* st = &self._states[<Py_ssize_t>idx]
+        if st.pos_int == 0:
             return
 
-        cdef double pos_float = pos_int / <double>Order.SCALER
+        cdef double pos_float = st.pos_int / <double>Order.SCALER
         cdef double cash_flow = pos_float * event.price
         
         self.cash_balance += cash_flow
-        self.net_cash_flow[event.symbol] += cash_flow
+        st.net_cash_flow += cash_flow
+        self._net_cash_flow += cash_flow
         
-        del self.position_dict[event.symbol]
+        self._set_position(st, 0)
+        self._resync_totals()
 
         # 清理相关订单
         cdef list keys = list(self.order_dict.keys())
@@ -127,47 +268,52 @@ cdef class OKXAccount(Account):
                 self.finished_order_ids.add(oid)
 
     # ==========================
-    # 查询接口 (保持不变)
+    # 查询接口
     # ==========================
 
     cpdef dict get_orders(self):
         return self.order_dict.copy()
     
     cpdef dict get_positions(self):
-        return {k: v / <double>Order.SCALER for k, v in self.position_dict.items()}
+        cdef dict out = {}
+        cdef Py_ssize_t i
+        cdef double scaler = <double>Order.SCALER
+        for i in range(self._n_sym):
+            if self._states[i].pos_int != 0:
+                out[self._symbols[i]] = self._states[i].pos_int / scaler
+        return out
     
     cpdef dict get_prices(self):
-        return self.price_dict.copy()
+        cdef dict out = {}
+        cdef Py_ssize_t i
+        for i in range(self._n_sym):
+            if self._states[i].has_price:
+                out[self._symbols[i]] = self._states[i].price
+        return out
     
     cpdef double get_balance(self):
         return self.cash_balance
 
-    cdef double _get_position_cashvalue(self):
-        cdef double total = 0.0
-        cdef str sym
-        cdef long qty_int
-        cdef double price
-        
-        for sym, qty_int in self.position_dict.items():
-            price = self.price_dict.get(sym, 0.0)
-            total += (qty_int / <double>Order.SCALER) * price
-        return total
+    cdef inline double _get_position_cashvalue(self):
+        return self._position_value
 
     cpdef double get_position_cashvalue(self):
-        return self._get_position_cashvalue()
+        return self._position_value
 
     cpdef double get_equity(self):
-        return self.cash_balance + self._get_position_cashvalue()
+        return self.cash_balance + self._position_value
     
     cpdef double get_total_margin(self):
-        cdef double total = 0.0
-        cdef str sym
-        cdef long qty_int
-        
-        for sym, qty_int in self.position_dict.items():
-            total += (abs(qty_int) / <double>Order.SCALER) * self.price_dict.get(sym, 0.0)
-        return total
+        return self._margin
     
+    def memory_footprint(self):
+        """MemoryMonitor 协议"""
+        return {
+            "order_dict": len(self.order_dict),
+            "finished_order_ids": len(self.finished_order_ids),
+            "symbols": self._n_sym,
+        }
+
     def get_leverage(self):
         cdef double equity = self.get_equity()
         if equity == 0:
@@ -175,16 +321,100 @@ cdef class OKXAccount(Account):
         return self.get_total_margin() / equity
     
     cpdef double get_total_turnover(self):
-        return sum(self.total_turnover.values())
+        return self._turnover
     
     cpdef int get_total_trade_count(self):
-        return sum(self.total_trade_count.values())
+        return self._trade_count
     
     cpdef double get_total_commission(self):
-        return sum(self.total_commission.values())
+        return self._commission
     
     cpdef double get_total_funding_fee(self):
-        return sum(self.total_funding_fee.values())
+        return self._funding_fee
         
     cpdef double get_total_trade_pnl(self):
-        return sum(self.net_cash_flow.values()) + self._get_position_cashvalue()
\ No newline at end of file
+        return self._net_cash_flow + self._position_value
+
+    # ==========================
+    # 按品种明细（兼容旧的 dict 字段，返回快照）
+    # ==========================
+
+    cdef dict _per_symbol(self, int field):
+        cdef dict out = {}
+        cdef Py_ssize_t i
+        cdef SymbolState* st
+        for i in range(self._n_sym):
+            st = &self._states[i]
+            if field == F_POSITION:
+                if st.pos_int != 0:
+                    out[self._symbols[i]] = st.pos_int
+            elif field == F_TRADE_COUNT:
+                if st.trade_count != 0:
+                    out[self._symbols[i]] = st.trade_count
+            elif field == F_TURNOVER:
+                if st.trade_count != 0:
+                    out[self._symbols[i]] = st.turnover
+            elif field == F_COMMISSION:
+                if st.trade_count != 0:
+                    out[self._symbols[i]] = st.commission
+            elif field == F_FUNDING:
+                if st.funding_fee != 0:
+                    out[self._symbols[i]] = st.funding_fee
+            elif field == F_NET_CASH_FLOW:
+                if st.net_cash_flow != 0:
+                    out[self._symbols[i]] = st.net_cash_flow
+        return out
+
+    @property
+    def position_dict(self):
+        """{symbol: 定点持仓 (Order.SCALER)}，只含非零持仓"""
+        return self._per_symbol(F_POSITION)
+
+    @property
+    def price_dict(self):
+        """可写视图：price_dict[symbol] = px 等价于 set_price(symbol, px)"""
+        return _PriceView(self)
+
+    @property
+    def total_turnover(self):
+        return self._per_symbol(F_TURNOVER)
+
+    @property
+    def total_commission(self):
+        return self._per_symbol(F_COMMISSION)
+
+    @property
+    def total_funding_fee(self):
+        return self._per_symbol(F_FUNDING)
+
+    @property
+    def net_cash_flow(self):
+        return self._per_symbol(F_NET_CASH_FLOW)
+
+    @property
+    def total_trade_count(self):
+        return self._per_symbol(F_TRADE_COUNT)
+
+
+class _PriceView(MutableMapping):
+    """OKXAccount.price_dict 的兼容视图：读走快照，写入转发到 set_price"""
+    def __init__(self, account):
+        self._account = account
+
+    def __getitem__(self, symbol):
+        return self._account.get_prices()[symbol]
+
+    def __setitem__(self, symbol, price):
+        self._account.set_price(symbol, price)
+
+    def __delitem__(self, symbol):
+        raise TypeError("OKXAccount prices cannot be removed")
+
+    def __iter__(self):
+        return iter(self._account.get_prices())
+
+    def __len__(self):
+        return len(self._account.get_prices())
+
+    def copy(self):
+        return self._account.get_prices()
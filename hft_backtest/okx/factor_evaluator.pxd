@@ -5,9 +5,115 @@ from hft_backtest.core.factor cimport FactorSignal
 from hft_backtest.okx.event cimport OKXBookticker, OKXTrades
 
 
+# 等待 forward return 的因子样本
+cdef struct PendingSample:
+    long long factor_ts
+    double x
+    double ref_mid
+
+
+# Welford 在线均值/方差；merge 用 Chan 的合并公式，分片结果可精确合并
+cdef class _RunningStats:
+    cdef long long n
+    cdef double mean_v
+    cdef double m2
+    cdef double min_v
+    cdef double max_v
+
+    cdef void update(self, double x) noexcept
+    cdef void merge(self, _RunningStats other) noexcept
+    cdef double mean(self) noexcept
+    cdef double var(self) noexcept
+    cdef double std(self) noexcept
+
+
+# 成对 (x, y) 的在线均值 / 二阶中心矩 / 协方差
+cdef class _CovStats:
+    cdef public long long n
+    cdef double mean_x
+    cdef double mean_y
+    cdef double m2_x
+    cdef double m2_y
+    cdef double c_xy
+
+    cdef void update(self, double x, double y) noexcept
+    cdef void merge(self, _CovStats other) noexcept
+
+
+cdef class _HorizonStats:
+    cdef public long long horizon
+    # 共享 pending 队列里已经在本 horizon 兑现的条数（从队头算起）
+    cdef public Py_ssize_t cursor
+
+    cdef _RunningStats x_stats
+    cdef _RunningStats y_stats
+    cdef _RunningStats delay_stats
+
+    # correlation / regression moments
+    cdef public _CovStats xy
+
+    # sign/hit stats
+    cdef public long long n_x_pos
+    cdef public long long n_x_neg
+    cdef public long long n_x_zero
+    cdef public long long n_y_pos
+    cdef public long long n_y_neg
+    cdef public long long n_y_zero
+    cdef public long long n_hit
+    cdef public long long n_miss
+
+    cdef void merge(self, _HorizonStats other) noexcept
+
+
+cdef class _SymbolStats:
+    cdef public str symbol
+
+    # counters
+    cdef public long long n_bookticker
+    cdef public long long n_trades
+    cdef public long long n_factor
+    cdef public long long n_skipped_no_price
+    cdef public long long n_skipped_bad_price
+
+    # timestamps
+    cdef public long long first_ts
+    cdef public long long last_ts
+
+    # last observed market state
+    cdef public double last_mid
+    cdef public long long last_mid_ts
+    cdef public double last_trade
+    cdef public long long last_trade_ts
+
+    # pending samples shared by all horizons: C ring buffer (capacity is a power of 2)
+    # 条目在最长的 horizon 兑现后才出队
+    cdef PendingSample* _ring
+    cdef Py_ssize_t _ring_cap
+    cdef Py_ssize_t _ring_head
+    cdef public Py_ssize_t n_pending
+
+    # one entry per horizon (ascending)
+    cdef public list horizons  # [_HorizonStats]
+
+    # factor autocorrelation (lag-1) as turnover proxy
+    # 本地连续序列的首尾值；分片边界的 (x_{t-1}, x_t) 不在 ac 里，读统计时按时间顺序补上
+    cdef public bint has_last_x
+    cdef public double first_x
+    cdef public long long first_x_ts
+    cdef public double last_x
+    cdef public long long last_x_ts
+    cdef public _CovStats ac             # (x_{t-1}, x_t)，只含各序列内部的相邻对
+    cdef public list segments            # merge 进来的序列 [(first_ts, last_ts, first_x, last_x)]
+
+    cdef PendingSample* push_pending(self) except NULL
+    cdef PendingSample* pending_at(self, Py_ssize_t i) noexcept
+    cdef void pop_pending(self, Py_ssize_t n) noexcept
+
+
 cdef class FactorEvaluator(Component):
     cdef public object event_engine
-    cdef public long long horizon
+    cdef public long long horizon          # 最短的 horizon（顶层统计口径）
+    cdef public tuple horizons             # 升序去重
     cdef public int max_store
     cdef public bint enable_store
 
@@ -15,6 +121,11 @@ cdef class FactorEvaluator(Component):
     cdef long long _global_first_ts
     cdef long long _global_last_ts
 
+    cdef _SymbolStats _get_or_create(self, str symbol)
+    cdef void _touch_ts(self, _SymbolStats st, long long ts) noexcept
+    cdef void _flush_pending(self, _SymbolStats st, long long market_ts, double mid_now)
+    cdef void _merge_symbol(self, _SymbolStats st, _SymbolStats o)
+
     cpdef start(self, EventEngine engine)
     cpdef stop(self)
 
@@ -23,6 +134,7 @@ cdef class FactorEvaluator(Component):
     cpdef on_factor(self, FactorSignal signal)
 
     cpdef reset(self)
+    cpdef merge(self, FactorEvaluator other)
     cpdef list symbols(self)
     cpdef dict get_symbol_stats(self, str symbol)
     cpdef dict get_stats(self)
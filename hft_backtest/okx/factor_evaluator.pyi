@@ -20,10 +20,19 @@ class FactorEvaluator(Component):
             observed at timestamp >= factor_ts + horizon.
         - Autocorr proxy: computes lag-1 autocorrelation of factor values per symbol
             (`x_autocorr1`). Lower values typically imply higher turnover.
+        - Multiple horizons: `horizons=[...]` evaluates every horizon in one pass over a
+            shared per-symbol pending queue. Per-horizon stats are under
+            `get_symbol_stats(sym)["by_horizon"][h]`; top-level fields refer to the
+            shortest horizon (`horizon`).
+        - Moments (mean/variance/covariance, incl. autocorr) use Welford updates and
+            can be combined exactly: `merge(other)` folds in an evaluator from another
+            time shard or worker (same `horizons`), in any order; lag-1 autocorr pairs
+            across shard boundaries are rebuilt from each shard's first/last values.
     """
 
     event_engine: Any
     horizon: int
+    horizons: tuple[int, ...]
     max_store: int
     enable_store: bool
 
@@ -32,6 +41,7 @@ class FactorEvaluator(Component):
         horizon: int = 0,
         enable_store: bool = True,
         max_store: int = 20000,
+        horizons: list[int] | None = None,
     ) -> None: ...
 
     def start(self, engine: EventEngine) -> None: ...
@@ -42,6 +52,9 @@ class FactorEvaluator(Component):
     def on_factor(self, signal: FactorSignal) -> None: ...
 
     def reset(self) -> None: ...
+    def merge(self, other: FactorEvaluator) -> None:
+        """Fold `other`'s statistics into this evaluator (pending samples of `other` are dropped)."""
+        ...
     def symbols(self) -> list[str]: ...
 
     def get_symbol_stats(self, symbol: str) -> dict[str, Any]: ...
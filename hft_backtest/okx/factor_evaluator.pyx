@@ -7,10 +7,8 @@
 
 from __future__ import annotations
 
-import math
-from collections import deque
-
-from libc.math cimport sqrt, fabs
+from libc.math cimport sqrt, fabs, isfinite, NAN
+from libc.stdlib cimport malloc, free
 
 from hft_backtest.core.event_engine cimport EventEngine, Component
 from hft_backtest.core.factor cimport FactorSignal
@@ -19,20 +17,18 @@ from hft_backtest.okx.event cimport OKXBookticker, OKXTrades
 
 def _sort_by_evaluated(item):
     """Sort key for (symbol, _SymbolStats) tuples."""
-    return item[1].n_xy
+    return item[1].horizons[0].xy.n
 
 
-cdef inline double _nan():
-    return float('nan')
+cdef inline double _nan() noexcept:
+    return NAN
 
 
-cdef inline bint _isfinite(double x):
-    # Avoid importing numpy; use math.isfinite via Python for portability.
-    # In practice Cython will call Python anyway, so keep it simple.
-    return math.isfinite(x)
+cdef inline bint _isfinite(double x) noexcept:
+    return isfinite(x)
 
 
-cdef inline double _mid_from_bookticker(OKXBookticker e):
+cdef inline double _mid_from_bookticker(OKXBookticker e) noexcept:
     cdef double bid = e.bid_price_1
     cdef double ask = e.ask_price_1
     if bid > 0.0 and ask > 0.0:
@@ -44,32 +40,28 @@ cdef inline double _mid_from_bookticker(OKXBookticker e):
     return 0.0
 
 
-cdef inline double _safe_div(double a, double b):
+cdef inline double _safe_div(double a, double b) noexcept:
     if b == 0.0:
         return _nan()
     return a / b
 
 
 cdef class _RunningStats:
-    cdef long long n
-    cdef double sum
-    cdef double sum2
-    cdef double min_v
-    cdef double max_v
 
     def __cinit__(self):
         self.n = 0
-        self.sum = 0.0
-        self.sum2 = 0.0
+        self.mean_v = 0.0
+        self.m2 = 0.0
         self.min_v = _nan()
         self.max_v = _nan()
 
-    cdef void update(self, double x):
+    cdef void update(self, double x) noexcept:
         if not _isfinite(x):
             return
         self.n += 1
-        self.sum += x
-        self.sum2 += x * x
+        cdef double d = x - self.mean_v
+        self.mean_v += d / <double>self.n
+        self.m2 += d * (x - self.mean_v)
         if self.n == 1:
             self.min_v = x
             self.max_v = x
@@ -79,81 +71,124 @@ cdef class _RunningStats:
             if x > self.max_v:
                 self.max_v = x
 
-    cdef inline double mean(self):
-        return _safe_div(self.sum, <double>self.n) if self.n > 0 else _nan()
-
-    cdef inline double var(self):
+    cdef void merge(self, _RunningStats other) noexcept:
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n = other.n
+            self.mean_v = other.mean_v
+            self.m2 = other.m2
+            self.min_v = other.min_v
+            self.max_v = other.max_v
+            return
+        cdef double na = <double>self.n
+        cdef double nb = <double>other.n
+        cdef double n = na + nb
+        cdef double d = other.mean_v - self.mean_v
+        self.mean_v += d * nb / n
+        self.m2 += other.m2 + d * d * na * nb / n
+        self.n += other.n
+        if other.min_v < self.min_v:
+            self.min_v = other.min_v
+        if other.max_v > self.max_v:
+            self.max_v = other.max_v
+
+    cdef double mean(self) noexcept:
+        return self.mean_v if self.n > 0 else _nan()
+
+    cdef double var(self) noexcept:
         if self.n <= 1:
             return _nan()
-        cdef double m = self.sum / <double>self.n
-        cdef double v = self.sum2 / <double>self.n - m * m
-        # numerical guard
-        if v < 0.0 and v > -1e-18:
-            v = 0.0
-        return v
-
-    cdef inline double std(self):
+        return self.m2 / <double>self.n
+
+    cdef double std(self) noexcept:
         cdef double v = self.var()
-        if not _isfinite(v) or v < 0.0:
+        if not _isfinite(v):
             return _nan()
         return sqrt(v)
 
 
+cdef class _CovStats:
+
+    def __cinit__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    cdef void update(self, double x, double y) noexcept:
+        self.n += 1
+        cdef double inv_n = 1.0 / <double>self.n
+        cdef double dx = x - self.mean_x
+        cdef double dy = y - self.mean_y
+        self.mean_x += dx * inv_n
+        self.mean_y += dy * inv_n
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    cdef void merge(self, _CovStats other) noexcept:
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n = other.n
+            self.mean_x = other.mean_x
+            self.mean_y = other.mean_y
+            self.m2_x = other.m2_x
+            self.m2_y = other.m2_y
+            self.c_xy = other.c_xy
+            return
+        cdef double na = <double>self.n
+        cdef double nb = <double>other.n
+        cdef double n = na + nb
+        cdef double dx = other.mean_x - self.mean_x
+        cdef double dy = other.mean_y - self.mean_y
+        cdef double w = na * nb / n
+        self.mean_x += dx * nb / n
+        self.mean_y += dy * nb / n
+        self.m2_x += other.m2_x + dx * dx * w
+        self.m2_y += other.m2_y + dy * dy * w
+        self.c_xy += other.c_xy + dx * dy * w
+        self.n += other.n
+
+
+cdef class _HorizonStats:
+    """Stats of evaluated samples for one forward horizon."""
+
+    def __cinit__(self, long long horizon=0):
+        self.horizon = horizon
+        self.cursor = 0
+        self.x_stats = _RunningStats()
+        self.y_stats = _RunningStats()
+        self.delay_stats = _RunningStats()
+        self.xy = _CovStats()
+        self.n_x_pos = 0
+        self.n_x_neg = 0
+        self.n_x_zero = 0
+        self.n_y_pos = 0
+        self.n_y_neg = 0
+        self.n_y_zero = 0
+        self.n_hit = 0
+        self.n_miss = 0
+
+    cdef void merge(self, _HorizonStats other) noexcept:
+        self.x_stats.merge(other.x_stats)
+        self.y_stats.merge(other.y_stats)
+        self.delay_stats.merge(other.delay_stats)
+        self.xy.merge(other.xy)
+        self.n_x_pos += other.n_x_pos
+        self.n_x_neg += other.n_x_neg
+        self.n_x_zero += other.n_x_zero
+        self.n_y_pos += other.n_y_pos
+        self.n_y_neg += other.n_y_neg
+        self.n_y_zero += other.n_y_zero
+        self.n_hit += other.n_hit
+        self.n_miss += other.n_miss
+
+
 cdef class _SymbolStats:
-    cdef public str symbol
-
-    # counters
-    cdef public long long n_bookticker
-    cdef public long long n_trades
-    cdef public long long n_factor
-    cdef public long long n_skipped_no_price
-    cdef public long long n_skipped_bad_price
-
-    # timestamps
-    cdef public long long first_ts
-    cdef public long long last_ts
-
-    # last observed market state
-    cdef public double last_mid
-    cdef public long long last_mid_ts
-    cdef public double last_trade
-    cdef public long long last_trade_ts
-
-    # pending factor samples awaiting horizon
-    cdef public object pending  # deque[(factor_ts, factor_value, ref_mid)]
-
-    # stats for evaluated samples
-    cdef _RunningStats x_stats
-    cdef _RunningStats y_stats
-    cdef _RunningStats delay_stats
-
-    # sums for correlation / regression
-    cdef public long long n_xy
-    cdef public double sum_x
-    cdef public double sum_y
-    cdef public double sum_x2
-    cdef public double sum_y2
-    cdef public double sum_xy
-
-    # sign/hit stats
-    cdef public long long n_x_pos
-    cdef public long long n_x_neg
-    cdef public long long n_x_zero
-    cdef public long long n_y_pos
-    cdef public long long n_y_neg
-    cdef public long long n_y_zero
-    cdef public long long n_hit
-    cdef public long long n_miss
-
-    # factor autocorrelation (lag-1) as turnover proxy
-    cdef public bint has_last_x
-    cdef public double last_x
-    cdef public long long n_ac
-    cdef public double sum_x_prev
-    cdef public double sum_x_curr
-    cdef public double sum_x_prev2
-    cdef public double sum_x_curr2
-    cdef public double sum_x_prev_curr
 
     def __cinit__(self):
         self.symbol = ""
@@ -168,32 +203,120 @@ cdef class _SymbolStats:
         self.last_mid_ts = 0
         self.last_trade = 0.0
         self.last_trade_ts = 0
-        self.pending = deque()
-        self.x_stats = _RunningStats()
-        self.y_stats = _RunningStats()
-        self.delay_stats = _RunningStats()
-        self.n_xy = 0
-        self.sum_x = 0.0
-        self.sum_y = 0.0
-        self.sum_x2 = 0.0
-        self.sum_y2 = 0.0
-        self.sum_xy = 0.0
-        self.n_x_pos = 0
-        self.n_x_neg = 0
-        self.n_x_zero = 0
-        self.n_y_pos = 0
-        self.n_y_neg = 0
-        self.n_y_zero = 0
-        self.n_hit = 0
-        self.n_miss = 0
+        self._ring = NULL
+        self._ring_cap = 0
+        self._ring_head = 0
+        self.n_pending = 0
+        self.horizons = []
         self.has_last_x = False
+        self.first_x = 0.0
+        self.first_x_ts = 0
         self.last_x = 0.0
-        self.n_ac = 0
-        self.sum_x_prev = 0.0
-        self.sum_x_curr = 0.0
-        self.sum_x_prev2 = 0.0
-        self.sum_x_curr2 = 0.0
-        self.sum_x_prev_curr = 0.0
+        self.last_x_ts = 0
+        self.ac = _CovStats()
+        self.segments = []
+
+    def __dealloc__(self):
+        if self._ring != NULL:
+            free(self._ring)
+
+    cdef PendingSample* push_pending(self) except NULL:
+        cdef Py_ssize_t new_cap
+        cdef Py_ssize_t i
+        cdef PendingSample* buf
+        if self.n_pending == self._ring_cap:
+            # 扩容时顺便把环展开成从 0 开始
+            new_cap = 16 if self._ring_cap == 0 else self._ring_cap * 2
+            buf = <PendingSample*>malloc(new_cap * sizeof(PendingSample))
+            if buf == NULL:
+                raise MemoryError()
+            for i in range(self.n_pending):
+                buf[i] = self._ring[(self._ring_head + i) & (self._ring_cap - 1)]
+            if self._ring != NULL:
+                free(self._ring)
+            self._ring = buf
+            self._ring_cap = new_cap
+            self._ring_head = 0
+        cdef PendingSample* p = &self._ring[(self._ring_head + self.n_pending) & (self._ring_cap - 1)]
+        self.n_pending += 1
+        return p
+
+    cdef PendingSample* pending_at(self, Py_ssize_t i) noexcept:
+        return &self._ring[(self._ring_head + i) & (self._ring_cap - 1)]
+
+    cdef void pop_pending(self, Py_ssize_t n) noexcept:
+        if n >= self.n_pending:
+            self._ring_head = 0
+            self.n_pending = 0
+            return
+        self._ring_head = (self._ring_head + n) & (self._ring_cap - 1)
+        self.n_pending -= n
+
+
+cdef inline void _update_x_autocorr(_SymbolStats st, double x, long long ts) noexcept:
+    """Update lag-1 autocorrelation stats for factor values.
+
+    This uses correlation between consecutive factor values (x_{t-1}, x_t).
+    Lower autocorr usually implies higher turnover (more jitter).
+    """
+    if not _isfinite(x):
+        return
+    if st.has_last_x:
+        st.ac.update(st.last_x, x)
+    else:
+        st.first_x = x
+        st.first_x_ts = ts
+    st.last_x = x
+    st.last_x_ts = ts
+    st.has_last_x = True
+
+
+cdef _CovStats _autocorr_with_boundaries(_SymbolStats st):
+    """st.ac 加上相邻序列（时间上不重叠）之间的边界对"""
+    if not st.segments:
+        return st.ac
+    cdef list segs = list(st.segments)
+    if st.has_last_x:
+        segs.append((st.first_x_ts, st.last_x_ts, st.first_x, st.last_x))
+        segs.sort()
+    cdef _CovStats ac = _CovStats()
+    ac.merge(st.ac)
+    cdef Py_ssize_t i
+    for i in range(1, len(segs)):
+        prev = segs[i - 1]
+        cur = segs[i]
+        if prev[1] <= cur[0]:
+            ac.update(prev[3], cur[2])
+    return ac
+
+
+cdef inline void _update_xy(_HorizonStats hs, double x, double y) noexcept:
+    if not _isfinite(x) or not _isfinite(y):
+        return
+    hs.xy.update(x, y)
+
+
+cdef inline void _update_sign_stats(_HorizonStats hs, double x, double y) noexcept:
+    if x > 0.0:
+        hs.n_x_pos += 1
+    elif x < 0.0:
+        hs.n_x_neg += 1
+    else:
+        hs.n_x_zero += 1
+
+    if y > 0.0:
+        hs.n_y_pos += 1
+    elif y < 0.0:
+        hs.n_y_neg += 1
+    else:
+        hs.n_y_zero += 1
+
+    if y == 0.0 or x == 0.0:
+        return
+    if x * y > 0.0:
+        hs.n_hit += 1
+    else:
+        hs.n_miss += 1
 
 
 cdef class FactorEvaluator(Component):
@@ -209,28 +332,43 @@ cdef class FactorEvaluator(Component):
     where mid_0 is the latest known mid at factor time, and mid_t is the first
     mid observed at timestamp >= factor_ts + horizon.
 
+    Multiple horizons (`horizons=[...]`) are evaluated in one pass: each factor
+    sample is queued once per symbol and realized for every horizon as the market
+    crosses it; stats are kept per horizon.
+
     This implementation is intentionally self-contained (no numpy dependency in
-    the core logic) and uses O(1) streaming statistics.
+    the core logic) and uses O(1) streaming statistics. Pending samples are C
+    structs in a per-symbol ring buffer.
     """
 
-    def __init__(self, long long horizon=0, bint enable_store=True, int max_store=20000):
+    def __init__(self, long long horizon=0, bint enable_store=True, int max_store=20000, object horizons=None):
+        if horizons is None:
+            horizons = [horizon]
+        hs = sorted({int(h) for h in horizons})
+        if not hs:
+            raise ValueError("horizons must not be empty")
+        if hs[0] < 0:
+            raise ValueError("horizons must be >= 0")
         self.event_engine = None
-        self.horizon = horizon
+        self.horizons = tuple(hs)
+        # 单 horizon 的旧接口：顶层统计对应最短的 horizon
+        self.horizon = hs[0]
         self.enable_store = enable_store
         self.max_store = max_store
         self._sym = {}
         self._global_first_ts = 0
         self._global_last_ts = 0
 
-    def _get_or_create(self, str symbol):
+    cdef _SymbolStats _get_or_create(self, str symbol):
         cdef _SymbolStats st = self._sym.get(symbol)
         if st is None:
             st = _SymbolStats()
             st.symbol = symbol
+            st.horizons = [_HorizonStats(h) for h in self.horizons]
             self._sym[symbol] = st
         return st
 
-    def _touch_ts(self, _SymbolStats st, long long ts):
+    cdef void _touch_ts(self, _SymbolStats st, long long ts) noexcept:
         if ts <= 0:
             return
         if st.first_ts == 0:
@@ -241,90 +379,46 @@ cdef class FactorEvaluator(Component):
         if ts > self._global_last_ts:
             self._global_last_ts = ts
 
-    def _update_x_autocorr(self, _SymbolStats st, double x):
-        """Update lag-1 autocorrelation stats for factor values.
-
-        This uses correlation between consecutive factor values (x_{t-1}, x_t).
-        Lower autocorr usually implies higher turnover (more jitter).
-        """
-        if not _isfinite(x):
-            return
-        if st.has_last_x:
-            st.n_ac += 1
-            st.sum_x_prev += st.last_x
-            st.sum_x_curr += x
-            st.sum_x_prev2 += st.last_x * st.last_x
-            st.sum_x_curr2 += x * x
-            st.sum_x_prev_curr += st.last_x * x
-        st.last_x = x
-        st.has_last_x = True
-
-    def _update_xy(self, _SymbolStats st, double x, double y):
-        if not _isfinite(x) or not _isfinite(y):
-            return
-        st.n_xy += 1
-        st.sum_x += x
-        st.sum_y += y
-        st.sum_x2 += x * x
-        st.sum_y2 += y * y
-        st.sum_xy += x * y
-
-    def _update_sign_stats(self, _SymbolStats st, double x, double y):
-        if x > 0.0:
-            st.n_x_pos += 1
-        elif x < 0.0:
-            st.n_x_neg += 1
-        else:
-            st.n_x_zero += 1
-
-        if y > 0.0:
-            st.n_y_pos += 1
-        elif y < 0.0:
-            st.n_y_neg += 1
-        else:
-            st.n_y_zero += 1
-
-        if y == 0.0 or x == 0.0:
-            return
-        if x * y > 0.0:
-            st.n_hit += 1
-        else:
-            st.n_miss += 1
-
-    def _flush_pending(self, _SymbolStats st, long long market_ts, double mid_now, long long horizon):
-        cdef object pending = st.pending
-        cdef tuple item
-        cdef long long factor_ts
-        cdef double x
-        cdef double ref_mid
+    cdef void _flush_pending(self, _SymbolStats st, long long market_ts, double mid_now):
+        cdef Py_ssize_t n = st.n_pending
+        cdef Py_ssize_t i
+        cdef _HorizonStats hs
+        cdef PendingSample* p
+        cdef long long horizon
         cdef double y
-        cdef double delay
-
-        while pending:
-            item = pending[0]
-            factor_ts = <long long>item[0]
-            if horizon > 0 and market_ts < factor_ts + horizon:
-                break
-
-            pending.popleft()
-            x = <double>item[1]
-            ref_mid = <double>item[2]
 
-            if ref_mid <= 0.0 or not _isfinite(ref_mid):
-                st.n_skipped_bad_price += 1
-                continue
-            if mid_now <= 0.0 or not _isfinite(mid_now):
-                st.n_skipped_bad_price += 1
-                continue
-
-            y = (mid_now - ref_mid) / ref_mid
-            delay = <double>(market_ts - factor_ts)
-
-            st.x_stats.update(x)
-            st.y_stats.update(y)
-            st.delay_stats.update(delay)
-            self._update_xy(st, x, y)
-            self._update_sign_stats(st, x, y)
+        # horizons 升序：短 horizon 的游标总在长 horizon 之前（或相同）
+        for hs in st.horizons:
+            horizon = hs.horizon
+            i = hs.cursor
+            while i < n:
+                p = st.pending_at(i)
+                if horizon > 0 and market_ts < p.factor_ts + horizon:
+                    break
+                i += 1
+
+                if p.ref_mid <= 0.0 or not _isfinite(p.ref_mid):
+                    st.n_skipped_bad_price += 1
+                    continue
+                if mid_now <= 0.0 or not _isfinite(mid_now):
+                    st.n_skipped_bad_price += 1
+                    continue
+
+                y = (mid_now - p.ref_mid) / p.ref_mid
+                hs.x_stats.update(p.x)
+                hs.y_stats.update(y)
+                hs.delay_stats.update(<double>(market_ts - p.factor_ts))
+                _update_xy(hs, p.x, y)
+                _update_sign_stats(hs, p.x, y)
+            hs.cursor = i
+
+        # 最长 horizon 兑现过的条目出队
+        cdef Py_ssize_t done = (<_HorizonStats>st.horizons[len(st.horizons) - 1]).cursor
+        if done == 0:
+            return
+        for hs in st.horizons:
+            hs.cursor -= done
+        st.pop_pending(done)
 
     cpdef start(self, EventEngine engine):
         self.event_engine = engine
@@ -345,7 +439,7 @@ cdef class FactorEvaluator(Component):
         if mid > 0.0:
             st.last_mid = mid
             st.last_mid_ts = event.timestamp
-            self._flush_pending(st, event.timestamp, mid, self.horizon)
+            self._flush_pending(st, event.timestamp, mid)
 
     cpdef on_trades(self, OKXTrades event):
         cdef _SymbolStats st = self._get_or_create(event.symbol)
@@ -361,14 +455,17 @@ cdef class FactorEvaluator(Component):
         self._touch_ts(st, signal.timestamp)
 
         # Turnover proxy: update autocorr regardless of whether we can evaluate y.
-        self._update_x_autocorr(st, signal.value)
+        _update_x_autocorr(st, signal.value, signal.timestamp)
 
         if st.last_mid <= 0.0:
             st.n_skipped_no_price += 1
             return
 
         # Enqueue: (factor_ts, factor_value, ref_mid)
-        st.pending.append((signal.timestamp, signal.value, st.last_mid))
+        cdef PendingSample* p = st.push_pending()
+        p.factor_ts = signal.timestamp
+        p.x = signal.value
+        p.ref_mid = st.last_mid
 
         # If horizon == 0 and we already have an up-to-date mid at same ts,
         # we still wait for the *next* market observation to avoid r==0 bias.
@@ -379,11 +476,68 @@ cdef class FactorEvaluator(Component):
         self._global_first_ts = 0
         self._global_last_ts = 0
 
+    cpdef merge(self, FactorEvaluator other):
+        """Fold another evaluator's statistics into this one.
+
+        Moments are combined with the pairwise (Chan) update, so merging shards is
+        exact up to floating point. Each shard's first/last factor values are kept,
+        and the lag-1 autocorr pairs across shard boundaries are rebuilt in time
+        order when stats are read, so shards can be merged in any order. Shards
+        that overlap in time are not bridged. Samples still pending in `other`
+        are not carried over (their forward return needs prices `other` never saw).
+        """
+        if other is self:
+            raise ValueError("cannot merge an evaluator into itself")
+        if other.horizons != self.horizons:
+            raise ValueError(f"horizons mismatch: {list(self.horizons)} vs {list(other.horizons)}")
+        cdef _SymbolStats o
+        for symbol, o in other._sym.items():
+            self._merge_symbol(self._get_or_create(symbol), o)
+        if other._global_first_ts and (self._global_first_ts == 0 or other._global_first_ts < self._global_first_ts):
+            self._global_first_ts = other._global_first_ts
+        if other._global_last_ts > self._global_last_ts:
+            self._global_last_ts = other._global_last_ts
+
+    cdef void _merge_symbol(self, _SymbolStats st, _SymbolStats o):
+        cdef Py_ssize_t i
+        st.n_bookticker += o.n_bookticker
+        st.n_trades += o.n_trades
+        st.n_factor += o.n_factor
+        st.n_skipped_no_price += o.n_skipped_no_price
+        st.n_skipped_bad_price += o.n_skipped_bad_price
+
+        for i in range(len(st.horizons)):
+            (<_HorizonStats>st.horizons[i]).merge(<_HorizonStats>o.horizons[i])
+
+        # autocorr：只合并序列内部的相邻对，各序列首尾值留到读统计时按时间顺序补边界对。
+        # st 自己的序列也收进 segments，之后再来的因子另起一段
+        st.ac.merge(o.ac)
+        if st.has_last_x:
+            st.segments.append((st.first_x_ts, st.last_x_ts, st.first_x, st.last_x))
+            st.has_last_x = False
+        st.segments.extend(o.segments)
+        if o.has_last_x:
+            st.segments.append((o.first_x_ts, o.last_x_ts, o.first_x, o.last_x))
+        st.segments.sort()
+
+        if o.first_ts and (st.first_ts == 0 or o.first_ts < st.first_ts):
+            st.first_ts = o.first_ts
+        if o.last_ts > st.last_ts:
+            st.last_ts = o.last_ts
+        if o.last_mid_ts >= st.last_mid_ts and o.last_mid > 0.0:
+            st.last_mid = o.last_mid
+            st.last_mid_ts = o.last_mid_ts
+        if o.last_trade_ts >= st.last_trade_ts and o.last_trade > 0.0:
+            st.last_trade = o.last_trade
+            st.last_trade_ts = o.last_trade_ts
+
     cpdef list symbols(self):
         return list(self._sym.keys())
 
     def _symbol_dict(self, _SymbolStats st):
         cdef dict d = {}
+        cdef Py_ssize_t n_pending = st.n_pending
+        cdef _HorizonStats first = st.horizons[0]
         d["symbol"] = st.symbol
         d["time"] = {
             "first_ts": st.first_ts,
@@ -394,8 +548,8 @@ cdef class FactorEvaluator(Component):
             "bookticker": st.n_bookticker,
             "trades": st.n_trades,
             "factor": st.n_factor,
-            "evaluated": st.n_xy,
-            "pending": len(st.pending),
+            "evaluated": first.xy.n,
+            "pending": n_pending - first.cursor,
             "skipped_no_price": st.n_skipped_no_price,
             "skipped_bad_price": st.n_skipped_bad_price,
         }
@@ -406,13 +560,50 @@ cdef class FactorEvaluator(Component):
             "last_trade_ts": st.last_trade_ts,
         }
 
+        # factor autocorr (lag-1)
+        cdef double x_autocorr1 = _nan()
+        cdef double turnover_proxy = _nan()
+        cdef double n
+        cdef double cov
+        cdef double vx
+        cdef double vy
+
+        cdef _CovStats ac = _autocorr_with_boundaries(st)
+        if ac.n >= 2:
+            n = <double>ac.n
+            cov = ac.c_xy / n
+            vx = ac.m2_x / n
+            vy = ac.m2_y / n
+            if vx > 0.0 and vy > 0.0:
+                x_autocorr1 = cov / sqrt(vx * vy)
+                turnover_proxy = 1.0 - x_autocorr1
+
+        cdef dict by_horizon = {}
+        cdef _HorizonStats hs
+        for hs in st.horizons:
+            by_horizon[hs.horizon] = self._horizon_dict(hs, n_pending, x_autocorr1, turnover_proxy)
+
+        # 顶层字段对应最短的 horizon（单 horizon 时与之前一致）
+        cdef dict top = by_horizon[first.horizon]
+        d["params"] = {
+            "horizon": self.horizon,
+            "horizons": list(self.horizons),
+        }
+        d["factor"] = top["factor"]
+        d["forward_return"] = top["forward_return"]
+        d["relationship"] = top["relationship"]
+        d["delay"] = top["delay"]
+        d["by_horizon"] = by_horizon
+        return d
+
+    def _horizon_dict(self, _HorizonStats hs, Py_ssize_t n_pending, double x_autocorr1, double turnover_proxy):
         # core moments
-        cdef double mx = st.x_stats.mean()
-        cdef double sx = st.x_stats.std()
-        cdef double my = st.y_stats.mean()
-        cdef double sy = st.y_stats.std()
-        cdef double md = st.delay_stats.mean()
-        cdef double sd = st.delay_stats.std()
+        cdef double mx = hs.x_stats.mean()
+        cdef double sx = hs.x_stats.std()
+        cdef double my = hs.y_stats.mean()
+        cdef double sy = hs.y_stats.std()
+        cdef double md = hs.delay_stats.mean()
+        cdef double sd = hs.delay_stats.std()
 
         # correlation/regression
         cdef double corr = _nan()
@@ -420,85 +611,65 @@ cdef class FactorEvaluator(Component):
         cdef double alpha = _nan()
         cdef double tstat = _nan()
 
-        # factor autocorr (lag-1)
-        cdef double x_autocorr1 = _nan()
-        cdef double turnover_proxy = _nan()
-
         cdef double n
         cdef double cov
         cdef double vx
         cdef double vy
 
-        if st.n_xy >= 2:
-            n = <double>st.n_xy
-            cov = st.sum_xy / n - (st.sum_x / n) * (st.sum_y / n)
-            vx = st.sum_x2 / n - (st.sum_x / n) * (st.sum_x / n)
-            vy = st.sum_y2 / n - (st.sum_y / n) * (st.sum_y / n)
-            if vx < 0.0 and vx > -1e-18:
-                vx = 0.0
-            if vy < 0.0 and vy > -1e-18:
-                vy = 0.0
+        if hs.xy.n >= 2:
+            n = <double>hs.xy.n
+            cov = hs.xy.c_xy / n
+            vx = hs.xy.m2_x / n
+            vy = hs.xy.m2_y / n
             if vx > 0.0 and vy > 0.0:
                 corr = cov / sqrt(vx * vy)
             if vx > 0.0:
                 beta = cov / vx
                 alpha = my - beta * mx
             # correlation t-stat approximation
-            if st.n_xy > 2 and _isfinite(corr) and fabs(corr) < 1.0:
-                tstat = corr * sqrt((st.n_xy - 2) / (1.0 - corr * corr))
-
-        if st.n_ac >= 2:
-            n = <double>st.n_ac
-            cov = st.sum_x_prev_curr / n - (st.sum_x_prev / n) * (st.sum_x_curr / n)
-            vx = st.sum_x_prev2 / n - (st.sum_x_prev / n) * (st.sum_x_prev / n)
-            vy = st.sum_x_curr2 / n - (st.sum_x_curr / n) * (st.sum_x_curr / n)
-            if vx < 0.0 and vx > -1e-18:
-                vx = 0.0
-            if vy < 0.0 and vy > -1e-18:
-                vy = 0.0
-            if vx > 0.0 and vy > 0.0:
-                x_autocorr1 = cov / sqrt(vx * vy)
-                turnover_proxy = 1.0 - x_autocorr1
-
-        d["params"] = {
-            "horizon": self.horizon,
-        }
-        d["factor"] = {
-            "mean": mx,
-            "std": sx,
-            "min": st.x_stats.min_v,
-            "max": st.x_stats.max_v,
-            "pos": st.n_x_pos,
-            "neg": st.n_x_neg,
-            "zero": st.n_x_zero,
-        }
-        d["forward_return"] = {
-            "mean": my,
-            "std": sy,
-            "min": st.y_stats.min_v,
-            "max": st.y_stats.max_v,
-            "pos": st.n_y_pos,
-            "neg": st.n_y_neg,
-            "zero": st.n_y_zero,
+            if hs.xy.n > 2 and _isfinite(corr) and fabs(corr) < 1.0:
+                tstat = corr * sqrt((hs.xy.n - 2) / (1.0 - corr * corr))
+
+        return {
+            "horizon": hs.horizon,
+            "evaluated": hs.xy.n,
+            "pending": n_pending - hs.cursor,
+            "factor": {
+                "mean": mx,
+                "std": sx,
+                "min": hs.x_stats.min_v,
+                "max": hs.x_stats.max_v,
+                "pos": hs.n_x_pos,
+                "neg": hs.n_x_neg,
+                "zero": hs.n_x_zero,
+            },
+            "forward_return": {
+                "mean": my,
+                "std": sy,
+                "min": hs.y_stats.min_v,
+                "max": hs.y_stats.max_v,
+                "pos": hs.n_y_pos,
+                "neg": hs.n_y_neg,
+                "zero": hs.n_y_zero,
+            },
+            "relationship": {
+                "corr": corr,
+                "corr_tstat": tstat,
+                "reg_beta": beta,
+                "reg_alpha": alpha,
+                "hit": hs.n_hit,
+                "miss": hs.n_miss,
+                "hit_rate": _safe_div(<double>hs.n_hit, <double>(hs.n_hit + hs.n_miss)) if (hs.n_hit + hs.n_miss) > 0 else _nan(),
+                "x_autocorr1": x_autocorr1,
+                "turnover_proxy": turnover_proxy,
+            },
+            "delay": {
+                "mean": md,
+                "std": sd,
+                "min": hs.delay_stats.min_v,
+                "max": hs.delay_stats.max_v,
+            },
         }
-        d["relationship"] = {
-            "corr": corr,
-            "corr_tstat": tstat,
-            "reg_beta": beta,
-            "reg_alpha": alpha,
-            "hit": st.n_hit,
-            "miss": st.n_miss,
-            "hit_rate": _safe_div(<double>st.n_hit, <double>(st.n_hit + st.n_miss)) if (st.n_hit + st.n_miss) > 0 else _nan(),
-            "x_autocorr1": x_autocorr1,
-            "turnover_proxy": turnover_proxy,
-        }
-        d["delay"] = {
-            "mean": md,
-            "std": sd,
-            "min": st.delay_stats.min_v,
-            "max": st.delay_stats.max_v,
-        }
-        return d
 
     cpdef dict get_symbol_stats(self, str symbol):
         cdef _SymbolStats st = self._sym.get(symbol)
@@ -510,6 +681,7 @@ cdef class FactorEvaluator(Component):
         cdef dict out = {}
         out["params"] = {
             "horizon": self.horizon,
+            "horizons": list(self.horizons),
             "enable_store": bool(self.enable_store),
             "max_store": int(self.max_store),
         }
@@ -528,9 +700,9 @@ cdef class FactorEvaluator(Component):
 
         cdef dict counters = d["counters"]
         cdef dict factor = d["factor"]
-        cdef dict fr = d["forward_return"]
-        cdef dict rel = d["relationship"]
-        cdef dict delay = d["delay"]
+        cdef dict fr
+        cdef dict rel
+        cdef dict delay
         cdef dict lastm = d["last_market"]
         cdef dict time = d["time"]
 
@@ -553,28 +725,38 @@ cdef class FactorEvaluator(Component):
             f"mean={factor['mean']:.6g} std={factor['std']:.6g} min={factor['min']:.6g} max={factor['max']:.6g} "
             f"pos/neg/zero={factor['pos']}/{factor['neg']}/{factor['zero']}"
         )
-        lines.append(
-            "  Return(y): "
-            f"mean={fr['mean']:.6g} std={fr['std']:.6g} min={fr['min']:.6g} max={fr['max']:.6g} "
-            f"pos/neg/zero={fr['pos']}/{fr['neg']}/{fr['zero']}"
-        )
-        lines.append(
-            "  Relation: "
-            f"corr={rel['corr']:.6g} t={rel['corr_tstat']:.6g} beta={rel['reg_beta']:.6g} alpha={rel['reg_alpha']:.6g} "
-            f"hit_rate={rel['hit_rate']:.4f} (hit={rel['hit']} miss={rel['miss']}) "
-            f"x_autocorr1={rel['x_autocorr1']:.6g} turnover_proxy={rel['turnover_proxy']:.6g}"
-        )
-        lines.append(
-            "  Delay: "
-            f"mean={delay['mean']:.6g} std={delay['std']:.6g} min={delay['min']:.6g} max={delay['max']:.6g}"
-        )
+        # 多 horizon 时每个 horizon 一组 Return / Relation / Delay
+        cdef bint multi = len(self.horizons) > 1
+        cdef str indent = "    " if multi else "  "
+        for h, hd in d["by_horizon"].items():
+            fr = hd["forward_return"]
+            rel = hd["relationship"]
+            delay = hd["delay"]
+            if multi:
+                lines.append(f"  Horizon {h}: evaluated={hd['evaluated']} pending={hd['pending']}")
+            lines.append(
+                f"{indent}Return(y): "
+                f"mean={fr['mean']:.6g} std={fr['std']:.6g} min={fr['min']:.6g} max={fr['max']:.6g} "
+                f"pos/neg/zero={fr['pos']}/{fr['neg']}/{fr['zero']}"
+            )
+            lines.append(
+                f"{indent}Relation: "
+                f"corr={rel['corr']:.6g} t={rel['corr_tstat']:.6g} beta={rel['reg_beta']:.6g} alpha={rel['reg_alpha']:.6g} "
+                f"hit_rate={rel['hit_rate']:.4f} (hit={rel['hit']} miss={rel['miss']}) "
+                f"x_autocorr1={rel['x_autocorr1']:.6g} turnover_proxy={rel['turnover_proxy']:.6g}"
+            )
+            lines.append(
+                f"{indent}Delay: "
+                f"mean={delay['mean']:.6g} std={delay['std']:.6g} min={delay['min']:.6g} max={delay['max']:.6g}"
+            )
 
         return lines
 
     cpdef str format_report(self, str symbol=None, int max_symbols=20):
         cdef list lines = []
         lines.append("FactorEvaluator Report")
-        lines.append(f"  horizon={self.horizon} enable_store={bool(self.enable_store)} max_store={int(self.max_store)}")
+        horizon_text = f"horizon={self.horizon}" if len(self.horizons) == 1 else f"horizons={list(self.horizons)}"
+        lines.append(f"  {horizon_text} enable_store={bool(self.enable_store)} max_store={int(self.max_store)}")
         lines.append(f"  global_first_ts={self._global_first_ts} global_last_ts={self._global_last_ts} span={(self._global_last_ts - self._global_first_ts) if self._global_first_ts and self._global_last_ts else 0}")
 
         if symbol is not None:
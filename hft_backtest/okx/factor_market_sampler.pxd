@@ -0,0 +1,88 @@
+# cython: language_level=3
+
+from hft_backtest.core.event_engine cimport Component, EventEngine
+from hft_backtest.core.factor cimport FactorSignal
+from hft_backtest.okx.event cimport OKXBookticker
+
+
+# 单个品种的行情 / 边界状态，按 symbol id 存在连续数组里
+cdef struct MarketSymbolState:
+    bint has_mid               # 见过有效盘口（第一笔只做初始化）
+    double last_mid
+    long long last_mid_ts
+    long long next_boundary
+    # 最近两个边界价 p(t_{k}) / p(t_{k+1})
+    int n_boundaries           # 0..2
+    long long b0_ts
+    double b0_mid
+    long long b1_ts
+    double b1_mid
+    # 该品种的因子序列 id（按首次出现顺序），即“按品种的因子索引”
+    int* series
+    int n_series
+    int cap_series
+
+
+# 单条 (symbol, factor) 序列的最新因子值
+cdef struct FactorSeriesState:
+    Py_ssize_t sid
+    Py_ssize_t fid
+    long long ts
+    double x
+
+
+cdef class FactorMarketSampler(Component):
+    cdef public object event_engine
+    cdef public long long interval_ms
+    cdef public int max_samples_per_series
+    cdef public bint store_prices
+    cdef public object sink                 # RecordSink 或 None
+    cdef public bint cross_section_stats
+    cdef public int n_quantiles
+    cdef public long long ic_close_lag_ms
+    cdef public int max_stats_records
+    cdef public long long n_late_samples
+
+    # symbol / factor 名 -> 下标（按首次出现顺序）
+    cdef dict _sym_index
+    cdef list _symbols
+    cdef dict _factor_index
+    cdef list _factor_names
+
+    cdef MarketSymbolState* _states
+    cdef Py_ssize_t _n_sym
+    cdef Py_ssize_t _cap_sym
+
+    cdef FactorSeriesState* _series
+    cdef Py_ssize_t _n_series
+    cdef Py_ssize_t _cap_series
+    # (symbol × factor) -> 序列 id，-1 表示没有
+    cdef object _slot_arr
+    cdef int[:, ::1] _slot
+
+    cdef list _samples                      # 序列 id -> deque[dict]
+    cdef object _new_samples                # deque[dict]
+
+    # 截面统计
+    cdef dict _open_xs                      # {ts: {factor: {symbol: sample}}}
+    cdef list _factor_coverage              # factor id -> 报过该因子的品种数
+    cdef long long _watermark
+    cdef long long _closed_through
+    cdef object _stats
+    cdef object _new_stats
+
+    cdef Py_ssize_t _symbol_id(self, str symbol) except -1
+    cdef Py_ssize_t _factor_id(self, str name) except -1
+    cdef void _grow_slots(self, Py_ssize_t n_sym, Py_ssize_t n_fac)
+    cdef Py_ssize_t _series_id(self, Py_ssize_t sid, Py_ssize_t fid) except -1
+    cdef void _free_states(self)
+    cdef void _try_emit_interval(self, Py_ssize_t sid) except *
+    cdef void _collect_cross_section(self, dict sample) except *
+    cdef void _close_cross_sections(self, long long through_ts) except *
+
+    cpdef start(self, EventEngine engine)
+    cpdef stop(self)
+    cpdef reset(self)
+
+    cpdef on_factor(self, FactorSignal signal)
+    cpdef on_bookticker(self, OKXBookticker event)
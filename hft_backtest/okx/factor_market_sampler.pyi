@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+
+from hft_backtest.core.event_engine import Component, EventEngine
+from hft_backtest.core.factor import FactorSignal
+from hft_backtest.core.sink import RecordSink
+from hft_backtest.okx.event import OKXBookticker
+
+
+class FactorMarketSampler(Component):
+    """Align per-(symbol,factor) signals with next-interval market target.
+
+    - Boundaries are $t_k = k * interval$; `p(t_k)` is the last mid strictly before
+      crossing `t_k`, and each sample pairs the latest factor with `ts <= t_k` with
+        y_k = (p(t_{k+1}) - p(t_k)) / p(t_k)
+      as {"symbol", "factor", "ts", "x", "x_ts", "y"} (plus p0/p1/p0_ts/p1_ts when
+      `store_prices=True`).
+    - `cross_section_stats=True` closes each boundary once the latest sample time reaches
+      `t_k + ic_close_lag_ms` and emits per-factor
+        {"ts", "factor", "n", "coverage", "ic", "rank_ic", "q_returns", "long_short"}.
+    - With `sink=RecordSink(...)` every sample is also spilled to disk; `stop()` closes it.
+    """
+
+    event_engine: Any
+    interval_ms: int
+    max_samples_per_series: int
+    store_prices: bool
+    sink: RecordSink | None
+    cross_section_stats: bool
+    n_quantiles: int
+    ic_close_lag_ms: int
+    max_stats_records: int
+    n_late_samples: int
+
+    def __init__(
+        self,
+        interval_ms: int,
+        *,
+        max_samples_per_series: int = 20000,
+        store_prices: bool = False,
+        sink: RecordSink | None = None,
+        cross_section_stats: bool = False,
+        n_quantiles: int = 5,
+        ic_close_lag_ms: int | None = None,
+        max_stats_records: int = 20000,
+    ) -> None: ...
+
+    def start(self, engine: EventEngine) -> None: ...
+    def stop(self) -> None: ...
+    def reset(self) -> None: ...
+
+    def on_factor(self, signal: FactorSignal) -> None: ...
+    def on_bookticker(self, event: OKXBookticker) -> None: ...
+
+    def memory_footprint(self) -> dict[str, int]: ...
+    def factors(self, symbol: str | None = None) -> list[str]: ...
+    def symbols(self) -> list[str]: ...
+    def get_samples(
+        self,
+        *,
+        symbol: str | None = None,
+        factor: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]: ...
+    def pop_new_samples(self, max_items: int | None = None) -> list[dict[str, Any]]: ...
+    def get_cross_section(self, ts: int, factor: str) -> dict[str, dict[str, Any]]: ...
+
+    def get_cross_section_stats(
+        self,
+        *,
+        factor: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+    ) -> list[dict[str, Any]]: ...
+    def pop_new_cross_section_stats(self, max_items: int | None = None) -> list[dict[str, Any]]: ...
+    def cross_section_stats_dataframe(self, *, factor: str | None = None) -> Any: ...
+    def flush_cross_sections(self) -> None: ...
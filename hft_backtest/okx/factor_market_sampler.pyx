@@ -0,0 +1,557 @@
+# hft_backtest/okx/factor_market_sampler.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+# cython: cdivision=True
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+
+from libc.stdlib cimport realloc, free
+
+from hft_backtest.core.event_engine cimport Component, EventEngine
+from hft_backtest.core.factor cimport FactorSignal
+from hft_backtest.okx.event cimport OKXBookticker
+
+
+def _rankdata(a):
+    """平均秩（并列取平均），与 scipy.stats.rankdata(method="average") 一致"""
+    order = np.argsort(a, kind="mergesort")
+    sorted_a = a[order]
+    # 每段相同值的起止位置
+    starts = np.flatnonzero(np.r_[True, sorted_a[1:] != sorted_a[:len(a) - 1]])
+    ends = np.r_[starts[1:], len(a)]
+    avg = 0.5 * (starts + ends - 1) + 1.0
+    ranks = np.empty(len(a), dtype=np.float64)
+    ranks[order] = np.repeat(avg, ends - starts)
+    return ranks
+
+
+def _pearson(x, y):
+    dx = x - x.mean()
+    dy = y - y.mean()
+    den = np.sqrt(np.dot(dx, dx) * np.dot(dy, dy))
+    if not den > 0.0:
+        return float("nan")
+    return float(np.dot(dx, dy) / den)
+
+
+def _cross_section_stats(x, y, int n_quantiles):
+    """一个截面的 IC / rank IC / 分位收益（按 x 从小到大分组，组大小相差不超过 1）"""
+    n = len(x)
+    ic = rank_ic = float("nan")
+    if n >= 2:
+        ic = _pearson(x, y)
+        rank_ic = _pearson(_rankdata(x), _rankdata(y))
+    q_returns = [float("nan")] * n_quantiles
+    if n_quantiles > 0 and n >= n_quantiles:
+        y_sorted = y[np.argsort(x, kind="mergesort")]
+        q_returns = [float(part.mean()) for part in np.array_split(y_sorted, n_quantiles)]
+    return {
+        "n": n,
+        "ic": ic,
+        "rank_ic": rank_ic,
+        "q_returns": q_returns,
+        "long_short": q_returns[n_quantiles - 1] - q_returns[0] if n_quantiles > 0 else float("nan"),
+    }
+
+
+cdef inline double _mid_from_bookticker(OKXBookticker event):
+    cdef double bid = event.bid_price_1
+    cdef double ask = event.ask_price_1
+    if bid <= 0.0 or ask <= 0.0:
+        return 0.0
+    return 0.5 * (bid + ask)
+
+
+cdef class FactorMarketSampler(Component):
+    """Align per-(symbol,factor) signals with next-interval market target.
+
+    This component is OKX-specific because it relies on OKX market data events.
+
+    Alignment rule (fixed interval):
+    - Maintain a grid of boundary timestamps $t_k = k * interval$.
+    - For each symbol, record boundary price `p(t_k)` as the *last* known mid-price
+      strictly before crossing `t_k` (i.e., from the previous bookticker).
+    - When both `p(t_k)` and `p(t_{k+1})` are available, compute
+        y_k = (p(t_{k+1}) - p(t_k)) / p(t_k)
+      and align it with factor snapshot x_k which is the latest factor value with
+      timestamp <= t_k.
+
+    Cross-sectional stats (`cross_section_stats=True`):
+    - Samples are also collected per boundary `t_k` and factor. Once the latest sample
+      timestamp reaches `t_k + ic_close_lag_ms` the boundary is closed and one compact
+      record is emitted per factor:
+        {"ts", "factor", "n", "coverage", "ic", "rank_ic", "q_returns", "long_short"}
+      `coverage` is n / number of symbols that have ever reported this factor.
+    - A symbol contributes to t_k only if it ticks within `ic_close_lag_ms` after t_{k+1}
+      (its sample for t_k is emitted on the first tick after t_{k+1}); later samples are
+      counted in `n_late_samples` and left out of the stats.
+    - `stop()` / `flush_cross_sections()` close every open boundary.
+
+    Notes:
+    - The first boundary cannot be formed until we have at least two booktickers.
+    - If there is no factor value available at or before t_k, the sample is skipped.
+    - With `sink=RecordSink(...)` every sample is also spilled to disk (independent of
+      `max_samples_per_series`); `stop()` closes the sink.
+    - Per-symbol market state and per-(symbol, factor) latest values are C structs;
+      each symbol keeps its own list of factor series, so a boundary only visits the
+      factors of the symbol that crossed it.
+    """
+
+    def __cinit__(self):
+        self._states = NULL
+        self._n_sym = 0
+        self._cap_sym = 0
+        self._series = NULL
+        self._n_series = 0
+        self._cap_series = 0
+
+    def __dealloc__(self):
+        self._free_states()
+        if self._states != NULL:
+            free(self._states)
+        if self._series != NULL:
+            free(self._series)
+
+    def __init__(
+        self,
+        long long interval_ms,
+        *,
+        int max_samples_per_series=20000,
+        bint store_prices=False,
+        object sink=None,
+        bint cross_section_stats=False,
+        int n_quantiles=5,
+        object ic_close_lag_ms=None,
+        int max_stats_records=20000,
+    ):
+        if interval_ms <= 0:
+            raise ValueError("interval_ms must be > 0")
+        if max_samples_per_series < 0:
+            raise ValueError("max_samples_per_series must be >= 0")
+        if n_quantiles < 0:
+            raise ValueError("n_quantiles must be >= 0")
+        if max_stats_records < 0:
+            raise ValueError("max_stats_records must be >= 0")
+
+        self.interval_ms = interval_ms
+        self.max_samples_per_series = max_samples_per_series
+        self.store_prices = store_prices
+        self.sink = sink
+        self.cross_section_stats = cross_section_stats
+        self.n_quantiles = n_quantiles
+        # 默认多等一个 interval，给成交稀疏的品种留出补报的时间
+        self.ic_close_lag_ms = interval_ms if ic_close_lag_ms is None else int(ic_close_lag_ms)
+        if self.ic_close_lag_ms < 0:
+            raise ValueError("ic_close_lag_ms must be >= 0")
+        self.max_stats_records = max_stats_records
+
+        self.event_engine = None
+        self._new_samples = deque()
+        self._stats = deque()
+        self._new_stats = deque()
+        self.reset()
+
+    cpdef start(self, EventEngine engine):
+        self.event_engine = engine
+        engine.register(FactorSignal, self.on_factor)
+        engine.register(OKXBookticker, self.on_bookticker)
+
+    cpdef stop(self):
+        self.flush_cross_sections()
+        if self.sink is not None:
+            self.sink.close()
+
+    cpdef reset(self):
+        self._free_states()
+        self._n_sym = 0
+        self._n_series = 0
+        self._sym_index = {}
+        self._symbols = []
+        self._factor_index = {}
+        self._factor_names = []
+        self._slot_arr = np.full((0, 0), -1, dtype=np.int32)
+        self._slot = self._slot_arr
+        self._samples = []
+        self._new_samples.clear()
+        self._open_xs = {}
+        self._factor_coverage = []
+        self._watermark = -1
+        self._closed_through = -1
+        self.n_late_samples = 0
+        self._stats.clear()
+        self._new_stats.clear()
+
+    cdef void _free_states(self):
+        cdef Py_ssize_t i
+        for i in range(self._n_sym):
+            if self._states[i].series != NULL:
+                free(self._states[i].series)
+                self._states[i].series = NULL
+
+    # ==========================
+    # 下标分配
+    # ==========================
+
+    cdef void _grow_slots(self, Py_ssize_t n_sym, Py_ssize_t n_fac):
+        cdef Py_ssize_t old_sym = self._slot_arr.shape[0]
+        cdef Py_ssize_t old_fac = self._slot_arr.shape[1]
+        if n_sym <= old_sym and n_fac <= old_fac:
+            return
+        cdef Py_ssize_t new_sym = old_sym, new_fac = old_fac
+        if n_sym > old_sym:
+            new_sym = max(n_sym, old_sym * 2, 8)
+        if n_fac > old_fac:
+            new_fac = max(n_fac, old_fac * 2, 8)
+        slot_arr = np.full((new_sym, new_fac), -1, dtype=np.int32)
+        slot_arr[:old_sym, :old_fac] = self._slot_arr
+        self._slot_arr = slot_arr
+        self._slot = slot_arr
+
+    cdef Py_ssize_t _symbol_id(self, str symbol) except -1:
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t new_cap
+        cdef MarketSymbolState* buf
+        cdef MarketSymbolState* st
+        if self._n_sym == self._cap_sym:
+            new_cap = 8 if self._cap_sym == 0 else self._cap_sym * 2
+            buf = <MarketSymbolState*>realloc(self._states, new_cap * sizeof(MarketSymbolState))
+            if buf == NULL:
+                raise MemoryError()
+            self._states = buf
+            self._cap_sym = new_cap
+        st = &self._states[self._n_sym]
+        st.has_mid = False
+        st.last_mid = 0.0
+        st.last_mid_ts = 0
+        st.next_boundary = 0
+        st.n_boundaries = 0
+        st.b0_ts = 0
+        st.b0_mid = 0.0
+        st.b1_ts = 0
+        st.b1_mid = 0.0
+        st.series = NULL
+        st.n_series = 0
+        st.cap_series = 0
+        self._sym_index[symbol] = self._n_sym
+        self._symbols.append(symbol)
+        self._n_sym += 1
+        self._grow_slots(self._n_sym, len(self._factor_names))
+        return self._n_sym - 1
+
+    cdef Py_ssize_t _factor_id(self, str name) except -1:
+        cdef object idx = self._factor_index.get(name)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t fid = len(self._factor_names)
+        self._factor_index[name] = fid
+        self._factor_names.append(name)
+        self._factor_coverage.append(0)
+        self._grow_slots(self._n_sym, fid + 1)
+        return fid
+
+    cdef Py_ssize_t _series_id(self, Py_ssize_t sid, Py_ssize_t fid) except -1:
+        cdef int k = self._slot[sid, fid]
+        if k >= 0:
+            return k
+        cdef Py_ssize_t new_cap
+        cdef FactorSeriesState* buf
+        cdef int* ids
+        cdef MarketSymbolState* st = &self._states[sid]
+        if self._n_series == self._cap_series:
+            new_cap = 16 if self._cap_series == 0 else self._cap_series * 2
+            buf = <FactorSeriesState*>realloc(self._series, new_cap * sizeof(FactorSeriesState))
+            if buf == NULL:
+                raise MemoryError()
+            self._series = buf
+            self._cap_series = new_cap
+        if st.n_series == st.cap_series:
+            new_cap = 4 if st.cap_series == 0 else st.cap_series * 2
+            ids = <int*>realloc(st.series, new_cap * sizeof(int))
+            if ids == NULL:
+                raise MemoryError()
+            st.series = ids
+            st.cap_series = <int>new_cap
+        k = <int>self._n_series
+        self._series[k].sid = sid
+        self._series[k].fid = fid
+        self._series[k].ts = 0
+        self._series[k].x = 0.0
+        st.series[st.n_series] = k
+        st.n_series += 1
+        self._slot[sid, fid] = k
+        self._n_series += 1
+        self._samples.append(deque())
+        self._factor_coverage[fid] += 1
+        return k
+
+    # ==========================
+    # 事件
+    # ==========================
+
+    cpdef on_factor(self, FactorSignal signal):
+        cdef Py_ssize_t sid = self._symbol_id(signal.symbol)
+        cdef Py_ssize_t fid = self._factor_id(signal.name)
+        cdef FactorSeriesState* fs = &self._series[self._series_id(sid, fid)]
+        fs.ts = signal.timestamp
+        fs.x = signal.value
+
+    cpdef on_bookticker(self, OKXBookticker event):
+        cdef double mid = _mid_from_bookticker(event)
+        if mid <= 0.0:
+            return
+        cdef long long ts = event.timestamp
+        cdef Py_ssize_t sid = self._symbol_id(event.symbol)
+        cdef MarketSymbolState* st = &self._states[sid]
+
+        # First tick: initialize state and wait for next bookticker to create boundaries.
+        if not st.has_mid:
+            st.has_mid = True
+            st.last_mid = mid
+            st.last_mid_ts = ts
+            # Start at the next boundary after the first observed timestamp.
+            st.next_boundary = (ts // self.interval_ms + 1) * self.interval_ms
+            return
+
+        # Record any boundaries crossed by this tick, using the previous mid (no lookahead).
+        cdef long long next_b = st.next_boundary
+        cdef double prev_mid = st.last_mid
+        while next_b <= ts:
+            st.b0_ts = st.b1_ts
+            st.b0_mid = st.b1_mid
+            st.b1_ts = next_b
+            st.b1_mid = prev_mid
+            if st.n_boundaries < 2:
+                st.n_boundaries += 1
+            # Each new boundary potentially enables one interval return sample
+            self._try_emit_interval(sid)
+            next_b += self.interval_ms
+
+        st.next_boundary = next_b
+        # Update last mid after processing boundaries
+        st.last_mid = mid
+        st.last_mid_ts = ts
+
+    cdef void _try_emit_interval(self, Py_ssize_t sid) except *:
+        cdef MarketSymbolState* st = &self._states[sid]
+        if st.n_boundaries < 2 or st.b0_mid <= 0.0:
+            return
+
+        cdef double y = (st.b1_mid - st.b0_mid) / st.b0_mid
+        cdef long long sample_ts = st.b0_ts
+        cdef str symbol = self._symbols[sid]
+        cdef Py_ssize_t j
+        cdef int k
+        cdef FactorSeriesState* fs
+        cdef dict sample
+        cdef object series
+
+        # For each factor series on this symbol, emit a sample if we have x snapshot at/before sample_ts.
+        for j in range(st.n_series):
+            k = st.series[j]
+            fs = &self._series[k]
+            if fs.ts > sample_ts:
+                continue
+
+            sample = {
+                "symbol": symbol,
+                "factor": self._factor_names[fs.fid],
+                "ts": sample_ts,
+                "x": fs.x,
+                "x_ts": fs.ts,
+                "y": y,
+            }
+            if self.store_prices:
+                sample["p0"] = st.b0_mid
+                sample["p1"] = st.b1_mid
+                sample["p0_ts"] = st.b0_ts
+                sample["p1_ts"] = st.b1_ts
+
+            series = self._samples[k]
+            series.append(sample)
+            self._new_samples.append(sample)
+            if self.sink is not None:
+                self.sink.append(sample)
+
+            if self.max_samples_per_series > 0:
+                while len(series) > self.max_samples_per_series:
+                    series.popleft()
+
+            if self.cross_section_stats:
+                self._collect_cross_section(sample)
+
+        if self.cross_section_stats and sample_ts > self._watermark:
+            self._watermark = sample_ts
+            self._close_cross_sections(sample_ts - self.ic_close_lag_ms)
+
+    # ==========================
+    # 截面统计
+    # ==========================
+
+    cdef void _collect_cross_section(self, dict sample) except *:
+        cdef long long ts = sample["ts"]
+        if ts <= self._closed_through:
+            self.n_late_samples += 1
+            return
+        xs = self._open_xs.get(ts)
+        if xs is None:
+            xs = self._open_xs[ts] = {}
+        by_symbol = xs.get(sample["factor"])
+        if by_symbol is None:
+            by_symbol = xs[sample["factor"]] = {}
+        by_symbol[sample["symbol"]] = sample
+
+    cdef void _close_cross_sections(self, long long through_ts) except *:
+        if through_ts <= self._closed_through:
+            return
+        self._closed_through = through_ts
+        ready = sorted(ts for ts in self._open_xs if ts <= through_ts)
+        for ts in ready:
+            xs = self._open_xs.pop(ts)
+            for fname in sorted(xs):
+                samples = xs[fname].values()
+                x = np.fromiter((s["x"] for s in samples), dtype=np.float64, count=len(samples))
+                y = np.fromiter((s["y"] for s in samples), dtype=np.float64, count=len(samples))
+                ok = np.isfinite(x) & np.isfinite(y)
+                if not ok.all():
+                    x = x[ok]
+                    y = y[ok]
+                stats = _cross_section_stats(x, y, self.n_quantiles)
+                n_universe = self._factor_coverage[self._factor_index[fname]]
+                rec = {
+                    "ts": ts,
+                    "factor": fname,
+                    "n": stats["n"],
+                    "coverage": stats["n"] / n_universe if n_universe else float("nan"),
+                    "ic": stats["ic"],
+                    "rank_ic": stats["rank_ic"],
+                    "q_returns": stats["q_returns"],
+                    "long_short": stats["long_short"],
+                }
+                self._stats.append(rec)
+                self._new_stats.append(rec)
+                if self.max_stats_records > 0:
+                    while len(self._stats) > self.max_stats_records:
+                        self._stats.popleft()
+
+    def flush_cross_sections(self):
+        """Close every open boundary (end of data)."""
+        if self._open_xs:
+            self._close_cross_sections(max(self._open_xs))
+
+    # ==========================
+    # 查询
+    # ==========================
+
+    def memory_footprint(self):
+        """MemoryMonitor 协议"""
+        cdef Py_ssize_t i
+        cdef long long n_boundaries = 0
+        for i in range(self._n_sym):
+            n_boundaries += self._states[i].n_boundaries
+        return {
+            "samples": sum(len(dq) for dq in self._samples),
+            "new_samples": len(self._new_samples),
+            "boundaries": n_boundaries,
+            "open_cross_sections": len(self._open_xs),
+            "stats": len(self._stats),
+            "new_stats": len(self._new_stats),
+        }
+
+    def factors(self, str symbol=None):
+        cdef Py_ssize_t k
+        names = set()
+        for k in range(self._n_series):
+            if symbol is None or self._symbols[self._series[k].sid] == symbol:
+                names.add(self._factor_names[self._series[k].fid])
+        return sorted(names)
+
+    def symbols(self):
+        # 只报过无效盘口（mid <= 0）的品种不会被分配下标
+        return sorted(self._symbols)
+
+    def get_samples(self, *, str symbol=None, str factor=None, start_ts=None, end_ts=None, limit=None):
+        """Return stored samples filtered by symbol/factor and time range."""
+        cdef Py_ssize_t k
+        out = []
+        for k in range(self._n_series):
+            if symbol is not None and self._symbols[self._series[k].sid] != symbol:
+                continue
+            if factor is not None and self._factor_names[self._series[k].fid] != factor:
+                continue
+            for s in self._samples[k]:
+                ts = s["ts"]
+                if start_ts is not None and ts < start_ts:
+                    continue
+                if end_ts is not None and ts > end_ts:
+                    continue
+                out.append(s)
+
+        out.sort(key=lambda d: (d["ts"], d["symbol"], d["factor"]))
+        if limit is not None:
+            return out[max(len(out) - int(limit), 0):]
+        return out
+
+    def pop_new_samples(self, max_items=None):
+        """Pop newly created samples (FIFO) for incremental processing."""
+        n = len(self._new_samples) if max_items is None else min(len(self._new_samples), int(max_items))
+        return [self._new_samples.popleft() for _ in range(n)]
+
+    def get_cross_section(self, long long ts, str factor):
+        """Return {symbol -> sample} for a given (ts, factor)."""
+        xs = self._open_xs.get(ts)
+        if xs is not None:
+            return dict(xs.get(factor, {}))
+        cdef object fid = self._factor_index.get(factor)
+        if fid is None:
+            return {}
+        cdef Py_ssize_t sid
+        cdef int k
+        out = {}
+        for sid in range(self._n_sym):
+            k = self._slot[sid, <Py_ssize_t>fid]
+            if k < 0:
+                continue
+            # Most deques are append-only in time order; scan from the end.
+            for s in reversed(self._samples[k]):
+                if s["ts"] == ts:
+                    out[self._symbols[sid]] = s
+                    break
+                if s["ts"] < ts:
+                    break
+        return out
+
+    def get_cross_section_stats(self, *, str factor=None, start_ts=None, end_ts=None):
+        """Closed per-boundary stats, in boundary order."""
+        out = []
+        for r in self._stats:
+            if factor is not None and r["factor"] != factor:
+                continue
+            if start_ts is not None and r["ts"] < start_ts:
+                continue
+            if end_ts is not None and r["ts"] > end_ts:
+                continue
+            out.append(r)
+        return out
+
+    def pop_new_cross_section_stats(self, max_items=None):
+        n = len(self._new_stats) if max_items is None else min(len(self._new_stats), int(max_items))
+        return [self._new_stats.popleft() for _ in range(n)]
+
+    def cross_section_stats_dataframe(self, *, str factor=None):
+        """每个 (ts, factor) 一行，分位收益展开成 q1..qN 列"""
+        import pandas as pd
+
+        cols = ["ts", "factor", "n", "coverage", "ic", "rank_ic"]
+        cols += [f"q{i + 1}" for i in range(self.n_quantiles)] + ["long_short"]
+        rows = []
+        for r in self.get_cross_section_stats(factor=factor):
+            rows.append([r["ts"], r["factor"], r["n"], r["coverage"], r["ic"], r["rank_ic"], *r["q_returns"], r["long_short"]])
+        return pd.DataFrame(rows, columns=cols)
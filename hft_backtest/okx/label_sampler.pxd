@@ -0,0 +1,40 @@
+# cython: language_level=3
+
+from hft_backtest.core.event_engine cimport Component, EventEngine
+from hft_backtest.core.timer cimport Timer
+from hft_backtest.okx.event cimport OKXBookticker
+
+
+# 单个品种的标签状态，按 symbol id 存在连续数组里
+cdef struct LabelSymbolState:
+    double mid              # 最新 mid，<= 0 表示还没有有效盘口
+    long long mid_ts
+    double timer_price      # 上一个 timer 时刻的 mid
+    long long timer_ts      # 0 表示还没有 timer 快照
+
+
+cdef class OKXLabelSampler(Component):
+    cdef public object event_engine
+    cdef public int max_records
+    cdef public bint enable_store
+    cdef public bint store_prices
+    cdef public str timer_name
+    cdef public object sink             # RecordSink 或 None
+
+    cdef dict _sym_index                # {symbol: symbol_id}
+    cdef list _symbols                  # 下标即 symbol_id（按首次有效盘口的顺序）
+    cdef LabelSymbolState* _states
+    cdef Py_ssize_t _n_sym
+    cdef Py_ssize_t _cap_sym
+
+    cdef object _records                # deque[dict]
+    cdef object _new_records            # deque[dict]
+
+    cdef Py_ssize_t _intern(self, str symbol) except -1
+
+    cpdef start(self, EventEngine engine)
+    cpdef stop(self)
+    cpdef reset(self)
+
+    cpdef on_bookticker(self, OKXBookticker event)
+    cpdef on_timer(self, Timer timer)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+from hft_backtest.core.event_engine import Component, EventEngine
+from hft_backtest.core.sink import RecordSink
+from hft_backtest.core.timer import Timer
+from hft_backtest.okx.event import OKXBookticker
+
+
+class OKXLabelSampler(Component):
+    """OKX label sampler driven by Timer.
+
+    On each timer tick at time t_k, emits a label for the previous tick:
+        {"timestamp": t_{k-1}, "symbol": sym, "y": (p_k - p_{k-1}) / p_{k-1}}
+    (plus p0 / p1 / p0_ts / p1_ts when `store_prices=True`), where p is the last
+    known bookticker mid. Labels align with `FactorSampler` rows on the same Timer.
+
+    With `sink=RecordSink(...)` every label is also spilled to disk; `stop()` closes the sink.
+    """
+
+    event_engine: Any
+    max_records: int
+    enable_store: bool
+    store_prices: bool
+    timer_name: str | None
+    sink: RecordSink | None
+
+    def __init__(
+        self,
+        *,
+        max_records: int = 20000,
+        enable_store: bool = True,
+        store_prices: bool = False,
+        timer_name: str | None = None,
+        sink: RecordSink | None = None,
+    ) -> None: ...
+
+    def start(self, engine: EventEngine) -> None: ...
+    def stop(self) -> None: ...
+    def reset(self) -> None: ...
+
+    def on_bookticker(self, event: OKXBookticker) -> None: ...
+    def on_timer(self, timer: Timer) -> None: ...
+
+    def memory_footprint(self) -> dict[str, int]: ...
+    def get_records(
+        self,
+        *,
+        symbol: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+    ) -> list[dict[str, Any]]: ...
+    def pop_new_records(self, max_items: int | None = None) -> list[dict[str, Any]]: ...
+    def to_dataframe(
+        self,
+        *,
+        symbol: str | None = None,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+    ) -> Any: ...
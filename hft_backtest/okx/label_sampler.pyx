@@ -0,0 +1,203 @@
+# hft_backtest/okx/label_sampler.pyx
+# cython: language_level=3
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: initializedcheck=False
+# cython: cdivision=True
+
+from __future__ import annotations
+
+from collections import deque
+
+from libc.stdlib cimport realloc, free
+
+from hft_backtest.core.event_engine cimport Component, EventEngine
+from hft_backtest.core.timer cimport Timer
+from hft_backtest.okx.event cimport OKXBookticker
+
+
+cdef inline double _mid_from_bookticker(OKXBookticker event):
+    cdef double bid = event.bid_price_1
+    cdef double ask = event.ask_price_1
+    if bid <= 0.0 or ask <= 0.0:
+        return 0.0
+    return 0.5 * (bid + ask)
+
+
+cdef class OKXLabelSampler(Component):
+    """OKX label sampler driven by Timer.
+
+    Listens to:
+    - `OKXBookticker` to maintain last mid per symbol
+    - `Timer` to snapshot price at timer timestamps
+
+    On each timer tick at time t_k:
+    - Take p_k = last known mid
+    - If previous timer snapshot p_{k-1} exists, emit label for ts=t_{k-1}:
+        y_{k-1} = (p_k - p_{k-1}) / p_{k-1}
+
+    This ensures labels align with factor rows emitted by core `FactorSampler`
+    that uses the same Timer timestamp.
+
+    With `sink=RecordSink(...)` every label is also spilled to disk (independent of
+    `max_records`); `stop()` closes the sink.
+
+    Per-symbol state (last mid, last timer snapshot) lives in a C struct array
+    indexed by symbol id.
+    """
+
+    def __cinit__(self):
+        self._states = NULL
+        self._n_sym = 0
+        self._cap_sym = 0
+
+    def __dealloc__(self):
+        if self._states != NULL:
+            free(self._states)
+
+    def __init__(
+        self,
+        *,
+        int max_records=20000,
+        bint enable_store=True,
+        bint store_prices=False,
+        str timer_name=None,
+        object sink=None,
+    ):
+        if max_records < 0:
+            raise ValueError("max_records must be >= 0")
+        self.max_records = max_records
+        # None: 默认 Timer；否则订阅 BacktestEngine.add_timer 添加的命名 timer
+        self.timer_name = timer_name
+        self.enable_store = enable_store
+        self.store_prices = store_prices
+        self.sink = sink
+
+        self.event_engine = None
+        self._records = deque()
+        self._new_records = deque()
+        self.reset()
+
+    cpdef start(self, EventEngine engine):
+        self.event_engine = engine
+        engine.register(OKXBookticker, self.on_bookticker)
+        if self.timer_name is None:
+            engine.register(Timer, self.on_timer)
+        else:
+            engine.register_timer(self.timer_name, self.on_timer)
+
+    cpdef stop(self):
+        if self.sink is not None:
+            self.sink.close()
+
+    cpdef reset(self):
+        self._sym_index = {}
+        self._symbols = []
+        self._n_sym = 0
+        self._records.clear()
+        self._new_records.clear()
+
+    cdef Py_ssize_t _intern(self, str symbol) except -1:
+        cdef object idx = self._sym_index.get(symbol)
+        if idx is not None:
+            return <Py_ssize_t>idx
+        cdef Py_ssize_t new_cap
+        cdef LabelSymbolState* buf
+        cdef LabelSymbolState* st
+        if self._n_sym == self._cap_sym:
+            new_cap = 8 if self._cap_sym == 0 else self._cap_sym * 2
+            buf = <LabelSymbolState*>realloc(self._states, new_cap * sizeof(LabelSymbolState))
+            if buf == NULL:
+                raise MemoryError()
+            self._states = buf
+            self._cap_sym = new_cap
+        st = &self._states[self._n_sym]
+        st.mid = 0.0
+        st.mid_ts = 0
+        st.timer_price = 0.0
+        st.timer_ts = 0
+        self._sym_index[symbol] = self._n_sym
+        self._symbols.append(symbol)
+        self._n_sym += 1
+        return self._n_sym - 1
+
+    cpdef on_bookticker(self, OKXBookticker event):
+        cdef double mid = _mid_from_bookticker(event)
+        if mid <= 0.0:
+            return
+        cdef LabelSymbolState* st = &self._states[self._intern(event.symbol)]
+        st.mid = mid
+        st.mid_ts = event.timestamp
+
+    cpdef on_timer(self, Timer timer):
+        cdef long long ts = timer.timestamp
+        if ts <= 0:
+            return
+
+        cdef Py_ssize_t sid
+        cdef LabelSymbolState* st
+        cdef long long prev_ts
+        cdef double prev_p
+        cdef dict rec
+        for sid in range(self._n_sym):
+            st = &self._states[sid]
+            if st.mid <= 0.0:
+                continue
+
+            prev_ts = st.timer_ts
+            prev_p = st.timer_price
+            st.timer_ts = ts
+            st.timer_price = st.mid
+
+            if prev_ts == 0 or prev_p <= 0.0:
+                continue
+
+            rec = {"timestamp": prev_ts, "symbol": self._symbols[sid], "y": (st.mid - prev_p) / prev_p}
+            if self.store_prices:
+                rec["p0"] = prev_p
+                rec["p1"] = st.mid
+                rec["p0_ts"] = prev_ts
+                rec["p1_ts"] = ts
+
+            self._new_records.append(rec)
+            if self.sink is not None:
+                self.sink.append(rec)
+            if not self.enable_store:
+                continue
+            self._records.append(rec)
+            if self.max_records > 0:
+                while len(self._records) > self.max_records:
+                    self._records.popleft()
+
+    def memory_footprint(self):
+        """MemoryMonitor 协议"""
+        return {"records": len(self._records), "new_records": len(self._new_records)}
+
+    def get_records(self, *, str symbol=None, start_ts=None, end_ts=None):
+        out = []
+        for r in self._records:
+            if symbol is not None and r["symbol"] != symbol:
+                continue
+            rts = r["timestamp"]
+            if start_ts is not None and rts < start_ts:
+                continue
+            if end_ts is not None and rts > end_ts:
+                continue
+            out.append(r)
+        out.sort(key=lambda d: (d["timestamp"], d["symbol"]))
+        return out
+
+    def pop_new_records(self, max_items=None):
+        n = len(self._new_records) if max_items is None else min(len(self._new_records), int(max_items))
+        return [self._new_records.popleft() for _ in range(n)]
+
+    def to_dataframe(self, *, str symbol=None, start_ts=None, end_ts=None):
+        import pandas as pd
+
+        records = self.get_records(symbol=symbol, start_ts=start_ts, end_ts=end_ts)
+        if not records:
+            cols = ["timestamp", "symbol", "y"]
+            if self.store_prices:
+                cols += ["p0", "p1", "p0_ts", "p1_ts"]
+            return pd.DataFrame(columns=cols)
+        return pd.DataFrame.from_records(records)
@@ -0,0 +1,12 @@
+# cython: language_level=3
+
+from hft_backtest.core.event cimport Event
+from hft_backtest.core.delaybus cimport LatencyModel
+
+cdef class RecordedArrivalLatencyModel(LatencyModel):
+    cdef public long offset
+    cdef public long min_delay
+    cdef public long max_delay
+    cdef public long fallback_delay
+
+    cpdef long get_delay(self, Event event)
@@ -0,0 +1,24 @@
+from hft_backtest.core.event import Event
+from hft_backtest.core.delaybus import LatencyModel
+
+class RecordedArrivalLatencyModel(LatencyModel):
+    """
+    回放录制到达时间的延迟模型。
+
+    对 OKXBookticker 使用 `local_timestamp + offset` 作为到达时间，
+    延迟截断到 [min_delay, max_delay]；其它事件使用 fallback_delay。
+    """
+    offset: int
+    min_delay: int
+    max_delay: int
+    fallback_delay: int
+
+    def __init__(
+        self,
+        offset: int = 0,
+        min_delay: int = 0,
+        max_delay: int = ...,
+        fallback_delay: int = 0,
+    ) -> None: ...
+
+    def get_delay(self, event: Event) -> int: ...
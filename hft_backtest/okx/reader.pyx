@@ -13,6 +13,17 @@ from hft_backtest.okx.event cimport OKXTrades, OKXBookticker
 # 初始化 Numpy C-API
 np.import_array()
 
+
+cdef inline object _object_column(object series):
+    """
+    字符串列 -> 可写的 object ndarray。
+    pandas 的 Arrow 字符串列以及 Copy-on-Write 下只读的 `.values` 都不能直接绑定 object[:] 视图。
+    """
+    arr = series.to_numpy(dtype=object)
+    if not arr.flags.writeable:
+        arr = arr.copy()
+    return arr
+
 cdef class OKXTradesArrayReader(DataReader):
     def __init__(self, dataset):
         """
@@ -35,8 +46,8 @@ cdef class OKXTradesArrayReader(DataReader):
             self.trade_ids = df['trade_id'].values.astype(np.int64)
             self.prices = df['price'].values.astype(np.float64)
             self.sizes = df['size'].values.astype(np.float64)
-            self.instrument_names = df['instrument_name'].values
-            self.sides = df['side'].values
+            self.instrument_names = _object_column(df['instrument_name'])
+            self.sides = _object_column(df['side'])
             
             # 3. 更新状态
             self.current_df = df # 重要：保活
@@ -92,7 +103,7 @@ cdef class OKXBooktickerArrayReader(DataReader):
             
             # 基础列绑定
             self.timestamps = df['timestamp'].values.astype(np.int64)
-            self.symbols = df['symbol'].values
+            self.symbols = _object_column(df['symbol'])
             if 'local_timestamp' in df.columns:
                 self.local_timestamps = df['local_timestamp'].values.astype(np.int64)
             else:
@@ -43,6 +43,11 @@ extensions = [
         ["hft_backtest/core/order.pyx"],
         define_macros=define_macros,
     ),
+    Extension(
+        "hft_backtest.core.order_batch",
+        ["hft_backtest/core/order_batch.pyx"],
+        define_macros=define_macros,
+    ),
     Extension(
         "hft_backtest.core.event_engine", 
         ["hft_backtest/core/event_engine.pyx"],
@@ -81,6 +86,11 @@ extensions = [
         ["hft_backtest/okx/event.pyx"],
         define_macros=define_macros,
     ),
+    Extension(
+        "hft_backtest.core.id_window",
+        ["hft_backtest/core/id_window.pyx"],
+        define_macros=define_macros,
+    ),
     Extension(
         "hft_backtest.core.account",
         ["hft_backtest/core/account.pyx"],
@@ -101,11 +111,72 @@ extensions = [
         ["hft_backtest/okx/reader.pyx"],
         define_macros=define_macros,
     ),
+    Extension(
+        "hft_backtest.binance.event",
+        ["hft_backtest/binance/event.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.binance.account",
+        ["hft_backtest/binance/account.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.binance.matcher",
+        ["hft_backtest/binance/matcher.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.binance.reader",
+        ["hft_backtest/binance/reader.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.low_freq.event",
+        ["hft_backtest/low_freq/event.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.low_freq.account",
+        ["hft_backtest/low_freq/account.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.low_freq.matcher",
+        ["hft_backtest/low_freq/matcher.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.low_freq.reader",
+        ["hft_backtest/low_freq/reader.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.ashare.state",
+        ["hft_backtest/ashare/state.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.okx.latency",
+        ["hft_backtest/okx/latency.pyx"],
+        language="c++",
+        define_macros=define_macros,
+    ),
     Extension(
         "hft_backtest.okx.factor_evaluator",
         ["hft_backtest/okx/factor_evaluator.pyx"],
         define_macros=define_macros,
     ),
+    Extension(
+        "hft_backtest.okx.factor_market_sampler",
+        ["hft_backtest/okx/factor_market_sampler.pyx"],
+        define_macros=define_macros,
+    ),
+    Extension(
+        "hft_backtest.okx.label_sampler",
+        ["hft_backtest/okx/label_sampler.pyx"],
+        define_macros=define_macros,
+    ),
     Extension(
         "hft_backtest.core.timer",
         ["hft_backtest/core/timer.pyx"],
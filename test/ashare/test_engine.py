@@ -1,4 +1,6 @@
-from hft_backtest import BacktestEngine, FixedDelayModel, Order, Strategy
+import numpy as np
+
+from hft_backtest import BacktestEngine, FixedDelayModel, Order, OrderBatch, Strategy
 from hft_backtest.core.delaybus import DelayBus
 
 from hft_backtest.ashare import AshareAccount, AshareDailyEvent, AshareDailyMatcher, AshareStkLimitEvent
@@ -117,10 +119,13 @@ class DoubleSellSameDayStrategy(Strategy):
             self.order_states.append(order.state)
 
 
-def _make_engine(dataset, matcher, server_account, client_account, strategy):
-    server2client = DelayBus(FixedDelayModel(0))
-    client2server = DelayBus(FixedDelayModel(0))
-    engine = BacktestEngine(dataset, server2client, client2server, timer_interval=None)
+def _make_engine(dataset, matcher, server_account, client_account, strategy, mode="dual"):
+    if mode == "single":
+        engine = BacktestEngine(dataset, timer_interval=None, mode="single")
+    else:
+        server2client = DelayBus(FixedDelayModel(0))
+        client2server = DelayBus(FixedDelayModel(0))
+        engine = BacktestEngine(dataset, server2client, client2server, timer_interval=None)
     engine.add_component(matcher, is_server=True)
     engine.add_component(server_account, is_server=True)
     engine.add_component(client_account, is_server=False)
@@ -243,4 +248,203 @@ def test_sell_order_reservation_blocks_second_order_same_day():
 
     assert server_account.get_positions().get("000001.SZ", 0.0) == 0.0
     assert strategy.order_states.count(Order.ORDER_STATE_CANCELED) >= 1
-    assert strategy.order_states.count(Order.ORDER_STATE_FILLED) >= 2
\ No newline at end of file
+    assert strategy.order_states.count(Order.ORDER_STATE_FILLED) >= 2
+
+def test_single_mode_matches_dual_mode_with_zero_latency():
+    def run(mode):
+        dataset = [
+            AshareDailyEvent(202401010000, ts_code="000001.SZ", trade_date="20240101", open=10.0, close=10.0, pct_chg=0.0, _next_open=None),
+            AshareDailyEvent(202401020000, ts_code="000001.SZ", trade_date="20240102", open=10.0, close=11.0, pct_chg=10.0, _next_open=None),
+            AshareDailyEvent(202401030000, ts_code="000001.SZ", trade_date="20240103", open=11.0, close=12.0, pct_chg=9.0, _next_open=None),
+        ]
+        server_account = AshareAccount(initial_balance=5000.0)
+        matcher = AshareDailyMatcher(server_account, fill_mode="close", commission_rate=0.0, min_commission=0.0)
+        client_account = AshareAccount(initial_balance=5000.0)
+        strategy = BuySellRetryStrategy(client_account, 100.0)
+        engine = _make_engine(dataset, matcher, server_account, client_account, strategy, mode=mode)
+        engine.run()
+        # 同一时刻内回报的交错顺序可能不同（单引擎没有总线批量转发），只比较结果
+        return (
+            sorted(strategy.order_states),
+            server_account.get_balance(),
+            server_account.get_positions().get("000001.SZ", 0.0),
+            client_account.get_balance(),
+            client_account.get_positions().get("000001.SZ", 0.0),
+        )
+
+    assert run("single") == run("dual")
+
+
+def test_bulk_cancel_uses_order_index():
+    from hft_backtest.core.event_engine import EventEngine
+
+    account = AshareAccount(initial_balance=1e6)
+    matcher = AshareDailyMatcher(account, fill_mode="close")
+    engine = EventEngine()
+    matcher.start(engine)
+    reports = []
+    engine.register(Order, reports.append, ignore_self=False)
+
+    symbols = [f"{i:06d}.SZ" for i in range(50)]
+    orders = []
+    for symbol in symbols:
+        order = Order.create_limit(symbol, 100.0, 1.0)
+        order.state = Order.ORDER_STATE_SUBMITTED
+        matcher.on_order(order)
+        orders.append(order)
+    assert len(matcher.order_symbol) == 50
+
+    cancel_ids = [o.order_id for o in orders[::2]] + [-1, orders[0].order_id]
+    reports.clear()
+    assert matcher.cancel_orders(cancel_ids) == 25
+    canceled = [r for r in reports if r.state == Order.ORDER_STATE_CANCELED]
+    assert sorted(r.order_id for r in canceled) == sorted(o.order_id for o in orders[::2])
+    assert len(matcher.order_symbol) == 25
+    assert set(matcher.active_orders) == set(symbols[1::2])
+
+    # 单笔撤单同样走索引
+    matcher.on_order(Order.create_cancel(orders[1]))
+    assert orders[1].order_id not in matcher.order_symbol
+    assert symbols[1] not in matcher.active_orders
+
+
+def _matcher_with_sellable_position():
+    from hft_backtest.core.event_engine import EventEngine
+
+    account = AshareAccount(initial_balance=1e6)
+    for day in ("20240101", "20240102"):
+        for symbol in ("000001.SZ", "000002.SZ"):
+            account.on_daily(AshareDailyEvent(1, ts_code=symbol, trade_date=day, open=10.0, close=10.0, pct_chg=0.0))
+        if day == "20240101":
+            account._apply_fill("000001.SZ", 300.0, 10.0, 0.0)
+            account._apply_fill("000002.SZ", 300.0, 10.0, 0.0)
+    matcher = AshareDailyMatcher(account, fill_mode="close", enforce_integer_lot=True)
+    engine = EventEngine()
+    matcher.start(engine)
+    # 账户也挂在引擎上：逐笔下单时成交回报会立刻扣减可卖仓位
+    engine.register(Order, account.on_order, ignore_self=False)
+    engine.register(OrderBatch, account.on_order_batch, ignore_self=False)
+    reports = []
+    engine.register(Order, reports.append, ignore_self=False)
+    engine.register(OrderBatch, lambda b: reports.extend(b.to_orders()), ignore_self=False)
+    for symbol in ("000001.SZ", "000002.SZ", "000003.SZ"):
+        matcher.on_stk_limit(AshareStkLimitEvent(2, ts_code=symbol, trade_date="20240102", up_limit=11.0, down_limit=9.0))
+        matcher.on_daily(AshareDailyEvent(2, ts_code=symbol, trade_date="20240102", open=10.0, close=10.0, pct_chg=0.0))
+    return matcher, reports
+
+
+def test_order_batch_columnar_path_matches_single_orders():
+    orders = [
+        Order.create_market("000001.SZ", -200.0),
+        Order.create_market("000001.SZ", -200.0),        # 超过剩余可卖，提交阶段被拒
+        Order.create_market("000001.SZ", 100.0),
+        Order.create_market("000002.SZ", 100.5),         # 非整手
+        Order.create_limit("000002.SZ", 100.0, 1.0),     # 挂着不成交，随后被同批撤单
+        Order.create_limit("000003.SZ", 100.0, 12.0),    # 高于涨停，撮合时撤单
+        Order.create_limit("000002.SZ", -300.0, 10.0),
+    ]
+    for order in orders:
+        order.state = Order.ORDER_STATE_SUBMITTED
+    rows = orders + [Order.create_cancel(orders[4])]
+
+    def key(reports):
+        return sorted((r.order_id, r.state, r.filled_price, r.commission_fee) for r in reports)
+
+    single, single_reports = _matcher_with_sellable_position()
+    for order in rows:
+        single.on_order(order)
+
+    batch, batch_reports = _matcher_with_sellable_position()
+
+    def no_per_row_dispatch(order):
+        raise AssertionError("on_order_batch must not dispatch rows through on_order")
+
+    batch.on_order = no_per_row_dispatch
+    batch.on_order_batch(OrderBatch.from_orders(rows))
+
+    assert key(batch_reports) == key(single_reports)
+    filled = [r for r in batch_reports if r.state == Order.ORDER_STATE_FILLED]
+    assert sorted(r.order_id for r in filled) == sorted(orders[i].order_id for i in (0, 2, 6))
+    assert batch.active_orders == {} and single.active_orders == {}
+    assert batch.symbol_reserved_sell == single.symbol_reserved_sell == {}
+
+
+class RebalanceStrategy(Strategy):
+    """第一根 bar 买入一篮子，第二根 bar 全部卖出；use_batch 决定逐笔还是 OrderBatch 下单"""
+
+    def __init__(self, account, symbols, use_batch):
+        super().__init__(account)
+        self.symbols = symbols
+        self.use_batch = use_batch
+        self.seen = set()
+        self.reports = []
+
+    def start(self, engine):
+        super().start(engine)
+        engine.register(AshareDailyEvent, self.on_daily)
+        engine.register(Order, self.reports.append)
+        engine.register(OrderBatch, self.reports.append)
+
+    def on_daily(self, event):
+        key = event.trade_date
+        if key in self.seen or event.ts_code != self.symbols[-1]:
+            return
+        self.seen.add(key)
+        quantity = 100.0 if len(self.seen) == 1 else -100.0
+        quantities = [quantity] * len(self.symbols)
+        # 最后一只给一个不可能成交的限价，留作挂单
+        prices = [np.nan] * (len(self.symbols) - 1) + [1.0 if quantity > 0 else 1000.0]
+        if self.use_batch:
+            self.send_order_batch(OrderBatch.create(self.symbols, quantities, prices))
+            return
+        for symbol, qty, price in zip(self.symbols, quantities, prices):
+            if np.isnan(price):
+                self.send_order(Order.create_market(symbol, qty))
+            else:
+                self.send_order(Order.create_limit(symbol, qty, price))
+
+
+def test_order_batch_matches_single_orders():
+    symbols = [f"{i:06d}.SZ" for i in range(20)]
+
+    def run(use_batch):
+        dataset = []
+        for day, ts in enumerate((202401010000, 202401020000)):
+            for i, symbol in enumerate(symbols):
+                px = 10.0 + i + day
+                dataset.append(
+                    AshareDailyEvent(ts, ts_code=symbol, trade_date=str(ts), open=px, close=px, pct_chg=0.0)
+                )
+        server_account = AshareAccount(initial_balance=1e6)
+        matcher = AshareDailyMatcher(server_account, fill_mode="close")
+        client_account = AshareAccount(initial_balance=1e6)
+        strategy = RebalanceStrategy(client_account, symbols, use_batch)
+        engine = _make_engine(dataset, matcher, server_account, client_account, strategy)
+        engine.run()
+        ledger = []
+        for account in (server_account, client_account):
+            ledger.append(
+                (
+                    account.get_balance(),
+                    account.get_positions(),
+                    account.get_total_commission(),
+                    account.get_total_trade_count(),
+                    sorted(account.get_orders()),
+                )
+            )
+        return ledger, strategy.reports, engine.client2server_bus.delivered
+
+    single_ledger, single_reports, single_sent = run(False)
+    batch_ledger, batch_reports, batch_sent = run(True)
+
+    assert len(batch_ledger[0][4]) == 1
+    assert [entry[:4] for entry in batch_ledger] == [entry[:4] for entry in single_ledger]
+    assert len(batch_ledger[0][4]) == len(single_ledger[0][4]) == len(batch_ledger[1][4])
+    # 每根 bar 只有一个订单事件和一个回报事件
+    assert batch_sent == 2 and single_sent == 2 * len(symbols)
+    assert all(isinstance(r, OrderBatch) for r in batch_reports)
+    # 策略自己 put 的提交批次也会回调到这里，过滤掉
+    batch_reports = [r for r in batch_reports if not (r.states == Order.ORDER_STATE_SUBMITTED).all()]
+    assert len(batch_reports) == 2
+    filled = sum(int((r.states == Order.ORDER_STATE_FILLED).sum()) for r in batch_reports)
+    assert filled == 2 * (len(symbols) - 1)
@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+from hft_backtest.ashare import AshareSymbolTable
+
+
+class TestAshareSymbolTable:
+    def test_intern_and_growth(self):
+        table = AshareSymbolTable()
+        ids = [table.intern(f"{i:06d}.SZ") for i in range(100)]
+        assert ids == list(range(100))
+        assert table.intern("000005.SZ") == 5
+        assert table.index_of("999999.SZ") == -1
+        assert len(table) == 100
+        assert table.memory_footprint()["symbols"] == 100
+
+    def test_limits(self):
+        table = AshareSymbolTable()
+        sid = table.intern("A")
+        # 未知涨跌停：只要求价格为正
+        assert table.tradeable_price(sid, 100.0)
+        assert not table.tradeable_price(sid, 0.0)
+        assert not table.limit_price_invalid(sid, 100.0)
+        assert table.tradeable_price(-1, 1.0) and not table.limit_price_invalid(-1, 1.0)
+
+        table.set_limits(sid, 11.0, None)
+        assert table.get_limits("A") == (11.0, None)
+        assert table.limit_price_invalid(sid, 11.5)
+        assert not table.limit_price_invalid(sid, 1.0)
+        assert table.tradeable_price(sid, 11.0) and not table.tradeable_price(sid, 11.01)
+
+    def test_t1_roll_and_trade_date_keys(self):
+        table = AshareSymbolTable()
+        sid = table.intern("A")
+        table.on_daily(sid, "20240101", 10.0, 0.0)
+        table.apply_fill(sid, 100.0, 10.0, False)
+        assert table.get_position("A") == 100.0 and table.get_sellable("A") == 0.0
+        # 同一交易日（int 与 str 视为同一天）不滚动
+        table.on_daily(sid, 20240101, 10.0, 0.0)
+        assert table.get_sellable("A") == 0.0
+        # 空交易日不滚动
+        table.on_daily(sid, "", 10.0, 0.0)
+        assert table.get_sellable("A") == 0.0
+        table.on_daily(sid, "20240102", 11.0, 10.0)
+        assert table.get_sellable("A") == 100.0
+        assert table.get_market_value() == pytest.approx(1100.0)
+
+        table.apply_fill(sid, -40.0, 11.0, False)
+        assert table.get_sellable("A") == 60.0
+        assert table.market_values()["A"] == pytest.approx(660.0)
+        with pytest.raises(RuntimeError):
+            table.apply_fill(sid, -100.0, 11.0, False)
+        table.apply_fill(sid, -60.0, 11.0, False)
+        assert table.positions() == {} and table.sellables() == {}
+        assert table.get_market_value() == 0.0
+        assert table.last_closes() == {"A": 11.0}
+
+    def test_buy_without_close_uses_fill_price(self):
+        table = AshareSymbolTable()
+        sid = table.intern("A")
+        table.apply_fill(sid, 10.0, 5.0, False)
+        assert table.get_market_value() == 50.0
+        # close 为 None 时保留上一次收盘价，pct_chg 为 None 视为 0
+        table.on_daily(sid, "20240101", None, None)
+        assert table.last_closes() == {}
+        assert table.get_market_value() == 50.0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
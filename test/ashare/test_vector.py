@@ -0,0 +1,220 @@
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from hft_backtest import BacktestEngine, Order, Strategy
+
+from hft_backtest.ashare import AshareAccount, AshareDailyEvent, AshareDailyMatcher, AshareStkLimitEvent, VectorBarBacktest
+
+
+SYMBOLS = ["000001.SZ", "000002.SZ", "600000.SH"]
+
+
+def _make_market(n_steps=40, seed=7):
+    rng = np.random.default_rng(seed)
+    n = len(SYMBOLS)
+    close = np.empty((n_steps, n))
+    open_ = np.empty((n_steps, n))
+    prev = np.array([10.0, 20.0, 5.0])
+    up = np.empty((n_steps, n))
+    down = np.empty((n_steps, n))
+    for t in range(n_steps):
+        open_[t] = prev * (1.0 + rng.uniform(-0.02, 0.02, n))
+        close[t] = prev * (1.0 + rng.uniform(-0.05, 0.05, n))
+        up[t] = np.round(prev * 1.1, 2)
+        down[t] = np.round(prev * 0.9, 2)
+        prev = close[t]
+    # 第三个品种停牌两天
+    for arr in (close, open_, up, down):
+        arr[10:12, 2] = np.nan
+    return close, open_, up, down
+
+
+def _rules(t, i, close, working, fill_mode):
+    """确定性下单规则：返回 (quantity, price) 或 None，price 为 None 表示市价"""
+    if np.isnan(close[t, i]):
+        return None
+    if i == 0:
+        if fill_mode != "close" or working:
+            return None
+        if t == 5:
+            # 限价高于涨停价，撮合时撤单
+            return 100.0, round(close[t, i] * 1.2, 2)
+        if t % 3 == 0:
+            return 100.0, round(close[t, i] * 0.98, 2)
+        if t % 7 == 1:
+            return -100.0, None
+        return None
+    phase = (t + i) % 4
+    if phase == 0:
+        return 100.0 * i, None
+    if phase == 2:
+        return -100.0 * i, None
+    if phase == 3 and i == 1:
+        # 超过可卖仓位，提交阶段被拒
+        return -300.0, None
+    return None
+
+
+class RuleStrategy(Strategy):
+    def __init__(self, account, close, fill_mode):
+        super().__init__(account)
+        self.close = close
+        self.fill_mode = fill_mode
+        self.step_of = {}
+        self.working = {}
+
+    def start(self, engine):
+        super().start(engine)
+        engine.register(AshareDailyEvent, self.on_daily)
+        engine.register(Order, self.on_order)
+
+    def on_daily(self, event):
+        i = SYMBOLS.index(event.ts_code)
+        t = self.step_of[event.timestamp]
+        rule = _rules(t, i, self.close, bool(self.working.get(i)), self.fill_mode)
+        if rule is None:
+            return
+        qty, price = rule
+        if price is None:
+            order = Order.create_market(event.ts_code, qty)
+        else:
+            order = Order.create_limit(event.ts_code, qty, price)
+        self.working.setdefault(i, set()).add(order.order_id)
+        self.send_order(order)
+
+    def on_order(self, order):
+        if order.is_filled or order.is_canceled:
+            self.working.get(SYMBOLS.index(order.symbol), set()).discard(order.order_id)
+
+
+def _run_event_engine(close, open_, up, down, pct, fill_mode):
+    timestamps = [202401010000 + t for t in range(close.shape[0])]
+    dataset = []
+    for t, ts in enumerate(timestamps):
+        for i, symbol in enumerate(SYMBOLS):
+            if np.isnan(close[t, i]):
+                continue
+            dataset.append(AshareStkLimitEvent(ts, ts_code=symbol, trade_date=str(ts), up_limit=up[t, i], down_limit=down[t, i]))
+        for i, symbol in enumerate(SYMBOLS):
+            if np.isnan(close[t, i]):
+                continue
+            dataset.append(
+                AshareDailyEvent(ts, ts_code=symbol, trade_date=str(ts), open=open_[t, i], close=close[t, i], pct_chg=pct[t, i])
+            )
+    server_account = AshareAccount(initial_balance=100000.0)
+    matcher = AshareDailyMatcher(server_account, fill_mode=fill_mode)
+    client_account = AshareAccount(initial_balance=100000.0)
+    strategy = RuleStrategy(client_account, close, fill_mode)
+    strategy.step_of = {ts: t for t, ts in enumerate(timestamps)}
+
+    # 单引擎模式下，同一时刻的回报在策略回调之后才处理，与向量化版本的步内顺序一致
+    engine = BacktestEngine(dataset, timer_interval=None, mode="single")
+    engine.add_component(matcher, is_server=True)
+    engine.add_component(server_account, is_server=True)
+    engine.add_component(client_account, is_server=False)
+    engine.add_component(strategy, is_server=False)
+    engine.run()
+    return server_account
+
+
+def _vector_strategy(close, fill_mode):
+    n = len(SYMBOLS)
+
+    def strategy(t, bt):
+        qty = np.zeros(n)
+        price = np.full(n, np.nan)
+        for i in range(n):
+            rule = _rules(t, i, close, bt.order_qty[i] != 0, fill_mode)
+            if rule is None:
+                continue
+            qty[i] = rule[0]
+            if rule[1] is not None:
+                price[i] = rule[1]
+        return qty, price
+
+    return strategy
+
+
+@pytest.mark.parametrize("fill_mode", ["close", "next_open"])
+def test_matches_event_driven_ledger(fill_mode):
+    close, open_, up, down = _make_market()
+    bt = VectorBarBacktest(
+        SYMBOLS, close, open=open_, up_limit=up, down_limit=down, initial_balance=100000.0, fill_mode=fill_mode
+    )
+    bt.run(_vector_strategy(close, fill_mode))
+    account = _run_event_engine(close, open_, up, down, bt.pct_chg, fill_mode)
+
+    assert bt.get_total_trade_count() == account.get_total_trade_count()
+    assert bt.get_total_trade_count() > 10
+    assert bt.get_balance() == pytest.approx(account.get_balance())
+    assert bt.get_market_value() == pytest.approx(account.get_market_value())
+    assert bt.get_equity() == pytest.approx(account.get_equity())
+    assert bt.get_total_turnover() == pytest.approx(account.get_total_turnover())
+    assert bt.get_total_commission() == pytest.approx(account.get_total_commission())
+    positions = account.get_positions()
+    assert bt.get_positions() == pytest.approx(positions)
+    for symbol in SYMBOLS:
+        assert bt.get_sellable_qty(symbol) == pytest.approx(account.get_sellable_qty(symbol))
+
+
+def test_t1_and_limit_rules():
+    n_steps = 5
+    close = np.full((n_steps, 1), 10.0)
+    up = np.full((n_steps, 1), 11.0)
+    down = np.full((n_steps, 1), 9.0)
+    # next_open：t 步提交的订单在 t+1 步开盘撮合，之后策略才在同一步下单
+    orders = {0: (200.0, np.nan), 1: (-100.0, np.nan), 2: (-300.0, np.nan), 3: (-200.0, 12.0)}
+
+    def strategy(t, bt):
+        if t not in orders:
+            return None
+        q, p = orders[t]
+        return np.array([q]), np.array([p])
+
+    bt = VectorBarBacktest(["000001.SZ"], close, open=close, up_limit=up, down_limit=down, initial_balance=5000.0,
+                           fill_mode="next_open", commission_rate=0.0, min_commission=0.0, stamp_tax_rate=0.0)
+    bt.run(strategy)
+    # 买入在第 1 步开盘成交；同一天卖出被拒（T+1）；次日超卖被拒；限价高于涨停在第 4 步撮合时被撤
+    assert bt.get_total_trade_count() == 1
+    assert bt.get_positions() == {"000001.SZ": 200.0}
+    assert bt.get_sellable_qty("000001.SZ") == 200.0
+    assert bt.total_cancel_count == 3
+    assert bt.get_balance() == 3000.0
+    np.testing.assert_allclose(bt.equity_curve, [5000.0] * n_steps)
+
+
+def test_from_frame_and_scale():
+    pd = pytest.importorskip("pandas")
+    n_steps, n_symbols = 15 * 244, 300
+    rng = np.random.default_rng(0)
+    close = 10.0 * np.cumprod(1.0 + rng.normal(0.0, 0.02, (n_steps, n_symbols)), axis=0)
+    symbols = [f"{i:06d}.SZ" for i in range(n_symbols)]
+
+    def momentum(t, bt):
+        if t % 20 != 0 or t == 0:
+            return None
+        signal = bt.close[t] / bt.close[max(t - 20, 0)] - 1.0
+        target = np.where(signal > np.quantile(signal, 0.9), 100.0, 0.0)
+        return target - bt.position, None
+
+    start = time.perf_counter()
+    bt = VectorBarBacktest(symbols, close, initial_balance=1e7).run(momentum)
+    elapsed = time.perf_counter() - start
+    assert bt.get_total_trade_count() > 0
+    assert np.isfinite(bt.equity_curve).all()
+    assert elapsed < 30.0
+
+    frame = pd.DataFrame(
+        {"ts_code": np.repeat(symbols[:3], 4), "trade_date": np.tile([1, 2, 3, 4], 3), "close": close[:4, :3].T.ravel()}
+    )
+    small = VectorBarBacktest.from_frame(frame, initial_balance=1000.0)
+    assert small.symbols == symbols[:3]
+    np.testing.assert_allclose(small.close, close[:4, :3])
+    np.testing.assert_allclose(small.pct_chg[1:], (close[1:4, :3] / close[:3, :3] - 1.0) * 100.0)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,40 @@
+import pytest
+from hft_backtest import Order, EventEngine
+from hft_backtest.binance.account import BinanceAccount
+from hft_backtest.binance.event import BinanceTrade
+from hft_backtest.okx.account import OKXAccount
+
+
+def _filled(symbol, qty, price, fee=0.0):
+    order = Order.create_limit(symbol, qty, price)
+    order.state = Order.ORDER_STATE_FILLED
+    order.filled_price = price
+    order.commission_fee = fee
+    return order
+
+
+def test_binance_account_tracks_fills_and_marks_to_trades():
+    account = BinanceAccount(initial_balance=1000.0)
+    assert isinstance(account, OKXAccount)
+
+    account.on_order(_filled("BTCUSDT", 2.0, 100.0, fee=0.1))
+    account.on_trade(BinanceTrade(symbol="BTCUSDT", price=110.0, qty=1.0))
+
+    assert account.get_positions() == {"BTCUSDT": 2.0}
+    assert account.get_prices() == {"BTCUSDT": 110.0}
+    assert account.get_balance() == pytest.approx(1000.0 - 200.0 - 0.1)
+    assert account.get_equity() == pytest.approx(1000.0 - 200.0 - 0.1 + 220.0)
+    assert account.get_total_trade_count() == 1
+
+
+def test_binance_account_registers_binance_events():
+    engine = EventEngine()
+    account = BinanceAccount()
+    account.start(engine)
+
+    engine.put(BinanceTrade(symbol="ETHUSDT", price=50.0))
+    order = Order.create_limit("ETHUSDT", -1.0, 50.0)
+    order.state = Order.ORDER_STATE_SUBMITTED
+    engine.put(order)
+    assert account.get_prices() == {"ETHUSDT": 50.0}
+    assert list(account.get_orders()) == [order.order_id]
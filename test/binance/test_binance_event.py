@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from hft_backtest.binance.event import BinanceBookTicker, BinanceTrade
+from hft_backtest.binance.reader import BinanceBookTickerArrayReader, BinanceTradeArrayReader
+
+
+def test_events_derive():
+    ticker = BinanceBookTicker(timestamp=5, symbol="BTCUSDT", update_id=7,
+                               best_bid_price=100.0, best_bid_qty=2.0,
+                               best_ask_price=100.5, best_ask_qty=3.0)
+    clone = ticker.derive()
+    assert isinstance(clone, BinanceBookTicker)
+    assert clone.timestamp == 0
+    assert (clone.symbol, clone.update_id, clone.best_bid_price, clone.best_ask_qty) == ("BTCUSDT", 7, 100.0, 3.0)
+
+    trade = BinanceTrade(timestamp=9, symbol="BTCUSDT", trade_id=11, price=100.2, qty=0.5, is_buyer_maker=True)
+    clone = trade.derive()
+    assert isinstance(clone, BinanceTrade)
+    assert (clone.trade_id, clone.price, clone.qty, clone.is_buyer_maker) == (11, 100.2, 0.5, True)
+
+
+def test_trade_reader_binance_archive_columns():
+    # Binance 官方归档列名：id, price, qty, quote_qty, time, is_buyer_maker（无 symbol 列）
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "price": [100.0, 100.5, 99.5],
+        "qty": [0.1, 0.2, 0.3],
+        "quote_qty": [10.0, 20.1, 29.85],
+        "time": [1000, 1001, 1002],
+        "is_buyer_maker": ["true", "False", "True"],
+    })
+    reader = BinanceTradeArrayReader([df.iloc[:2], df.iloc[2:]], symbol="BTCUSDT")
+    evts = list(reader)
+    assert [e.trade_id for e in evts] == [1, 2, 3]
+    assert [e.timestamp for e in evts] == [1000, 1001, 1002]
+    assert [e.is_buyer_maker for e in evts] == [True, False, True]
+    assert all(e.symbol == "BTCUSDT" for e in evts)
+
+
+def test_bookticker_reader_with_symbol_column():
+    df = pd.DataFrame({
+        "timestamp": np.array([10, 20], dtype=np.int64),
+        "symbol": ["BTCUSDT", "ETHUSDT"],
+        "update_id": [5, 6],
+        "best_bid_price": [100.0, 10.0],
+        "best_bid_qty": [1.0, 2.0],
+        "best_ask_price": [100.1, 10.1],
+        "best_ask_qty": [3.0, 4.0],
+    })
+    evts = list(BinanceBookTickerArrayReader([df]))
+    assert [e.symbol for e in evts] == ["BTCUSDT", "ETHUSDT"]
+    assert [e.update_id for e in evts] == [5, 6]
+    assert evts[1].best_ask_qty == 4.0
+    assert evts[0].local_timestamp == 0
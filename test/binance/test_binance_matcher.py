@@ -0,0 +1,250 @@
+import sys
+import pytest
+from collections import deque
+from hft_backtest import EventEngine, Order
+from hft_backtest.binance.event import BinanceBookTicker, BinanceTrade
+from hft_backtest.binance.matcher import BinanceMatcher
+
+
+class MockEventEngine(EventEngine):
+    def __init__(self):
+        super().__init__()
+        self.queue = deque()
+
+    def put(self, event):
+        self.queue.append(event)
+
+    def register(self, event_type, handler, ignore_self=False):
+        pass
+
+
+SYMBOL = "BTCUSDT"
+
+
+class TestBinanceMatcher:
+    def setup_method(self):
+        self.engine = MockEventEngine()
+        self.matcher = BinanceMatcher(SYMBOL)
+        self.matcher.start(self.engine)
+        self.S = self.matcher.PRICE_SCALAR
+
+    # --- Helper Methods ---
+
+    def ticker(self, bid, ask, bid_qty=1.0, ask_qty=1.0):
+        return BinanceBookTicker(symbol=SYMBOL, best_bid_price=bid, best_bid_qty=bid_qty,
+                                 best_ask_price=ask, best_ask_qty=ask_qty)
+
+    def trade(self, price, qty, is_buyer_maker):
+        return BinanceTrade(symbol=SYMBOL, price=price, qty=qty, is_buyer_maker=is_buyer_maker)
+
+    def submit(self, order):
+        order.state = Order.ORDER_STATE_SUBMITTED
+        self.matcher.on_order(order)
+        return order
+
+    def drain(self):
+        out = list(self.engine.queue)
+        self.engine.queue.clear()
+        return out
+
+    def fills(self, events):
+        return [e for e in events if e.state == Order.ORDER_STATE_FILLED]
+
+    # --- Tests ---
+
+    def test_order_waits_for_next_market_data(self):
+        self.submit(Order.create_limit(SYMBOL, 1.0, 99.0))
+        evts = self.drain()
+        assert [e.state for e in evts] == [Order.ORDER_STATE_RECEIVED]
+        assert len(self.matcher.order_index) == 0
+        assert len(self.matcher.pending) == 1
+
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0))
+        assert len(self.matcher.order_index) == 1
+        assert self.matcher.max_buy_int == 99 * self.S
+        assert len(self.matcher.pending) == 0
+
+    def test_taker_and_market_fill_at_bbo(self):
+        self.submit(Order.create_limit(SYMBOL, 1.0, 102.0))
+        self.submit(Order.create_market(SYMBOL, -2.0))
+        self.drain()
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0))
+        fills = self.fills(self.drain())
+        assert [f.filled_price for f in fills] == [101.0, 100.0]
+        assert fills[0].commission_fee == pytest.approx(101.0 * self.matcher.taker_fee)
+
+    def test_post_only_crossing_is_canceled(self):
+        self.submit(Order.create_limit(SYMBOL, 1.0, 101.0, post_only=True))
+        self.drain()
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0))
+        evts = self.drain()
+        assert [e.state for e in evts] == [Order.ORDER_STATE_CANCELED]
+        assert len(self.matcher.order_index) == 0
+
+    def test_tracking_order_joins_best_bid(self):
+        self.submit(Order.create_tracking(SYMBOL, 1.0))
+        self.drain()
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0, bid_qty=5.0))
+        entered = self.drain()[-1]
+        assert entered.is_limit_order and entered.price == 100.0
+        resting = next(iter(self.matcher.order_index.values()))
+        assert resting.rank == 5.0
+
+    def test_queue_position_and_trade_fill(self):
+        self.submit(Order.create_limit(SYMBOL, 1.0, 100.0))
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0, bid_qty=3.0))
+        self.drain()
+
+        # 砸 bid 2 手：排位仍在前面
+        self.matcher.on_trade(self.trade(100.0, 2.0, True))
+        assert not self.fills(self.drain())
+        # 盘口剩 1 手：前面 2 手被吃掉，rank 变为 1
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0, bid_qty=1.0))
+        resting = next(iter(self.matcher.order_index.values()))
+        assert resting.rank == 1.0
+        self.matcher.on_trade(self.trade(100.0, 1.5, True))
+        fills = self.fills(self.drain())
+        assert len(fills) == 1 and fills[0].filled_price == 100.0
+        assert fills[0].commission_fee == pytest.approx(100.0 * self.matcher.maker_fee)
+
+    def test_trade_sweeps_price_levels(self):
+        self.matcher.on_bookticker(self.ticker(105.0, 106.0))
+        for px in (101.0, 102.0, 103.0, 104.0):
+            self.submit(Order.create_limit(SYMBOL, 1.0, px))
+            self.submit(Order.create_limit(SYMBOL, -1.0, px + 10))
+        self.matcher.on_bookticker(self.ticker(105.0, 106.0))
+        self.drain()
+        assert self.matcher.max_buy_int == 104 * self.S
+        assert self.matcher.min_sell_int == 111 * self.S
+
+        # 卖方砸到 102：104/103 全部成交，102 同价排位未知不成交
+        self.matcher.on_trade(self.trade(102.0, 1.0, True))
+        fills = self.fills(self.drain())
+        assert sorted(f.filled_price for f in fills) == [103.0, 104.0]
+        assert self.matcher.max_buy_int == 102 * self.S
+
+        # 买方吃到 112：111 成交，112 同价排位未知
+        self.matcher.on_trade(self.trade(112.0, 1.0, False))
+        fills = self.fills(self.drain())
+        assert [f.filled_price for f in fills] == [111.0]
+        assert self.matcher.min_sell_int == 112 * self.S
+
+        # 卖方砸在 112：此刻 112 是 bid，同价卖单全部成交
+        self.matcher.on_trade(self.trade(112.0, 1.0, True))
+        fills = self.fills(self.drain())
+        assert [f.filled_price for f in fills] == [112.0]
+        assert self.matcher.min_sell_int == 113 * self.S
+
+    def test_cancel(self):
+        order = self.submit(Order.create_limit(SYMBOL, 1.0, 99.0))
+        self.matcher.on_bookticker(self.ticker(100.0, 101.0))
+        self.drain()
+        self.matcher.on_order(Order.create_cancel(order))
+        self.matcher.on_trade(self.trade(100.5, 1.0, False))
+        evts = self.drain()
+        assert [e.state for e in evts] == [Order.ORDER_STATE_CANCELED]
+        assert evts[0].order_id == order.order_id
+        assert len(self.matcher.order_index) == 0
+        assert self.matcher.buy_levels == {}
+        assert self.matcher.max_buy_int < 0
+
+    def test_level_index_matches_book(self):
+        import random
+        rng = random.Random(7)
+        self.matcher.on_bookticker(self.ticker(500.0, 501.0))
+        orders = []
+        for _ in range(300):
+            if orders and rng.random() < 0.3:
+                self.matcher.on_order(Order.create_cancel(orders.pop(rng.randrange(len(orders)))))
+            else:
+                buy = rng.random() < 0.5
+                px = float(rng.randint(400, 499)) if buy else float(rng.randint(502, 600))
+                orders.append(self.submit(Order.create_limit(SYMBOL, 1.0 if buy else -1.0, px)))
+            self.matcher.on_bookticker(self.ticker(500.0, 501.0))
+            assert list(self.matcher.buy_index) == sorted(self.matcher.buy_levels, reverse=True)
+            assert list(self.matcher.sell_index) == sorted(self.matcher.sell_levels)
+            assert self.matcher.max_buy_int == max(self.matcher.buy_levels, default=-1)
+
+    def test_deep_ladder_sweep(self):
+        self.matcher.on_bookticker(self.ticker(1000.0, 1000.5))
+        n = 2000
+        for i in range(n):
+            self.submit(Order.create_limit(SYMBOL, 1.0, 999.0 - i * 0.01))
+        self.matcher.on_bookticker(self.ticker(1000.0, 1000.5))
+        self.drain()
+        assert len(self.matcher.buy_index) == n
+
+        self.matcher.on_trade(self.trade(900.0, 1.0, True))
+        fills = self.fills(self.drain())
+        assert len(fills) == n
+        # 从最优价往下依次成交
+        assert fills[0].filled_price == 999.0
+        assert fills[-1].filled_price == pytest.approx(999.0 - (n - 1) * 0.01)
+        assert len(self.matcher.buy_index) == 0 and self.matcher.buy_levels == {}
+        assert self.matcher.max_buy_int < 0
+
+    def test_deep_ladders_both_sides_above_1e5(self):
+        mid = 123456.0
+        self.matcher.on_bookticker(self.ticker(mid - 0.5, mid + 0.5))
+        n = 500
+        for i in range(n):
+            self.submit(Order.create_limit(SYMBOL, 1.0, mid - 1.0 - i * 0.1))
+            self.submit(Order.create_limit(SYMBOL, -1.0, mid + 1.0 + i * 0.1))
+        self.matcher.on_bookticker(self.ticker(mid - 0.5, mid + 0.5))
+        self.drain()
+        assert len(self.matcher.buy_index) == n and len(self.matcher.sell_index) == n
+
+        # 买方一路吃穿整个卖边：从最优价往上依次成交，扫空后停在空边上
+        self.matcher.on_trade(self.trade(mid + 1000.0, 1.0, False))
+        fills = self.fills(self.drain())
+        assert len(fills) == n
+        assert fills[0].filled_price == pytest.approx(mid + 1.0)
+        assert fills[-1].filled_price == pytest.approx(mid + 1.0 + (n - 1) * 0.1)
+        assert len(self.matcher.sell_index) == 0 and self.matcher.sell_levels == {}
+        # 卖边已空：更高的成交价也不会去找不存在的价位
+        self.matcher.on_trade(self.trade(mid + 5000.0, 1.0, False))
+        assert not self.fills(self.drain())
+
+        self.matcher.on_trade(self.trade(mid - 1000.0, 1.0, True))
+        fills = self.fills(self.drain())
+        assert len(fills) == n
+        assert fills[0].filled_price == pytest.approx(mid - 1.0)
+        assert len(self.matcher.buy_index) == 0 and self.matcher.buy_levels == {}
+        self.matcher.on_trade(self.trade(1.0, 1.0, True))
+        assert not self.fills(self.drain())
+        assert self.matcher.order_index == {}
+
+    @pytest.mark.parametrize("mid", [60000.0, 100000.0])
+    def test_btc_level_prices(self, mid):
+        # 空簿上的大价格成交不能把卖方哨兵当成一个在簿价位
+        fresh = BinanceMatcher(SYMBOL)
+        fresh.start(MockEventEngine())
+        fresh.on_trade(self.trade(mid, 1.0, False))
+        fresh.on_trade(self.trade(mid, 1.0, True))
+        assert fresh.sell_levels == {} and fresh.buy_levels == {}
+
+        # 限价单按真实盘口入场，不会被当成穿价吃单
+        self.submit(Order.create_limit(SYMBOL, 1.0, mid - 10.0))
+        self.submit(Order.create_limit(SYMBOL, -1.0, mid + 10.0))
+        self.matcher.on_bookticker(self.ticker(mid - 0.1, mid + 0.1))
+        assert not self.fills(self.drain())
+        assert self.matcher.max_buy_int == self.matcher.to_int_price(mid - 10.0)
+        assert self.matcher.min_sell_int == self.matcher.to_int_price(mid + 10.0)
+
+        self.matcher.on_trade(self.trade(mid + 20.0, 1.0, False))
+        fills = self.fills(self.drain())
+        assert [f.filled_price for f in fills] == [mid + 10.0]
+        self.matcher.on_trade(self.trade(mid - 20.0, 1.0, True))
+        fills = self.fills(self.drain())
+        assert [f.filled_price for f in fills] == [mid - 10.0]
+        assert self.matcher.order_index == {}
+
+    def test_other_symbol_ignored(self):
+        self.matcher.on_order(Order.create_limit("ETHUSDT", 1.0, 99.0))
+        self.matcher.on_bookticker(BinanceBookTicker(symbol="ETHUSDT", best_bid_price=1.0, best_ask_price=2.0))
+        assert not self.engine.queue
+        assert self.matcher.best_bid_price_int == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
@@ -312,5 +312,272 @@ class TestBacktestEngine:
         assert len(exch.received_ts) == 1
         assert exch.received_ts[0] == 110
 
+    def test_single_mode_shares_one_engine_without_bus(self):
+        engine = BacktestEngine(mock_data_generator(), timer_interval=None, mode="single")
+        assert engine.mode == "single"
+        assert engine.client_engine is engine.server_engine
+        assert engine.server2client_bus is None
+        assert engine.client2server_bus is None
+        assert engine.server_source_id != engine.client_source_id
+
+    def test_single_mode_rejects_bus_and_dual_mode_requires_bus(self):
+        with pytest.raises(ValueError):
+            BacktestEngine([], DelayBus(FixedDelayModel(0)), DelayBus(FixedDelayModel(0)), mode="single")
+        with pytest.raises(ValueError):
+            BacktestEngine([], None, None)
+        with pytest.raises(ValueError):
+            BacktestEngine([], mode="triple")
+
+    def test_single_mode_keeps_source_and_producer_semantics(self):
+        """单引擎模式下，server/client 组件产生的事件仍带各自侧别的 source"""
+        class PingEvent(Event):
+            pass
+
+        class PongEvent(Event):
+            pass
+
+        engine = BacktestEngine([Event(100), Event(500)], timer_interval=100, mode="single")
+
+        class ClientStrategy(Component):
+            def __init__(self):
+                self.pong_sources = []
+                self.timers = []
+            def start(self, eng):
+                self.eng = eng
+                eng.register(Timer, self.on_timer)
+                eng.register(PongEvent, self.on_pong)
+            def on_timer(self, e):
+                self.timers.append((e.timestamp, e.source))
+                if e.timestamp == 100:
+                    self.eng.put(PingEvent(e.timestamp))
+            def on_pong(self, e):
+                self.pong_sources.append(e.source)
+
+        class ServerExchange(Component):
+            def __init__(self):
+                self.ping = []
+                self.data_sources = []
+            def start(self, eng):
+                self.eng = eng
+                eng.register(PingEvent, self.on_ping)
+                eng.register(Event, self.on_data)
+            def on_ping(self, e):
+                self.ping.append((e.timestamp, e.source))
+                self.eng.put(PongEvent(e.timestamp))
+            def on_data(self, e):
+                self.data_sources.append(e.source)
+
+        strat = ClientStrategy()
+        exch = ServerExchange()
+        engine.add_component(strat, is_server=False)
+        engine.add_component(exch, is_server=True)
+        engine.run()
+
+        # 零延迟：Ping 在发出时刻即到达 server
+        assert exch.ping == [(100, engine.client_source_id)]
+        assert strat.pong_sources == [engine.server_source_id]
+        assert exch.data_sources == [engine.server_source_id] * 2
+        assert [t for t, _ in strat.timers] == [100, 200, 300, 400, 500]
+        assert all(src == engine.client_source_id for _, src in strat.timers)
+
+    def test_single_mode_time_travel_and_end_time(self):
+        engine = BacktestEngine([Event(200), Event(100)], timer_interval=None, mode="single")
+        with pytest.raises(RuntimeError, match=r"Time travel detected"):
+            engine.run()
+
+        spy = SpyComponent("server")
+        engine = BacktestEngine(mock_data_generator(), timer_interval=None, end_time=250, mode="single")
+        engine.add_component(spy, is_server=True)
+        engine.run()
+        assert spy.received == [("Event", 100), ("Event", 200)]
+
+    @staticmethod
+    def _collect_timers(timer_mode, mode="dual"):
+        dataset = [Event(100), Event(120), Event(1000)]
+        if mode == "single":
+            engine = BacktestEngine(dataset, timer_interval=100, mode="single", timer_mode=timer_mode)
+        else:
+            engine = BacktestEngine(
+                dataset, DelayBus(FixedDelayModel(0)), DelayBus(FixedDelayModel(0)),
+                timer_interval=100, timer_mode=timer_mode,
+            )
+        timers = []
+
+        class TimerSpy(Component):
+            def start(self, eng):
+                eng.register(Timer, self.on_timer)
+            def on_timer(self, t):
+                timers.append((t.timestamp, t.skipped))
+
+        engine.add_component(TimerSpy(), is_server=False)
+        engine.run()
+        return timers
+
+    @pytest.mark.parametrize("mode", ["dual", "single"])
+    def test_timer_mode_dense_fires_every_interval(self, mode):
+        timers = self._collect_timers("dense", mode)
+        assert timers == [(t, 0) for t in range(100, 1001, 100)]
+
+    @pytest.mark.parametrize("mode", ["dual", "single"])
+    def test_timer_mode_on_activity_skips_empty_ticks(self, mode):
+        # T=100 的 tick 先于同刻数据，之前没有数据 -> 跳过；T=200 之前有数据 -> 触发；
+        # 300..1000 是空档 -> 全部跳过
+        assert self._collect_timers("on_activity", mode) == [(200, 0)]
+
+    @pytest.mark.parametrize("mode", ["dual", "single"])
+    def test_timer_mode_catch_up_collapses_gap(self, mode):
+        timers = self._collect_timers("catch_up", mode)
+        # 300..900 七个空 tick 合并进 T=1000（数据恢复前最后一个网格点）
+        assert timers == [(100, 0), (200, 0), (1000, 7)]
+        # 合并后代表的 tick 总数与 dense 一致
+        assert sum(1 + s for _, s in timers) == 10
+
+    def test_timer_mode_and_interval_validation(self):
+        with pytest.raises(ValueError):
+            BacktestEngine([], timer_interval=100, mode="single", timer_mode="sparse")
+        with pytest.raises(ValueError):
+            BacktestEngine([], timer_interval=0, mode="single")
+
+    @pytest.mark.parametrize("mode", ["dual", "single"])
+    def test_named_timers_route_only_to_subscribers(self, mode):
+        dataset = [Event(0), Event(1000)]
+        if mode == "single":
+            engine = BacktestEngine(dataset, timer_interval=100, mode="single")
+        else:
+            engine = BacktestEngine(
+                dataset, DelayBus(FixedDelayModel(0)), DelayBus(FixedDelayModel(0)), timer_interval=100,
+            )
+        tid_fast = engine.add_timer("bt_fast", 250)
+        tid_slow = engine.add_timer("bt_slow", 500)
+        assert tid_fast != tid_slow and tid_fast > 0 and tid_slow > 0
+
+        default_ticks, fast_ticks, slow_ticks = [], [], []
+
+        class Subscriber(Component):
+            def start(self, eng):
+                eng.register(Timer, lambda t: default_ticks.append(t.timestamp))
+                eng.register_timer("bt_fast", lambda t: fast_ticks.append((t.timestamp, t.name)))
+                eng.register_timer("bt_slow", lambda t: slow_ticks.append(t.timer_id))
+
+        engine.add_component(Subscriber(), is_server=False)
+        engine.run()
+
+        assert default_ticks == list(range(0, 1001, 100))
+        assert fast_ticks == [(0, "bt_fast"), (250, "bt_fast"), (500, "bt_fast"), (750, "bt_fast"), (1000, "bt_fast")]
+        assert slow_ticks == [tid_slow] * 3
+
+    def test_named_timer_without_default_timer_and_validation(self):
+        engine = BacktestEngine([Event(0), Event(300)], timer_interval=None, mode="single")
+        engine.add_timer("bt_only", 150)
+        with pytest.raises(ValueError):
+            engine.add_timer("bt_only", 100)
+        with pytest.raises(ValueError):
+            engine.add_timer("bt_bad", 0)
+
+        ticks = []
+        default_ticks = []
+
+        class Subscriber(Component):
+            def start(self, eng):
+                eng.register(Timer, default_ticks.append)
+                eng.register_timer("bt_only", lambda t: ticks.append(t.timestamp))
+
+        engine.add_component(Subscriber(), is_server=False)
+        engine.run()
+        assert ticks == [0, 150, 300]
+        assert default_ticks == []
+        with pytest.raises(RuntimeError):
+            engine.add_timer("bt_late", 100)
+
+    @staticmethod
+    def _side_timer_engine(mode, **kwargs):
+        dataset = [Event(1000), Event(1600)]
+        if mode == "single":
+            return BacktestEngine(dataset, timer_interval=100, mode="single", **kwargs)
+        return BacktestEngine(
+            dataset, DelayBus(FixedDelayModel(10)), DelayBus(FixedDelayModel(10)), timer_interval=100, **kwargs,
+        )
+
+    @pytest.mark.parametrize("mode", ["dual", "single"])
+    def test_server_timer_is_scheduled_per_side(self, mode):
+        engine = self._side_timer_engine(mode, server_timer_interval=300)
+        engine.add_timer("srv_expire", 200, is_server=True)
+
+        server_ticks, client_ticks, server_named, client_named = [], [], [], []
+
+        class Side(Component):
+            def __init__(self, ticks, named):
+                self.ticks = ticks
+                self.named = named
+            def start(self, eng):
+                self.eng = eng
+                eng.register(Timer, lambda t: self.ticks.append((t.timestamp, self.eng.timestamp)))
+                eng.register_timer("srv_expire", lambda t: self.named.append(t.timestamp))
+
+        engine.add_component(Side(server_ticks, server_named), is_server=True)
+        engine.add_component(Side(client_ticks, client_named), is_server=False)
+        engine.run()
+
+        # server 只收到自己的节拍（准时、不经总线）
+        assert server_ticks == [(1000, 1000), (1300, 1300), (1600, 1600)]
+        assert client_ticks == [(t, t) for t in range(1000, 1601, 100)]
+        # 命名 server timer 不会发给 client 侧订阅者
+        assert server_named == [1000, 1200, 1400, 1600]
+        assert client_named == []
+
+    def test_client_timer_still_reaches_server_without_server_timer(self):
+        """未开启 server timer 时保持原行为：client Timer 经 C2S 总线（带延迟）到达 server"""
+        engine = self._side_timer_engine("dual")
+        server_ticks = []
+
+        class ServerSpy(Component):
+            def start(self, eng):
+                self.eng = eng
+                eng.register(Timer, lambda t: server_ticks.append((t.timestamp, self.eng.timestamp)))
+
+        engine.add_component(ServerSpy(), is_server=True)
+        engine.run()
+        assert server_ticks == [(t, t + 10) for t in range(1000, 1601, 100)]
+
+    def test_timer_derive_keeps_skipped(self):
+        t = Timer(500, 3)
+        t.source = 7
+        d = t.derive()
+        assert d.skipped == 3
+        assert d.timestamp == 0 and d.source == 0
+
+    def test_run_returns_stats_and_reports_progress(self):
+        """run() 返回 RunStats：按来源计数、阶段耗时、总线峰值深度，并周期性回调 progress"""
+        engine = BacktestEngine(
+            mock_data_generator(), DelayBus(FixedDelayModel(10)), DelayBus(FixedDelayModel(10)), timer_interval=50,
+        )
+        reports = []
+        stats = engine.run(progress=lambda s: reports.append((s.n_data, s.finished)), progress_interval=1e-9)
+
+        assert stats is engine.stats
+        # 数据 3 条全部经 S2C 到 client；client Timer 100..300 共 5 个，经 C2S 搬到 server
+        assert (stats.n_data, stats.n_timer, stats.n_s2c, stats.n_c2s) == (3, 5, 3, 5)
+        assert stats.n_events == 16
+        assert stats.peak_s2c_depth == 1 and stats.peak_c2s_depth == 1
+        assert stats.sim_time == 310
+        assert stats.finished
+        assert stats.wall_ns >= stats.fetch_ns + stats.bus_ns + stats.dispatch_ns > 0
+        assert stats.events_per_sec > 0
+        assert stats.as_dict()["n_events"] == 16
+
+        # 极小间隔：每个循环都汇报一次，最后一次是 finished
+        assert len(reports) > 2
+        assert reports[-1] == (3, True)
+        assert all(not f for _, f in reports[:-1])
+
+        with pytest.raises(ValueError):
+            BacktestEngine(mock_data_generator(), mode="single").run(progress=print, progress_interval=0)
+
+    def test_single_mode_run_stats(self):
+        engine = BacktestEngine(mock_data_generator(), timer_interval=50, mode="single")
+        stats = engine.run()
+        assert (stats.n_data, stats.n_timer, stats.n_s2c, stats.n_c2s) == (3, 5, 0, 0)
+        assert stats.peak_s2c_depth == 0 and stats.sim_time == 300
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
\ No newline at end of file
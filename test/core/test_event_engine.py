@@ -51,6 +51,29 @@ class TestEventEngine:
         
         assert result == ["senior", "spec", "junior"]
 
+    def test_named_timer_routing(self):
+        """命名 timer 只派发给 register_timer 的订阅者；register(Timer) 只收到默认 timer"""
+        from hft_backtest.core.timer import Timer, timer_id_of
+
+        engine = EventEngine()
+        default_ticks, named_ticks, global_ticks = [], [], []
+        engine.register(Timer, lambda t: default_ticks.append(t.timestamp))
+        engine.register_timer("ee_named", lambda t: named_ticks.append(t.timestamp))
+        engine.global_register(lambda t: global_ticks.append(t.timestamp))
+
+        engine.put(Timer(10))
+        engine.put(Timer(20, timer_id=timer_id_of("ee_named")))
+        engine.put(Timer(30, timer_id=timer_id_of("ee_other")))
+
+        assert default_ticks == [10]
+        assert named_ticks == [20]
+        assert global_ticks == [10, 20, 30]
+        assert timer_id_of("ee_named") == timer_id_of("ee_named")
+
+        with pytest.raises(ValueError):
+            engine.register_timer("ee_named", engine.put)
+            engine.register_timer("ee_named", engine.put)
+
     def test_no_polymorphic_dispatch(self):
         """验证：不支持多态分发 (父类监听器收不到子类事件)"""
         engine = EventEngine()
@@ -162,5 +185,40 @@ class TestEventEngine:
         # 验证 good_handler 没有运行
         assert e.timestamp == 1
 
+    def test_profile(self):
+        """profiling：按 (事件类型, listener) 计数计时，按 put 来源计数；默认关闭"""
+        engine = EventEngine()
+
+        class Forwarder:
+            def on_market(self, e):
+                engine.put(OrderEvent(0))
+
+        def on_order(e):
+            pass
+
+        fwd = Forwarder()
+        engine.register(MarketEvent, fwd.on_market)
+        engine.register(OrderEvent, on_order)
+
+        engine.put(MarketEvent(1))
+        assert engine.get_profile() == {"listeners": [], "puts": []}
+
+        engine.enable_profile()
+        for i in range(3):
+            engine.put(MarketEvent(2 + i))
+
+        prof = engine.get_profile()
+        calls = {(r["event_type"], r["listener"]): r["calls"] for r in prof["listeners"]}
+        assert calls == {("MarketEvent", "Forwarder.on_market"): 3, ("OrderEvent", "TestEventEngine.test_profile.<locals>.on_order"): 3}
+        assert all(r["total_ns"] >= 0 and r["avg_ns"] == r["total_ns"] / r["calls"] for r in prof["listeners"])
+        puts = {(r["origin"], r["event_type"]): r["count"] for r in prof["puts"]}
+        assert puts == {("<external>", "MarketEvent"): 3, ("Forwarder.on_market", "OrderEvent"): 3}
+
+        engine.enable_profile(False)
+        engine.put(MarketEvent(10))
+        assert engine.get_profile()["puts"] == prof["puts"]
+        engine.reset_profile()
+        assert engine.get_profile() == {"listeners": [], "puts": []}
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
\ No newline at end of file
@@ -52,6 +52,25 @@ class TestFactorSampler:
 
         assert fs.get_records(symbol=sym) == []
 
+    def test_skips_symbol_whose_only_factor_is_in_future(self):
+        ee = EventEngine()
+        fs = FactorSampler(max_records=1000, enable_store=True, emit_empty=False)
+        fs.start(ee)
+
+        f1 = FactorSignal("A", 1.0, name="f1")
+        f1.timestamp = 50
+        ee.put(f1)
+        # B 从未报过 f1，只有一个 Timer 之后才生效的 f2
+        f2 = FactorSignal("B", 2.0, name="f2")
+        f2.timestamp = 150
+        ee.put(f2)
+
+        ee.put(Timer(100))
+
+        recs = fs.get_records()
+        assert [r["symbol"] for r in recs] == ["A"]
+        assert recs[0]["factors"] == {"f1": pytest.approx(1.0)}
+
     def test_dense_records_shape(self):
         ee = EventEngine()
         fs = FactorSampler(max_records=1000, enable_store=True, emit_empty=True)
@@ -77,6 +96,79 @@ class TestFactorSampler:
         assert row["f1"] == pytest.approx(1.0)
         assert row["f2"] == pytest.approx(-3.0)
 
+    def _feed(self, fs, ee, n_ticks, symbols, factors, step=100):
+        for k in range(n_ticks):
+            ts = (k + 1) * step
+            for i, sym in enumerate(symbols):
+                for j, name in enumerate(factors):
+                    sig = FactorSignal(sym, float(k * 100 + i * 10 + j), name=name)
+                    sig.timestamp = ts - 1
+                    ee.put(sig)
+            ee.put(Timer(ts))
+
+    def test_ring_evicts_oldest_and_range_queries(self):
+        ee = EventEngine()
+        fs = FactorSampler(max_records=10, enable_store=True)
+        fs.start(ee)
+        self._feed(fs, ee, 8, ["A", "B"], ["f1"])
+
+        recs = fs.get_records()
+        assert len(recs) == 10
+        # 最早的 3 个 tick 的 6 行被覆盖掉，保留 tick 4..8
+        assert [r["timestamp"] for r in recs[:2]] == [400, 400]
+        assert recs[-1] == {"timestamp": 800, "symbol": "B", "factors": {"f1": 710.0}}
+
+        ranged = fs.get_records(symbol="A", start_ts=500, end_ts=700)
+        assert [r["timestamp"] for r in ranged] == [500, 600, 700]
+        assert fs.get_records(symbol="B", limit=2)[0]["timestamp"] == 700
+        assert fs.get_row(600, "B")["factors"] == {"f1": 510.0}
+        assert fs.get_row(300, "B") == {}
+        assert fs.get_records(symbol="C") == []
+
+        arrays = fs.to_arrays(start_ts=700)
+        assert arrays["timestamp"].tolist() == [700, 700, 800, 800]
+        assert [arrays["symbols"][i] for i in arrays["symbol_id"]] == ["A", "B", "A", "B"]
+        assert arrays["values"].shape == (4, 1)
+
+        df = fs.to_dataframe()
+        assert len(df) == 10 and list(df.columns) == ["timestamp", "symbol", "f1"]
+        assert df["f1"].tolist() == [r["factors"]["f1"] for r in recs]
+
+    def test_new_factor_columns_backfill_nan(self):
+        ee = EventEngine()
+        fs = FactorSampler(max_records=0)
+        fs.start(ee)
+        self._feed(fs, ee, 2, ["A"], ["f1"])
+        # 中途出现的新因子，之前的行为 NaN；超过初始列数也能扩展
+        late = ["g%d" % i for i in range(12)]
+        self._feed(fs, ee, 1, ["A"], late, step=1000)
+
+        df = fs.to_dataframe(factors=["f1", "g11", "missing"])
+        assert len(df) == 3
+        assert df["g11"].isna().tolist() == [True, True, False]
+        assert df["missing"].isna().all()
+        dense = fs.get_dense_records(factors=["g0"], fill_nan=False)
+        assert dense[0] == {"timestamp": 100, "symbol": "A"}
+        assert dense[2]["g0"] == 0.0
+
+        new = fs.pop_new_records(max_items=2)
+        assert [r["timestamp"] for r in new] == [100, 200]
+        rest = fs.pop_new_records()
+        assert len(rest) == 1 and set(rest[0]["factors"]) == {"f1"} | set(late)
+        assert fs.pop_new_records() == []
+        assert fs.memory_footprint()["new_records"] == 0
+
+    def test_unbounded_ring_grows(self):
+        ee = EventEngine()
+        fs = FactorSampler(max_records=0)
+        fs.start(ee)
+        symbols = ["S%03d" % i for i in range(300)]
+        self._feed(fs, ee, 5, symbols, ["f1", "f2"])
+        assert fs.memory_footprint()["records"] == 1500
+        df = fs.to_dataframe()
+        assert df["timestamp"].is_monotonic_increasing
+        assert df.iloc[-1]["symbol"] == "S299" and df.iloc[-1]["f2"] == 400.0 + 2990.0 + 1.0
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,53 @@
+import random
+import sys
+
+import pytest
+
+from hft_backtest.core.id_window import OrderIdWindow
+
+
+class TestOrderIdWindow:
+    def test_capacity_rounds_up(self):
+        assert OrderIdWindow(1).capacity == 64
+        assert OrderIdWindow(100).capacity == 128
+        with pytest.raises(ValueError):
+            OrderIdWindow(0)
+
+    def test_watermark_rolls_over_contiguous_ids(self):
+        w = OrderIdWindow(128)
+        w.add(0)
+        w.add(2)
+        assert w.watermark == 1
+        assert 0 in w and 2 in w and 1 not in w
+        w.add(1)
+        assert w.watermark == 3 and len(w) == 0
+        # 整 word 跳跃
+        for i in range(3, 200):
+            w.add(i)
+        assert w.watermark == 200 and len(w) == 0
+
+    def test_matches_set_within_window(self):
+        rng = random.Random(3)
+        w = OrderIdWindow(1024)
+        ref = set()
+        for i in range(1, 500):
+            if rng.random() < 0.7:
+                w.add(i)
+                ref.add(i)
+        for i in range(1, 520):
+            assert (i in w) == (i in ref or i < w.watermark)
+        assert w.watermark == min(set(range(0, 520)) - ref)
+
+    def test_overflow_forces_watermark(self):
+        w = OrderIdWindow(64)
+        w.add(5)
+        w.add(1000)
+        # 1000 之前 capacity 以外的 id 都被视为已加入
+        assert w.watermark == 1000 - 64 + 1
+        assert 10 in w and 1000 in w
+        assert 999 not in w and 1001 not in w
+        assert len(w) == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,78 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from hft_backtest import BacktestEngine, DelayBus, Event, EventEngine, FixedDelayModel, MemoryMonitor, Order, Timer
+from hft_backtest.core.monitor import count_live_events, read_rss
+from hft_backtest.okx.account import OKXAccount
+
+
+class LeakyComponent:
+    def __init__(self):
+        self.kept = []
+
+    def memory_footprint(self):
+        return {"kept": len(self.kept)}
+
+
+class TestMemoryMonitor:
+    def test_count_live_events_sees_container_held_events(self):
+        held = [Order.create_limit("BTC", 1.0, 100.0) for _ in range(7)]
+        counts = count_live_events()
+        assert counts["Order"] >= 7
+        del held
+
+    def test_read_rss(self):
+        rss = read_rss()
+        if rss == -1:
+            pytest.skip("no psutil and no /proc/self/statm")
+        # 已经加载了 pandas 的解释器，常驻内存至少也有几 MB
+        assert 4 << 20 < rss < 1 << 40
+
+    def test_watch_requires_protocol(self, tmp_path):
+        monitor = MemoryMonitor(str(tmp_path / "mem.csv"), interval=10)
+        with pytest.raises(TypeError):
+            monitor.watch(object())
+
+    def test_timer_driven_time_series(self, tmp_path):
+        path = tmp_path / "mem.csv"
+        leaky = LeakyComponent()
+        account = OKXAccount(initial_balance=1000)
+        monitor = MemoryMonitor(str(path), interval=100, components=[account], count_events=True)
+        monitor.watch(leaky, "leaky")
+
+        engine = EventEngine()
+        monitor.start(engine)
+        for ts in range(100, 501, 50):
+            leaky.kept.append(Event(ts))
+            engine.put(Timer(ts))
+
+        # 运行中途文件里已经有数据
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        assert sorted(df["timestamp"].unique()) == [100, 200, 300, 400, 500]
+        kept = df[df["metric"] == "leaky.kept"].set_index("timestamp")["value"]
+        assert kept.to_dict() == {100: 1, 200: 3, 300: 5, 400: 7, 500: 9}
+        assert (df[df["metric"] == "OKXAccount.finished_order_ids"]["value"] == 0).all()
+        assert monitor.last_sample["leaky.kept"] == 9
+        assert monitor.last_sample["events.Event"] >= 9
+        monitor.stop()
+
+    def test_delaybus_footprint_in_backtest(self, tmp_path):
+        bus = DelayBus(FixedDelayModel(1_000))
+        engine = BacktestEngine(
+            [Event(100), Event(200), Event(300)], bus, DelayBus(FixedDelayModel(0)), timer_interval=100,
+        )
+        # 默认不做 O(堆) 的 Event 计数
+        monitor = MemoryMonitor(str(tmp_path / "mem.csv"), interval=100, components=[bus])
+        engine.add_component(monitor, is_server=False)
+        engine.run()
+        df = pd.read_csv(tmp_path / "mem.csv", encoding="utf-8-sig")
+        # 延迟 1000：数据都还在 S2C 总线里时，client 侧已经在采样
+        depth = df[df["metric"] == "DelayBus.queue"]["value"].tolist()
+        assert max(depth) >= 2
+        assert not df["metric"].str.startswith("events.").any()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,63 @@
+import sys
+
+import numpy as np
+import pytest
+
+from hft_backtest import Order, OrderBatch
+
+
+class TestOrderBatch:
+    def test_create_assigns_ids_and_types(self):
+        batch = OrderBatch.create(["A", "B", "C"], [100.0, -50.0, 10.0], [np.nan, 9.5, np.nan])
+        assert len(batch) == 3
+        ids = batch.order_ids.tolist()
+        assert ids == list(range(ids[0], ids[0] + 3))
+        # 与单笔订单共用 ID 计数器
+        assert Order.create_market("A", 1.0).order_id == ids[-1] + 1
+        assert batch.order_types.tolist() == [Order.ORDER_TYPE_MARKET, Order.ORDER_TYPE_LIMIT, Order.ORDER_TYPE_MARKET]
+        assert batch.prices.tolist() == [-1.0, 9.5, -1.0]
+        assert (batch.states == Order.ORDER_STATE_CREATED).all()
+
+        order = batch.order_at(1)
+        assert order.order_id == ids[1]
+        assert order.symbol == "B" and order.quantity == -50.0 and order.price == 9.5
+        assert order.is_limit_order and order.is_created
+
+    def test_create_cancel(self):
+        batch = OrderBatch.create_cancel([7, 8], ["A", "B"])
+        orders = batch.to_orders()
+        assert [o.order_id for o in orders] == [7, 8]
+        assert all(o.is_cancel_order for o in orders)
+
+    def test_derive_copies_columns(self):
+        batch = OrderBatch.create(["A", "B"], [1.0, 2.0])
+        batch.timestamp = 123
+        snapshot = batch.derive()
+        assert snapshot.timestamp == 0
+        batch.states[:] = Order.ORDER_STATE_SUBMITTED
+        batch.symbols[0] = "Z"
+        assert (snapshot.states == Order.ORDER_STATE_CREATED).all()
+        assert snapshot.symbols == ["A", "B"]
+        assert snapshot.order_ids.tolist() == batch.order_ids.tolist()
+
+    def test_from_orders_roundtrip(self):
+        filled = Order.create_limit("A", 3.0, 10.0)
+        filled.state = Order.ORDER_STATE_FILLED
+        filled.filled_price = 9.9
+        filled.commission_fee = 0.5
+        received = Order.create_market("B", -2.0)
+        received.state = Order.ORDER_STATE_RECEIVED
+        batch = OrderBatch.from_orders([filled, received])
+        back = batch.to_orders()
+        assert [o.order_id for o in back] == [filled.order_id, received.order_id]
+        assert back[0].is_filled and back[0].filled_price == 9.9 and back[0].commission_fee == 0.5
+        assert back[1].is_received and back[1].is_market_order
+        assert len(OrderBatch.from_orders([])) == 0
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            OrderBatch(["A"], [1, 2], [0], [1.0], [1.0])
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
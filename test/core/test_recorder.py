@@ -196,5 +196,30 @@ class TestAccountRecorder:
             if os.path.exists(path):
                 os.remove(path)
 
+    def test_account_recorder_named_timer(self):
+        """timer_name 模式：只响应命名 timer，默认 Timer 不触发记录"""
+        from hft_backtest.core.timer import timer_id_of
+
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            path = tmp.name
+
+        try:
+            acc = MockAccount()
+            recorder = AccountRecorder(path, acc, interval=100, buffer_size=1, timer_name="rec_1s")
+            engine = EventEngine()
+            recorder.start(engine)
+
+            engine.put(Timer(0))
+            engine.put(Timer(100, timer_id=timer_id_of("rec_1s")))
+            recorder.file.flush()
+
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                lines = f.readlines()
+            assert [line.split(',')[0] for line in lines[1:]] == ['100']
+            recorder.stop()
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
\ No newline at end of file
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from hft_backtest import EventEngine, FactorSampler, RecordSink, Timer
+from hft_backtest.core.factor import FactorSignal
+from hft_backtest.okx import OKXBookticker, OKXLabelSampler
+
+
+class TestRecordSink:
+    @pytest.mark.parametrize("fmt", ["parquet", "ipc"])
+    def test_round_trip_in_chunks(self, tmp_path, fmt):
+        sink = RecordSink(str(tmp_path / "out"), format=fmt, chunk_rows=3)
+        for i in range(10):
+            sink.append({"timestamp": i, "symbol": f"S{i % 2}", "y": i * 0.5})
+        sink.close()
+
+        assert sink.rows_written == 10
+        assert sink.chunks_written == 4
+        df = RecordSink.read(str(tmp_path / "out"))
+        assert df["timestamp"].tolist() == list(range(10))
+        assert df["y"].tolist() == pytest.approx([i * 0.5 for i in range(10)])
+        assert RecordSink.read(str(tmp_path / "out"), columns=["symbol"]).columns.tolist() == ["symbol"]
+
+    def test_schema_grows_across_chunks(self, tmp_path):
+        sink = RecordSink(str(tmp_path / "out"), chunk_rows=2)
+        sink.append({"timestamp": 1, "f1": 1.0})
+        sink.append({"timestamp": 2, "f1": 2.0})
+        # 新列：之前的行补 null，之前的分片读回时也补 null
+        sink.append({"timestamp": 3, "f1": 3.0, "f2": 30.0})
+        sink.append({"timestamp": 4, "f2": 40.0})
+        sink.close()
+
+        df = RecordSink.read(str(tmp_path / "out"))
+        assert df["timestamp"].tolist() == [1, 2, 3, 4]
+        assert df["f2"].isna().tolist() == [True, True, False, False]
+        assert df["f1"].isna().tolist() == [False, False, False, True]
+
+    def test_closed_and_existing_parts(self, tmp_path):
+        sink = RecordSink(str(tmp_path / "out"), chunk_rows=1)
+        sink.append({"a": 1})
+        sink.close()
+        with pytest.raises(RuntimeError):
+            sink.append({"a": 2})
+        with pytest.raises(FileExistsError):
+            RecordSink(str(tmp_path / "out"))
+
+
+class TestSamplerSpill:
+    def test_factor_sampler_spills_beyond_max_records(self, tmp_path):
+        ee = EventEngine()
+        sink = RecordSink(str(tmp_path / "factors"), chunk_rows=7)
+        fs = FactorSampler(max_records=5, sink=sink)
+        fs.start(ee)
+
+        for k in range(1, 21):
+            for sym in ("A", "B"):
+                sig = FactorSignal(sym, float(k), name="f1")
+                sig.timestamp = k * 100 - 1
+                ee.put(sig)
+            if k == 10:
+                sig = FactorSignal("A", -1.0, name="f2")
+                sig.timestamp = k * 100 - 1
+                ee.put(sig)
+            ee.put(Timer(k * 100))
+        fs.stop()
+
+        assert sink.closed
+        assert len(fs.get_records()) == 5
+        df = RecordSink.read(str(tmp_path / "factors"))
+        assert len(df) == 40
+        assert df["timestamp"].tolist() == [k * 100 for k in range(1, 21) for _ in range(2)]
+        assert df["symbol"].tolist() == ["A", "B"] * 20
+        assert df["f1"].tolist() == [float(k) for k in range(1, 21) for _ in range(2)]
+        f2 = df["f2"].to_numpy()
+        assert np.isnan(f2[:18]).all()
+        assert f2[18] == -1.0 and np.isnan(f2[19])
+
+    def test_label_sampler_spills_all_labels(self, tmp_path):
+        ee = EventEngine()
+        sink = RecordSink(str(tmp_path / "labels"), format="ipc", chunk_rows=4)
+        ls = OKXLabelSampler(max_records=2, sink=sink)
+        ls.start(ee)
+
+        for k in range(1, 12):
+            ee.put(
+                OKXBookticker(
+                    timestamp=k * 10 - 5,
+                    symbol="BTC-USDT-SWAP",
+                    bid_price_1=100.0 + k,
+                    ask_price_1=100.0 + k,
+                    bid_amount_1=1.0,
+                    ask_amount_1=1.0,
+                )
+            )
+            ee.put(Timer(k * 10))
+        ls.stop()
+
+        assert len(ls.get_records()) == 2
+        df = RecordSink.read(str(tmp_path / "labels"))
+        assert df["timestamp"].tolist() == [k * 10 for k in range(1, 11)]
+        assert df["y"].tolist() == pytest.approx([1.0 / (100.0 + k) for k in range(1, 11)])
@@ -0,0 +1,67 @@
+import csv
+
+import pytest
+
+from hft_backtest import BacktestEngine, Order, Strategy
+from hft_backtest.low_freq import BarAccount, BarEvent, BarFundingRate, BarMatcher, BarRecorder
+
+
+def test_bar_account_marks_and_funding():
+    account = BarAccount(initial_balance=1000.0)
+    order = Order.create_limit("A", 2.0, 10.0)
+    order.state = Order.ORDER_STATE_FILLED
+    order.filled_price = 10.0
+    account.on_order(order)
+
+    account.on_bar(BarEvent(symbol="A", close_price=12.0))
+    assert account.get_position("A") == 2.0
+    assert account.get_price("A") == 12.0
+    assert account.get_equity() == pytest.approx(1000.0 - 20.0 + 24.0)
+
+    # 结算价缺省用最新收盘价
+    account.on_bar_funding(BarFundingRate(symbol="A", funding_rate=0.01))
+    assert account.get_symbol_funding_fee("A") == pytest.approx(2.0 * 12.0 * 0.01)
+    assert account.get_total_funding_fee() == pytest.approx(0.24)
+    assert account.get_position("B") == 0.0
+
+
+class BuyOnceStrategy(Strategy):
+    def start(self, engine):
+        super().start(engine)
+        self.sent = False
+        engine.register(BarEvent, self.on_bar)
+
+    def on_bar(self, event):
+        if not self.sent:
+            self.send_order(Order.create_market(event.symbol, 1.0))
+            self.sent = True
+
+
+def test_bar_stack_in_single_engine(tmp_path):
+    dataset = [
+        BarEvent(timestamp=60, symbol="A", open_price=10.0, high_price=10.0, low_price=10.0, close_price=10.0),
+        BarEvent(timestamp=120, symbol="A", open_price=11.0, high_price=12.0, low_price=11.0, close_price=12.0),
+        BarEvent(timestamp=180, symbol="A", open_price=12.0, high_price=13.0, low_price=12.0, close_price=13.0),
+    ]
+    account = BarAccount(initial_balance=100.0)
+    engine = BacktestEngine(dataset, timer_interval=None, mode="single")
+    engine.add_component(BarMatcher(taker_fee=0.0, maker_fee=0.0), is_server=True)
+    engine.add_component(account, is_server=True)
+    recorder = BarRecorder(str(tmp_path), account)
+    engine.add_component(recorder, is_server=True)
+    engine.add_component(BuyOnceStrategy(account), is_server=False)
+    engine.run()
+
+    # 第一根 bar 下单，第二根 bar 开盘价成交
+    assert account.get_position("A") == 1.0
+    assert account.get_balance() == pytest.approx(89.0)
+    assert account.get_equity() == pytest.approx(102.0)
+
+    with open(recorder.snapshot_file_path, encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["time"] for r in rows] == ["60", "120", "180"]
+    # 120 的成交回报在该 bar 的快照之后到达，计入下一期：13 - 11
+    assert [float(r["pnl"]) for r in rows] == pytest.approx([0.0, 0.0, 2.0])
+    with open(recorder.trade_file_path, encoding="utf-8-sig") as f:
+        trades = list(csv.DictReader(f))
+    assert len(trades) == 1 and float(trades[0]["price"]) == 11.0
@@ -0,0 +1,34 @@
+import math
+
+import pandas as pd
+
+from hft_backtest.low_freq import BarArrayReader, BarEvent
+
+
+def test_bar_event_derive():
+    evt = BarEvent(timestamp=60, symbol="A", open_price=1.0, high_price=2.0, low_price=0.5, close_price=1.5, volume=10.0)
+    assert math.isnan(evt.next_open_price)
+    clone = evt.derive()
+    assert isinstance(clone, BarEvent) and clone.timestamp == 0
+    assert (clone.symbol, clone.open_price, clone.high_price, clone.low_price, clone.close_price, clone.volume) == \
+        ("A", 1.0, 2.0, 0.5, 1.5, 10.0)
+
+
+def test_bar_reader_columns_and_batches():
+    df = pd.DataFrame({
+        "close_time": [60, 60, 120],
+        "symbol": ["A", "B", "A"],
+        "open": [1.0, 2.0, 1.1],
+        "high": [1.2, 2.2, 1.3],
+        "low": [0.9, 1.9, 1.0],
+        "close": [1.1, 2.1, 1.2],
+        "next_open": [1.1, 2.1, float("nan")],
+    })
+    evts = list(BarArrayReader([df.iloc[:2], df.iloc[2:]]))
+    assert [(e.timestamp, e.symbol) for e in evts] == [(60, "A"), (60, "B"), (120, "A")]
+    assert [e.close_price for e in evts] == [1.1, 2.1, 1.2]
+    assert evts[0].volume == 0.0
+    assert evts[1].next_open_price == 2.1 and math.isnan(evts[2].next_open_price)
+
+    evts = list(BarArrayReader([df.drop(columns=["symbol"]).rename(columns={"close_time": "timestamp"})], symbol="X"))
+    assert {e.symbol for e in evts} == {"X"}
@@ -0,0 +1,118 @@
+import sys
+from collections import deque
+
+import pytest
+
+from hft_backtest import EventEngine, Order
+from hft_backtest.low_freq import BarEvent, BarMatcher
+
+
+class MockEventEngine(EventEngine):
+    def __init__(self):
+        super().__init__()
+        self.queue = deque()
+
+    def put(self, event):
+        self.queue.append(event)
+
+    def register(self, event_type, handler, ignore_self=False):
+        pass
+
+
+def bar(symbol, o, h, l, c, ts=1):
+    return BarEvent(timestamp=ts, symbol=symbol, open_price=o, high_price=h, low_price=l, close_price=c)
+
+
+class TestBarMatcher:
+    def setup_method(self):
+        self.engine = MockEventEngine()
+        self.matcher = BarMatcher(taker_fee=1e-3, maker_fee=5e-4)
+        self.matcher.start(self.engine)
+
+    def submit(self, order):
+        order.state = Order.ORDER_STATE_SUBMITTED
+        self.matcher.on_order(order)
+        return order
+
+    def drain(self):
+        out = list(self.engine.queue)
+        self.engine.queue.clear()
+        return out
+
+    def test_limit_and_market_rules(self):
+        buy_maker = self.submit(Order.create_limit("A", 1.0, 99.0))
+        buy_taker = self.submit(Order.create_limit("A", 1.0, 101.0))
+        sell_rest = self.submit(Order.create_limit("A", -1.0, 110.0))
+        sell_maker = self.submit(Order.create_limit("A", -1.0, 104.0))
+        market = self.submit(Order.create_market("A", -2.0))
+        evts = self.drain()
+        assert all(e.state == Order.ORDER_STATE_RECEIVED for e in evts)
+
+        self.matcher.on_bar(bar("A", 100.0, 105.0, 98.0, 102.0))
+        fills = {e.order_id: e for e in self.drain()}
+        assert set(fills) == {buy_maker.order_id, buy_taker.order_id, sell_maker.order_id, market.order_id}
+        assert fills[buy_maker.order_id].filled_price == 99.0
+        assert fills[buy_maker.order_id].commission_fee == pytest.approx(99.0 * 5e-4)
+        # 开盘已低于限价：按开盘价成交，变为 taker
+        assert fills[buy_taker.order_id].filled_price == 100.0
+        assert fills[buy_taker.order_id].commission_fee == pytest.approx(100.0 * 1e-3)
+        assert fills[sell_maker.order_id].filled_price == 104.0
+        assert fills[market.order_id].filled_price == 100.0
+        assert fills[market.order_id].commission_fee == pytest.approx(200.0 * 1e-3)
+
+        assert [o.order_id for o in self.matcher.get_resting_orders("A")] == [sell_rest.order_id]
+        self.matcher.on_bar(bar("A", 108.0, 111.0, 107.0, 109.0))
+        fills = self.drain()
+        assert [(f.order_id, f.filled_price) for f in fills] == [(sell_rest.order_id, 110.0)]
+        assert self.matcher.get_resting_orders("A") == []
+
+    def test_symbols_are_isolated(self):
+        a = self.submit(Order.create_limit("A", 1.0, 10.0))
+        self.submit(Order.create_limit("B", 1.0, 10.0))
+        self.drain()
+        self.matcher.on_bar(bar("A", 10.5, 11.0, 9.5, 10.0))
+        fills = self.drain()
+        assert [f.order_id for f in fills] == [a.order_id]
+        assert len(self.matcher.get_resting_orders("B")) == 1
+        assert self.matcher.memory_footprint()["orders"] == 1
+
+    def test_cancel_and_post_only(self):
+        keep = self.submit(Order.create_limit("A", 1.0, 90.0))
+        gone = self.submit(Order.create_limit("A", 1.0, 91.0))
+        po = self.submit(Order.create_limit("A", 1.0, 101.0, post_only=True))
+        self.drain()
+
+        self.matcher.on_order(Order.create_cancel(gone))
+        evts = self.drain()
+        assert [(e.order_id, e.state) for e in evts] == [(gone.order_id, Order.ORDER_STATE_CANCELED)]
+
+        # post_only 限价单开盘即穿价：撤销而不是吃单
+        self.matcher.on_bar(bar("A", 100.0, 102.0, 95.0, 100.0))
+        evts = self.drain()
+        assert [(e.order_id, e.state) for e in evts] == [(po.order_id, Order.ORDER_STATE_CANCELED)]
+        assert [o.order_id for o in self.matcher.get_resting_orders("A")] == [keep.order_id]
+
+    def test_tracking_order_uses_last_close(self):
+        early = self.submit(Order.create_tracking("A", 1.0))
+        assert self.drain()[0].state == Order.ORDER_STATE_CANCELED
+
+        self.matcher.on_bar(bar("A", 100.0, 101.0, 99.0, 100.5))
+        self.submit(Order.create_tracking("A", 1.0))
+        recv = self.drain()[0]
+        assert recv.state == Order.ORDER_STATE_RECEIVED
+        assert recv.is_limit_order and recv.price == 100.5
+        assert early.order_id != recv.order_id
+
+    def test_many_resting_orders_single_pass(self):
+        orders = [self.submit(Order.create_limit("A", 1.0, 50.0 + i * 0.01)) for i in range(5000)]
+        self.drain()
+        # low=75 触发价格 >= 75 的买单，顺序与挂单顺序一致
+        self.matcher.on_bar(bar("A", 80.0, 80.0, 75.0, 78.0))
+        fills = self.drain()
+        expected = [o.order_id for o in orders if o.price >= 75.0]
+        assert [f.order_id for f in fills] == expected
+        assert len(self.matcher.get_resting_orders("A")) == 5000 - len(expected)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))
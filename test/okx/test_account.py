@@ -263,6 +263,119 @@ class TestOKXAccount:
 
         print("Race condition test passed: Zombie order prevented.")
 
+    def test_incremental_totals_match_recompute(self):
+        """增量维护的汇总与按品种明细逐项重算一致（多品种、随机成交/行情/资金费/交割）"""
+        import random
+        rng = random.Random(5)
+        account = OKXAccount(initial_balance=10000.0)
+        symbols = [f"S{i}-USDT-SWAP" for i in range(6)]
+        for step in range(2000):
+            sym = rng.choice(symbols)
+            r = rng.random()
+            if r < 0.5:
+                qty = rng.choice([-2.0, -1.0, 1.0, 2.0])
+                o = self.create_filled_order(0, sym, 1, qty, rng.uniform(90, 110), fee=0.01)
+                account.on_order(o)
+            elif r < 0.9:
+                account.on_trade_data(OKXTrades(timestamp=step, symbol=sym, trade_id=step, price=rng.uniform(90, 110), size=1.0, side="buy"))
+            elif r < 0.97:
+                account.on_funding_data(OKXFundingRate(timestamp=step, symbol=sym, funding_rate=0.0001, price=100.0))
+            else:
+                account.on_delivery_data(OKXDelivery(timestamp=step, symbol=sym, price=100.0))
+
+        positions = account.get_positions()
+        prices = account.get_prices()
+        value = sum(q * prices.get(s, 0.0) for s, q in positions.items())
+        margin = sum(abs(q) * prices.get(s, 0.0) for s, q in positions.items())
+        assert account.get_position_cashvalue() == pytest.approx(value, abs=1e-6)
+        assert account.get_total_margin() == pytest.approx(margin, abs=1e-6)
+        assert account.get_equity() == pytest.approx(account.get_balance() + value, abs=1e-6)
+        assert account.get_total_trade_pnl() == pytest.approx(sum(account.net_cash_flow.values()) + value, abs=1e-6)
+        assert account.get_total_turnover() == pytest.approx(sum(account.total_turnover.values()))
+        assert account.get_total_commission() == pytest.approx(sum(account.total_commission.values()))
+        assert account.get_total_funding_fee() == pytest.approx(sum(account.total_funding_fee.values()))
+        assert account.get_total_trade_count() == sum(account.total_trade_count.values())
+        assert {s: q / SCALER for s, q in account.position_dict.items()} == positions
+
+    def test_totals_resync_while_always_holding(self):
+        """一直持仓时，资金费结算会按品种重算汇总，长时间盯市的浮点误差不会累积"""
+        import random
+        rng = random.Random(9)
+        account = OKXAccount(initial_balance=1e6)
+        symbols = [f"S{i}-USDT-SWAP" for i in range(3)]
+        for sym in symbols:
+            account.on_trade_data(OKXTrades(timestamp=0, symbol=sym, trade_id=0, price=100.0, size=1.0, side="buy"))
+            account.on_order(self.create_filled_order(0, sym, 1, 3.0, 100.0))
+        for step in range(1, 50001):
+            sym = rng.choice(symbols)
+            price = rng.choice([0.01, 1e6]) * rng.uniform(0.5, 1.5)
+            account.on_trade_data(OKXTrades(timestamp=step, symbol=sym, trade_id=step, price=price, size=1.0, side="buy"))
+        account.on_funding_data(OKXFundingRate(timestamp=50001, symbol=symbols[0], funding_rate=0.0, price=100.0))
+
+        positions = account.get_positions()
+        prices = account.get_prices()
+        assert account.get_position_cashvalue() == sum(positions[s] * prices[s] for s in symbols)
+        assert account.get_total_margin() == sum(abs(positions[s]) * prices[s] for s in symbols)
+
+    def test_finished_order_ids_bounded(self):
+        """大量订单滚动终结后，已终结集合的内存不随订单数增长，迟到的回报仍被拒绝"""
+        account = OKXAccount(initial_balance=1e9, finished_window=256)
+        symbol = "BTC-USDT-SWAP"
+
+        # 一张长寿挂单：之后有大量订单流过，它仍然活跃
+        resting = Order.create_limit(symbol, 1.0, 100.0)
+        resting.state = Order.ORDER_STATE_RECEIVED
+        account.on_order(resting)
+
+        for _ in range(5000):
+            o = Order.create_limit(symbol, 1.0, 100.0)
+            o.state = Order.ORDER_STATE_CANCELED
+            account.on_order(o)
+        last_id = o.order_id
+
+        assert len(account.finished_order_ids) <= account.finished_order_ids.capacity
+        assert account.finished_order_ids.watermark > resting.order_id
+
+        # 迟到的 RECEIVED：无论在窗口内还是已在水位线以下，都不会复活
+        zombie = Order.create_limit(symbol, 1.0, 100.0)
+        zombie.order_id = last_id
+        zombie.state = Order.ORDER_STATE_RECEIVED
+        account.on_order(zombie)
+        zombie.order_id = resting.order_id + 1
+        account.on_order(zombie)
+        assert set(account.get_orders()) == {resting.order_id}
+
+        # 被水位线越过的活跃挂单依然能正常成交
+        resting.state = Order.ORDER_STATE_FILLED
+        resting.filled_price = 100.0
+        account.on_order(resting)
+        assert account.get_orders() == {}
+        assert account.get_positions() == {symbol: 1.0}
+
+    def test_cancel_request_before_its_order(self):
+        """同一时刻发出的撤单先于原单到达时，原单的后续回报仍要正常记账"""
+        account = OKXAccount(initial_balance=10000.0)
+        symbol = "BTC-USDT-SWAP"
+        orders = [Order.create_limit(symbol, 1.0, 100.0) for _ in range(2)]
+        cancel = Order.create_cancel(orders[-1])
+
+        # DelayBus 对相同触发时刻不保证先后：撤单可能先于它要撤的原单到达
+        for o in orders:
+            o.state = Order.ORDER_STATE_RECEIVED
+        for evt in (orders[0], cancel, orders[1]):
+            account.on_order(evt)
+
+        target = orders[-1]
+        assert target.order_id in account.get_orders()
+
+        filled = target.derive()
+        filled.state = Order.ORDER_STATE_FILLED
+        filled.filled_price = 100.0
+        account.on_order(filled)
+        assert target.order_id not in account.get_orders()
+        assert account.get_positions() == {symbol: 1.0}
+        assert account.get_balance() == pytest.approx(10000.0 - 100.0)
+
 
 if __name__ == "__main__":
     # 方式 A: 调用 pytest 运行当前文件 (推荐)
@@ -1,5 +1,6 @@
 import sys
 
+import numpy as np
 import pytest
 
 from hft_backtest import EventEngine
@@ -163,6 +164,138 @@ class TestOKXFactorEvaluator:
         assert counters["pending"] == 0
         assert counters["skipped_no_price"] == 1
 
+    def test_multi_horizon_matches_single_horizon_evaluators(self):
+        horizons = [0, 7, 30, 120]
+        ee = EventEngine()
+        multi = FactorEvaluator(horizons=horizons)
+        multi.start(ee)
+        singles = {h: FactorEvaluator(horizon=h) for h in horizons}
+        for ev in singles.values():
+            ev.start(ee)
+
+        rng = np.random.default_rng(3)
+        ts = 1000
+        for _ in range(3000):
+            ts += int(rng.integers(1, 6))
+            sym = ("BTC-USDT-SWAP", "ETH-USDT-SWAP")[int(rng.integers(0, 2))]
+            if rng.random() < 0.4:
+                f = FactorSignal(sym, float(rng.normal()), name="f")
+                f.timestamp = ts
+                ee.put(f)
+            else:
+                mid = 100.0 + rng.normal()
+                ee.put(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=mid - 0.1, ask_price_1=mid + 0.1))
+
+        for sym in multi.symbols():
+            by_h = multi.get_symbol_stats(sym)["by_horizon"]
+            assert sorted(by_h) == horizons
+            for h, ev in singles.items():
+                single = ev.get_symbol_stats(sym)
+                assert by_h[h]["evaluated"] == single["counters"]["evaluated"]
+                assert by_h[h]["pending"] == single["counters"]["pending"]
+                assert by_h[h]["relationship"] == pytest.approx(single["relationship"], nan_ok=True)
+                assert by_h[h]["forward_return"] == pytest.approx(single["forward_return"], nan_ok=True)
+                assert by_h[h]["delay"] == pytest.approx(single["delay"], nan_ok=True)
+            # 顶层字段对应最短 horizon
+            assert multi.get_symbol_stats(sym)["counters"] == singles[0].get_symbol_stats(sym)["counters"]
+
+        report = multi.format_report()
+        assert "horizons=[0, 7, 30, 120]" in report
+        assert "Horizon 120:" in report
+
+    def test_stats_stable_with_large_offset(self):
+        ee = EventEngine()
+        ev = FactorEvaluator(horizon=0)
+        ev.start(ee)
+
+        sym = "BTC-USDT-SWAP"
+        rng = np.random.default_rng(5)
+        # 大偏移 + 极小波动：朴素的 sum2/n - mean^2 在这里会完全丢精度
+        xs = 1e6 + rng.normal(scale=1e-3, size=2000)
+        mids = 100.0 * (1.0 + 1e-7 * np.cumsum(rng.normal(size=2001)))
+        ys = []
+        ts = 1000
+        for k, x in enumerate(xs):
+            ee.put(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=mids[k], ask_price_1=mids[k]))
+            f = FactorSignal(sym, float(x), name="f")
+            f.timestamp = ts
+            ee.put(f)
+            ys.append((mids[k + 1] - mids[k]) / mids[k])
+            ts += 1
+        ee.put(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=mids[-1], ask_price_1=mids[-1]))
+
+        stats = ev.get_symbol_stats(sym)
+        ys = np.asarray(ys)
+        assert stats["counters"]["evaluated"] == len(xs)
+        assert stats["factor"]["std"] == pytest.approx(np.std(xs), rel=1e-6)
+        assert stats["forward_return"]["std"] == pytest.approx(np.std(ys), rel=1e-6)
+        assert stats["relationship"]["corr"] == pytest.approx(np.corrcoef(xs, ys)[0, 1], rel=1e-6, abs=1e-9)
+        assert stats["relationship"]["x_autocorr1"] == pytest.approx(np.corrcoef(xs[:-1], xs[1:])[0, 1], rel=1e-6, abs=1e-9)
+
+    @pytest.mark.parametrize("order", [(1, 0, 2), (0, 2, 1), (2, 1, 0)])
+    def test_merge_time_shards_matches_serial(self, order):
+        syms = ["BTC-USDT-SWAP", "ETH-USDT-SWAP"]
+        rng = np.random.default_rng(11)
+
+        def shard(ts0, n):
+            # 以每个品种的盘口开头和结尾，horizon=0 时分片末尾没有 pending
+            events = []
+            ts = ts0
+            for sym in syms:
+                events.append(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=99.9, ask_price_1=100.1))
+            for _ in range(n):
+                ts += int(rng.integers(1, 4))
+                sym = syms[int(rng.integers(0, 2))]
+                if rng.random() < 0.4:
+                    f = FactorSignal(sym, float(rng.normal()), name="f")
+                    f.timestamp = ts
+                    events.append(f)
+                else:
+                    mid = 100.0 + rng.normal()
+                    events.append(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=mid - 0.1, ask_price_1=mid + 0.1))
+            ts += 1
+            for sym in syms:
+                events.append(OKXBookticker(timestamp=ts, symbol=sym, bid_price_1=99.9, ask_price_1=100.1))
+            return events, ts
+
+        shards = []
+        ts = 1000
+        for _ in range(3):
+            events, ts = shard(ts + 1, 1500)
+            shards.append(events)
+
+        def run(events_list):
+            ee = EventEngine()
+            ev = FactorEvaluator(horizon=0)
+            ev.start(ee)
+            for events in events_list:
+                for e in events:
+                    ee.put(e)
+            return ev
+
+        serial = run(shards)
+        parts = [run([events]) for events in shards]
+        merged = FactorEvaluator(horizon=0)
+        # 任意顺序合并（包括先合并不相邻的分片）都应该得到同样的结果
+        for k in order:
+            merged.merge(parts[k])
+
+        assert merged.get_stats()["time"] == serial.get_stats()["time"]
+        for sym in syms:
+            got = merged.get_symbol_stats(sym)
+            want = serial.get_symbol_stats(sym)
+            for key in ("time", "counters", "last_market"):
+                assert got[key] == want[key]
+            for key in ("factor", "forward_return", "relationship", "delay"):
+                assert got[key] == pytest.approx(want[key], rel=1e-9, abs=1e-12, nan_ok=True)
+
+    def test_merge_rejects_mismatched_horizons(self):
+        with pytest.raises(ValueError):
+            FactorEvaluator(horizons=[0, 10]).merge(FactorEvaluator(horizon=0))
+        ev = FactorEvaluator(horizon=0)
+        with pytest.raises(ValueError):
+            ev.merge(ev)
+
 
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
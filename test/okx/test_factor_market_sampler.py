@@ -1,5 +1,7 @@
 import sys
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from hft_backtest import EventEngine
@@ -200,5 +202,65 @@ class TestOKXFactorMarketSampler:
         assert xs[s2]["y"] == pytest.approx(0.1)
 
 
+class TestFactorMarketSamplerCrossSection:
+    @staticmethod
+    def _run(sampler, n_sym=8, n_ticks=60, seed=7):
+        ee = EventEngine()
+        sampler.start(ee)
+        rng = np.random.default_rng(seed)
+        mids = 100.0 + rng.random(n_sym)
+        for k in range(n_ticks):
+            for i in range(n_sym):
+                sym = f"S{i}"
+                ts = 1000 + k * 10 + i
+                mids[i] *= 1.0 + 0.01 * rng.normal()
+                ee.put(
+                    OKXBookticker(
+                        timestamp=ts,
+                        symbol=sym,
+                        bid_price_1=mids[i],
+                        ask_price_1=mids[i],
+                        bid_amount_1=1.0,
+                        ask_amount_1=1.0,
+                    )
+                )
+                # 奇数品种用离散值，覆盖 rank 并列
+                f = FactorSignal(sym, float(rng.integers(0, 4)) if i % 2 else float(rng.normal()), name="f1")
+                f.timestamp = 1000 + k * 10
+                ee.put(f)
+        sampler.stop()
+        return sampler
+
+    def test_matches_brute_force_per_boundary(self):
+        sampler = self._run(FactorMarketSampler(interval_ms=10, cross_section_stats=True, n_quantiles=4))
+        df = pd.DataFrame(sampler.get_samples(factor="f1"))
+        stats = sampler.cross_section_stats_dataframe(factor="f1")
+
+        assert sampler.n_late_samples == 0
+        assert (stats["n"] == 8).all()
+        assert stats["ts"].tolist() == sorted(df["ts"].unique())
+        for row in stats.itertuples():
+            g = df[df["ts"] == row.ts]
+            assert row.n == len(g)
+            assert row.coverage == pytest.approx(len(g) / 8)
+            assert row.ic == pytest.approx(np.corrcoef(g["x"], g["y"])[0, 1])
+            assert row.rank_ic == pytest.approx(np.corrcoef(g["x"].rank(), g["y"].rank())[0, 1])
+            y_sorted = g["y"].to_numpy()[np.argsort(g["x"].to_numpy(), kind="mergesort")]
+            q = [part.mean() for part in np.array_split(y_sorted, 4)]
+            assert [row.q1, row.q2, row.q3, row.q4] == pytest.approx(q)
+            assert row.long_short == pytest.approx(q[-1] - q[0])
+
+    def test_close_lag_drops_late_symbols(self):
+        sampler = self._run(FactorMarketSampler(interval_ms=10, cross_section_stats=True, ic_close_lag_ms=0), n_ticks=20)
+        stats = sampler.get_cross_section_stats(factor="f1")
+        # lag=0：每个边界在第一个品种报到时就关闭，其余品种都算迟到
+        assert stats
+        assert all(r["n"] == 1 for r in stats)
+        assert sampler.n_late_samples == 7 * len(stats)
+        assert np.isnan(stats[0]["ic"])
+        assert len(sampler.pop_new_cross_section_stats()) == len(stats)
+        assert sampler.pop_new_cross_section_stats() == []
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,90 @@
+import sys
+
+import pytest
+
+from hft_backtest import BacktestEngine, Event
+from hft_backtest.core.delaybus import DelayBus, FixedDelayModel
+from hft_backtest.core.event_engine import Component, EventEngine
+from hft_backtest.okx import OKXBookticker, OKXTrades, RecordedArrivalLatencyModel
+
+
+class TestRecordedArrivalLatencyModel:
+    def test_bookticker_uses_local_timestamp(self):
+        model = RecordedArrivalLatencyModel()
+        ticker = OKXBookticker(timestamp=1000, symbol="BTC-USDT", local_timestamp=1250)
+        assert model.get_delay(ticker) == 250
+
+    def test_offset_and_clamp(self):
+        model = RecordedArrivalLatencyModel(offset=100, min_delay=50, max_delay=300)
+        # 时钟偏差导致 local < exchange：截断到 min_delay
+        assert model.get_delay(OKXBookticker(timestamp=1000, local_timestamp=800)) == 50
+        # 1000 -> 1150 + offset 100 = 250
+        assert model.get_delay(OKXBookticker(timestamp=1000, local_timestamp=1150)) == 250
+        # 超过上限：截断到 max_delay
+        assert model.get_delay(OKXBookticker(timestamp=1000, local_timestamp=5000)) == 300
+
+    def test_fallback_for_other_events(self):
+        model = RecordedArrivalLatencyModel(fallback_delay=7)
+        assert model.get_delay(OKXTrades(timestamp=1000, symbol="BTC-USDT")) == 7
+        assert model.get_delay(Event(1000)) == 7
+        # 缺失 local_timestamp 的盘口同样走 fallback
+        assert model.get_delay(OKXBookticker(timestamp=1000)) == 7
+
+    def test_invalid_params(self):
+        with pytest.raises(ValueError):
+            RecordedArrivalLatencyModel(min_delay=-1)
+        with pytest.raises(ValueError):
+            RecordedArrivalLatencyModel(min_delay=10, max_delay=5)
+
+    def test_delaybus_delivers_at_recorded_time(self):
+        source = EventEngine()
+        target = EventEngine()
+        bus = DelayBus(RecordedArrivalLatencyModel())
+        bus.start(source)
+        bus.set_target_engine(target)
+
+        received = []
+        target.register(OKXBookticker, lambda e: received.append((target.timestamp, e.timestamp)))
+
+        source.put(OKXBookticker(timestamp=1000, symbol="BTC-USDT", local_timestamp=1300))
+        assert bus.next_timestamp == 1300
+
+        bus.process_until(1299)
+        assert received == []
+        bus.process_until(1300)
+        # 原始交易所时间戳保留，引擎时间推进到录制到达时间
+        assert received == [(1300, 1000)]
+
+    def test_backtest_engine_integration(self):
+        class Spy(Component):
+            def __init__(self):
+                self.arrivals = []
+
+            def start(self, engine):
+                self.engine = engine
+                engine.register(OKXBookticker, self.on_bookticker)
+
+            def on_bookticker(self, event):
+                self.arrivals.append((self.engine.timestamp, event.local_timestamp))
+
+        dataset = [
+            OKXBookticker(timestamp=100, symbol="BTC-USDT", local_timestamp=130),
+            OKXBookticker(timestamp=200, symbol="BTC-USDT", local_timestamp=205),
+            OKXBookticker(timestamp=300, symbol="BTC-USDT", local_timestamp=290),
+        ]
+        engine = BacktestEngine(
+            dataset,
+            DelayBus(RecordedArrivalLatencyModel()),
+            DelayBus(FixedDelayModel(0)),
+            timer_interval=None,
+        )
+        spy = Spy()
+        engine.add_component(spy, is_server=False)
+        engine.run()
+
+        # 第三条 local < timestamp，被 min_delay=0 截断为即时到达
+        assert spy.arrivals == [(130, 130), (205, 205), (300, 290)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", __file__]))